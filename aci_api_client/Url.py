@@ -9,7 +9,7 @@
 from __future__ import annotations
 import yaml
 from .UserClass import UserClass
-from typing import Any, Dict, Type, cast
+from typing import Any, Dict, List, Type, cast
 
 ###########################
 # Private Singleton Class #
@@ -54,6 +54,18 @@ class UrlClass(metaclass=_PrivateCookie):
     def getComponentApic(self) -> str:
         return cast(str, self.__URLs['COMPONENTS']['APIC'])
 
+    ###############################
+    # Collection Profiles Methods #
+    ###############################
+
+    # Returning the name of all the Collection Profiles
+    def getCollectionProfiles(self) -> List[str]:
+        return list(self.__URLs['PROFILES'].keys())
+
+    # Returning the MO classes fetched by a Collection Profile
+    def getCollectionProfile(self, profile: str) -> List[str]:
+        return cast(List[str], self.__URLs['PROFILES'][profile])
+
     ####################
     # APIC Get Methods #
     ####################
@@ -230,6 +242,18 @@ class UrlClass(metaclass=_PrivateCookie):
     def getChassisInterfaceSfp(self) -> str:
         return cast(str, self.__URLs['URLs']['CHASSIS']['LINECARD_INFO']['INTERFACE_SFP_DETAILS'])
 
+    # Returning Chassis Node SFPs Details URL
+    def getChassisNodeSfp(self) -> str:
+        return cast(str, self.__URLs['URLs']['CHASSIS']['LINECARD_INFO']['NODE_SFP_DETAILS'])
+
+    # Returning Chassis Node Interfaces Error Counters URL
+    def getChassisNodeInterfaceCounters(self) -> str:
+        return cast(str, self.__URLs['URLs']['CHASSIS']['LINECARD_INFO']['NODE_INTERFACE_COUNTERS'])
+
+    # Returning Chassis Node Interfaces Operational Status URL
+    def getChassisNodeOperationalInterfaceStatus(self) -> str:
+        return cast(str, self.__URLs['URLs']['CHASSIS']['LINECARD_INFO']['NODE_OPERATIONAL_INTERFACE_STATUS'])
+
     # Returning Chassis Linecard Interface EPG Deployed URL
     def getChassisInterfaceEpg(self) -> str:
         return cast(str, self.__URLs['URLs']['CHASSIS']['LINECARD_INFO']['INTERFACE_EPG'])
@@ -374,6 +398,42 @@ class UrlClass(metaclass=_PrivateCookie):
     def getTenantFullSubtree(self) -> str:
         return cast(str, self.__URLs['URLs']['TENANT']['TENANT_FULL_SUBTREE'])
 
+    # Returning the Subtree URL of a single Tenant (only the classes used by the reports)
+    def getTenantSubtree(self) -> str:
+        return cast(str, self.__URLs['URLs']['TENANT']['TENANT_SUBTREE'])
+
+    ############################
+    # Subscription Get Methods #
+    ############################
+
+    # Returning APIC Websocket URL
+    def getSubscriptionWebsocket(self) -> str:
+        return cast(str, self.__URLs['URLs']['SUBSCRIPTION']['WEBSOCKET'])
+
+    # Returning Subscription Refresh URL
+    def getSubscriptionRefresh(self) -> str:
+        return cast(str, self.__URLs['URLs']['SUBSCRIPTION']['SUBSCRIPTION_REFRESH'])
+
+    # Returning Fabric Node Subscription URL
+    def getSubscriptionFabricNode(self) -> str:
+        return cast(str, self.__URLs['URLs']['SUBSCRIPTION']['FABRIC_NODE'])
+
+    # Returning Fault Summary Subscription URL
+    def getSubscriptionFaultSummary(self) -> str:
+        return cast(str, self.__URLs['URLs']['SUBSCRIPTION']['FAULT_SUMMARY'])
+
+    # Returning Operational Interface Subscription URL
+    def getSubscriptionOperationalInterface(self) -> str:
+        return cast(str, self.__URLs['URLs']['SUBSCRIPTION']['OPERATIONAL_INTERFACE'])
+
+    # Returning LLDP Adjacency Subscription URL
+    def getSubscriptionLldpAdjacency(self) -> str:
+        return cast(str, self.__URLs['URLs']['SUBSCRIPTION']['LLDP_ADJACENCY'])
+
+    # Returning Power Supply Subscription URL
+    def getSubscriptionPowerSupply(self) -> str:
+        return cast(str, self.__URLs['URLs']['SUBSCRIPTION']['POWER_SUPPLY'])
+
     ##################################
     # Private Method that will build #
     ##################################
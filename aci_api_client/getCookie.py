@@ -36,6 +36,12 @@ class _PrivateCookie(type):
 
 class getCookie(metaclass=_PrivateCookie):
 
+    # Connections kept open to the APIC, shared by the collector threads and the Counter Watch
+    CONNECTION_POOL_SIZE = 32
+
+    # Seconds to wait for an APIC response
+    REQUEST_TIMEOUT = 30
+
     def __init__( self, username, password, base_url, token_url):
         self.__username = username
         self.__password = password
@@ -44,6 +50,7 @@ class getCookie(metaclass=_PrivateCookie):
         self.__cookie = None
         self.__last_login = None
         self.__refresh_timeout = None
+        self.__session = self.__openSession()
         self.__getToken()
 
     ###############
@@ -64,6 +71,10 @@ class getCookie(metaclass=_PrivateCookie):
         # returning cookie
         return self.__cookie
 
+    # Return the APIC Token value, needed to open the APIC Websocket
+    def getToken(self):
+        return self.getCookie().get('APIC-cookie')
+
     # Method to request tokens to the Cisco APICs
     def __getToken(self):
         try:
@@ -124,6 +135,14 @@ class getCookie(metaclass=_PrivateCookie):
         # Returning restconf object
         return resp
 
+    # Method that opens the HTTP session, the TCP/TLS connections to the APIC are reused by all the GET requests
+    def __openSession(self):
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.CONNECTION_POOL_SIZE)
+        session.mount("https://", adapter)
+        session.verify = False
+        return session
+
     # Method that refresh the token from the Cisco APICs
     def __aaaRefresh(self):
 
@@ -150,6 +169,9 @@ class getCookie(metaclass=_PrivateCookie):
             # Logout Token session 
             requests.post(Logout, data=LogoutBody,verify=False, timeout=8)
 
+            # Closing the connections of the session
+            self.__session.close()
+
         except requests.exceptions.Timeout:
             return 1
         except requests.exceptions.ConnectionError:
@@ -158,13 +180,18 @@ class getCookie(metaclass=_PrivateCookie):
     # Method that will help the sub class to retrieve the information from APICs in JSON format
     def get_request(self, url):
 
+        # Return Json object obtained by Cisco ACI
+        return json.loads(self.get_raw_request(url))
+
+    # Method that retrieve the raw response body (JSON bytes) from APICs, decoded by the caller (see parsers.aci_parse_pool)
+    def get_raw_request(self, url):
+
         # We check if the token need to be refreshed
         if self.__aaaRefresh():
             self.__cookie = self.__getToken()
 
-        # Making the Get method in the Request Library for Resconf Cisco ACI Query
-        responds = requests.get(url, cookies=self.getCookie(), verify=False)
-        json_obj = json.loads(responds.content)
+        # Making the Get method in the Request Library for Resconf Cisco ACI Query (keep-alive connection of the session)
+        responds = self.__session.get(url, cookies=self.getCookie(), timeout=self.REQUEST_TIMEOUT)
 
-        # Return Json object obtained by Cisco ACI
-        return json_obj
+        # Return the raw body obtained by Cisco ACI
+        return responds.content
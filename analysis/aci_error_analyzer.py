@@ -0,0 +1,194 @@
+# coding=utf-8
+
+#########################################################################
+#  Class that will detect the fabric links reporting interface errors  #
+#  reading the counters of all the fabric edges at once                #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Dict, Type, List, Optional, Tuple
+from model.aci_edge_attributes import EdgeEndpoint, FabricEdgeAttributes
+from model.aci_counter_store import CounterStore
+from model.aci_graph import keyedEdges
+from model.aci_node_index import nodeNameById
+from itertools import chain, compress, repeat
+from array import array
+import networkx as nx
+import operator
+
+###########################
+# Private Singleton Class #
+###########################
+
+class _PrivateCookie(type):
+
+    _instances: Dict[Type[Any], Any] = {}
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+
+        if cls not in cls._instances:
+            instance = super().__call__(*args, **kwargs)
+            cls._instances[cls] = instance
+        return cls._instances[cls]
+
+#########################################################################################################
+# EdgeErrorResult Class, a fabric link reporting errors with the non-zero counters of each side         #
+#########################################################################################################
+
+class EdgeErrorResult:
+
+    __slots__ = ('source_node', 'source_interface', 'dest_node', 'dest_interface', 'key', 'errors', 'last_errors', 'total')
+
+    def __init__(self, source_node: str, source_interface: Any, dest_node: str, dest_interface: Any, key: Any = None) -> None:
+        self.source_node: str = source_node
+        self.source_interface: Any = source_interface
+        self.dest_node: str = dest_node
+        self.dest_interface: Any = dest_interface
+        self.key: Any = key
+        self.errors: Dict[str, Tuple[Optional[float], Optional[float]]] = {}
+        self.last_errors: Tuple[Optional[str], Optional[str]] = (None, None)
+        self.total: float = 0
+
+    # Returning the result as a plain dict (exports)
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'source_node'      : self.source_node,
+            'source_interface' : self.source_interface,
+            'dest_node'        : self.dest_node,
+            'dest_interface'   : self.dest_interface,
+            'total_errors'     : self.total,
+            'errors'           : {counter: {'source': source, 'dest': dest} for counter, (source, dest) in self.errors.items()},
+            'last_errors'      : {'source': self.last_errors[0], 'dest': self.last_errors[1]},
+        }
+
+#########################################################################################################
+# FabricErrorAnalyzer Class, builds the error matrix of the fabric (edges as rows, error counters as    #
+# columns) and returns the edges with errors ranked by the total number of errors                      #
+#########################################################################################################
+
+class FabricErrorAnalyzer(metaclass=_PrivateCookie):
+
+    # Error counters (rmonEtherStats) checked on both sides of every fabric edge
+    ERROR_COUNTERS: Tuple[str, ...] = (
+        'cRCAlignErrors', 'collisions', 'dropEvents', 'fragments', 'jabbers', 'undersizePkts',
+        'oversizePkts', 'rxGiantPkts', 'rxOversizePkts', 'txGiantPkts', 'txOversizePkts',
+    )
+
+    # 'lastErrors' values that do not report an error
+    NO_LAST_ERRORS: Tuple[Any, ...] = (None, '0', '', 'N/A')
+
+    def __init__(self) -> None:
+        self.__counter_getter = operator.itemgetter(*(EdgeEndpoint.COUNTER_INDEX[counter] for counter in self.ERROR_COUNTERS))
+
+    ##################
+    # Public Methods #
+    ##################
+
+    # Function that returns the fabric edges reporting errors, ranked by the total number of errors
+    def analyzeFabricErrors(self, graph: nx.Graph) -> List[EdgeErrorResult]:
+
+        # Fabric edges (rows of the matrix)
+        edges = [(u, v, key, data) for u, v, key, data in keyedEdges(graph) if data is not None and not data.get('downlink')]
+        if not edges:
+            return []
+
+        columns = len(self.ERROR_COUNTERS)
+        matrices = {side: self._error_matrix(edges, side) for side in ('source', 'dest')}
+        last_errors = {side: [self._last_errors(data, side) for *_, data in edges] for side in ('source', 'dest')}
+
+        # Auxilear Dict with the result of each edge with errors (row -> result)
+        results: Dict[int, EdgeErrorResult] = {}
+
+        # Each column of the matrix is scanned at once: the rows with a non-zero counter
+        for index, counter in enumerate(self.ERROR_COUNTERS):
+
+            # Counters not collected (MISSING) are not errors
+            source_column = array('q', map(max, matrices['source'][index::columns], repeat(0)))
+            dest_column = array('q', map(max, matrices['dest'][index::columns], repeat(0)))
+            for row in compress(range(len(edges)), map(operator.or_, source_column, dest_column)):
+                result = results.get(row) or results.setdefault(row, self.__result(graph, edges[row]))
+                source, dest = source_column[row], dest_column[row]
+                result.errors[counter] = (source or None, dest or None)
+                result.total += source + dest
+
+        # 'lastErrors' text of the operational status
+        for row in range(len(edges)):
+            source, dest = last_errors['source'][row], last_errors['dest'][row]
+            if source not in self.NO_LAST_ERRORS or dest not in self.NO_LAST_ERRORS:
+                result = results.get(row) or results.setdefault(row, self.__result(graph, edges[row]))
+                result.last_errors = (source if source not in self.NO_LAST_ERRORS else None, dest if dest not in self.NO_LAST_ERRORS else None)
+
+        # Ranking: more errors first, then by link name
+        return sorted(results.values(), key=lambda result: (-result.total, str(result.source_node), str(result.dest_node)))
+
+    # Function that returns the fabric edges whose error counters increased over the window of the Counter Store,
+    # ranked by errors per second (the 'errors' of the results are rates and 'total' the errors per second)
+    def analyzeFabricErrorRates(self, graph: nx.Graph, store: CounterStore, window: float = CounterStore.DEFAULT_WINDOW) -> List[EdgeErrorResult]:
+
+        # Auxilear Dict with the error rates of each interface ((node_id, port) -> counter -> errors per second)
+        rates: Dict[Tuple[str, str], Dict[str, float]] = {}
+        for rate in store.rates(self.ERROR_COUNTERS, window):
+            if rate.delta > 0:
+                rates.setdefault((rate.node_id, rate.port), {})[rate.counter] = rate.rate
+
+        # Auxilear List with the fabric edges whose counters increased
+        results: List[EdgeErrorResult] = []
+        for u, v, key, data in keyedEdges(graph):
+            if data is None or data.get('downlink'):
+                continue
+            sides = [rates.get((str(data.get(side + '_node_id')), str(data.get(side + '_interface_id') or '').lower()), {}) for side in ('source', 'dest')]
+            if not sides[0] and not sides[1]:
+                continue
+            result = self.__result(graph, (u, v, key, data))
+            for counter in self.ERROR_COUNTERS:
+                if counter in sides[0] or counter in sides[1]:
+                    result.errors[counter] = (sides[0].get(counter), sides[1].get(counter))
+            result.total = sum(sides[0].values()) + sum(sides[1].values())
+            results.append(result)
+
+        # Ranking: more errors per second first, then by link name
+        return sorted(results, key=lambda result: (-result.total, str(result.source_node), str(result.dest_node)))
+
+    # Function that returns the results as plain dicts (exports)
+    def errorsToDicts(self, results: List[EdgeErrorResult]) -> List[Dict[str, Any]]:
+        return [result.to_dict() for result in results]
+
+    ####################
+    # Privates Methods #
+    ####################
+
+    # Function that returns the error counters of one side of all the edges as a flat matrix (rows x columns),
+    # the compact edges (FabricEdgeAttributes) already store numeric counters, other edges are parsed once here
+    def _error_matrix(self, edges: List[Tuple[Any, ...]], side: str) -> array:
+
+        empty = (EdgeEndpoint.MISSING,) * len(self.ERROR_COUNTERS)
+        rows: List[Tuple[int, ...]] = []
+
+        for *_, data in edges:
+            if isinstance(data, FabricEdgeAttributes):
+                counters = data.counters(side)
+                rows.append(self.__counter_getter(counters) if counters is not None else empty)
+            else:
+                rows.append(tuple(EdgeEndpoint.parseCounter(data.get(side + '_' + counter)) for counter in self.ERROR_COUNTERS))
+
+        return array('q', chain.from_iterable(rows))
+
+    # Function that returns the 'lastErrors' text of one side of the edge
+    def _last_errors(self, data: Any, side: str) -> Any:
+        if isinstance(data, FabricEdgeAttributes):
+            endpoint = data.endpoint(side)
+            return endpoint.interface_operLastErrors if endpoint is not None else None
+        return data.get(side + '_interface_operLastErrors')
+
+    # Creating the result of an edge (u, v, key, data). The 'source_*' side is the switch whose ID is 'source_node_id'
+    # (the switch whose LLDP result was applied last), not the first node of the edge
+    def __result(self, graph: nx.Graph, edge: Tuple[Any, Any, Any, Any]) -> EdgeErrorResult:
+        u, v, key, data = edge
+        source_node = nodeNameById(graph, data.get('source_node_id')) if data.get('source_node_id') is not None else None
+        if source_node not in (u, v):
+            source_node = u
+        dest_node = v if source_node == u else u
+        return EdgeErrorResult(source_node, data.get('source_interface_id', 'N/A'), dest_node, data.get('dest_interface_id', 'N/A'), key)
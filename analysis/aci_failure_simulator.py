@@ -0,0 +1,293 @@
+# coding=utf-8
+
+#########################################################################
+#  Class that will simulate the failure of nodes, linecards or links   #
+#  and report the lost leaf connectivity, ECMP and downlink devices    #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Dict, Type, Iterable, List, Optional, Set, Tuple
+from analysis.aci_path_analyzer import FabricPathAnalyzer, FabricPathEngine
+from model.aci_node_index import nodeNameById
+from model.aci_graph import edgeAttributes, keyedEdges
+import networkx as nx
+import time
+import re
+
+###########################
+# Private Singleton Class #
+###########################
+
+class _PrivateCookie(type):
+
+    _instances: Dict[Type[Any], Any] = {}
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+
+        if cls not in cls._instances:
+            instance = super().__call__(*args, **kwargs)
+            cls._instances[cls] = instance
+        return cls._instances[cls]
+
+#########################################################################################################
+# FailureScenario Class, the nodes, linecards ((node, slot)) and interfaces ((node, port)) that fail   #
+#########################################################################################################
+
+class FailureScenario:
+
+    __slots__ = ('label', 'nodes', 'linecards', 'interfaces')
+
+    def __init__(self, label: str, nodes: Iterable[Any] = (), linecards: Iterable[Tuple[Any, str]] = (), interfaces: Iterable[Tuple[Any, str]] = ()) -> None:
+        self.label: str = label
+        self.nodes: Set[Any] = set(nodes)
+        self.linecards: Set[Tuple[Any, str]] = set(linecards)
+        self.interfaces: Set[Tuple[Any, str]] = set(interfaces)
+
+#########################################################################################################
+# FailureImpact Class, the result of a scenario                                                        #
+#########################################################################################################
+
+class FailureImpact:
+
+    __slots__ = ('scenario', 'failed_links', 'failed_downlinks', 'lost_pairs', 'reduced_pairs', 'isolated_leaves', 'lost_devices', 'degraded_devices', 'seconds')
+
+    def __init__(self, scenario: str) -> None:
+        self.scenario: str = scenario
+        self.failed_links: int = 0
+        self.failed_downlinks: int = 0
+        self.lost_pairs: List[Tuple[Any, Any, int]] = []
+        self.reduced_pairs: List[Tuple[Any, Any, int, int]] = []
+        self.isolated_leaves: List[Any] = []
+        self.lost_devices: List[Tuple[Any, List[str]]] = []
+        self.degraded_devices: List[Tuple[Any, List[str]]] = []
+        self.seconds: float = 0.0
+
+    # Returning the impact as a plain dict (exports)
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'scenario'         : self.scenario,
+            'failed_links'     : self.failed_links,
+            'failed_downlinks' : self.failed_downlinks,
+            'lost_pairs'       : [{'source': source, 'dest': dest, 'ecmp_before': before} for source, dest, before in self.lost_pairs],
+            'reduced_pairs'    : [{'source': source, 'dest': dest, 'ecmp_before': before, 'ecmp_after': after} for source, dest, before, after in self.reduced_pairs],
+            'isolated_leaves'  : self.isolated_leaves,
+            'lost_devices'     : [{'device': device, 'downlinks': downlinks} for device, downlinks in self.lost_devices],
+            'degraded_devices' : [{'device': device, 'failed_downlinks': downlinks} for device, downlinks in self.degraded_devices],
+        }
+
+#########################################################################################################
+# FailureModel Class, the connectivity of the fabric precomputed as integer bitmasks: the spines of    #
+# every leaf (ECMP width of a pair = common spines), the links of every leaf/spine pair, node, linecard #
+# and interface, and the downlinks of every leaf, linecard, interface and device. A scenario only       #
+# combines masks, the leaf pairs checked are the ones with a leaf whose spines changed                  #
+#########################################################################################################
+
+class FailureModel:
+
+    def __init__(self, graph: nx.Graph, engine: FabricPathEngine) -> None:
+        self.signature: Tuple[int, int, int] = (engine.stats['changes'], graph.number_of_nodes(), graph.number_of_edges())
+        self.leaves: List[Any] = engine.leaves()
+        self.spines: List[Any] = engine.spines()
+        self.__leaf_index: Dict[Any, int] = {leaf: index for index, leaf in enumerate(self.leaves)}
+        self.__spine_index: Dict[Any, int] = {spine: index for index, spine in enumerate(self.spines)}
+        self.__leaf_spines: List[int] = [0] * len(self.leaves)
+        self.__pair_links: Dict[Tuple[int, int], int] = {}
+        self.__link_pair: List[Tuple[int, int]] = []
+        self.__links: Dict[Any, int] = {}
+        self.__downlinks: Dict[Any, int] = {}
+        self.__downlink_ports: List[Tuple[Any, Any, str]] = []
+        self.__devices: Dict[Any, int] = {}
+        self.__build(graph, engine)
+
+    ##################
+    # Public Methods #
+    ##################
+
+    # Method that returns the impact of the scenario
+    def simulate(self, scenario: FailureScenario) -> FailureImpact:
+
+        started = time.perf_counter()
+        impact = FailureImpact(scenario.label)
+
+        # Failed links and downlinks of the nodes, linecards and interfaces
+        failed_leaves = {self.__leaf_index[node] for node in scenario.nodes if node in self.__leaf_index}
+        failed_links, failed_downlinks = 0, 0
+        for key in list(scenario.nodes) + list(scenario.linecards) + list(scenario.interfaces):
+            failed_links |= self.__links.get(key, 0)
+            failed_downlinks |= self.__downlinks.get(key, 0)
+
+        # Spines of the leaves after the failure, a leaf keeps a spine while one of its links is up
+        leaf_spines = list(self.__leaf_spines)
+        for link in self.__bits(failed_links):
+            leaf, spine = self.__link_pair[link]
+            if not self.__pair_links[(leaf, spine)] & ~failed_links:
+                leaf_spines[leaf] &= ~(1 << spine)
+        changed = {leaf for leaf in range(len(self.leaves)) if leaf_spines[leaf] != self.__leaf_spines[leaf]} | failed_leaves
+
+        # Leaves without spines lose all their downlink devices
+        for leaf in sorted(changed - failed_leaves):
+            if self.__leaf_spines[leaf] and not leaf_spines[leaf]:
+                impact.isolated_leaves.append(self.leaves[leaf])
+                failed_downlinks |= self.__downlinks.get(self.leaves[leaf], 0)
+
+        # ECMP width of the leaf pairs with a changed leaf (common spines before and after)
+        for leaf in sorted(changed):
+            for peer in range(len(self.leaves)):
+                if peer == leaf or (peer in changed and peer < leaf):
+                    continue
+                before = (self.__leaf_spines[leaf] & self.__leaf_spines[peer]).bit_count()
+                after = (leaf_spines[leaf] & leaf_spines[peer]).bit_count()
+                if after >= before or leaf in failed_leaves or peer in failed_leaves:
+                    continue
+                pair = tuple(sorted((self.leaves[leaf], self.leaves[peer]), key=str))
+                if after == 0:
+                    impact.lost_pairs.append((pair[0], pair[1], before))
+                else:
+                    impact.reduced_pairs.append((pair[0], pair[1], before, after))
+
+        # Downlink devices with all (lost) or some (degraded) of their downlinks failed
+        devices: Set[Any] = {self.__downlink_ports[downlink][0] for downlink in self.__bits(failed_downlinks)}
+        for device in sorted(devices, key=str):
+            downlinks = self.__devices[device]
+            ports = [f"{leaf} {port}" for _, leaf, port in (self.__downlink_ports[downlink] for downlink in self.__bits(downlinks & failed_downlinks))]
+            (impact.degraded_devices if downlinks & ~failed_downlinks else impact.lost_devices).append((device, ports))
+
+        impact.failed_links = failed_links.bit_count()
+        impact.failed_downlinks = failed_downlinks.bit_count()
+        impact.lost_pairs.sort(key=lambda item: (str(item[0]), str(item[1])))
+        impact.reduced_pairs.sort(key=lambda item: (item[3] - item[2], str(item[0]), str(item[1])))
+        impact.seconds = time.perf_counter() - started
+        return impact
+
+    ####################
+    # Privates Methods #
+    ####################
+
+    # Building the masks from the usable leaf/spine links of the Path Engine and the downlink edges of the Graph
+    def __build(self, graph: nx.Graph, engine: FabricPathEngine) -> None:
+
+        # Fabric links, one bit per link (parallel links between the same leaf and spine have their own bit)
+        for u, v, key in engine.usableLinks():
+            leaf, spine = (u, v) if u in self.__leaf_index else (v, u)
+            if leaf not in self.__leaf_index or spine not in self.__spine_index:
+                continue
+            link = len(self.__link_pair)
+            pair = (self.__leaf_index[leaf], self.__spine_index[spine])
+            self.__link_pair.append(pair)
+            self.__pair_links[pair] = self.__pair_links.get(pair, 0) | 1 << link
+            self.__leaf_spines[pair[0]] |= 1 << pair[1]
+            self.__addBit(self.__links, u, None, link)
+            self.__addBit(self.__links, v, None, link)
+            for node, port in self.__linkPorts(graph, u, v, key):
+                self.__addBit(self.__links, node, port, link)
+
+        # Downlinks of the leaves, one bit per downlink edge
+        for u, v, data in graph.edges(data=True):
+            if data is None or not data.get('downlink'):
+                continue
+            leaf, device = (u, v) if u in self.__leaf_index else (v, u)
+            if leaf not in self.__leaf_index:
+                continue
+            downlink = len(self.__downlink_ports)
+            port = str(data.get('leaf_int') or '').lower()
+            self.__downlink_ports.append((device, leaf, port))
+            self.__devices[device] = self.__devices.get(device, 0) | 1 << downlink
+            self.__addBit(self.__downlinks, leaf, None, downlink)
+            self.__addBit(self.__downlinks, leaf, port, downlink)
+
+    # Returning the (node, port) of both sides of a fabric link
+    def __linkPorts(self, graph: nx.Graph, u: Any, v: Any, key: Any) -> List[Tuple[Any, str]]:
+        data = next(iter(edgeAttributes(graph, u, v, key)), None) or {}
+        nodes = {str(graph.nodes[node].get('id')): node for node in (u, v)}
+        return [(nodes[str(data.get(side + '_node_id'))], str(data.get(side + '_interface_id') or '').lower()) for side in ('source', 'dest') if str(data.get(side + '_node_id')) in nodes]
+
+    # Adding a bit into the masks of the node or, with a port, of the linecard and the interface
+    def __addBit(self, masks: Dict[Any, int], node: Any, port: Optional[str], bit: int) -> None:
+        for key in ((node,) if port is None else ((node, FabricFailureSimulator.linecardOf(port)), (node, port))):
+            masks[key] = masks.get(key, 0) | 1 << bit
+
+    # Returning the positions of the bits set in the mask
+    @staticmethod
+    def __bits(mask: int) -> Iterable[int]:
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+
+#########################################################################################################
+# FabricFailureSimulator Class, parses the scenarios, keeps the Failure Model of the Graph and returns  #
+# a copy-on-write view of the Graph without the failed elements                                          #
+#########################################################################################################
+
+class FabricFailureSimulator(metaclass=_PrivateCookie):
+
+    # Linecard slot of an interface (eth1/49 -> 1, eth1/1/1 -> 1)
+    SLOT_PATTERN: "re.Pattern[str]" = re.compile(r'^[a-z]*(\d+)/')
+
+    def __init__(self) -> None:
+        self.__path_analyzer: FabricPathAnalyzer = FabricPathAnalyzer()
+
+    ##################
+    # Public Methods #
+    ##################
+
+    # Function that returns the Failure Model of the Graph, built again only when the links or the Graph changed
+    def failureModel(self, graph: nx.Graph, exclude_errors: bool = True) -> FailureModel:
+        engine = self.__path_analyzer.pathEngine(graph, exclude_errors)
+        model: Optional[FailureModel] = graph.graph.get('failure_model')
+        if model is None or model.signature != (engine.stats['changes'], graph.number_of_nodes(), graph.number_of_edges()):
+            model = graph.graph['failure_model'] = FailureModel(graph, engine)
+        return model
+
+    # Function that returns the impact of every scenario (text as parseScenario or FailureScenario)
+    def simulate(self, graph: nx.Graph, scenarios: Iterable[Any], exclude_errors: bool = True) -> List[FailureImpact]:
+        model = self.failureModel(graph, exclude_errors)
+        return [model.simulate(scenario if isinstance(scenario, FailureScenario) else self.parseScenario(graph, scenario)) for scenario in scenarios]
+
+    # Function that parses a scenario: comma separated nodes (name or ID), NODE:SLOT (linecard) or NODE:INTERFACE
+    def parseScenario(self, graph: nx.Graph, text: str) -> FailureScenario:
+
+        scenario = FailureScenario(text.strip())
+        for item in filter(None, (part.strip() for part in text.split(','))):
+            name, _, target = item.partition(':')
+            node = name if name in graph else nodeNameById(graph, name)
+            if node is None:
+                raise ValueError(f"Unknown node '{name}' in the scenario, expected a node name or ID")
+            if not target:
+                scenario.nodes.add(node)
+            elif target.isdigit():
+                scenario.linecards.add((node, target))
+            else:
+                scenario.interfaces.add((node, target.lower()))
+
+        if not (scenario.nodes or scenario.linecards or scenario.interfaces):
+            raise ValueError("Empty scenario, expected nodes, NODE:SLOT or NODE:INTERFACE")
+        return scenario
+
+    # Function that returns a read-only view of the Graph without the failed nodes and the links and downlinks of
+    # the failed linecards and interfaces (no copy, the reports can run over the view)
+    def scenarioView(self, graph: nx.Graph, scenario: FailureScenario) -> nx.Graph:
+
+        hidden_edges = []
+        for u, v, key, data in keyedEdges(graph):
+            if data is None:
+                continue
+            if data.get('downlink'):
+                leaf = u if str(graph.nodes[u].get('id')) == str(data.get('leaf')) else v
+                ports = [(leaf, str(data.get('leaf_int') or '').lower())]
+            else:
+                nodes = {str(graph.nodes[node].get('id')): node for node in (u, v)}
+                ports = [(nodes.get(str(data.get(side + '_node_id'))), str(data.get(side + '_interface_id') or '').lower()) for side in ('source', 'dest')]
+            if any((node, port) in scenario.interfaces or (node, self.linecardOf(port)) in scenario.linecards for node, port in ports):
+                hidden_edges.append((u, v) if key is None else (u, v, key))
+
+        return nx.restricted_view(graph, scenario.nodes, hidden_edges)
+
+    # Linecard slot of an interface name
+    @classmethod
+    def linecardOf(cls, port: str) -> Optional[str]:
+        match = cls.SLOT_PATTERN.match(str(port).lower())
+        return match.group(1) if match else None
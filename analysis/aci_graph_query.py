@@ -0,0 +1,514 @@
+# coding=utf-8
+
+#########################################################################
+#  Class that will run ad-hoc queries over the Fabric Graph, e.g.       #
+#    role==leaf and psus[*].operSt!=ok                                  #
+#    edges where source_cRCAlignErrors>0                                #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Callable, Dict, Type, List, Optional, Tuple
+from model.aci_interface_table import InterfaceTable
+from model.aci_node_index import graphNodeIndex, nodesWithRole, nodeNameById
+from model.aci_graph import keyedEdges
+import networkx as nx
+import operator
+import time
+import re
+
+###########################
+# Private Singleton Class #
+###########################
+
+class _PrivateCookie(type):
+
+    _instances: Dict[Type[Any], Any] = {}
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+
+        if cls not in cls._instances:
+            instance = super().__call__(*args, **kwargs)
+            cls._instances[cls] = instance
+        return cls._instances[cls]
+
+###################
+# Value Functions #
+###################
+
+# Function that converts a value into a number, None if it is not a number
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(str(value))
+    except (TypeError, ValueError):
+        return None
+
+#########################################################################################################
+# QueryCondition Class, one comparison of the query: path, operator and value. The path is a list of   #
+# steps: attribute names, '*' (every entry of a list) or list positions. psus[*].operSt reads 'operSt' #
+# of every PSU of the node and the condition is True if any of them matches (a missing path is False)  #
+#########################################################################################################
+
+class QueryCondition:
+
+    __slots__ = ('name', 'path', 'op', 'value', 'number', 'pattern')
+
+    # Comparison operators
+    OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+        '==': operator.eq, '!=': operator.ne, '>': operator.gt, '>=': operator.ge, '<': operator.lt, '<=': operator.le,
+    }
+
+    # Operators that only compare numbers when the value of the condition is a number
+    ORDERING: Tuple[str, ...] = ('>', '>=', '<', '<=')
+
+    def __init__(self, name: str, path: Tuple[Any, ...], op: Optional[str] = None, value: Optional[str] = None) -> None:
+        self.name: str = name
+        self.path: Tuple[Any, ...] = path
+        self.op: Optional[str] = op
+        self.value: Optional[str] = value
+        self.number: Optional[float] = _number(value) if value is not None else None
+        self.pattern: Optional[Any] = None
+        if op == '~':
+            try:
+                self.pattern = re.compile(str(value), re.IGNORECASE)
+            except re.error as e:
+                raise ValueError(f"Invalid regular expression '{value}': {e}")
+
+    # Returning True if any value of the path matches: numbers compared as numbers, text case insensitive, '~' regular
+    # expression search. Without operator the condition is True if any value is set (not empty)
+    def matches(self, values: List[Any]) -> bool:
+        for value in values:
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple)) and self.op is not None:
+                if self.matches(list(value)):
+                    return True
+                continue
+            if self.op is None:
+                if value not in ('', False) and not (isinstance(value, (list, tuple, dict)) and not value):
+                    return True
+            elif self.pattern is not None:
+                if self.pattern.search(str(value)):
+                    return True
+            else:
+                number = _number(value) if self.number is not None else None
+                if number is not None:
+                    if self.OPERATORS[self.op](number, self.number):
+                        return True
+                elif self.number is not None and self.op in self.ORDERING:
+                    continue
+                elif self.OPERATORS[self.op](str(value).lower(), str(self.value).lower()):
+                    return True
+        return False
+
+    # Returning the attribute name if the path is a single attribute (conditions that can use an index)
+    def attribute(self) -> Optional[str]:
+        return self.path[0] if len(self.path) == 1 and isinstance(self.path[0], str) and self.path[0] != '*' else None
+
+    def __repr__(self) -> str:
+        return f"QueryCondition({self.name}{self.op or ''}{self.value or ''})"
+
+#########################################################################################################
+# QueryResult Class, the items matching the query (key and the values of every path of the query), how #
+# they were found (indexes or full scan) and the number of items evaluated                              #
+#########################################################################################################
+
+class QueryResult:
+
+    def __init__(self, target: str, expression: str, columns: List[str]) -> None:
+        self.target: str = target
+        self.expression: str = expression
+        self.columns: List[str] = columns
+        self.items: List[Tuple[Any, Dict[str, List[Any]]]] = []
+        self.plan: str = "full scan"
+        self.scanned: int = 0
+        self.seconds: float = 0.0
+
+    # Number of items found
+    def __len__(self) -> int:
+        return len(self.items)
+
+    # Returning the result as a plain dict (exports)
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'target': self.target, 'expression': self.expression, 'plan': self.plan, 'scanned': self.scanned, 'seconds': self.seconds,
+            'items': [{'key': list(key) if isinstance(key, tuple) else key, 'values': values} for key, values in self.items],
+        }
+
+#########################################################################################################
+# ACIGraphQuery Class. Grammar:                                                                         #
+#   query      := [ ('nodes' | 'edges' | 'interfaces') 'where' ] expression        (default: nodes)     #
+#   expression := term ('or' term)*        term := factor ('and' factor)*                               #
+#   factor     := 'not' factor | '(' expression ')' | path [ operator value ]                           #
+#   operator   := == | != | > | >= | < | <= | ~ (regular expression)                                    #
+# The query is compiled into a predicate. The conditions of the top level 'and' that match an index     #
+# select the candidates before the predicate is evaluated: role/id/podId/name (Node Index) for the      #
+# nodes, node_id and the categorical/numeric columns (Interface Table) for the interfaces, the node     #
+# names/ids (Node Index and adjacency) and the counters (Interface Table rows) for the edges            #
+#########################################################################################################
+
+class ACIGraphQuery(metaclass=_PrivateCookie):
+
+    # Query targets
+    TARGETS: Tuple[str, ...] = ('nodes', 'edges', 'interfaces')
+
+    # Tokens: quoted values, operators/parentheses and words (paths, values and keywords)
+    TOKEN: Any = re.compile(r"\s*(?:'(?P<single>[^']*)'|\"(?P<double>[^\"]*)\"|(?P<op>==|!=|>=|<=|>|<|~|\(|\))|(?P<word>[^\s()=!<>~'\"]+))")
+
+    # Steps of a path: attribute names, [*] and [position]
+    PATH_STEP: Any = re.compile(r"([^.\[\]]+)|\[(\*|-?\d+)\]")
+
+    # Interface Table columns of the interfaces queries
+    INTERFACE_COLUMNS: Tuple[str, ...] = InterfaceTable.CATEGORY_COLUMNS + InterfaceTable.NUMBER_COLUMNS + InterfaceTable.TEXT_COLUMNS + InterfaceTable.COUNTER_COLUMNS
+
+    ##################
+    # Public Methods #
+    ##################
+
+    # Method that runs the query over the Graph and returns the matching nodes, edges or interfaces
+    def query(self, graph: nx.Graph, text: str) -> QueryResult:
+
+        started = time.perf_counter()
+        target, tree, conditions = self.compile(text)
+        predicate = self.__predicate(tree)
+
+        # Columns of the result, one per path of the query
+        columns: Dict[str, QueryCondition] = {}
+        for condition in conditions:
+            columns.setdefault(condition.name, condition)
+        result = QueryResult(target, text, list(columns))
+
+        # Candidates from the indexes of the top level conditions, all the items otherwise
+        candidates, plan = self.__candidates(graph, target, tree)
+        if candidates is None:
+            candidates = self.__allItems(graph, target)
+        else:
+            result.plan = plan
+
+        table: Optional[InterfaceTable] = graph.graph.get('interface_table')
+        for key in candidates:
+            item = self.__item(graph, target, key, table)
+            if item is None:
+                continue
+            result.scanned += 1
+            if predicate(item):
+                display = (table.value(key, 'node_id'), table.value(key, 'port')) if target == 'interfaces' else key
+                result.items.append((display, {name: self.__values(item, condition.path) for name, condition in columns.items()}))
+
+        result.seconds = time.perf_counter() - started
+        return result
+
+    # Method that parses the query, returning the target, the expression tree and its conditions (ValueError if the
+    # query is not valid). Tree nodes: ('condition', QueryCondition), ('not', tree), ('and', [trees]), ('or', [trees])
+    def compile(self, text: str) -> Tuple[str, Any, List[QueryCondition]]:
+
+        tokens = self.__tokenize(text)
+        target = 'nodes'
+        if tokens and tokens[0][0] == 'word' and tokens[0][1].lower() in self.TARGETS:
+            if len(tokens) == 1:
+                return tokens[0][1].lower(), None, []
+            if tokens[1][0] == 'word' and tokens[1][1].lower() == 'where':
+                target, tokens = tokens[0][1].lower(), tokens[2:]
+
+        conditions: List[QueryCondition] = []
+        tree, position = self.__parseOr(tokens, 0, conditions)
+        if position != len(tokens):
+            raise ValueError(f"Unexpected '{tokens[position][1]}' in the query")
+
+        # The interfaces are the rows of the Interface Table
+        if target == 'interfaces':
+            for condition in conditions:
+                if condition.attribute() not in self.INTERFACE_COLUMNS:
+                    raise ValueError(f"Unknown interface column '{condition.name}', available columns: {', '.join(self.INTERFACE_COLUMNS)}")
+
+        return target, tree, conditions
+
+    ####################
+    # Privates Methods #
+    ####################
+
+    # Splitting the query into (kind, text) tokens: 'value' (quoted), 'op' and 'word'
+    def __tokenize(self, text: str) -> List[Tuple[str, str]]:
+        tokens: List[Tuple[str, str]] = []
+        text = text.strip()
+        position = 0
+        while position < len(text):
+            match = self.TOKEN.match(text, position)
+            if match is None:
+                raise ValueError(f"Invalid query near '{text[position:]}'")
+            position = match.end()
+            if match.group('single') is not None or match.group('double') is not None:
+                tokens.append(('value', match.group('single') if match.group('single') is not None else match.group('double')))
+            elif match.group('op'):
+                tokens.append(('op', match.group('op')))
+            elif match.group('word'):
+                tokens.append(('word', match.group('word')))
+        return tokens
+
+    # Returning True if the token is the keyword
+    def __isKeyword(self, tokens: List[Tuple[str, str]], position: int, keyword: str) -> bool:
+        return position < len(tokens) and tokens[position][0] == 'word' and tokens[position][1].lower() == keyword
+
+    # expression := term ('or' term)*
+    def __parseOr(self, tokens: List[Tuple[str, str]], position: int, conditions: List[QueryCondition]) -> Tuple[Any, int]:
+        term, position = self.__parseAnd(tokens, position, conditions)
+        terms = [term]
+        while self.__isKeyword(tokens, position, 'or'):
+            term, position = self.__parseAnd(tokens, position + 1, conditions)
+            terms.append(term)
+        return (terms[0] if len(terms) == 1 else ('or', terms)), position
+
+    # term := factor ('and' factor)*
+    def __parseAnd(self, tokens: List[Tuple[str, str]], position: int, conditions: List[QueryCondition]) -> Tuple[Any, int]:
+        factor, position = self.__parseFactor(tokens, position, conditions)
+        factors = [factor]
+        while self.__isKeyword(tokens, position, 'and'):
+            factor, position = self.__parseFactor(tokens, position + 1, conditions)
+            factors.append(factor)
+        return (factors[0] if len(factors) == 1 else ('and', factors)), position
+
+    # factor := 'not' factor | '(' expression ')' | path [operator value]
+    def __parseFactor(self, tokens: List[Tuple[str, str]], position: int, conditions: List[QueryCondition]) -> Tuple[Any, int]:
+
+        if position >= len(tokens):
+            raise ValueError("Incomplete query, a condition is missing")
+        kind, text = tokens[position]
+
+        if self.__isKeyword(tokens, position, 'not'):
+            factor, position = self.__parseFactor(tokens, position + 1, conditions)
+            return ('not', factor), position
+
+        if (kind, text) == ('op', '('):
+            expression, position = self.__parseOr(tokens, position + 1, conditions)
+            if position >= len(tokens) or tokens[position] != ('op', ')'):
+                raise ValueError("Missing ')' in the query")
+            return expression, position + 1
+
+        if kind != 'word' or text.lower() in ('and', 'or', 'where'):
+            raise ValueError(f"Expected an attribute instead of '{text}'")
+
+        # Condition with operator and value, or a path alone (the attribute is set)
+        path = self.__parsePath(text)
+        if position + 1 < len(tokens) and tokens[position + 1][0] == 'op' and tokens[position + 1][1] not in ('(', ')'):
+            op = tokens[position + 1][1]
+            if position + 2 >= len(tokens) or tokens[position + 2][0] == 'op':
+                raise ValueError(f"Missing value after '{text}{op}'")
+            condition = QueryCondition(text, path, op, tokens[position + 2][1])
+            position += 3
+        else:
+            condition = QueryCondition(text, path)
+            position += 1
+
+        conditions.append(condition)
+        return ('condition', condition), position
+
+    # Splitting the path into steps: 'psus[*].operSt' -> ('psus', '*', 'operSt')
+    def __parsePath(self, text: str) -> Tuple[Any, ...]:
+        steps: List[Any] = []
+        for name, index in self.PATH_STEP.findall(text):
+            if name:
+                steps.append(name)
+            else:
+                steps.append('*' if index == '*' else int(index))
+        if not steps or not isinstance(steps[0], str) or steps[0] == '*':
+            raise ValueError(f"Invalid attribute '{text}'")
+        return tuple(steps)
+
+    # Compiling the expression tree into a predicate of the items
+    def __predicate(self, tree: Any) -> Callable[[Any], bool]:
+        if tree is None:
+            return lambda item: True
+        kind = tree[0]
+        if kind == 'condition':
+            condition = tree[1]
+            return lambda item: condition.matches(self.__values(item, condition.path))
+        if kind == 'not':
+            inner = self.__predicate(tree[1])
+            return lambda item: not inner(item)
+        parts = [self.__predicate(part) for part in tree[1]]
+        if kind == 'and':
+            return lambda item: all(part(item) for part in parts)
+        return lambda item: any(part(item) for part in parts)
+
+    # Returning the values of the path in the item (attributes, pseudo attributes), the attribute names applied to a
+    # list read the attribute of every entry (psus.operSt is psus[*].operSt)
+    def __values(self, item: Tuple[Any, Dict[str, Any]], path: Tuple[Any, ...]) -> List[Any]:
+        attributes, pseudo = item
+        values = [pseudo[path[0]] if path[0] in pseudo else attributes.get(path[0])]
+        for step in path[1:]:
+            next_values: List[Any] = []
+            for value in values:
+                if value is None:
+                    continue
+                if step == '*':
+                    next_values.extend(value if isinstance(value, (list, tuple)) else [value])
+                elif isinstance(step, int):
+                    if isinstance(value, (list, tuple)) and -len(value) <= step < len(value):
+                        next_values.append(value[step])
+                elif isinstance(value, (list, tuple)):
+                    next_values.extend(entry.get(step) for entry in value if hasattr(entry, 'get'))
+                elif hasattr(value, 'get'):
+                    next_values.append(value.get(step))
+            values = next_values
+        return values
+
+    # Returning all the item keys of the target (full scan)
+    def __allItems(self, graph: nx.Graph, target: str) -> List[Any]:
+        if target == 'nodes':
+            return list(graph.nodes)
+        if target == 'edges':
+            return [self.__edgeKey(u, v, key) for u, v, key, _ in keyedEdges(graph)]
+        table: Optional[InterfaceTable] = graph.graph.get('interface_table')
+        return list(range(len(table))) if table is not None else []
+
+    # Returning the key of an edge, the same for both orientations, (u, v, key) for the links of a multigraph
+    def __edgeKey(self, u: Any, v: Any, key: Any = None) -> Tuple[Any, ...]:
+        nodes = (u, v) if str(u) <= str(v) else (v, u)
+        return nodes if key is None else nodes + (key,)
+
+    # Returning the item (attributes, pseudo attributes) of the key, None if it is not in the Graph anymore
+    def __item(self, graph: nx.Graph, target: str, key: Any, table: Optional[InterfaceTable]) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        if target == 'nodes':
+            return (graph.nodes[key], {'name': key}) if key in graph else None
+        if target == 'edges':
+            return (graph.edges[key], {'nodes': list(key[:2])}) if graph.has_edge(*key) else None
+        return (_TableRow(table, key), {}) if table is not None else None
+
+    # Returning the candidates of the indexed conditions of the top level 'and' (intersection, in the order of the
+    # first index) and the plan, (None, "") when no condition uses an index
+    def __candidates(self, graph: nx.Graph, target: str, tree: Any) -> Tuple[Optional[List[Any]], str]:
+
+        conjuncts = [] if tree is None else (tree[1] if tree[0] == 'and' else [tree])
+        candidates: Optional[List[Any]] = None
+        plans: List[str] = []
+
+        for conjunct in conjuncts:
+            found = self.__indexed(graph, target, conjunct)
+            if found is None:
+                continue
+            keys, plan = found
+            plans.append(plan)
+            if candidates is None:
+                candidates = keys
+            else:
+                selected = set(keys)
+                candidates = [key for key in candidates if key in selected]
+
+        return candidates, ("index " + ", ".join(plans) if plans else "")
+
+    # Returning the (keys, plan) of a condition, or of an 'or' of conditions, that uses an index. None otherwise
+    def __indexed(self, graph: nx.Graph, target: str, tree: Any) -> Optional[Tuple[List[Any], str]]:
+
+        # Union of the indexed conditions (every member must use an index)
+        if tree[0] == 'or':
+            keys: Dict[Any, None] = {}
+            plans = []
+            for part in tree[1]:
+                found = self.__indexed(graph, target, part)
+                if found is None:
+                    return None
+                keys.update(dict.fromkeys(found[0]))
+                plans.append(found[1])
+            return list(keys), "(" + " | ".join(plans) + ")"
+
+        if tree[0] != 'condition':
+            return None
+        condition: QueryCondition = tree[1]
+        attribute = condition.attribute()
+        if attribute is None or condition.op is None or condition.op == '~':
+            return None
+
+        if target == 'nodes':
+            return self.__indexedNodes(graph, condition, attribute)
+        if target == 'interfaces':
+            return self.__indexedRows(graph, condition, attribute)
+        return self.__indexedEdges(graph, condition, attribute)
+
+    # Node Index: role, id and podId, and the node name (equality only)
+    def __indexedNodes(self, graph: nx.Graph, condition: QueryCondition, attribute: str) -> Optional[Tuple[List[Any], str]]:
+        index = graphNodeIndex(graph)
+        if condition.op != '==':
+            return None
+        if attribute == 'name':
+            return ([condition.value] if condition.value in graph else []), f"name={condition.value}"
+        if index is None:
+            return None
+        if attribute == 'role':
+            return [node for node, _ in nodesWithRole(graph, str(condition.value))], f"role={condition.value}"
+        if attribute == 'id':
+            node = nodeNameById(graph, condition.value)
+            return ([node] if node is not None else []), f"id={condition.value}"
+        if attribute == 'podId':
+            return index.nodesInPod(condition.value), f"podId={condition.value}"
+        return None
+
+    # Interface Table: node_id, categorical columns (equality) and numeric columns (comparisons with a number)
+    def __indexedRows(self, graph: nx.Graph, condition: QueryCondition, attribute: str) -> Optional[Tuple[List[Any], str]]:
+        table: Optional[InterfaceTable] = graph.graph.get('interface_table')
+        if table is None:
+            return None
+        if attribute == 'node_id' and condition.op == '==':
+            return table.nodeRows(condition.value), f"node_id={condition.value}"
+        if attribute in InterfaceTable.CATEGORY_COLUMNS and condition.op == '==':
+            rows: List[int] = []
+            for label in table.labels(attribute):
+                if label.lower() == str(condition.value).lower():
+                    rows += table.select(**{attribute: label})
+            return sorted(rows), f"{attribute}={condition.value}"
+        if attribute in InterfaceTable.NUMBER_COLUMNS + InterfaceTable.COUNTER_COLUMNS and condition.number is not None:
+            compare, number = QueryCondition.OPERATORS[condition.op], condition.number
+            return table.where(attribute, lambda value: compare(value, number)), f"{attribute}{condition.op}{condition.value}"
+        return None
+
+    # Edges: the node names/ids through the adjacency of the node, the counters through the Interface Table rows
+    def __indexedEdges(self, graph: nx.Graph, condition: QueryCondition, attribute: str) -> Optional[Tuple[List[Any], str]]:
+
+        # Edges of a node: 'nodes==leaf101', 'source_node_id==101', 'dest_node_id==201'
+        if condition.op == '==' and attribute in ('nodes', 'source_node_id', 'dest_node_id'):
+            node = condition.value if attribute == 'nodes' else nodeNameById(graph, condition.value)
+            edges = [self.__edgeKey(u, v, key) for u, v, key, _ in keyedEdges(graph, [node])] if node is not None and node in graph else []
+            return edges, f"{attribute}={condition.value}"
+
+        # Edge counters: 'source_cRCAlignErrors>0', the rows of the Interface Table mapped to the edges of the row node
+        table: Optional[InterfaceTable] = graph.graph.get('interface_table')
+        side, _, counter = attribute.partition('_')
+        if table is None or side not in ('source', 'dest') or counter not in InterfaceTable.COUNTER_COLUMNS or condition.number is None:
+            return None
+        compare, number = QueryCondition.OPERATORS[condition.op], condition.number
+        rows = set(table.where(counter, lambda value: compare(value, number)))
+        found: Dict[Any, None] = {}
+        for node_id in dict.fromkeys(table.value(row, 'node_id') for row in sorted(rows)):
+            node = nodeNameById(graph, node_id)
+            if node is None:
+                continue
+            for u, v, key, data in keyedEdges(graph, [node]):
+                if data.get(side + '_row') in rows:
+                    found[self.__edgeKey(u, v, key)] = None
+        return list(found), f"{attribute}{condition.op}{condition.value}"
+
+#########################################################################################################
+# _TableRow Class, dict read interface over a row of the Interface Table (the values of InterfaceTable. #
+# value: labels for the categorical columns, None for the missing numbers)                              #
+#########################################################################################################
+
+class _TableRow:
+
+    __slots__ = ('table', 'row')
+
+    def __init__(self, table: InterfaceTable, row: int) -> None:
+        self.table: InterfaceTable = table
+        self.row: int = row
+
+    # Returning the value of the column, default for the missing values and unknown columns
+    def get(self, column: str, default: Any = None) -> Any:
+        try:
+            value = self.table.value(self.row, column)
+        except KeyError:
+            return default
+        return default if value is None else value
@@ -0,0 +1,357 @@
+# coding=utf-8
+
+#########################################################################
+#  Class that will compute the leaf-to-leaf paths through the spines   #
+#  and their ECMP width from the usable fabric links of the Graph      #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Dict, Type, List, Optional, Set, Tuple
+from analysis.aci_error_analyzer import FabricErrorAnalyzer
+from model.aci_counter_store import CounterStore
+from model.aci_node_index import nodeNameById, nodesWithRole
+from model.aci_graph import keyedEdges
+from collections import deque
+import networkx as nx
+import itertools
+
+###########################
+# Private Singleton Class #
+###########################
+
+class _PrivateCookie(type):
+
+    _instances: Dict[Type[Any], Any] = {}
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+
+        if cls not in cls._instances:
+            instance = super().__call__(*args, **kwargs)
+            cls._instances[cls] = instance
+        return cls._instances[cls]
+
+#########################################################################################################
+# LeafPathResult Class, the equal-cost shortest paths between two leaves                                #
+#########################################################################################################
+
+class LeafPathResult:
+
+    __slots__ = ('source', 'dest', 'hops', 'ecmp', 'paths', 'spines')
+
+    def __init__(self, source: str, dest: str, hops: Optional[int], ecmp: int, paths: List[List[str]], spines: List[str]) -> None:
+        self.source: str = source
+        self.dest: str = dest
+        self.hops: Optional[int] = hops
+        self.ecmp: int = ecmp
+        self.paths: List[List[str]] = paths
+        self.spines: List[str] = spines
+
+    # Returning the result as a plain dict (exports)
+    def to_dict(self) -> Dict[str, Any]:
+        return {'source': self.source, 'dest': self.dest, 'hops': self.hops, 'ecmp': self.ecmp, 'paths': self.paths, 'spines': self.spines}
+
+#########################################################################################################
+# FabricPathEngine Class, kept in graph.graph['path_engine']. The usable fabric links (not oper-down,  #
+# LLDP adjacency not lost, not erroring) are kept per pair of nodes, a pair is adjacent while one of   #
+# its parallel links is usable. The shortest paths of every source leaf (distance, number of equal-    #
+# cost paths and predecessors, only the spines are transit nodes) are computed on first use and        #
+# cached: a pair that changes only drops the sources whose paths can change                            #
+#########################################################################################################
+
+class FabricPathEngine:
+
+    # Paths listed per leaf pair (the ECMP width counts all of them)
+    MAX_PATHS: int = 16
+
+    # Operational states of a fabric link side that are usable (None: not collected)
+    USABLE_OPER_ST: Tuple[Any, ...] = ('up', None, 'N/A')
+
+    def __init__(self, graph: nx.Graph) -> None:
+        self.graph: nx.Graph = graph
+        self.stats: Dict[str, int] = {'links': 0, 'excluded': 0, 'computed': 0, 'invalidated': 0, 'changes': 0}
+        self.__leaves: Set[Any] = set()
+        self.__spines: Set[Any] = set()
+        self.__excluded: Dict[Tuple[Any, Any, Any], str] = {}
+        self.__usable: Dict[Tuple[Any, Any], Set[Any]] = {}
+        self.__adjacency: Dict[Any, Set[Any]] = {}
+        self.__cache: Dict[Any, Tuple[Dict[Any, int], Dict[Any, int], Dict[Any, List[Any]]]] = {}
+        self.__erroring: Set[Tuple[Any, Any, Any]] = set()
+        self.error_source: str = "not checked"
+
+    ##################
+    # Public Methods #
+    ##################
+
+    # Method that reads the roles and checks every fabric link, only the links whose state changed update the
+    # cached paths. 'erroring' are the keys (linkKey) of the links with errors. Returns the links that changed
+    def refresh(self, erroring: Optional[Set[Tuple[Any, Any, Any]]] = None) -> List[Tuple[Any, Any, Any]]:
+
+        if erroring is not None:
+            self.__erroring = erroring
+
+        # A role change (new switch, decommission) drops all the cached paths
+        leaves, spines = {node for node, _ in nodesWithRole(self.graph, 'leaf')}, {node for node, _ in nodesWithRole(self.graph, 'spine')}
+        if leaves != self.__leaves or spines != self.__spines:
+            self.__leaves, self.__spines = leaves, spines
+            self.stats['invalidated'] += len(self.__cache)
+            self.__cache.clear()
+
+        # Auxilear Dict with the reason of every excluded link (None: usable)
+        states: Dict[Tuple[Any, Any, Any], Optional[str]] = {}
+        switches = leaves | spines
+        for u, v, key, data in keyedEdges(self.graph):
+            if data is not None and not data.get('downlink') and u in switches and v in switches:
+                states[self.linkKey(u, v, key)] = self.__exclusion(u, v, key, data)
+
+        # Links removed from the Graph are not usable anymore
+        changed = [link for link in self.__knownLinks() if link not in states]
+        for link in changed:
+            self.__setLink(link, None, removed=True)
+
+        for link, reason in states.items():
+            if self.__setLink(link, reason):
+                changed.append(link)
+
+        self.stats['links'] = len(states)
+        self.stats['excluded'] = len(self.__excluded)
+        return changed
+
+    # Method that checks the links between two nodes again (subscription events), returns True when one changed
+    def updateLink(self, u: Any, v: Any) -> bool:
+
+        pair = self.linkKey(u, v)[:2]
+        current = {self.linkKey(u, peer, key): data for _, peer, key, data in keyedEdges(self.graph, [u]) if peer == v and data is not None and not data.get('downlink')}
+
+        changed = False
+        for link in [link for link in self.__knownLinks() if link[:2] == pair and link not in current]:
+            changed = self.__setLink(link, None, removed=True) or changed
+        for link, data in current.items():
+            changed = self.__setLink(link, self.__exclusion(link[0], link[1], link[2], data)) or changed
+
+        self.stats['excluded'] = len(self.__excluded)
+        return changed
+
+    # Method that returns the equal-cost shortest paths between two leaves through the spines
+    def paths(self, source: Any, dest: Any) -> LeafPathResult:
+
+        distances, counts, predecessors = self.__shortestPaths(source)
+        if dest not in distances or dest == source:
+            return LeafPathResult(source, dest, None if dest != source else 0, 0, [], [])
+
+        paths = [list(reversed(path)) for path in itertools.islice(self.__walk(dest, source, predecessors), self.MAX_PATHS)]
+        spines = sorted({node for node in self.__dagNodes(dest, predecessors) if node in self.__spines}, key=str)
+        return LeafPathResult(source, dest, distances[dest], counts[dest], paths, spines)
+
+    # Method that returns the paths of every pair of leaves, the pairs with less ECMP width first
+    def allPaths(self) -> List[LeafPathResult]:
+        results = [self.paths(source, dest) for source, dest in itertools.combinations(sorted(self.__leaves, key=str), 2)]
+        return sorted(results, key=lambda result: (result.ecmp, str(result.source), str(result.dest)))
+
+    # Method that returns the excluded links (linkKey) and the reason
+    def excluded(self) -> Dict[Tuple[Any, Any, Any], str]:
+        return dict(self.__excluded)
+
+    # Method that returns the leaves of the engine
+    def leaves(self) -> List[Any]:
+        return sorted(self.__leaves, key=str)
+
+    # Method that returns the spines of the engine
+    def spines(self) -> List[Any]:
+        return sorted(self.__spines, key=str)
+
+    # Method that returns the keys (linkKey) of the usable links
+    def usableLinks(self) -> List[Tuple[Any, Any, Any]]:
+        return sorted(((u, v, key) for (u, v), keys in self.__usable.items() for key in keys), key=lambda link: tuple(map(str, link)))
+
+    # Canonical key of a link: both nodes (the edges of an undirected Graph are seen in both orders) and the edge
+    # key (None for the Graphs that are not multigraphs)
+    @staticmethod
+    def linkKey(u: Any, v: Any, key: Any = None) -> Tuple[Any, Any, Any]:
+        return (u, v, key) if str(u) <= str(v) else (v, u, key)
+
+    ####################
+    # Privates Methods #
+    ####################
+
+    # Returning why the link is not usable, None when it is usable
+    def __exclusion(self, u: Any, v: Any, key: Any, data: Any) -> Optional[str]:
+        for side in ('source', 'dest'):
+            oper_st = data.get(side + '_interface_operSt')
+            if oper_st not in self.USABLE_OPER_ST:
+                return f"{side} {data.get(side + '_interface_id', 'N/A')} {oper_st}"
+        if data.get('lldp_adjacency') == 'lost':
+            return "lldp adjacency lost"
+        if self.linkKey(u, v, key) in self.__erroring:
+            return "errors"
+        return None
+
+    # Returning the links already seen by the engine (usable or excluded)
+    def __knownLinks(self) -> List[Tuple[Any, Any, Any]]:
+        return [(u, v, key) for (u, v), keys in self.__usable.items() for key in keys] + list(self.__excluded)
+
+    # Updating the state of a link (reason None: usable). The nodes are adjacent while one of their links is usable,
+    # when the adjacency changes the cached sources whose paths can change are dropped. Returns True when the link changed
+    def __setLink(self, link: Tuple[Any, Any, Any], reason: Optional[str], removed: bool = False) -> bool:
+
+        u, v, key = link
+        usable = reason is None and not removed
+        keys = self.__usable.setdefault((u, v), set())
+        was_usable = key in keys
+
+        if removed:
+            self.__excluded.pop(link, None)
+        elif not usable:
+            self.__excluded[link] = reason
+        if usable == was_usable:
+            return False
+
+        adjacent = bool(keys)
+        if usable:
+            keys.add(key)
+            self.__excluded.pop(link, None)
+        else:
+            keys.discard(key)
+        self.stats['changes'] += 1
+        if adjacent == bool(keys):
+            return True
+
+        if keys:
+            self.__adjacency.setdefault(u, set()).add(v)
+            self.__adjacency.setdefault(v, set()).add(u)
+        else:
+            self.__adjacency[u].discard(v)
+            self.__adjacency[v].discard(u)
+
+        # Only the sources whose shortest paths use the pair (removed) or can be shortened or widened by it (added)
+        stale = [source for source, cached in self.__cache.items() if self.__affects(source, cached, u, v, bool(keys))]
+        for source in stale:
+            del self.__cache[source]
+        self.stats['invalidated'] += len(stale)
+        return True
+
+    # Returning True when the change of the link can change the shortest paths of the cached source
+    def __affects(self, source: Any, cached: Tuple[Dict[Any, int], Dict[Any, int], Dict[Any, List[Any]]], u: Any, v: Any, usable: bool) -> bool:
+        distances, _, predecessors = cached
+        if not usable:
+            return u in predecessors.get(v, ()) or v in predecessors.get(u, ())
+        for near, far in ((u, v), (v, u)):
+            if near in distances and (near == source or near in self.__spines) and (far not in distances or distances[near] + 1 <= distances[far]):
+                return True
+        return False
+
+    # Returning the (cached) distance, number of equal-cost paths and predecessors of every node from the source leaf,
+    # breadth-first over the usable links, only the source and the spines forward the paths
+    def __shortestPaths(self, source: Any) -> Tuple[Dict[Any, int], Dict[Any, int], Dict[Any, List[Any]]]:
+
+        cached = self.__cache.get(source)
+        if cached is not None:
+            return cached
+
+        distances, counts, predecessors = {source: 0}, {source: 1}, {source: []}
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            if node != source and node not in self.__spines:
+                continue
+            for peer in self.__adjacency.get(node, ()):
+                if peer not in distances:
+                    distances[peer], counts[peer], predecessors[peer] = distances[node] + 1, 0, []
+                    queue.append(peer)
+                if distances[peer] == distances[node] + 1:
+                    counts[peer] += counts[node]
+                    predecessors[peer].append(node)
+
+        self.__cache[source] = (distances, counts, predecessors)
+        self.stats['computed'] += 1
+        return self.__cache[source]
+
+    # Walking the predecessors from the destination back to the source (paths in reverse order)
+    def __walk(self, node: Any, source: Any, predecessors: Dict[Any, List[Any]]) -> Any:
+        if node == source:
+            yield [node]
+            return
+        for previous in sorted(predecessors[node], key=str):
+            for path in self.__walk(previous, source, predecessors):
+                yield [node] + path
+
+    # Returning the nodes of all the shortest paths to the destination
+    def __dagNodes(self, dest: Any, predecessors: Dict[Any, List[Any]]) -> Set[Any]:
+        nodes, pending = {dest}, [dest]
+        while pending:
+            for previous in predecessors[pending.pop()]:
+                if previous not in nodes:
+                    nodes.add(previous)
+                    pending.append(previous)
+        return nodes
+
+#########################################################################################################
+# FabricPathAnalyzer Class, keeps the Path Engine of the Graph updated (fabric links state and errors) #
+# and answers the leaf-to-leaf path and redundancy questions                                            #
+#########################################################################################################
+
+class FabricPathAnalyzer(metaclass=_PrivateCookie):
+
+    def __init__(self) -> None:
+        self.__error_analyzer: FabricErrorAnalyzer = FabricErrorAnalyzer()
+
+    ##################
+    # Public Methods #
+    ##################
+
+    # Function that returns the Path Engine of the Graph refreshed with the current state of the fabric links.
+    # The erroring links are the ones whose counters increased in the window of the Counter Store. Without a
+    # Counter Store the lifetime counters are only used when 'lifetime_errors' is set (a link with old CRCs
+    # would be excluded forever), the source of the erroring links is kept in engine.error_source
+    def pathEngine(self, graph: nx.Graph, exclude_errors: bool = True, window: float = CounterStore.DEFAULT_WINDOW, lifetime_errors: bool = False) -> FabricPathEngine:
+
+        engine: Optional[FabricPathEngine] = graph.graph.get('path_engine')
+        if engine is None or engine.graph is not graph:
+            engine = graph.graph['path_engine'] = FabricPathEngine(graph)
+
+        erroring: Set[Tuple[Any, Any, Any]] = set()
+        store: Optional[CounterStore] = graph.graph.get('counter_store')
+        if not exclude_errors:
+            engine.error_source = "not checked"
+        elif store is not None:
+            erroring = {FabricPathEngine.linkKey(result.source_node, result.dest_node, result.key) for result in self.__error_analyzer.analyzeFabricErrorRates(graph, store, window)}
+            engine.error_source = f"error rates over the last {window:g}s (counter store)"
+        elif lifetime_errors:
+            erroring = {FabricPathEngine.linkKey(result.source_node, result.dest_node, result.key) for result in self.__error_analyzer.analyzeFabricErrors(graph)}
+            engine.error_source = "lifetime error counters"
+        else:
+            engine.error_source = "not checked, no counter store"
+
+        engine.refresh(erroring)
+        return engine
+
+    # Function that returns the paths between two leaves (node names or IDs)
+    def leafPaths(self, graph: nx.Graph, source: Any, dest: Any, exclude_errors: bool = True, lifetime_errors: bool = False) -> LeafPathResult:
+        engine = self.pathEngine(graph, exclude_errors, lifetime_errors=lifetime_errors)
+        return engine.paths(self.__leaf(graph, engine, source), self.__leaf(graph, engine, dest))
+
+    # Function that returns the paths of every pair of leaves, the pairs with less redundancy first
+    def fabricRedundancy(self, graph: nx.Graph, exclude_errors: bool = True, lifetime_errors: bool = False) -> List[LeafPathResult]:
+        return self.pathEngine(graph, exclude_errors, lifetime_errors=lifetime_errors).allPaths()
+
+    # Function that checks again the fabric links attached to an interface after an event, only when the
+    # Graph already has a Path Engine
+    def linkEvent(self, graph: nx.Graph, node: Any) -> None:
+        engine: Optional[FabricPathEngine] = graph.graph.get('path_engine')
+        if engine is None:
+            return
+        for peer in {peer for _, peer, data in graph.edges(node, data=True) if data is not None and not data.get('downlink')}:
+            engine.updateLink(node, peer)
+
+    ####################
+    # Privates Methods #
+    ####################
+
+    # Returning the Graph node of a leaf given by name or node ID
+    def __leaf(self, graph: nx.Graph, engine: FabricPathEngine, leaf: Any) -> Any:
+        node = leaf if leaf in graph else nodeNameById(graph, leaf)
+        if node is None or node not in engine.leaves():
+            raise ValueError(f"Unknown leaf '{leaf}', expected a leaf name or node ID")
+        return node
@@ -0,0 +1,224 @@
+# coding=utf-8
+
+#########################################################################
+#  Class that will answer the port-level questions over the Port Graph  #
+#  (port paths, vPC pairs and blast radius of a failure)               #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Dict, Type, Iterable, List, Optional, Set, Tuple
+from analysis.aci_failure_simulator import FabricFailureSimulator, FailureScenario
+from model.aci_port_graph import PortGraph
+from model.aci_node_index import nodeNameById, nodesWithRole
+import networkx as nx
+import time
+
+###########################
+# Private Singleton Class #
+###########################
+
+class _PrivateCookie(type):
+
+    _instances: Dict[Type[Any], Any] = {}
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+
+        if cls not in cls._instances:
+            instance = super().__call__(*args, **kwargs)
+            cls._instances[cls] = instance
+        return cls._instances[cls]
+
+#########################################################################################################
+# PortPathResult Class, the shortest port-level path between two endpoints and the devices reachable  #
+#########################################################################################################
+
+class PortPathResult:
+
+    __slots__ = ('source', 'dest', 'path', 'reachable_devices')
+
+    def __init__(self, source: str, dest: str, path: List[str], reachable_devices: int) -> None:
+        self.source: str = source
+        self.dest: str = dest
+        self.path: List[str] = path
+        self.reachable_devices: int = reachable_devices
+
+    # Returning the result as a plain dict (exports)
+    def to_dict(self) -> Dict[str, Any]:
+        return {'source': self.source, 'dest': self.dest, 'path': self.path, 'reachable_devices': self.reachable_devices}
+
+#########################################################################################################
+# VpcPairResult Class, the leaves that share dual-homed devices and the ports of every device by leaf  #
+#########################################################################################################
+
+class VpcPairResult:
+
+    __slots__ = ('leaves', 'devices')
+
+    def __init__(self, leaves: Tuple[Any, ...]) -> None:
+        self.leaves: Tuple[Any, ...] = leaves
+        self.devices: List[Tuple[Any, Dict[Any, List[str]], List[str]]] = []
+
+    # Devices with a down port
+    def degraded(self) -> List[Tuple[Any, Dict[Any, List[str]], List[str]]]:
+        return [device for device in self.devices if device[2]]
+
+    # Returning the result as a plain dict (exports)
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'leaves'  : list(self.leaves),
+            'devices' : [{'device': device, 'ports': {str(leaf): ports for leaf, ports in by_leaf.items()}, 'down': down} for device, by_leaf, down in self.devices],
+        }
+
+#########################################################################################################
+# BlastRadiusResult Class, what loses the reachability to the spines when the scenario fails            #
+#########################################################################################################
+
+class BlastRadiusResult:
+
+    __slots__ = ('scenario', 'failed_ports', 'isolated_switches', 'lost_devices', 'degraded_devices', 'seconds')
+
+    def __init__(self, scenario: str) -> None:
+        self.scenario: str = scenario
+        self.failed_ports: int = 0
+        self.isolated_switches: List[Any] = []
+        self.lost_devices: List[Tuple[Any, List[str]]] = []
+        self.degraded_devices: List[Tuple[Any, List[str]]] = []
+        self.seconds: float = 0.0
+
+    # Returning the result as a plain dict (exports)
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'scenario'          : self.scenario,
+            'failed_ports'      : self.failed_ports,
+            'isolated_switches' : self.isolated_switches,
+            'lost_devices'      : [{'device': device, 'ports': ports} for device, ports in self.lost_devices],
+            'degraded_devices'  : [{'device': device, 'lost_ports': ports} for device, ports in self.degraded_devices],
+        }
+
+#########################################################################################################
+# PortAnalyzer Class, keeps the Port Graph of the Graph (graph.graph['port_graph']) built only when     #
+# the Graph gets new nodes, edges or interfaces, the port states are read again on every question      #
+#########################################################################################################
+
+class PortAnalyzer(metaclass=_PrivateCookie):
+
+    def __init__(self) -> None:
+        self.__failure_simulator: FabricFailureSimulator = FabricFailureSimulator()
+
+    ##################
+    # Public Methods #
+    ##################
+
+    # Function that returns the Port Graph of the Graph with the current port states
+    def portGraph(self, graph: nx.Graph) -> PortGraph:
+        ports: Optional[PortGraph] = graph.graph.get('port_graph')
+        if ports is None or ports.signature != PortGraph.signatureOf(graph):
+            ports = graph.graph['port_graph'] = PortGraph(graph)
+        else:
+            ports.refreshStates(graph)
+        return ports
+
+    # Function that returns the shortest path over the usable ports between two endpoints: switch or device (name
+    # or node ID) or NODE:INTERFACE. The devices are not transit nodes
+    def portPath(self, graph: nx.Graph, source: str, dest: str) -> PortPathResult:
+
+        ports = self.portGraph(graph)
+        source_id, dest_id = self.__endpoint(graph, ports, source), self.__endpoint(graph, ports, dest)
+        view = ports.usableView(devices=(source_id, dest_id))
+
+        try:
+            path = [ports.text(node) for node in nx.shortest_path(view, source_id, dest_id)] if source_id in view and dest_id in view else []
+        except nx.NetworkXNoPath:
+            path = []
+
+        # Devices attached to the usable ports reachable from the source
+        component = nx.node_connected_component(view, source_id) if source_id in view else set()
+        reachable = {peer for node in component if ports.kinds[node] == PortGraph.PORT for peer in ports.topology[node] if ports.kinds[peer] == PortGraph.DEVICE}
+        reachable.discard(source_id)
+
+        return PortPathResult(ports.text(source_id), ports.text(dest_id), path, len(reachable))
+
+    # Function that returns the leaves that share dual-homed devices (vPC pairs), the devices of every pair with
+    # their ports by leaf and the down ports
+    def vpcPairs(self, graph: nx.Graph) -> List[VpcPairResult]:
+
+        ports = self.portGraph(graph)
+        pairs: Dict[Tuple[Any, ...], VpcPairResult] = {}
+        for device in ports.idsOf(PortGraph.DEVICE):
+            by_leaf: Dict[Any, List[str]] = {}
+            for port in sorted(ports.topology[device]):
+                by_leaf.setdefault(ports.labels[ports.parents[port]], []).append(ports.labels[port][1])
+            if len(by_leaf) < 2:
+                continue
+            leaves = tuple(sorted(by_leaf, key=str))
+            down = [ports.text(port) for port in sorted(ports.topology[device]) if port in ports.down]
+            pairs.setdefault(leaves, VpcPairResult(leaves)).devices.append((ports.labels[device], by_leaf, down))
+
+        return [pairs[leaves] for leaves in sorted(pairs, key=lambda leaves: tuple(map(str, leaves)))]
+
+    # Function that returns the blast radius of every scenario (text as FabricFailureSimulator.parseScenario or
+    # FailureScenario): the switches and devices that lose the reachability to the spines over the usable ports
+    def blastRadius(self, graph: nx.Graph, scenarios: Iterable[Any]) -> List[BlastRadiusResult]:
+        ports = self.portGraph(graph)
+        return [self.__blastRadius(graph, ports, scenario if isinstance(scenario, FailureScenario) else self.__failure_simulator.parseScenario(graph, scenario)) for scenario in scenarios]
+
+    ####################
+    # Privates Methods #
+    ####################
+
+    # Returning the blast radius of a scenario
+    def __blastRadius(self, graph: nx.Graph, ports: PortGraph, scenario: FailureScenario) -> BlastRadiusResult:
+
+        started = time.perf_counter()
+        result = BlastRadiusResult(scenario.label)
+
+        # Auxilear Set with the failed IDs (nodes with their ports, linecard ports and interfaces)
+        failed: Set[int] = set()
+        for node in scenario.nodes:
+            node_id = ports.nodeId(node)
+            if node_id is not None:
+                failed.add(node_id)
+                failed.update(ports.ports(node_id) if ports.kinds[node_id] == PortGraph.SWITCH else ())
+        for node, slot in scenario.linecards:
+            node_id = ports.nodeId(node)
+            failed.update(port for port in (ports.ports(node_id) if node_id is not None else ()) if self.__failure_simulator.linecardOf(ports.labels[port][1]) == slot)
+        failed.update(port for port in map(ports.nodeId, scenario.interfaces) if port is not None)
+        result.failed_ports = len([node for node in failed if ports.kinds[node] == PortGraph.PORT and node not in ports.down])
+
+        spines = [node_id for node_id in map(ports.nodeId, (node for node, _ in nodesWithRole(graph, 'spine'))) if node_id is not None]
+        before = self.__core(ports.usableView(), spines)
+        after = self.__core(ports.usableView(hidden=failed), spines)
+
+        result.isolated_switches = sorted((ports.labels[node] for node in before - after if ports.kinds[node] == PortGraph.SWITCH and node not in failed), key=str)
+        for device in ports.idsOf(PortGraph.DEVICE):
+            attached = sorted(port for port in ports.topology[device] if port in before)
+            if not attached or device in failed:
+                continue
+            lost = [ports.text(port) for port in attached if port not in after]
+            if len(lost) == len(attached):
+                result.lost_devices.append((ports.labels[device], lost))
+            elif lost:
+                result.degraded_devices.append((ports.labels[device], lost))
+
+        result.seconds = time.perf_counter() - started
+        return result
+
+    # Returning the IDs connected to the spines in the view
+    def __core(self, view: nx.Graph, spines: List[int]) -> Set[int]:
+        core: Set[int] = set()
+        for spine in spines:
+            if spine in view and spine not in core:
+                core |= nx.node_connected_component(view, spine)
+        return core
+
+    # Returning the ID of an endpoint: switch or device (name or node ID) or NODE:INTERFACE
+    def __endpoint(self, graph: nx.Graph, ports: PortGraph, text: str) -> int:
+        name, _, port = str(text).strip().partition(':')
+        node = name if name in graph else nodeNameById(graph, name)
+        node_id = ports.nodeId((node, port.lower()) if port else node)
+        if node_id is None:
+            raise ValueError(f"Unknown endpoint '{text}', expected a switch or device (name or ID) or NODE:INTERFACE")
+        return node_id
@@ -0,0 +1,325 @@
+# coding=utf-8
+
+#########################################################################
+#  Class that will compare two Fabric Graphs (two collections or two    #
+#  snapshots) node by node, edge by edge and attribute by attribute     #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Dict, Type, Iterator, List, Optional, Tuple
+from model.aci_graph_snapshot import valueDigest
+from model.aci_lazy_attributes import LazyAttribute
+from model.aci_edge_attributes import EdgeEndpoint
+from model.aci_graph import keyedEdges
+from model.aci_tenant_index import TenantIndex
+from collections import Counter
+import networkx as nx
+import hashlib
+
+###########################
+# Private Singleton Class #
+###########################
+
+class _PrivateCookie(type):
+
+    _instances: Dict[Type[Any], Any] = {}
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+
+        if cls not in cls._instances:
+            instance = super().__call__(*args, **kwargs)
+            cls._instances[cls] = instance
+        return cls._instances[cls]
+
+#########################################################################################################
+# GraphChange Class, a single change: a node/edge added or removed, or a changed value. 'attribute' is  #
+# the node attribute or edge key, 'item' the key of the list entry (interface, fault code, tenant DN)   #
+# and 'field' the field of the entry ('operSt.operSt' for the nested dicts)                             #
+#########################################################################################################
+
+class GraphChange:
+
+    __slots__ = ('kind', 'target', 'action', 'attribute', 'item', 'field', 'old', 'new')
+
+    def __init__(self, kind: str, target: Any, action: str, attribute: Optional[str] = None, item: Any = None, field: Optional[str] = None, old: Any = None, new: Any = None) -> None:
+        self.kind: str = kind
+        self.target: Any = target
+        self.action: str = action
+        self.attribute: Optional[str] = attribute
+        self.item: Any = item
+        self.field: Optional[str] = field
+        self.old: Any = old
+        self.new: Any = new
+
+    # Returning the change as a plain dict (exports)
+    def to_dict(self) -> Dict[str, Any]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"GraphChange({self.kind} {self.target} {self.action} {self.attribute} {self.item} {self.field})"
+
+#########################################################################################################
+# ChangeSet Class, the changes between the old and the new Graph and the comparison statistics          #
+#########################################################################################################
+
+class ChangeSet:
+
+    def __init__(self, old_label: str, new_label: str) -> None:
+        self.old_label: str = old_label
+        self.new_label: str = new_label
+        self.changes: List[GraphChange] = []
+        self.stats: Dict[str, int] = {'nodes': 0, 'nodes_unchanged': 0, 'attributes_compared': 0, 'edges': 0, 'edges_unchanged': 0}
+
+    # Number of changes
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    # Iterating the changes
+    def __iter__(self) -> Iterator[GraphChange]:
+        return iter(self.changes)
+
+    # Returning the number of changes per (kind, attribute, action), e.g. ('node', 'faults', 'added')
+    def summary(self) -> Dict[Tuple[str, Optional[str], str], int]:
+        return dict(Counter((change.kind, change.attribute, change.action) for change in self.changes))
+
+    # Returning the change set as a plain dict (exports)
+    def to_dict(self) -> Dict[str, Any]:
+        return {'old': self.old_label, 'new': self.new_label, 'stats': dict(self.stats), 'changes': [change.to_dict() for change in self.changes]}
+
+#########################################################################################################
+# ACISnapshotDiff Class. Every node gets a digest per attribute (stored in the snapshot for the blobs   #
+# not read yet) and a node digest over them: the nodes with equal digests are skipped without reading  #
+# their attributes, only the attributes with different digests are compared entry by entry            #
+#########################################################################################################
+
+class ACISnapshotDiff(metaclass=_PrivateCookie):
+
+    # Key fields of the list entries of the node attributes, the other lists are keyed by 'id', 'name' or position
+    ITEM_KEYS: Dict[str, Tuple[str, ...]] = {
+        'interfaces'        : ('id',),
+        'opt_interfaces'    : ('intID',),
+        'sfp'               : ('int_id',),
+        'faults'            : ('code',),
+        'filesystem'        : ('path',),
+        'apic_ntp'          : ('remote',),
+        'apic_filesystem'   : ('mount',),
+    }
+
+    # Node attributes and edge keys that change on every collection and are not compared
+    IGNORED_NODE_KEYS: Tuple[str, ...] = ('interface_rows',)
+    IGNORED_EDGE_FIELDS: Tuple[str, ...] = ('row', 'leaf_row')
+
+    # Numeric fields whose drift below the tolerance is noise (SFP diagnostics, sensors)
+    NUMERIC_TOLERANCE: Dict[str, float] = {'temp': 2.0, 'volt': 0.05, 'txPwr': 0.5, 'rxPwr': 0.5, 'bias': 1.0, 'value': 2.0}
+
+    ##################
+    # Public Methods #
+    ##################
+
+    # Method that compares the two Graphs, the edge counters (cumulative) are only compared with include_counters
+    def diffGraphs(self, old: nx.Graph, new: nx.Graph, include_counters: bool = False) -> ChangeSet:
+
+        changes = ChangeSet(self.__label(old, 'old'), self.__label(new, 'new'))
+
+        self.__diffNodes(old, new, changes)
+        self.__diffEdges(old, new, changes, include_counters)
+
+        return changes
+
+    # Method that returns the digest of every attribute of the node (the digests of a snapshot are used for the
+    # attributes not read yet) and the node digest over them
+    def nodeDigests(self, graph: nx.Graph, node: Any) -> Tuple[bytes, Dict[str, bytes]]:
+
+        attributes = graph.nodes[node]
+        stored = ((graph.graph.get('snapshot') or {}).get('digests') or {}).get(node, {})
+
+        # Auxilear Dict with the digest of each attribute
+        digests: Dict[str, bytes] = {}
+        for key in sorted(dict.keys(attributes), key=str):
+            if key in self.IGNORED_NODE_KEYS:
+                continue
+            if isinstance(dict.get(attributes, key), LazyAttribute) and key in stored:
+                digests[key] = stored[key]
+            else:
+                digests[key] = valueDigest(attributes[key])
+
+        node_digest = hashlib.blake2b(digest_size=16)
+        for key, digest in digests.items():
+            node_digest.update(str(key).encode() + b'\0' + digest)
+        return node_digest.digest(), digests
+
+    ####################
+    # Privates Methods #
+    ####################
+
+    # Comparing the nodes: added, removed and, for the nodes with different digests, the changed attributes
+    def __diffNodes(self, old: nx.Graph, new: nx.Graph, changes: ChangeSet) -> None:
+
+        for node in self.__union(old.nodes, new.nodes):
+            changes.stats['nodes'] += 1
+            if node not in new:
+                changes.changes.append(GraphChange('node', node, 'removed', old=old.nodes[node].get('role')))
+                continue
+            if node not in old:
+                changes.changes.append(GraphChange('node', node, 'added', new=new.nodes[node].get('role')))
+                continue
+
+            old_digest, old_digests = self.nodeDigests(old, node)
+            new_digest, new_digests = self.nodeDigests(new, node)
+            if old_digest == new_digest:
+                changes.stats['nodes_unchanged'] += 1
+                continue
+
+            for key in self.__union(old_digests, new_digests):
+                if old_digests.get(key) == new_digests.get(key):
+                    continue
+                changes.stats['attributes_compared'] += 1
+                if key not in new_digests:
+                    changes.changes.append(GraphChange('node', node, 'removed', key, old=old.nodes[node][key]))
+                elif key not in old_digests:
+                    changes.changes.append(GraphChange('node', node, 'added', key, new=new.nodes[node][key]))
+                else:
+                    self.__diffValue(changes, 'node', node, key, old.nodes[node][key], new.nodes[node][key])
+
+    # Comparing the edges (whatever their orientation) link by link (edge key), the 'source_*'/'dest_*' keys are
+    # matched by node. The link of the changes is their 'item' (interfaces of both sides)
+    def __diffEdges(self, old: nx.Graph, new: nx.Graph, changes: ChangeSet, include_counters: bool) -> None:
+
+        old_edges = {(frozenset((u, v)), key): (u, v, data) for u, v, key, data in keyedEdges(old)}
+        new_edges = {(frozenset((u, v)), key): (u, v, data) for u, v, key, data in keyedEdges(new)}
+
+        for key in self.__union(old_edges, new_edges):
+            changes.stats['edges'] += 1
+            link = " <-> ".join(str(interface or '-') for interface in key[1]) if isinstance(key[1], tuple) else None
+            if key not in new_edges:
+                u, v, _ = old_edges[key]
+                changes.changes.append(GraphChange('edge', (u, v), 'removed', item=link))
+                continue
+            if key not in old_edges:
+                u, v, _ = new_edges[key]
+                changes.changes.append(GraphChange('edge', (u, v), 'added', item=link))
+                continue
+
+            # Both switches write the same fabric link, the 'source_*' side is the one that was applied last
+            u, v, old_data = old_edges[key]
+            _, _, new_data = new_edges[key]
+            swap = str(new_data.get('source_node_id')) != str(old_data.get('source_node_id'))
+            old_values = self.__edgeValues(old_data, False, include_counters)
+            new_values = self.__edgeValues(new_data, swap, include_counters)
+            if old_values == new_values:
+                changes.stats['edges_unchanged'] += 1
+                continue
+
+            for field in self.__union(old_values, new_values):
+                self.__diffScalar(changes, 'edge', (u, v), field, link, None, old_values.get(field), new_values.get(field))
+
+    # Comparing two values of an attribute: lists entry by entry, dicts field by field
+    def __diffValue(self, changes: ChangeSet, kind: str, target: Any, attribute: str, old: Any, new: Any) -> None:
+
+        if attribute == 'tenants' and isinstance(old, list) and isinstance(new, list):
+            old_items = {obj.dn: obj.attributes for obj in TenantIndex(old)}
+            new_items = {obj.dn: obj.attributes for obj in TenantIndex(new)}
+        elif isinstance(old, list) and isinstance(new, list):
+            old_items, new_items = self.__keyed(attribute, old), self.__keyed(attribute, new)
+        elif hasattr(old, 'items') and hasattr(new, 'items'):
+            old_items, new_items = {None: old}, {None: new}
+        else:
+            self.__diffScalar(changes, kind, target, attribute, None, None, old, new)
+            return
+
+        for item in self.__union(old_items, new_items):
+            if item not in new_items:
+                changes.changes.append(GraphChange(kind, target, 'removed', attribute, item, old=self.__plain(old_items[item])))
+            elif item not in old_items:
+                changes.changes.append(GraphChange(kind, target, 'added', attribute, item, new=self.__plain(new_items[item])))
+            elif valueDigest(old_items[item]) != valueDigest(new_items[item]):
+                old_fields, new_fields = self.__fields(old_items[item]), self.__fields(new_items[item])
+                for field in self.__union(old_fields, new_fields):
+                    self.__diffScalar(changes, kind, target, attribute, item, field, old_fields.get(field), new_fields.get(field))
+
+    # Adding the change of a single value, the numeric drift below the tolerance of the field is ignored
+    def __diffScalar(self, changes: ChangeSet, kind: str, target: Any, attribute: Optional[str], item: Any, field: Optional[str], old: Any, new: Any) -> None:
+
+        if old == new:
+            return
+
+        tolerance = self.NUMERIC_TOLERANCE.get((field or attribute or '').rsplit('.', 1)[-1])
+        if tolerance is not None:
+            try:
+                if abs(float(new) - float(old)) < tolerance:
+                    return
+            except (TypeError, ValueError):
+                pass
+
+        if kind == 'edge':
+            changes.changes.append(GraphChange(kind, target, 'changed', attribute, item, old=old, new=new))
+        else:
+            changes.changes.append(GraphChange(kind, target, 'changed', attribute, item, field, old, new))
+
+    # Returning the list entries by their key fields
+    def __keyed(self, attribute: str, entries: List[Any]) -> Dict[Any, Any]:
+
+        key_fields = self.ITEM_KEYS.get(attribute)
+
+        # Auxilear Dict with the entries (key -> entry)
+        keyed: Dict[Any, Any] = {}
+        for position, entry in enumerate(entries):
+            if not hasattr(entry, 'get'):
+                keyed[position] = entry
+                continue
+            fields = key_fields or next(((field,) for field in ('id', 'name', 'dn') if entry.get(field) is not None), ())
+            key = tuple(str(entry.get(field)) for field in fields)
+            key = (key[0] if len(key) == 1 else key) if key else position
+            keyed[key if key not in keyed else (key, position)] = entry
+        return keyed
+
+    # Returning the fields of an entry, the nested dicts as 'parent.field'
+    def __fields(self, entry: Any, prefix: str = "") -> Dict[str, Any]:
+
+        if not hasattr(entry, 'items'):
+            return {prefix or 'value': entry}
+
+        # Auxilear Dict with the flat fields
+        fields: Dict[str, Any] = {}
+        for field, value in entry.items():
+            if hasattr(value, 'items'):
+                fields.update(self.__fields(value, prefix + str(field) + '.'))
+            else:
+                fields[prefix + str(field)] = value
+        return fields
+
+    # Returning the compared values of an edge, the sides are swapped when the edge was stored the other way.
+    # The interface names are compared in lower case (l1PhysIf 'eth1/49', LLDP 'Eth1/49')
+    def __edgeValues(self, data: Any, swap: bool, include_counters: bool) -> Dict[str, Any]:
+
+        # Auxilear Dict with the values of the edge
+        values: Dict[str, Any] = {}
+        for key, value in data.items():
+            side, _, field = key.partition('_')
+            if side in ('source', 'dest') and field:
+                if field in self.IGNORED_EDGE_FIELDS or (field in EdgeEndpoint.COUNTER_INDEX and not include_counters):
+                    continue
+                if swap:
+                    key = ('dest_' if side == 'source' else 'source_') + field
+                if field == 'interface_id' and isinstance(value, str):
+                    value = value.lower()
+            elif key in self.IGNORED_EDGE_FIELDS:
+                continue
+            values[key] = value
+        return values
+
+    # Returning the entry as plain values (records as dicts)
+    def __plain(self, entry: Any) -> Any:
+        return entry.to_dict() if hasattr(entry, 'to_dict') else entry
+
+    # Returning the keys of both collections, first the old ones in their order
+    def __union(self, old: Any, new: Any) -> List[Any]:
+        return list(dict.fromkeys(list(old) + list(new)))
+
+    # Returning the label of the Graph (snapshot path and date, or the collection)
+    def __label(self, graph: nx.Graph, default: str) -> str:
+        snapshot = graph.graph.get('snapshot')
+        return f"{snapshot.get('path')} ({snapshot.get('created')})" if snapshot else default
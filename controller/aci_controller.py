@@ -9,13 +9,24 @@
 # Import Section #
 ##################
 
-from typing import Any, Dict, Type, List, Tuple, Optional, Union, cast
+from typing import Any, Dict, Type, List, Set, Tuple, Optional, Union, cast
 from parsers.aci_parser import ACITroubleshooterParser
+from parsers.aci_dn_parser import ACIDnParser
+from parsers.aci_parse_pool import ACIParsePool
 from aci_api_client.getCookie import getCookie
 from aci_api_client.Url import UrlClass
 from aci_api_client.UserClass import UserClass
 from controller.aci_tenant_controller import ACITenantController # NEW IMPORT
+from model.aci_lazy_attributes import LazyAttribute, peekAttribute
+from model.aci_interface_table import InterfaceTable
+from model.aci_vlan_index import VlanIndex
+from model.aci_tenant_index import TenantIndex
+from model.aci_counter_store import CounterStore
+from model.aci_graph import ACIFabricGraph, edgeAttributes, keyedEdges
+import networkx as nx
 import concurrent.futures
+import functools
+import threading
 
 ###########################
 # Private Singleton Class #
@@ -39,9 +50,55 @@ class _PrivateCookie(type):
 
 class ACIController(metaclass=_PrivateCookie):
 
+    # Collection sections in priority order (key, label shown in the Menu)
+    COLLECTION_SECTIONS: Tuple[Tuple[str, str], ...] = (
+        ('inventory',  'Inventory & Health'),
+        ('tenants',    'Tenant Configuration'),
+        ('interfaces', 'Interfaces & Links'),
+        ('counters',   'Counters & SFPs'),
+    )
+
+    # Interface counters (rmonEtherStats) stored in the fabric edges for each side of the link
+    EDGE_COUNTERS: Tuple[str, ...] = (
+        'broadcastPkts', 'cRCAlignErrors', 'collisions', 'dropEvents', 'fragments', 'jabbers', 'multicastPkts',
+        'oversizePkts', 'pkts', 'pkts65to127Octets', 'pkts128to255Octets', 'pkts256to511Octets', 'pkts512to1023Octets',
+        'pkts1024to1518Octets', 'octets', 'pkts64Octets', 'rXNoErrors', 'rxGiantPkts', 'rxOversizePkts', 'tXNoErrors',
+        'txGiantPkts', 'txOversizePkts', 'undersizePkts',
+    )
+
+    # Inventory & Health attributes per role: attribute -> (MO class, UrlClass getter, ACITroubleshooterParser method)
+    SWITCH_ATTRIBUTES: Dict[str, Tuple[str, str, str]] = {
+        'psus'              : ('eqptPsu',                 'getApicPowerSupply',          'getSwitchPsuInfo'),
+        'supervisors'       : ('eqptSupC',                'getChassisSuppervisor',       'getSwitchSupInfo'),
+        'linecard'          : ('eqptLC',                  'getChassisLinecardInfo',      'getSwitchLinecardInfo'),
+        'faults'            : ('faultSummary',            'getChassisNodeFault',         'getSwitchFaultsInfo'),
+        'filesystem'        : ('eqptcapacityFSPartition', 'getFileSystemInfo',           'getSwitchFileSystemInfo'),
+    }
+    SPINE_ATTRIBUTES: Dict[str, Tuple[str, str, str]] = {
+        'fabric_modules'    : ('eqptFC',                  'getChassisFabricModule',      'getSwitchFabricModuleInfo'),
+        'system_controller' : ('eqptSysC',                'getChassisSystemController',  'getSwitchFabricSystemControllerInfo'),
+    }
+    APIC_ATTRIBUTES: Dict[str, Tuple[str, str, str]] = {
+        'apic_ntp'            : ('datetimeNtpq',          'getApicNtp',                  'getApicNtpInfo'),
+        'apic_bbdd_sync'      : ('infraWiNode',           'getApicClusterByNode',        'getApicDatabaseStatusInfo'),
+        'apic_power_supplies' : ('eqptPsu',               'getApicPowerSupply',          'getApicPowerSupplyInfo'),
+        'apic_fans'           : ('eqptFan',               'getApicFan',                  'getApicFansInfo'),
+        'apic_sensor'         : ('eqptSensor',            'getApicSensors',              'getApicSensorInfo'),
+        'apic_dimm'           : ('eqptDimm',              'getApicMemorySlots',          'getApicDimmInfo'),
+        'apic_filesystem'     : ('eqptStorage',           'getApicFileSystem',           'getApicFileSystemInfo'),
+        'apic_phyint'         : ('cnwPhysIf',             'getApicPhyInterfaces',        'getApicPhyIntInfo'),
+        'apic_aggint'         : ('l3EncRtdIf',            'getApicAggregatedInterfaces', 'getApicAggyIntInfo'),
+    }
+
     def __init__(self) -> None:
         self.parser: ACITroubleshooterParser = ACITroubleshooterParser()
         self.tenant_controller: ACITenantController = ACITenantController() # NEW INITIALIZATION
+        self.dn_parser: ACIDnParser = ACIDnParser()
+        self.parse_pool: ACIParsePool = ACIParsePool()
+        self.__lazy_attributes: bool = False
+        self.__profile: str = 'full'
+        self.__profile_classes: Optional[Set[str]] = None
+        self.__counter_store: Optional[CounterStore] = None
 
     ##################
     # Public Methods #
@@ -50,75 +107,244 @@ class ACIController(metaclass=_PrivateCookie):
     # Function that return a list of nodes from a Cisco ACI Fabric Json var
     def getNodesList(self, main_cookie: getCookie, Urls: UrlClass, User: UserClass) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[Tuple[str, str, Dict[str, Any]]]]:
 
-        # Fetching all the Nodes detected in the Cisco ACI Fabric
-        fabricInfo = main_cookie.get_request(Urls.getFabricNumNodesIDs().replace('https://%s',"https://" + User.base_url))
-
-        # List generated from the Cisco ACI Fabric Json Variable
-        nodeList: List[Tuple[str, Dict[str, Any]]] = []
-        # List generated to return the connections between nods in the Fabric
-        edgeList: List[Tuple[str, str, Dict[str, Any]]] = []
-
-        # List that will store all devices connected to our Fabrics
-        epgNodeList: List[str] = []
-        epgEdgeList: List[Tuple[str, str, Dict[str, Any]]] = []
+        # Collecting all sections into an auxilear Graph (one edge per link)
+        graph: nx.Graph = ACIFabricGraph()
+        self.collectGraph(graph, main_cookie, Urls, User)
 
-        # =========================================================================
-        # NEW FEATURE: Fetch Global Fabric Configuration (Tenants, EPGs, etc.)
-        # =========================================================================
+        # Returning list
+        return list(graph.nodes(data=True)), list(graph.edges(data=True))
+
+    # Function that enable the lazy attributes: node attributes are placeholders fetched on first access
+    # (only for Graphs whose node attributes support it, see model.aci_graph.ACIFabricGraph)
+    def setLazyAttributes(self, lazy: bool) -> None:
+        self.__lazy_attributes = lazy
+
+    # Function that select the Collection Profile (url.yaml 'PROFILES'), only the MO classes of the profile are fetched
+    def setCollectionProfile(self, profile: str) -> None:
+        self.__profile = profile
+
+    # Function that set the Counter Store, the interface counters of every collection are appended into it
+    def setCounterStore(self, store: Optional[CounterStore]) -> None:
+        self.__counter_store = store
+
+    # Function that return True when the MO class is fetched by the selected Collection Profile
+    def collects(self, mo_class: str) -> bool:
+        return self.__profile_classes is None or mo_class in self.__profile_classes
+
+    # Function that start the collection in a background thread, the Graph is filled section by section
+    # while the Menu is already available
+    def startBackgroundCollection(self, graph: nx.Graph, main_cookie: getCookie, Urls: UrlClass, User: UserClass) -> threading.Thread:
+
+        # Progress is created before the thread starts, so the Menu never see an empty state
+        self.__initCollectionState(graph)
+
+        collector = threading.Thread(target=self.collectGraph, args=(graph, main_cookie, Urls, User), name="aci-graph-collector", daemon=True)
+        collector.start()
+        return collector
+
+    # Function that fill the Graph in priority order:
+    #   1. Inventory & Health (Fabric Nodes, PSUs, Supervisors, Linecards, Faults, File System, APIC Health)
+    #   2. Tenant Configuration
+    #   3. Interfaces & Links (Interfaces, Operational Status, LLDP Fabric Edges, Downlink Edges)
+    #   4. Counters & SFPs
+    def collectGraph(self, graph: nx.Graph, main_cookie: getCookie, Urls: UrlClass, User: UserClass) -> None:
+
+        self.__initCollectionState(graph)
+        lock = graph.graph['graph_lock']
+
+        # MO classes fetched by the Collection Profile
+        self.__profile_classes = None if self.__profile == 'full' else set(Urls.getCollectionProfile(self.__profile))
+        graph.graph['collection_profile'] = self.__profile
+
+        # Parsing throughput of the collection (Parse Pool statistics, read by the Menu)
+        self.parse_pool.resetStats()
+        graph.graph['parse_stats'] = self.parse_pool.stats
+
+        # Lazy placeholders are only stored in Graphs that resolve them on access
+        lazy = self.__lazy_attributes and getattr(graph, 'supportsLazyAttributes', lambda: False)()
+        if self.__lazy_attributes and not lazy:
+            print("Lazy attributes are not supported by this Graph, collecting all the attributes")
+
+        try:
+            # Fetching all the Nodes detected in the Cisco ACI Fabric
+            fabricNodes: List[Dict[str, Any]] = []
+            if self.collects('fabricNode'):
+                fabricInfo = main_cookie.get_request(Urls.getFabricNumNodesIDs().replace('https://%s',"https://" + User.base_url))
+                fabricNodes = fabricInfo['imdata'] if int(fabricInfo['totalCount']) > 0 else []
+
+            # All the Fabric nodes are added at once, the node list of the Graph is stable from the first second
+            baseNodes = [self._base_node(node) for node in fabricNodes]
+            with lock:
+                graph.add_nodes_from(baseNodes)
+
+            # Auxilear Tuples for Resources feching depending on device role
+            switch_role = {'leaf', 'spine'}
+            switchNodes = [(nodeName, attributes) for nodeName, attributes in baseNodes if attributes.get('role') in switch_role]
 
-        # Get the global config node and add it to the list
-        fabric_config_node = self.tenant_controller.getFabricTenantConfig(main_cookie, Urls, User)
-        nodeList.append(fabric_config_node)
+            ###################################
+            #    Section 1: Inventory/Health  #
+            ###################################
+            inventoryNodes = [node for node in baseNodes if self._node_attribute_collectors(node[1].get('role'))]
+            self.__runSection(graph, 'inventory', inventoryNodes, lambda node: self._collect_node_inventory(node[0], node[1], main_cookie, Urls, User, lazy), self.__applyNodeAttributes)
 
-        # =========================================================================
-        # END OF NEW FEATURE
-        # =========================================================================
+            ###############################
+            #    Section 2: Tenants       #
+            ###############################
+            self.__runSection(graph, 'tenants', [None] if self.collects('fvTenant') else [], lambda _: self._collect_tenant_config(main_cookie, Urls, User), self.__applyTenantConfig)
 
-        # We check if there is information collected from the Fabric
-        if int(fabricInfo['totalCount']) > 0:
+            ##################################
+            #    Section 3: Interfaces       #
+            ##################################
+            self.__runSection(graph, 'interfaces', switchNodes if self.collects('l1PhysIf') else [], lambda node: self._collect_node_interfaces(node[0], node[1], main_cookie, Urls, User, lazy), self.__applyInterfaces)
 
-            # Create a ThreadPoolExecutor to run tasks concurrently
-            with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-                # Submit tasks for each node
-                future_results = executor.map(lambda node: self._process_node(node, main_cookie, Urls, User), fabricInfo['imdata'])
+            ###################################
+            #    Section 4: Counters & SFPs   #
+            ###################################
+            with lock:
+                fabricEdges = [(source, dest, key, data) for source, dest, key, data in keyedEdges(graph) if not data.get('downlink')]
+
+            # SFPs per switch and counters per fabric edge are collected in the same section
+            work: List[Tuple[str, Any]] = []
+            if self.collects('ethpmFcot'):
+                if lazy:
+                    with lock:
+                        for nodeName, attributes in switchNodes:
+                            graph.nodes[nodeName]['sfp'] = LazyAttribute(functools.partial(self._load_node_sfps, nodeName, str(attributes.get('id')), main_cookie, Urls, User), default=list, description=f"'sfp' of {nodeName}")
+                else:
+                    work += [('sfp', (nodeName, str(attributes.get('id')))) for nodeName, attributes in switchNodes]
+            if self.collects('rmonEtherStats'):
+                work += [('counters', edge) for edge in fabricEdges]
+            self.__runSection(graph, 'counters', work, lambda item: self._collect_counters_and_sfps(item, main_cookie, Urls, User), self.__applyCountersAndSfps)
 
-                # Process results as they become available
-                for node_result, edge_result, epgNodeList_result, epgEdgeList_result in future_results:
-                    if node_result:
-                        nodeList.append(node_result)
-                    edgeList.extend(edge_result)
-                    epgNodeList.extend(epgNodeList_result)
-                    epgEdgeList.extend(epgEdgeList_result)
+            # Appending the counters of this collection into the Counter Store (rates over the collections)
+            if self.__counter_store is not None:
+                with lock:
+                    graph.graph['counter_store'] = self.__counter_store
+                    self.__counter_store.appendCollection(graph)
 
-        # Correcting the bug: Convert epgNodeList to a list of tuples before extending nodeList
-        epgNodeList_formatted: List[Tuple[str, Dict[str, Any]]] = [(node, {}) for node in epgNodeList]
-        nodeList.extend(epgNodeList_formatted)
+        except Exception as e:
+            graph.graph['collection_error'] = f"Error collecting the Fabric information: {e}"
+            print(graph.graph['collection_error'])
 
-        # Extending List edgeList with the connection between Fabric Switch Node and Endpoint Device
-        edgeList.extend(epgEdgeList)
+        finally:
+            graph.graph['collection_complete'] = True
 
-        # Returning list
-        return nodeList, edgeList
+    # Function that return the progress of each collection section (empty when the Graph was not collected)
+    def getCollectionProgress(self, graph: nx.Graph) -> Dict[str, Dict[str, Any]]:
+        return cast(Dict[str, Dict[str, Any]], graph.graph.get('collection_progress', {}))
 
     ####################
     # Privates Methods #
     ####################
 
-    # Function that contains the logic for a single node, now passed to the executor
-    def _process_node(self, node: Dict[str, Any], main_cookie: getCookie, Urls: UrlClass, User: UserClass) -> Tuple[Optional[Tuple[str, Dict[str, Any]]], List[Tuple[str, str, Dict[str, Any]]], List[str], List[Tuple[str, str, Dict[str, Any]]]]:
-
-        # List generated from the Cisco ACI Fabric Json Variable
-        node_result = None
-
-        # List generated to return the connections between nodes in the Fabric
-        edge_result: List[Tuple[str, str, Dict[str, Any]]] = []
-
-        # List that will store all devices connected to our Fabrics
-        epgNodeList: List[str] = []
-        epgEdgeList: List[Tuple[str, str, Dict[str, Any]]] = []
-
-        # Auxilear Tuples for Resources feching depending on device role
-        switch_role = {'leaf', 'spine'}
+    # Creating the Graph lock and the progress of each section
+    def __initCollectionState(self, graph: nx.Graph) -> None:
+        if 'graph_lock' not in graph.graph:
+            graph.graph['graph_lock'] = threading.RLock()
+        if 'collection_progress' not in graph.graph or graph.graph.get('collection_complete'):
+            graph.graph['collection_progress'] = {key: {'label': label, 'done': 0, 'total': None, 'state': 'pending'} for key, label in self.COLLECTION_SECTIONS}
+            graph.graph['collection_complete'] = False
+            graph.graph['interface_table'] = InterfaceTable()
+            graph.graph['vlan_index'] = VlanIndex()
+            graph.graph.pop('tenant_index', None)
+            graph.graph.pop('interface_views', None)
+        graph.graph.setdefault('interface_table', InterfaceTable())
+        graph.graph.setdefault('vlan_index', VlanIndex())
+
+    # Running all the items of a section concurrently, each result is applied into the Graph (under the Graph lock)
+    # as soon as it is available, so the Menu reports show the partial section
+    def __runSection(self, graph: nx.Graph, section: str, items: List[Any], collect: Any, apply: Any) -> None:
+
+        progress = graph.graph['collection_progress'][section]
+        progress.update({'total': len(items), 'done': 0, 'state': 'running'})
+        lock = graph.graph['graph_lock']
+
+        # Create a ThreadPoolExecutor to run tasks concurrently
+        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+            futures = [executor.submit(collect, item) for item in items]
+
+            # Process results as they become available
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    result = future.result()
+                    if result:
+                        with lock:
+                            apply(graph, result)
+                except Exception as e:
+                    print(f"Error collecting the section {section}: {e}")
+                progress['done'] += 1
+
+        progress['state'] = 'done' if items else 'skipped'
+
+    # Adding the Fabric_Config_Root node and the index of its Tenant subtrees
+    def __applyTenantConfig(self, graph: nx.Graph, result: Tuple[str, Dict[str, Any], TenantIndex]) -> None:
+        nodeName, attributes, tenant_index = result
+        graph.add_node(nodeName, **attributes)
+        graph.graph['tenant_index'] = tenant_index
+
+    # Updating the attributes of an existing node
+    def __applyNodeAttributes(self, graph: nx.Graph, node: Tuple[str, Dict[str, Any]]) -> None:
+        graph.nodes[node[0]].update(node[1])
+
+    # Updating the switch attributes and adding the fabric and downlink edges
+    def __applyInterfaces(self, graph: nx.Graph, result: Tuple[str, Dict[str, Any], List[Tuple[str, str, Dict[str, Any]]]]) -> None:
+        nodeName, attributes, edges = result
+        self.__indexInterfaces(graph, nodeName, attributes, edges)
+        graph.nodes[nodeName].update(attributes)
+        graph.add_edges_from(edges)
+
+    # Applying the SFPs into the switch node, or the counters into the fabric link (edge key)
+    def __applyCountersAndSfps(self, graph: nx.Graph, result: Tuple[str, Tuple[Any, ...], Dict[str, Any]]) -> None:
+        kind, target, attributes = result
+        table: InterfaceTable = graph.graph['interface_table']
+        if kind == 'sfp':
+            graph.nodes[target[0]].update(attributes)
+            node_id = graph.nodes[target[0]].get('id')
+            for sfp in attributes.get('sfp', []):
+                table.setValues(table.rowFor(node_id, sfp.get('int_id'), target[0]), optics_type=sfp.get('actualType'), optics_pid=sfp.get('guiCiscoPID'), optics_sn=sfp.get('guiSN'))
+        else:
+            for edge_attributes in edgeAttributes(graph, *target):
+                edge_attributes.update(attributes)
+                for side in ('source', 'dest'):
+                    if edge_attributes.get(side + '_row') is not None:
+                        table.setValues(edge_attributes[side + '_row'], **{counter: attributes.get(side + '_' + counter) for counter in self.EDGE_COUNTERS})
+
+    # Adding the interfaces of the switch into the Interface Table, the node ('interface_rows') and the
+    # edges ('source_row'/'dest_row' for the fabric edges, 'leaf_row' for the downlinks) point into the table.
+    # The VLANs of the downlinks are added into the VLAN Index
+    def __indexInterfaces(self, graph: nx.Graph, nodeName: str, attributes: Dict[str, Any], edges: List[Tuple[str, str, Dict[str, Any]]]) -> None:
+
+        table: InterfaceTable = graph.graph['interface_table']
+        node_id = graph.nodes[nodeName].get('id')
+
+        # Configuration of the interfaces (l1PhysIf)
+        rows: List[int] = []
+        for interface in attributes.get('interfaces', []):
+            row = table.rowFor(node_id, interface.get('id'), nodeName)
+            table.setValues(row, admin_st=interface.get('adminSt'), usage=interface.get('usage'), speed=interface.get('speed'), mtu=interface.get('mtu'))
+            rows.append(row)
+        attributes['interface_rows'] = rows
+
+        # Operational status of the interfaces (ethpmPhysIf), placeholders are not fetched
+        for opt_interface in peekAttribute(attributes, 'opt_interfaces', []) or []:
+            operSt = opt_interface.get('operSt') or {}
+            table.setValues(table.rowFor(node_id, opt_interface.get('intID'), nodeName), oper_st=operSt.get('operSt'), oper_speed=operSt.get('operSpeed'),
+                            oper_mode=operSt.get('operMode'), oper_duplex=operSt.get('operDuplex'), last_link_change=operSt.get('lastLinkStChg'))
+
+        # Fabric and Downlink edges
+        for source, dest, data in edges:
+            if data.get('downlink'):
+                data['leaf_row'] = table.rowFor(data.get('leaf'), data.get('leaf_int'), source)
+                graph.graph['vlan_index'].setPort(source, data.get('leaf_int'), data.get('operVlans'), data.get('allowedVlans'))
+                continue
+            for side, side_node in (('source', source), ('dest', dest)):
+                if data.get(side + '_node_id') is None or not data.get(side + '_interface_id'):
+                    continue
+                data[side + '_row'] = table.rowFor(data[side + '_node_id'], data[side + '_interface_id'], side_node)
+                table.setValues(data[side + '_row'], oper_st=data.get(side + '_interface_operSt'), oper_speed=data.get(side + '_interface_operSpeed'))
+
+    # Function that return the base node (fabricNode attributes) for the Graph
+    def _base_node(self, node: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
 
         # Attributes saved in the variable for simplicity
         attributes = node['fabricNode']['attributes']
@@ -127,8 +353,11 @@ class ACIController(metaclass=_PrivateCookie):
         # Ensure nodeName is explicitly a str immediately
         nodeName: str = str(attributes['name'])
 
-        # Eliminating unnecesary attributes
+        # Eliminating unnecesary attributes, the Pod ID is kept from the dn (Graph Node Index)
         attributes_node = attributes.copy()
+        pod = self.dn_parser.parseDn(attributes.get('dn')).pod
+        if pod is not None:
+            attributes_node.setdefault('podId', pod)
         attributes_node.pop('name', None)
         attributes_node.pop('dn', None)
         attributes_node.pop('lastStateModTs', None)
@@ -139,378 +368,256 @@ class ACIController(metaclass=_PrivateCookie):
         attributes_node.pop('uid', None)
         attributes_node.pop('delayedHeartbeat', None)
 
-        # If the node role is 'leaf' or 'spine' we fecth the following info from then:
-        #   - PSU Info
-        #   - Linecards
-        #   - System Controllers (Only Spine Switches)
-        #   - Fabric Modules (Only Spine Switches)
-        #   - Supervisors
-        #   - Filesystem
-        if attributes_node.get('role') in switch_role:
-
-            # Using a nested thread pool for interface-related fetches
-            with concurrent.futures.ThreadPoolExecutor(max_workers=5) as sub_executor:
-
-                # All I/O-bound requests for a single node are now inside this function
-                # and will be executed in parallel by the thread pool.
-
-                #######################
-                #     Power Supply    #
-                #######################
-                SwitchPsuInfo = main_cookie.get_request(Urls.getApicPowerSupply().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + attributes_node.get('id')))
-                if int(SwitchPsuInfo.get('totalCount')) > 0:
-                    attributes_node['psus'] = self.parser.getSwitchPsuInfo(SwitchPsuInfo)
-                else:
-                    attributes_node['psus'] = []
-
-                #######################
-                #     Supervisor      #
-                #######################
-                SwitchSupInfo = main_cookie.get_request(Urls.getChassisSuppervisor().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + attributes_node.get('id')))
-                if int(SwitchSupInfo.get('totalCount')) > 0:
-                    attributes_node['supervisors'] = self.parser.getSwitchSupInfo(SwitchSupInfo)
-                else:
-                    attributes_node['supervisors'] = []
-
-                ####################
-                #    Linecards     #
-                ####################
-                SwitchLinecardInfo = main_cookie.get_request(Urls.getChassisLinecardInfo().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + attributes_node.get('id')))
-                if int(SwitchLinecardInfo.get('totalCount')) > 0:
-                    attributes_node['linecard'] = self.parser.getSwitchLinecardInfo(SwitchLinecardInfo)
-                else:
-                    attributes_node['linecard'] = []
-
-                ##########################
-                #     Interface info     #
-                ##########################
-                SwitchInterfaceInfo = main_cookie.get_request(Urls.getChassisInterfaceBriefStatus().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + attributes_node.get('id')))
-                if int(SwitchInterfaceInfo.get('totalCount')) > 0:
-                    attributes_node['interfaces'], fabricAuxInterfaceVar, DownlinkAuxInterfaceVar = self.parser.getSwitchIntInfo(SwitchInterfaceInfo)
-
-                    # Handling Downlink Endpoints
-                    for downlink in DownlinkAuxInterfaceVar:
-                        portStatus = main_cookie.get_request(Urls.getChassisInterfaceOperationalStatus().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + attributes_node.get('id')).replace('eth%s/%s', downlink.get('id').lower() ))
-                        # Check if the port is 'up' and has a 'descr' attribute
-                        if int(portStatus.get('totalCount')) > 0:
-                            portOperAttributes = portStatus['imdata'][0]['ethpmPhysIf']['attributes']
-                            if portOperAttributes.get('operSt') == "up" and downlink.get('descr'):
-                                # Retrieve optional description
-                                deviceDesc_opt = downlink.get('descr')
-                                # Ensure deviceDesc_raw is a string by casting anything retrieved and stripping it
-                                deviceDesc_raw: str = str(deviceDesc_opt).strip() if deviceDesc_opt is not None else ""
-
-                                # Clean up any remaining extra characters from the device description
-                                final_deviceDesc: str = deviceDesc_raw.split('-')[0]
-
-                                # Only proceed if the resulting deviceDesc is not empty
-                                if final_deviceDesc:
-                                    # Defining Downlink Attribute
-                                    auxDeviceDictAttribute = {
-                                        'downlink'      : True,
-                                        'leaf'          : attributes_node.get('id'),
-                                        'leaf_int'      : downlink.get('id').lower(),
-                                        'allowedVlans'  : portOperAttributes.get('portStatus', 'N/A'),
-                                        'operVlans'     : portOperAttributes.get('operVlans', 'N/A'),
-                                        'backplaneMac'  : portOperAttributes.get('backplaneMac', 'N/A'),
-                                        'lastLinkStChg' : portOperAttributes.get('lastLinkStChg', 'N/A'),
-                                        'operMode'      : portOperAttributes.get('operMode', 'N/A'),
-                                        'operSpeed'     : portOperAttributes.get('operSpeed', 'N/A'),
-                                        'operSt'        : portOperAttributes.get('operSt', 'N/A')
-                                    }
-
-                                    # Fix for controller/aci_controller.py:225: error: Argument 1 to "append" of "list" has incompatible type
-                                    # Since nodeName is now explicitly str, we only need to assure the derived name is str.
-                                    # We use the variable with the guaranteed type 'final_deviceDesc'
-
-                                    # Using cast to explicitly confirm the type for MyPy (Fix for previous error at line 225)
-                                    new_epg_edge = cast(
-                                        Tuple[str, str, Dict[str, Any]],
-                                        (nodeName, final_deviceDesc, auxDeviceDictAttribute)
-                                    )
-
-                                    if new_epg_edge not in epgEdgeList:
-                                        epgEdgeList.append(new_epg_edge)
-
-                    # New lists for storing interface data
-                    sfpList: List[Dict[str, Any]] = []
-                    optIntList: List[Dict[str, Union[str, Dict[str, Any]]]] = []
-
-                    # Map LLDP neighbor fetching for fabric interfaces
-                    neighbor_futures = [sub_executor.submit(self._get_lldp_neighbor_info, main_cookie, Urls, User, attributes_node.get('id'), fabricInt) for fabricInt in fabricAuxInterfaceVar]
-                    for future in concurrent.futures.as_completed(neighbor_futures):
-                        try:
-                            neighbor_name, source_int_oper, dest_int_oper, source_int_counter, dest_int_counter = future.result()
-                            if neighbor_name is not None:
-                                # **START OF FIX FOR LINE 232**
-                                # Extract sysName and ensure it is a string (defaulting to empty string if missing)
-                                # The explicit casting here resolves the mypy error.
-                                sys_name: str = str(neighbor_name.get('sysName', ''))
-
-                                new_edge = cast(
-                                    Tuple[str, str, Dict[str, Any]],
-                                    (
-                                        nodeName,
-                                        sys_name,
-                                        {
-                                            'source_interface_speed'             : neighbor_name.get('source_int_speed'),
-                                            'source_interface_id'                : neighbor_name.get('destInt'),
-                                            'source_interface_mtu'               : neighbor_name.get('source_int_mtu'),
-                                            'source_interface_adminSt'           : neighbor_name.get('source_int_adminSt'),
-                                            'source_interface_mode'              : neighbor_name.get('source_int_mode'),
-                                            'source_interface_operSt'            : source_int_oper.get('operSt') if source_int_oper else None,
-                                            'source_interface_operAllowedVlans'  : source_int_oper.get('allowedVlans') if source_int_oper else None,
-                                            'source_interface_operLastErrors'    : source_int_oper.get('lastErrors') if source_int_oper else None,
-                                            'source_interface_operLastLinkStChg' : source_int_oper.get('lastLinkStChg') if source_int_oper else None,
-                                            'source_interface_operOperDuplex'    : source_int_oper.get('operDuplex') if source_int_oper else None,
-                                            'source_interface_operOperMode'      : source_int_oper.get('operMode') if source_int_oper else None,
-                                            'source_interface_operSpeed'         : source_int_oper.get('operSpeed') if source_int_oper else None,
-                                            'source_broadcastPkts'               : source_int_counter.get('broadcastPkts') if source_int_counter else None,
-                                            'source_cRCAlignErrors'              : source_int_counter.get('cRCAlignErrors') if source_int_counter else None,
-                                            'source_collisions'                  : source_int_counter.get('collisions') if source_int_counter else None,
-                                            'source_dropEvents'                  : source_int_counter.get('dropEvents') if source_int_counter else None,
-                                            'source_fragments'                   : source_int_counter.get('fragments') if source_int_counter else None,
-                                            'source_jabbers'                     : source_int_counter.get('jabbers') if source_int_counter else None,
-                                            'source_multicastPkts'               : source_int_counter.get('multicastPkts') if source_int_counter else None,
-                                            'source_oversizePkts'                : source_int_counter.get('oversizePkts') if source_int_counter else None,
-                                            'source_pkts'                          : source_int_counter.get('pkts') if source_int_counter else None,
-                                            'source_pkts65to127Octets'           : source_int_counter.get('pkts65to127Octets') if source_int_counter else None,
-                                            'source_pkts128to255Octets'          : source_int_counter.get('pkts128to255Octets') if source_int_counter else None,
-                                            'source_pkts256to511Octets'          : source_int_counter.get('pkts256to511Octets') if source_int_counter else None,
-                                            'source_pkts512to1023Octets'         : source_int_counter.get('pkts512to1023Octets') if source_int_counter else None,
-                                            'source_pkts1024to1518Octets'        : source_int_counter.get('pkts1024to1518Octets') if source_int_counter else None,
-                                            'source_octets'                      : source_int_counter.get('octets') if source_int_counter else None,
-                                            'source_pkts64Octets'                : source_int_counter.get('pkts64Octets') if source_int_counter else None,
-                                            'source_rXNoErrors'                  : source_int_counter.get('rXNoErrors') if source_int_counter else None,
-                                            'source_rxGiantPkts'                 : source_int_counter.get('rxGiantPkts') if source_int_counter else None,
-                                            'source_rxOversizePkts'              : source_int_counter.get('rxOversizePkts') if source_int_counter else None,
-                                            'source_tXNoErrors'                  : source_int_counter.get('tXNoErrors') if source_int_counter else None,
-                                            'source_txGiantPkts'                 : source_int_counter.get('txGiantPkts') if source_int_counter else None,
-                                            'source_txOversizePkts'              : source_int_counter.get('txOversizePkts') if source_int_counter else None,
-                                            'source_undersizePkts'               : source_int_counter.get('undersizePkts') if source_int_counter else None,
-                                            'dest_interface_id'                  : neighbor_name.get('source_int_id'),
-                                            'dest_interface_speed'               : dest_int_oper.get('operSpeed') if dest_int_oper else None,
-                                            'dest_interface_mtu'                 : neighbor_name.get('dest_int_mtu'),
-                                            'dest_interface_admingSt'            : neighbor_name.get('dest_int_adminSt'),
-                                            'dest_interface_mode'                : neighbor_name.get('dest_int_mode'),
-                                            'dest_interface_operSt'              : dest_int_oper.get('operSt') if dest_int_oper else None,
-                                            'dest_interface_operAllowedVlans'    : dest_int_oper.get('allowedVlans') if dest_int_oper else None,
-                                            'dest_interface_operLastErrors'      : dest_int_oper.get('lastErrors') if dest_int_oper else None,
-                                            'dest_interface_operLastLinkStChg'   : dest_int_oper.get('lastLinkStChg') if dest_int_oper else None,
-                                            'dest_interface_operOperDuplex'      : dest_int_oper.get('operDuplex') if dest_int_oper else None,
-                                            'dest_interface_operOperMode'        : dest_int_oper.get('operMode') if dest_int_oper else None,
-                                            'dest_interface_operSpeed'           : dest_int_oper.get('operSpeed') if dest_int_oper else None,
-                                            'dest_broadcastPkts'                 : dest_int_counter.get('broadcastPkts') if dest_int_counter else None,
-                                            'dest_cRCAlignErrors'                : dest_int_counter.get('cRCAlignErrors') if dest_int_counter else None,
-                                            'dest_collisions'                    : dest_int_counter.get('collisions') if dest_int_counter else None,
-                                            'dest_dropEvents'                    : dest_int_counter.get('dropEvents') if dest_int_counter else None,
-                                            'dest_fragments'                     : dest_int_counter.get('fragments') if dest_int_counter else None,
-                                            'dest_jabbers'                       : dest_int_counter.get('jabbers') if dest_int_counter else None,
-                                            'dest_multicastPkts'                 : dest_int_counter.get('multicastPkts') if dest_int_counter else None,
-                                            'dest_oversizePkts'                  : dest_int_counter.get('oversizePkts') if dest_int_counter else None,
-                                            'dest_pkts'                          : dest_int_counter.get('pkts') if dest_int_counter else None,
-                                            'dest_pkts65to127Octets'             : dest_int_counter.get('pkts65to127Octets') if dest_int_counter else None,
-                                            'dest_pkts128to255Octets'            : dest_int_counter.get('pkts128to255Octets') if dest_int_counter else None,
-                                            'dest_pkts256to511Octets'            : dest_int_counter.get('pkts256to511Octets') if dest_int_counter else None,
-                                            'dest_pkts512to1023Octets'           : dest_int_counter.get('pkts512to1023Octets') if dest_int_counter else None,
-                                            'dest_pkts1024to1518Octets'          : dest_int_counter.get('pkts1024to1518Octets') if dest_int_counter else None,
-                                            'dest_octets'                        : dest_int_counter.get('octets') if dest_int_counter else None,
-                                            'dest_pkts64Octets'                  : dest_int_counter.get('pkts64Octets') if dest_int_counter else None,
-                                            'dest_rXNoErrors'                    : dest_int_counter.get('rXNoErrors') if dest_int_counter else None,
-                                            'dest_rxGiantPkts'                   : dest_int_counter.get('rxGiantPkts') if dest_int_counter else None,
-                                            'dest_rxOversizePkts'                : dest_int_counter.get('rxOversizePkts') if dest_int_counter else None,
-                                            'dest_tXNoErrors'                    : dest_int_counter.get('tXNoErrors') if dest_int_counter else None,
-                                            'dest_txGiantPkts'                   : dest_int_counter.get('txGiantPkts') if dest_int_counter else None,
-                                            'dest_txOversizePkts'                : dest_int_counter.get('txOversizePkts') if dest_int_counter else None,
-                                            'dest_undersizePkts'                 : dest_int_counter.get('undersizePkts') if dest_int_counter else None
-                                        }
-                                    )
-                                )
-                                edge_result.append(new_edge)
-                                # **END OF FIX FOR LINE 232**
-                        except Exception as e:
-                            print(f"Error processing LLDP neighbor for node {nodeName}: {e}")
-
-                    # 2 different threads for each feature, one detect the operational status
-                    # The other one check the SFP Status
-                    oper_futures = [sub_executor.submit(self._get_operational_info, main_cookie, Urls, User, attributes_node.get('id'), i) for i in (DownlinkAuxInterfaceVar + fabricAuxInterfaceVar)]
-                    sfp_futures = [sub_executor.submit(self._get_sfp_info, main_cookie, Urls, User, attributes_node.get('id'), i) for i in (DownlinkAuxInterfaceVar + fabricAuxInterfaceVar)]
-
-                    for oper_future in concurrent.futures.as_completed(oper_futures):
-                        try:
-                            int_info = oper_future.result()
-                            if int_info:
-                                optIntList.append(int_info)
-                        except Exception as e:
-                            print(f"Error processing operational info for node {nodeName}: {e}")
-
-                    for sfp_future in concurrent.futures.as_completed(sfp_futures):
-                        try:
-                            sfp_info = sfp_future.result()
-                            # Only append if a valid SFP object is returned
-                            if sfp_info:
-                                # Ensure sfp_info is a list before extending
-                                if isinstance(sfp_info, list):
-                                    sfpList.extend(sfp_info)
-                                else:
-                                    sfpList.append(sfp_info)
-                        except Exception as e:
-                            print(f"Error processing SFP info for node {nodeName}: {e}")
-
-                    # Store the collected SFP data in the attributes_node dictionary
-                    if sfpList:
-                        sfpList.sort(key=lambda x: x['int_id'])
-                        attributes_node['sfp'] = sfpList
-                    else:
-                        attributes_node['sfp'] = []
-
-                    if optIntList:
-                        optIntList.sort(key=lambda x: str(x['intID']))
-                        attributes_node['opt_interfaces'] = optIntList
-                else:
-                    attributes_node['interfaces'] = []
-                    attributes_node['opt_interfaces'] = []
-                    attributes_node['sfp'] = []
-
-            ###################
-            #     Faults      #
-            ###################
-            SwitchFaultsInfo = main_cookie.get_request(Urls.getChassisNodeFault().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + attributes_node.get('id')))
-            if int(SwitchFaultsInfo.get('totalCount')) > 0:
-                attributes_node['faults'] = self.parser.getSwitchFaultsInfo(SwitchFaultsInfo)
-            else:
-                attributes_node['faults'] = []
-
-            ######################
-            #    File System     #
-            ######################
-            SwitchFileSystemInfo = main_cookie.get_request(Urls.getFileSystemInfo().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + attributes_node.get('id')))
-            if int(SwitchFileSystemInfo.get('totalCount')) > 0:
-                attributes_node['filesystem'] = self.parser.getSwitchFileSystemInfo(SwitchFileSystemInfo)
+        return (nodeName, attributes_node)
+
+    # Function that collect the Tenant configuration, the Tenant Index is built here (outside the Graph lock)
+    def _collect_tenant_config(self, main_cookie: getCookie, Urls: UrlClass, User: UserClass) -> Tuple[str, Dict[str, Any], TenantIndex]:
+        nodeName, attributes = self.tenant_controller.getFabricTenantConfig(main_cookie, Urls, User)
+        return (nodeName, attributes, TenantIndex(attributes.get('tenants', [])))
+
+    # Function that collect the Inventory & Health information for a single node
+    # In lazy mode the attributes are placeholders fetched on first access
+    def _collect_node_inventory(self, nodeName: str, node_attributes: Dict[str, Any], main_cookie: getCookie, Urls: UrlClass, User: UserClass, lazy: bool = False) -> Tuple[str, Dict[str, Any]]:
+
+        # Attributes fetched in this section
+        attributes_node: Dict[str, Any] = {}
+        node_id: str = str(node_attributes.get('id'))
+
+        for attribute, (mo_class, url_getter, parser_method) in self._node_attribute_collectors(node_attributes.get('role')).items():
+            if lazy:
+                attributes_node[attribute] = LazyAttribute(
+                    functools.partial(self._fetch_node_attribute, url_getter, parser_method, node_id, main_cookie, Urls, User),
+                    default=list,
+                    description=f"'{attribute}' of {nodeName}"
+                )
             else:
-                attributes_node['faults'] = []
+                attributes_node[attribute] = self._fetch_node_attribute(url_getter, parser_method, node_id, main_cookie, Urls, User)
 
-            ###############################
-            #    Spine Hardware Modules   #
-            ###############################
+        return (nodeName, attributes_node)
 
-            if attributes_node.get('role') == "spine":
+    # Function that return the Inventory & Health collectors for the node role (only the ones in the Collection Profile)
+    def _node_attribute_collectors(self, role: Optional[str]) -> Dict[str, Tuple[str, str, str]]:
 
-                #######################
-                #    Fabric Modules   #
-                #######################
-                SpineSwitchFabricModuleInfo = main_cookie.get_request(Urls.getChassisFabricModule().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + attributes_node.get('id')))
-                if int(SpineSwitchFabricModuleInfo['totalCount']) > 0:
-                    attributes_node['fabric_modules'] = self.parser.getSwitchFabricModuleInfo(SpineSwitchFabricModuleInfo)
-                else:
-                    attributes_node['fabric_modules'] = []
-
-                ##################################
-                #    System Controller Modules   #
-                ##################################
-                SpineSwitchSystemControllerInfo = main_cookie.get_request(Urls.getChassisSystemController().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + attributes_node.get('id')))
-                if int(SpineSwitchSystemControllerInfo['totalCount']) > 0:
-                    attributes_node['system_controller'] = self.parser.getSwitchFabricSystemControllerInfo(SpineSwitchSystemControllerInfo)
-                else:
-                    attributes_node['system_controller'] = []
-
-        # If the device role is apic, we will retrieve the following information
-        #   - Power Supply
-        #   - DIMMs
-        #   - FANs
-        #   - Filesystem
-        #   - Physical Interfaces
-        #   - Aggregate Interfaces
+        # If the node role is 'leaf' or 'spine' we fecth PSUs, Supervisors, Linecards, Faults and Filesystem
+        # plus Fabric Modules and System Controllers for the Spine Switches
+        if role in {'leaf', 'spine'}:
+            collectors = dict(self.SWITCH_ATTRIBUTES)
+            if role == 'spine':
+                collectors.update(self.SPINE_ATTRIBUTES)
+
+        # If the device role is apic, we will retrieve NTP, Cluster Health, Power Supplies, FANs, Sensors,
+        # DIMMs, Filesystem, Physical and Aggregate Interfaces
         else:
-            #######################
-            #   APIC NTP Server   #
-            #######################
-            ApicNtpInfo = main_cookie.get_request(Urls.getApicNtp().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + attributes_node.get('id')))
-            if int(ApicNtpInfo.get('totalCount')) > 0:
-                attributes_node['apic_ntp'] = self.parser.getApicNtpInfo(ApicNtpInfo)
-            else:
-                attributes_node['apic_ntp'] = []
-
-            ################################
-            #    Apic BBDD Health State    #
-            ################################
-            ApicBbddHealthState = main_cookie.get_request(Urls.getApicClusterByNode().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + attributes_node.get('id')))
-            if int(ApicBbddHealthState.get('totalCount')) > 0:
-                attributes_node['apic_bbdd_sync'] = self.parser.getApicDatabaseStatusInfo(ApicBbddHealthState)
-            else:
-                attributes_node['apic_bbdd_sync'] = []
-
-            ##########################
-            #   APICs Power Supply   #
-            ##########################
-            ApicPowerSupplyInfo = main_cookie.get_request(Urls.getApicPowerSupply().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + attributes_node.get('id')))
-            if int(ApicPowerSupplyInfo.get('totalCount')) > 0:
-                attributes_node['apic_power_supplies'] = self.parser.getApicPowerSupplyInfo(ApicPowerSupplyInfo)
-            else:
-                attributes_node['apic_power_supplies'] = []
-
-            ###################
-            #    APIC FANs    #
-            ###################
-            ApicFansInfo = main_cookie.get_request(Urls.getApicFan().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + attributes_node.get('id')))
-            if int(ApicFansInfo.get('totalCount')) > 0:
-                attributes_node['apic_fans'] = self.parser.getApicFansInfo(ApicFansInfo)
-            else:
-                attributes_node['apic_fans'] = []
-
-            ########################
-            #     APIC Sensors     #
-            ########################
-            ApicSensorInfo = main_cookie.get_request(Urls.getApicSensors().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + attributes_node.get('id')))
-            if int(ApicSensorInfo.get('totalCount')) > 0:
-                attributes_node['apic_sensor'] = self.parser.getApicSensorInfo(ApicSensorInfo)
-            else:
-                attributes_node['apic_sensor'] = []
-
-            #####################
-            #     APIC DIMM     #
-            #####################
-            ApicDimmInfo = main_cookie.get_request(Urls.getApicMemorySlots().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + attributes_node.get('id')))
-            if int(ApicDimmInfo.get('totalCount')) > 0:
-                attributes_node['apic_dimm'] = self.parser.getApicDimmInfo(ApicDimmInfo)
-
-            ###########################
-            #     APIC FileSystem     #
-            ###########################
-            ApicFsInfo = main_cookie.get_request(Urls.getApicFileSystem().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + attributes_node.get('id')))
-            if int(ApicFsInfo.get('totalCount')) > 0:
-                attributes_node['apic_filesystem'] = self.parser.getApicFileSystemInfo(ApicFsInfo)
-            else:
-                attributes_node['apic_filesystem'] = []
+            collectors = dict(self.APIC_ATTRIBUTES)
 
-            ###################################
-            #     APIC Physical Interface     #
-            ###################################
-            ApicPhyIntInfo = main_cookie.get_request(Urls.getApicPhyInterfaces().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + attributes_node.get('id')))
-            if int(ApicPhyIntInfo.get('totalCount')) > 0:
-                attributes_node['apic_phyint'] = self.parser.getApicPhyIntInfo(ApicPhyIntInfo)
-            else:
-                attributes_node['apic_phyint'] = []
-
-            ####################################
-            #     APIC Aggregate Interface     #
-            ####################################
-            ApicAggIntInfo = main_cookie.get_request(Urls.getApicAggregatedInterfaces().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + attributes_node.get('id')))
-            if int(ApicAggIntInfo.get('totalCount')) > 0:
-                attributes_node['apic_aggint'] = self.parser.getApicAggyIntInfo(ApicAggIntInfo)
-            else:
-                attributes_node['apic_aggint'] = []
+        return {attribute: collector for attribute, collector in collectors.items() if self.collects(collector[0])}
+
+    # Function that fetch and parse a single node attribute, an empty list is returned when the APIC return no objects
+    # (the response is parsed by the Parse Pool, in a worker process when --parse-workers is set)
+    def _fetch_node_attribute(self, url_getter: str, parser_method: str, node_id: str, main_cookie: getCookie, Urls: UrlClass, User: UserClass) -> Any:
+        return self.parse_pool.requestParsed(main_cookie, getattr(Urls, url_getter)().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + node_id), parser_method, default=list)
 
-        node_result = (nodeName, attributes_node)
+    # Function that collect the Interfaces, Operational Status, Fabric Edges (LLDP) and Downlink Edges for a single switch
+    # In lazy mode 'opt_interfaces' is a placeholder fetched on first access
+    def _collect_node_interfaces(self, nodeName: str, node_attributes: Dict[str, Any], main_cookie: getCookie, Urls: UrlClass, User: UserClass, lazy: bool = False) -> Tuple[str, Dict[str, Any], List[Tuple[str, str, Dict[str, Any]]]]:
 
-        return node_result, edge_result, epgNodeList, epgEdgeList
+        # Attributes fetched in this section
+        attributes_node: Dict[str, Any] = {}
+        node_id: str = str(node_attributes.get('id'))
+
+        # List generated to return the connections between nodes in the Fabric
+        edge_result: List[Tuple[str, str, Dict[str, Any]]] = []
+
+        # List that will store all devices connected to our Fabrics
+        epgEdgeList: List[Tuple[str, str, Dict[str, Any]]] = []
+
+        ##########################
+        #     Interface info     #
+        ##########################
+        SwitchInterfaceInfo = self.parse_pool.requestParsed(main_cookie, Urls.getChassisInterfaceBriefStatus().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + node_id), 'getSwitchIntInfo', default=tuple)
+        if not SwitchInterfaceInfo:
+            attributes_node['interfaces'] = []
+            attributes_node['opt_interfaces'] = []
+            return nodeName, attributes_node, edge_result
+
+        attributes_node['interfaces'], fabricAuxInterfaceVar, DownlinkAuxInterfaceVar = SwitchInterfaceInfo
+
+        # Using a nested thread pool for interface-related fetches
+        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as sub_executor:
+
+            # Handling Downlink Endpoints (the operational status is needed to know if the device is connected)
+            for downlink in (DownlinkAuxInterfaceVar if self.collects('ethpmPhysIf') else []):
+                portStatus = main_cookie.get_request(Urls.getChassisInterfaceOperationalStatus().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + node_id).replace('eth%s/%s', downlink.get('id').lower() ))
+                # Check if the port is 'up' and has a 'descr' attribute
+                if int(portStatus.get('totalCount')) > 0:
+                    portOperAttributes = portStatus['imdata'][0]['ethpmPhysIf']['attributes']
+                    if portOperAttributes.get('operSt') == "up" and downlink.get('descr'):
+                        # Retrieve optional description
+                        deviceDesc_opt = downlink.get('descr')
+                        # Ensure deviceDesc_raw is a string by casting anything retrieved and stripping it
+                        deviceDesc_raw: str = str(deviceDesc_opt).strip() if deviceDesc_opt is not None else ""
+
+                        # Clean up any remaining extra characters from the device description
+                        final_deviceDesc: str = deviceDesc_raw.split('-')[0]
+
+                        # Only proceed if the resulting deviceDesc is not empty
+                        if final_deviceDesc:
+                            # Defining Downlink Attribute
+                            auxDeviceDictAttribute = {
+                                'downlink'      : True,
+                                'leaf'          : node_id,
+                                'leaf_int'      : downlink.get('id').lower(),
+                                'allowedVlans'  : portOperAttributes.get('allowedVlans', 'N/A'),
+                                'operVlans'     : portOperAttributes.get('operVlans', 'N/A'),
+                                'backplaneMac'  : portOperAttributes.get('backplaneMac', 'N/A'),
+                                'lastLinkStChg' : portOperAttributes.get('lastLinkStChg', 'N/A'),
+                                'operMode'      : portOperAttributes.get('operMode', 'N/A'),
+                                'operSpeed'     : portOperAttributes.get('operSpeed', 'N/A'),
+                                'operSt'        : portOperAttributes.get('operSt', 'N/A')
+                            }
+
+                            # Using cast to explicitly confirm the type for MyPy
+                            new_epg_edge = cast(
+                                Tuple[str, str, Dict[str, Any]],
+                                (nodeName, final_deviceDesc, auxDeviceDictAttribute)
+                            )
+
+                            if new_epg_edge not in epgEdgeList:
+                                epgEdgeList.append(new_epg_edge)
+
+            # Map LLDP neighbor fetching for fabric interfaces
+            neighbor_futures = [sub_executor.submit(self._get_lldp_neighbor_info, main_cookie, Urls, User, node_id, fabricInt) for fabricInt in (fabricAuxInterfaceVar if self.collects('lldpAdjEp') else [])]
+            for future in concurrent.futures.as_completed(neighbor_futures):
+                try:
+                    neighbor_name, source_int_oper, dest_int_oper = future.result()
+                    if neighbor_name is not None:
+                        # Extract sysName and ensure it is a string (defaulting to empty string if missing)
+                        sys_name: str = str(neighbor_name.get('sysName', ''))
+                        edge_result.append((nodeName, sys_name, self._fabric_edge_attributes(node_id, neighbor_name, source_int_oper, dest_int_oper)))
+                except Exception as e:
+                    print(f"Error processing LLDP neighbor for node {nodeName}: {e}")
+
+        # Operational status for each interface
+        allInterfaces = DownlinkAuxInterfaceVar + fabricAuxInterfaceVar
+        if self.collects('ethpmPhysIf'):
+            if lazy:
+                attributes_node['opt_interfaces'] = LazyAttribute(functools.partial(self._load_node_opt_interfaces, nodeName, node_id, allInterfaces, main_cookie, Urls, User), default=list, description=f"'opt_interfaces' of {nodeName}")
+            else:
+                attributes_node['opt_interfaces'] = self._load_node_opt_interfaces(nodeName, node_id, allInterfaces, main_cookie, Urls, User)
+
+        # Extending the edges with the connection between Fabric Switch Node and Endpoint Device
+        edge_result.extend(epgEdgeList)
+
+        return nodeName, attributes_node, edge_result
+
+    # Function that fetch the operational status (ethpmPhysIf) for each interface of a switch
+    def _load_node_opt_interfaces(self, nodeName: str, node_id: str, interfaces: List[Dict[str, Any]], main_cookie: getCookie, Urls: UrlClass, User: UserClass) -> List[Dict[str, Union[str, Dict[str, Any]]]]:
+
+        # New list for storing interface data
+        optIntList: List[Dict[str, Union[str, Dict[str, Any]]]] = []
+
+        # Thread that detect the operational status for each interface
+        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as sub_executor:
+            oper_futures = [sub_executor.submit(self._get_operational_info, main_cookie, Urls, User, node_id, i) for i in interfaces]
+
+            for oper_future in concurrent.futures.as_completed(oper_futures):
+                try:
+                    int_info = oper_future.result()
+                    if int_info:
+                        optIntList.append(int_info)
+                except Exception as e:
+                    print(f"Error processing operational info for node {nodeName}: {e}")
+
+        optIntList.sort(key=lambda x: str(x['intID']))
+        return optIntList
+
+    # Function that fetch the SFP details (ethpmFcot) of all the interfaces of a switch in a single query
+    def _load_node_sfps(self, nodeName: str, node_id: str, main_cookie: getCookie, Urls: UrlClass, User: UserClass) -> List[Dict[str, Any]]:
+
+        sfpList: List[Dict[str, Any]] = []
+
+        try:
+            sfpList = self.parse_pool.requestParsed(main_cookie, Urls.getChassisNodeSfp().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + node_id), 'getSwitchSfpInfo', default=list)
+        except Exception as e:
+            print(f"Error processing SFP info for node {nodeName}: {e}")
+
+        # Store the collected SFP data sorted by interface
+        sfpList.sort(key=lambda x: x['int_id'])
+        return sfpList
+
+    # Function that collect the SFPs of a switch ('sfp' item) or the counters of both sides of a fabric edge ('counters' item)
+    def _collect_counters_and_sfps(self, item: Tuple[str, Any], main_cookie: getCookie, Urls: UrlClass, User: UserClass) -> Tuple[str, Tuple[Any, ...], Dict[str, Any]]:
+
+        kind, target = item
+
+        ###############
+        #     SFP     #
+        ###############
+        if kind == 'sfp':
+            nodeName, node_id = target
+            return kind, (nodeName,), {'sfp': self._load_node_sfps(nodeName, node_id, main_cookie, Urls, User)}
+
+        ########################
+        #     Edge Counters    #
+        ########################
+        source, dest, key, data = target
+        counters: Dict[str, Any] = {}
+        for side in ('source', 'dest'):
+            side_node_id = data.get(side + '_node_id')
+            side_int_id = str(data.get(side + '_interface_id') or '').lower()
+            if side_node_id is None or not side_int_id:
+                continue
+            counter_json = main_cookie.get_request(Urls.getChassisInterfaceOperationalCounterStatus().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + str(side_node_id)).replace('%s', side_int_id))
+            counters.update(self._edge_counter_attributes(side, self.parser.getSwitchSingleOperationalCounterIntInfo(counter_json)))
+        return kind, (source, dest, key), counters
+
+    # Function that build the fabric edge attributes, the counters are filled in the Counters & SFPs section
+    def _fabric_edge_attributes(self, node_id: str, neighbor_name: Dict[str, Any], source_int_oper: Optional[Dict[str, Any]], dest_int_oper: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+
+        edge_attributes: Dict[str, Any] = {
+            'source_node_id'                     : node_id,
+            'source_interface_speed'             : neighbor_name.get('source_int_speed'),
+            'source_interface_id'                : neighbor_name.get('source_int_id'),
+            'source_interface_mtu'               : neighbor_name.get('source_int_mtu'),
+            'source_interface_adminSt'           : neighbor_name.get('source_int_adminSt'),
+            'source_interface_mode'              : neighbor_name.get('source_int_mode'),
+            'source_interface_operSt'            : source_int_oper.get('operSt') if source_int_oper else None,
+            'source_interface_operAllowedVlans'  : source_int_oper.get('allowedVlans') if source_int_oper else None,
+            'source_interface_operLastErrors'    : source_int_oper.get('lastErrors') if source_int_oper else None,
+            'source_interface_operLastLinkStChg' : source_int_oper.get('lastLinkStChg') if source_int_oper else None,
+            'source_interface_operOperDuplex'    : source_int_oper.get('operDuplex') if source_int_oper else None,
+            'source_interface_operOperMode'      : source_int_oper.get('operMode') if source_int_oper else None,
+            'source_interface_operSpeed'         : source_int_oper.get('operSpeed') if source_int_oper else None,
+        }
+        edge_attributes.update(self._edge_counter_attributes('source', None))
+        edge_attributes.update({
+            'dest_node_id'                       : neighbor_name.get('neighbor_id'),
+            'dest_interface_id'                  : neighbor_name.get('destInt'),
+            'dest_interface_speed'               : dest_int_oper.get('operSpeed') if dest_int_oper else None,
+            'dest_interface_mtu'                 : neighbor_name.get('dest_int_mtu'),
+            'dest_interface_adminSt'             : neighbor_name.get('dest_int_adminSt'),
+            'dest_interface_mode'                : neighbor_name.get('dest_int_mode'),
+            'dest_interface_operSt'              : dest_int_oper.get('operSt') if dest_int_oper else None,
+            'dest_interface_operAllowedVlans'    : dest_int_oper.get('allowedVlans') if dest_int_oper else None,
+            'dest_interface_operLastErrors'      : dest_int_oper.get('lastErrors') if dest_int_oper else None,
+            'dest_interface_operLastLinkStChg'   : dest_int_oper.get('lastLinkStChg') if dest_int_oper else None,
+            'dest_interface_operOperDuplex'      : dest_int_oper.get('operDuplex') if dest_int_oper else None,
+            'dest_interface_operOperMode'        : dest_int_oper.get('operMode') if dest_int_oper else None,
+            'dest_interface_operSpeed'           : dest_int_oper.get('operSpeed') if dest_int_oper else None,
+        })
+        edge_attributes.update(self._edge_counter_attributes('dest', None))
+        return edge_attributes
+
+    # Function that return the counters of one side of the fabric edge ('source_'/'dest_' prefix)
+    def _edge_counter_attributes(self, side: str, counters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        return {side + '_' + counter: counters.get(counter) if counters else None for counter in self.EDGE_COUNTERS}
 
     # Helper function for concurrent LLDP neighbor fetching
-    def _get_lldp_neighbor_info(self, main_cookie: getCookie, Urls: UrlClass, User: UserClass, node_id: str, fabricInt: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], Optional[Dict[str, Any]], Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    def _get_lldp_neighbor_info(self, main_cookie: getCookie, Urls: UrlClass, User: UserClass, node_id: str, fabricInt: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
         # Ensure fabric_int_id is a string before concatenation
         fabric_int_id_opt = fabricInt.get('id')
         if fabric_int_id_opt is None:
-            return None, None, None, None, None
+            return None, None, None
 
         fabric_int_id: str = str(fabric_int_id_opt)
 
@@ -529,15 +636,15 @@ class ACIController(metaclass=_PrivateCookie):
                 main_cookie.get_request(Urls.getChassisInterfaceStatus().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + neighbor_name.get('neighbor_id')).replace('eth%s/%s', dest_int_id))
             )
 
-            source_oper_inter_json = main_cookie.get_request(Urls.getChassisInterfaceOperationalStatus().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + node_id).replace('eth%s/%s', fabric_int_id.lower()))
-            destination_oper_inter_json = main_cookie.get_request(Urls.getChassisInterfaceOperationalStatus().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + neighbor_name.get('neighbor_id')).replace('eth%s/%s', dest_int_id))
-            source_operational_counter_int_json = main_cookie.get_request(Urls.getChassisInterfaceOperationalCounterStatus().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + node_id).replace('%s', fabric_int_id.lower()))
-            dest_operational_counter_int_json = main_cookie.get_request(Urls.getChassisInterfaceOperationalCounterStatus().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + neighbor_name.get('neighbor_id')).replace('%s', dest_int_id))
+            # Operational status of both sides of the link
+            source_oper_inter: Optional[Dict[str, Any]] = None
+            destination_oper_inter: Optional[Dict[str, Any]] = None
+            if self.collects('ethpmPhysIf'):
+                source_oper_inter_json = main_cookie.get_request(Urls.getChassisInterfaceOperationalStatus().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + node_id).replace('eth%s/%s', fabric_int_id.lower()))
+                destination_oper_inter_json = main_cookie.get_request(Urls.getChassisInterfaceOperationalStatus().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + neighbor_name.get('neighbor_id')).replace('eth%s/%s', dest_int_id))
 
-            source_oper_inter = self.parser.getSwitchSingleOperationalIntInfo(source_oper_inter_json)
-            destination_oper_inter = self.parser.getSwitchSingleOperationalIntInfo(destination_oper_inter_json)
-            source_oper_int_counter = self.parser.getSwitchSingleOperationalCounterIntInfo(source_operational_counter_int_json)
-            dest_oper_int_counter = self.parser.getSwitchSingleOperationalCounterIntInfo(dest_operational_counter_int_json)
+                source_oper_inter = self.parser.getSwitchSingleOperationalIntInfo(source_oper_inter_json)
+                destination_oper_inter = self.parser.getSwitchSingleOperationalIntInfo(destination_oper_inter_json)
 
             neighbor_name['source_int_speed'] = str(fabricInt.get('speed', ''))
             neighbor_name['source_int_mtu'] = str(fabricInt.get('mtu', ''))
@@ -550,8 +657,8 @@ class ACIController(metaclass=_PrivateCookie):
                 neighbor_name['dest_int_adminSt'] = neighbor_interface_status.get('adminSt')
                 neighbor_name['dest_int_mode'] = neighbor_interface_status.get('mode')
 
-            return neighbor_name, source_oper_inter, destination_oper_inter, source_oper_int_counter, dest_oper_int_counter
-        return None, None, None, None, None
+            return neighbor_name, source_oper_inter, destination_oper_inter
+        return None, None, None
 
     # New Helper function for concurrent operational status fetching
     def _get_operational_info(self, main_cookie: getCookie, Urls: UrlClass, User: UserClass, node_id: str, interface_info: Dict[str, Any]) -> Optional[Dict[str, Union[str, Dict[str, Any]]]]:
@@ -565,18 +672,3 @@ class ACIController(metaclass=_PrivateCookie):
             port_status = main_cookie.get_request(Urls.getChassisInterfaceOperationalStatus().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + node_id).replace('eth%s/%s', int_id.lower()))
             return {'nodeID': node_id, 'intID': int_id.lower(), 'operSt': self.parser.getSwitchSingleOperationalIntInfo(port_status)}
         return None
-
-    # New Helper function for concurrent SFP info fetching
-    def _get_sfp_info(self, main_cookie: getCookie, Urls: UrlClass, User: UserClass, node_id: str, interface_info: Dict[str, Any]) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
-        int_id_opt = interface_info.get('id')
-        if int_id_opt is None:
-            return None
-
-        int_id: str = str(int_id_opt)
-
-        if int_id != "":
-            sfp_port_info_json = main_cookie.get_request(Urls.getChassisInterfaceSfp().replace('https://%s',"https://" + User.base_url).replace('node-%s', 'node-' + node_id).replace('eth%s/%s', int_id.lower()))
-            sfp_port_tuple = self.parser.getSwitchSfpInfo(sfp_port_info_json, int_id.lower())
-            if sfp_port_tuple:
-                return sfp_port_tuple
-        return None
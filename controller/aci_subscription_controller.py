@@ -0,0 +1,390 @@
+# coding=utf-8
+
+#########################################################################
+#  Class that will subscribe to the Cisco ACI MO classes used by the    #
+#  Graph and will apply the events pushed by the APIC Websocket to the  #
+#  Node and Edge attributes in place (no re-polling needed)             #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Callable, Dict, List, Optional, Type, Tuple
+from aci_api_client.getCookie import getCookie
+from aci_api_client.Url import UrlClass
+from aci_api_client.UserClass import UserClass
+from model.aci_lazy_attributes import peekAttribute
+from model.aci_node_index import graphNodeIndex
+from parsers.aci_parser import ACITroubleshooterParser
+from parsers.aci_dn_parser import ACIDnParser
+from analysis.aci_path_analyzer import FabricPathAnalyzer
+from datetime import datetime
+import networkx as nx
+import threading
+import json
+import ssl
+
+###########################
+# Private Singleton Class #
+###########################
+
+class _PrivateCookie(type):
+
+    _instances: Dict[Type[Any], Any] = {}
+
+    def __call__(cls, *args, **kwargs):
+
+        if cls not in cls._instances:
+            instance = super().__call__(*args, **kwargs)
+            cls._instances[cls] = instance
+        return cls._instances[cls]
+
+#########################################################################################################
+# ACISubscriptionController Class that keep the Graph live with the APIC MO subscriptions               #
+#########################################################################################################
+
+class ACISubscriptionController(metaclass=_PrivateCookie):
+
+    # APIC expires the subscriptions after 90 seconds without refresh
+    SUBSCRIPTION_REFRESH_INTERVAL: int = 30
+
+    # Operational attributes (ethpmPhysIf) mapped to the fabric edge attribute suffix
+    EDGE_OPERATIONAL_MAP: Dict[str, str] = {
+        'operSt'        : 'interface_operSt',
+        'allowedVlans'  : 'interface_operAllowedVlans',
+        'lastErrors'    : 'interface_operLastErrors',
+        'lastLinkStChg' : 'interface_operLastLinkStChg',
+        'operDuplex'    : 'interface_operOperDuplex',
+        'operMode'      : 'interface_operOperMode',
+        'operSpeed'     : 'interface_operSpeed',
+    }
+
+    # Operational attributes (ethpmPhysIf) stored in the downlink edges
+    DOWNLINK_OPERATIONAL_KEYS: Tuple[str, ...] = ('operVlans', 'allowedVlans', 'backplaneMac', 'lastLinkStChg', 'operMode', 'operSpeed', 'operSt')
+
+    # Operational attributes (ethpmPhysIf) stored in the node 'opt_interfaces' list
+    NODE_OPERATIONAL_KEYS: Tuple[str, ...] = ('accessVlan', 'allowedVlans', 'lastErrors', 'lastLinkStChg', 'operDuplex', 'operMode', 'operSpeed', 'operSt')
+
+    def __init__(self) -> None:
+        self.parser: ACITroubleshooterParser = ACITroubleshooterParser()
+        self.dn_parser: ACIDnParser = ACIDnParser()
+        self.__graph: Optional[nx.Graph] = None
+        self.__main_cookie: Any = None
+        self.__Urls: Optional[UrlClass] = None
+        self.__User: Optional[UserClass] = None
+        self.__transport_factory: Optional[Callable[[str], Any]] = None
+        self.__websocket: Any = None
+        self.__subscriptions: Dict[str, str] = {}
+        self.__node_names: Dict[str, str] = {}
+        self.__lock: threading.RLock = threading.RLock()
+        self.__stop: threading.Event = threading.Event()
+        self.__threads: List[threading.Thread] = []
+
+    ##################
+    # Public Methods #
+    ##################
+
+    # Method that subscribe to all MO classes used by the Graph, open the Websocket and start the
+    # receiver/refresh threads. 'transport_factory' receive the websocket URL and return an object with recv/close
+    def startSubscriptions(self, graph: nx.Graph, main_cookie: getCookie, Urls: UrlClass, User: UserClass, transport_factory: Optional[Callable[[str], Any]] = None) -> None:
+
+        self.__graph = graph
+        self.__main_cookie = main_cookie
+        self.__Urls = Urls
+        self.__User = User
+        self.__transport_factory = transport_factory if transport_factory else self.__openWebsocket
+        self.__stop.clear()
+
+        # Status shown in the Menu
+        graph.graph['subscription_status'] = {'state': 'connecting', 'subscriptions': 0, 'events': 0, 'last_event': None}
+
+        # Websocket must be opened before the subscription, APIC link the subscription IDs to the token socket
+        self.__connect()
+
+        # Thread that receive the events and thread that keep the subscription IDs renewed
+        self.__threads = [
+            threading.Thread(target=self.__receiverLoop, name="aci-subscription-receiver", daemon=True),
+            threading.Thread(target=self.__refreshLoop, name="aci-subscription-refresh", daemon=True),
+        ]
+        for thread in self.__threads:
+            thread.start()
+
+    # Method that stop the threads and close the Websocket
+    def stopSubscriptions(self) -> None:
+        self.__stop.set()
+        self.__closeWebsocket()
+        for thread in self.__threads:
+            thread.join(timeout=5)
+        self.__threads = []
+        if self.__graph is not None:
+            self.__graph.graph.setdefault('subscription_status', {})['state'] = 'stopped'
+
+    # Method that apply an APIC Websocket message to the Graph
+    def applyEvent(self, graph: nx.Graph, message: Dict[str, Any]) -> int:
+
+        # Auxilear counter with the number of MOs applied into the Graph
+        applied = 0
+
+        # Auxilear Dict with the MO attributes of the message by class (the APIC can push several MOs at once)
+        batches: Dict[str, List[Dict[str, Any]]] = {}
+        for mo in message.get('imdata', []):
+            for mo_class, mo_body in mo.items():
+                if mo_class in self.__handlers():
+                    batches.setdefault(mo_class, []).append(mo_body.get('attributes', {}))
+
+        # The Graph lock is shared with the background collection and the Menu reports
+        with graph.graph.get('graph_lock') or self.__lock:
+
+            # The MOs of every class are grouped by the node of their DN, the node is resolved once per group
+            for mo_class, batch in batches.items():
+                handler = self.__handlers()[mo_class]
+                for node_id, group in self.dn_parser.groupByNode(batch).items():
+                    node = self._node_from_id(graph, node_id)
+                    if node is None:
+                        continue
+                    for attributes in group:
+                        if handler(graph, node, attributes):
+                            applied += 1
+
+            # Updating the status shown in the Menu
+            status = graph.graph.setdefault('subscription_status', {'state': 'live', 'subscriptions': 0, 'events': 0, 'last_event': None})
+            status['events'] = status.get('events', 0) + applied
+            status['last_event'] = datetime.now().strftime('%H:%M:%S')
+
+        return applied
+
+    ####################
+    # Privates Methods #
+    ####################
+
+    # Returning the MO class handlers (Graph, node of the DN, MO attributes)
+    def __handlers(self) -> Dict[str, Callable[[nx.Graph, str, Dict[str, Any]], bool]]:
+        return {
+            'fabricNode'  : self._apply_fabric_node,
+            'faultSummary': self._apply_fault_summary,
+            'ethpmPhysIf' : self._apply_operational_interface,
+            'lldpAdjEp'   : self._apply_lldp_adjacency,
+            'eqptPsu'     : self._apply_power_supply,
+        }
+
+    # Returning the subscription URL per MO class
+    def __subscriptionUrls(self) -> Dict[str, str]:
+        Urls = self.__Urls
+        return {
+            'fabricNode'  : Urls.getSubscriptionFabricNode(),
+            'faultSummary': Urls.getSubscriptionFaultSummary(),
+            'ethpmPhysIf' : Urls.getSubscriptionOperationalInterface(),
+            'lldpAdjEp'   : Urls.getSubscriptionLldpAdjacency(),
+            'eqptPsu'     : Urls.getSubscriptionPowerSupply(),
+        }
+
+    # Opening the APIC Websocket, websocket-client is only required when the subscriptions are enabled
+    def __openWebsocket(self, url: str) -> Any:
+        try:
+            import websocket
+        except ImportError:
+            raise Exception("The 'websocket-client' library is required for the APIC subscriptions (pip install websocket-client)")
+        return websocket.create_connection(url, sslopt={"cert_reqs": ssl.CERT_NONE})
+
+    # Closing the Websocket ignoring errors of already closed sockets
+    def __closeWebsocket(self) -> None:
+        if self.__websocket is not None:
+            try:
+                self.__websocket.close()
+            except Exception:
+                pass
+
+    # Opening the Websocket with the current token and subscribing to all the MO classes
+    def __connect(self) -> None:
+
+        # The token can change when getCookie refresh the login, so the socket URL is built every time
+        socket_url = self.__Urls.getSubscriptionWebsocket() % (self.__User.base_url, self.__main_cookie.getToken())
+        self.__websocket = self.__transport_factory(socket_url)
+
+        self.__subscriptions = {}
+        for mo_class, url in self.__subscriptionUrls().items():
+            try:
+                subscription = self.__main_cookie.get_request(url.replace('https://%s', "https://" + self.__User.base_url))
+                if subscription.get('subscriptionId'):
+                    self.__subscriptions[mo_class] = str(subscription['subscriptionId'])
+            except Exception as e:
+                print(f"Error subscribing to the MO class {mo_class}: {e}")
+
+        status = self.__graph.graph.setdefault('subscription_status', {})
+        status['state'] = 'live'
+        status['subscriptions'] = len(self.__subscriptions)
+
+    # Thread that wait for the Websocket events, if the socket is closed by the APIC (token expired)
+    # the socket is opened again and all the subscriptions are registered again
+    def __receiverLoop(self) -> None:
+        while not self.__stop.is_set():
+            try:
+                message = self.__websocket.recv()
+                if message:
+                    self.applyEvent(self.__graph, json.loads(message))
+            except Exception as e:
+                if self.__stop.is_set():
+                    break
+                self.__graph.graph.setdefault('subscription_status', {})['state'] = 'reconnecting'
+                self.__closeWebsocket()
+                try:
+                    self.__connect()
+                except Exception as error:
+                    print(f"Error reconnecting the APIC Websocket: {error}")
+                    self.__stop.wait(self.SUBSCRIPTION_REFRESH_INTERVAL)
+
+    # Thread that refresh all the subscription IDs before they expire
+    def __refreshLoop(self) -> None:
+        while not self.__stop.wait(self.SUBSCRIPTION_REFRESH_INTERVAL):
+            for mo_class, subscription_id in list(self.__subscriptions.items()):
+                url = self.__Urls.getSubscriptionRefresh() % (self.__User.base_url, subscription_id)
+                try:
+                    error = self.__responseError(self.__main_cookie.get_request(url))
+                except Exception as e:
+                    error = str(e)
+
+                # Subscription lost (expired or unknown ID), registering the MO class again
+                if error is not None:
+                    self.__resubscribe(mo_class, error)
+
+    # Returning the error text of an APIC response (error object in 'imdata'), None when the response has no error
+    def __responseError(self, response: Any) -> Optional[str]:
+        if not isinstance(response, dict):
+            return "Unexpected APIC response"
+        for mo in response.get('imdata', []):
+            if 'error' in mo:
+                attributes = mo['error'].get('attributes', {})
+                return "{} {}".format(attributes.get('code', 'N/A'), attributes.get('text', '')).strip()
+        return None
+
+    # Registering again the subscription of a MO class whose refresh failed, the failure is kept in the status
+    def __resubscribe(self, mo_class: str, error: str) -> None:
+
+        status = self.__graph.graph.setdefault('subscription_status', {})
+        status['refresh_failures'] = status.get('refresh_failures', 0) + 1
+        status['last_error'] = f"{mo_class}: {error} ({datetime.now().strftime('%H:%M:%S')})"
+
+        # The old ID is kept when the registration fails, the next refresh tries again
+        try:
+            subscription = self.__main_cookie.get_request(self.__subscriptionUrls()[mo_class].replace('https://%s', "https://" + self.__User.base_url))
+            if self.__responseError(subscription) is None and subscription.get('subscriptionId'):
+                self.__subscriptions[mo_class] = str(subscription['subscriptionId'])
+            else:
+                print(f"Error refreshing the subscription for {mo_class}: {self.__responseError(subscription) or 'no subscription ID'}")
+        except Exception as e:
+            print(f"Error refreshing the subscription for {mo_class}: {e}")
+        status['subscriptions'] = len(self.__subscriptions)
+
+    # Returning the Graph node name from the Node ID of the DN
+    def _node_from_id(self, graph: nx.Graph, node_id: str) -> Optional[str]:
+
+        # Graphs with Node Index (ACIFabricGraph) answer from the index
+        node_index = graphNodeIndex(graph)
+        if node_index is not None:
+            return node_index.nodeName(node_id)
+
+        # The map is built again on misses, nodes can be added while the Graph is being filled
+        if node_id not in self.__node_names or self.__node_names[node_id] not in graph:
+            self.__node_names = {str(data.get('id')): node for node, data in graph.nodes(data=True) if data.get('id') is not None}
+        return self.__node_names.get(node_id)
+
+    # Returning the Interface ID in the DN (lower case, as stored in the Graph)
+    def _interface_from_dn(self, dn: str) -> Optional[str]:
+        return self.dn_parser.interfaceId(dn)
+
+    # Applying fabricNode events (fabricSt, adSt, etc.) into the node attributes
+    def _apply_fabric_node(self, graph: nx.Graph, node: str, attributes: Dict[str, Any]) -> bool:
+        node_attributes = graph.nodes[node]
+        for key, value in attributes.items():
+            if key in node_attributes and key not in ('dn', 'status', 'name'):
+                node_attributes[key] = value
+        return True
+
+    # Applying faultSummary events into the node 'faults' list
+    def _apply_fault_summary(self, graph: nx.Graph, node: str, attributes: Dict[str, Any]) -> bool:
+        # Faults not fetched yet (lazy attribute) will be fetched with the current state
+        faults = peekAttribute(graph.nodes[node], 'faults')
+        if faults is None:
+            return False
+        # Only the fault fields stored in the Graph (same projection as the collector)
+        fault_attributes = self.parser.projectAttributes('faultSummary', attributes)
+
+        # Existing fault with the same DN (the DN is the identity of the fault, a code can be raised on several DNs)
+        current = next((fault for fault in faults if fault.get('dn') == attributes.get('dn')), None)
+
+        if attributes.get('status') == 'deleted':
+            if current is not None:
+                faults.remove(current)
+        elif current is not None:
+            current.update(fault_attributes)
+        else:
+            faults.append(self.parser.projectRecord('faultSummary', attributes))
+        return True
+
+    # Applying ethpmPhysIf events into the node 'opt_interfaces', fabric edges and downlink edges
+    def _apply_operational_interface(self, graph: nx.Graph, node: str, attributes: Dict[str, Any]) -> bool:
+        interface = self._interface_from_dn(attributes.get('dn', ''))
+        if interface is None:
+            return False
+        node_id = str(graph.nodes[node].get('id'))
+
+        # Node Operational Interfaces
+        for opt_interface in peekAttribute(graph.nodes[node], 'opt_interfaces', []) or []:
+            if str(opt_interface.get('intID', '')).lower() == interface and isinstance(opt_interface.get('operSt'), dict):
+                opt_interface['operSt'].update({key: attributes[key] for key in self.NODE_OPERATIONAL_KEYS if key in attributes})
+
+        # Interface Table row of the interface
+        table = graph.graph.get('interface_table')
+        row = table.find(node_id, interface) if table is not None else None
+        if row is not None:
+            table.setValues(row, oper_st=attributes.get('operSt'), oper_speed=attributes.get('operSpeed'), oper_mode=attributes.get('operMode'),
+                            oper_duplex=attributes.get('operDuplex'), last_link_change=attributes.get('lastLinkStChg'))
+
+        # Fabric and Downlink Edges attached to the interface
+        for _, _, edge_attributes in graph.edges(node, data=True):
+            if edge_attributes.get('downlink'):
+                if str(edge_attributes.get('leaf')) == node_id and str(edge_attributes.get('leaf_int', '')).lower() == interface:
+                    edge_attributes.update({key: attributes[key] for key in self.DOWNLINK_OPERATIONAL_KEYS if key in attributes})
+                    if graph.graph.get('vlan_index') is not None:
+                        graph.graph['vlan_index'].setPort(node, interface, attributes.get('operVlans'), attributes.get('allowedVlans'))
+                continue
+            for side in ('source', 'dest'):
+                if str(edge_attributes.get(side + '_node_id')) == node_id and str(edge_attributes.get(side + '_interface_id', '')).lower() == interface:
+                    for key, suffix in self.EDGE_OPERATIONAL_MAP.items():
+                        if key in attributes:
+                            edge_attributes[side + '_' + suffix] = attributes[key]
+
+        # Leaf-to-leaf paths using the fabric links of the node
+        FabricPathAnalyzer().linkEvent(graph, node)
+        return True
+
+    # Applying lldpAdjEp events into the fabric edges attached to the local interface
+    def _apply_lldp_adjacency(self, graph: nx.Graph, node: str, attributes: Dict[str, Any]) -> bool:
+        interface = self._interface_from_dn(attributes.get('dn', ''))
+        if interface is None:
+            return False
+        node_id = str(graph.nodes[node].get('id'))
+        lldp_state = 'lost' if attributes.get('status') == 'deleted' else 'up'
+
+        for _, _, edge_attributes in graph.edges(node, data=True):
+            for side in ('source', 'dest'):
+                if str(edge_attributes.get(side + '_node_id')) == node_id and str(edge_attributes.get(side + '_interface_id', '')).lower() == interface:
+                    edge_attributes['lldp_adjacency'] = lldp_state
+
+        # Leaf-to-leaf paths using the fabric links of the node
+        FabricPathAnalyzer().linkEvent(graph, node)
+        return True
+
+    # Applying eqptPsu events into the switch 'psus' or APIC 'apic_power_supplies' list
+    def _apply_power_supply(self, graph: nx.Graph, node: str, attributes: Dict[str, Any]) -> bool:
+        slot = self.dn_parser.parseDn(attributes.get('dn', '')).slot
+        if slot is None:
+            return False
+        node_attributes = graph.nodes[node]
+        psu_list = peekAttribute(node_attributes, 'psus') if 'psus' in node_attributes else peekAttribute(node_attributes, 'apic_power_supplies')
+        for psu in psu_list or []:
+            if str(psu.get('id')) == slot:
+                psu.update({key: value for key, value in attributes.items() if key in psu})
+                return True
+        return False
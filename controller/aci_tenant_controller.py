@@ -9,11 +9,13 @@
 # Import Section #
 ##################
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from parsers.aci_parser import ACITroubleshooterParser
+from parsers.aci_parse_pool import ACIParsePool
 from aci_api_client.getCookie import getCookie
 from aci_api_client.Url import UrlClass
 from aci_api_client.UserClass import UserClass
+import concurrent.futures
 
 ###########################
 # Private Singleton Class #
@@ -38,32 +40,63 @@ class ACITenantController(metaclass=_PrivateCookie):
 
     def __init__(self) -> None:
         self.parser: ACITroubleshooterParser = ACITroubleshooterParser()
+        self.parse_pool: ACIParsePool = ACIParsePool()
 
     ##################
     # Public Methods #
     ##################
 
-    # Function that fetches and returns the full tenant subtree data.
+    # Function that lists the Tenants and fetches the subtree of each Tenant concurrently.
     def getFabricTenantConfig(self, main_cookie: getCookie, Urls: UrlClass, User: UserClass) -> Tuple[str, Dict[str, Any]]:
 
         # Define a single 'root' node name for all fabric-wide configuration data
         fabric_config_node_name = "Fabric_Config_Root"
-        fabric_config_attributes: Dict[str, Any] = {'role': 'fabric_config_root'}
+        fabric_config_attributes: Dict[str, Any] = {'role': 'fabric_config_root', 'tenants': [], 'tenant_errors': {}}
 
-        # Fetching Full Tenant Subtree
+        # Listing the Tenants deployed in the Fabric (only the fvTenant attributes, no subtree)
         try:
-            apic_url = Urls.getTenantFullSubtree().replace('https://%s', "https://" + User.base_url)
-            AciTenantFullSubtree = main_cookie.get_request(apic_url)
-            tenant_data = self.parser.getTenantFullSubtreeInfo(AciTenantFullSubtree)
-
-            if tenant_data:
-                # Store the raw, nested tenant configuration subtree
-                fabric_config_attributes['tenants'] = tenant_data
+            apic_url = Urls.getTenantsDeployed().replace('https://%s', "https://" + User.base_url)
+            tenant_names: List[str] = [tenant['fvTenant']['attributes']['name'] for tenant in self.parser.getTenantFullSubtreeInfo(main_cookie.get_request(apic_url))]
 
         except Exception as e:
             # Handle API/Network errors gracefully
             fabric_config_attributes['error'] = f"Failed to fetch tenant configuration: {e}"
-            fabric_config_attributes['tenants'] = []
+            return (fabric_config_node_name, fabric_config_attributes)
+
+        # Auxilear Dict with the subtree of each Tenant
+        tenant_subtrees: Dict[str, Dict[str, Any]] = {}
+
+        # Fetching the subtree of every Tenant concurrently
+        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+            futures = {executor.submit(self._get_tenant_subtree, main_cookie, Urls, User, tenant_name): tenant_name for tenant_name in tenant_names}
+
+            for future in concurrent.futures.as_completed(futures):
+                tenant_name = futures[future]
+                try:
+                    tenant_subtree = future.result()
+                    if tenant_subtree is not None:
+                        tenant_subtrees[tenant_name] = tenant_subtree
+                    else:
+                        fabric_config_attributes['tenant_errors'][tenant_name] = "Tenant not returned by the APIC"
+                except Exception as e:
+                    # A failed Tenant does not discard the others
+                    fabric_config_attributes['tenant_errors'][tenant_name] = f"Failed to fetch tenant subtree: {e}"
+
+        # Merging the subtrees keeping the order of the Tenant list
+        fabric_config_attributes['tenants'] = [tenant_subtrees[tenant_name] for tenant_name in tenant_names if tenant_name in tenant_subtrees]
 
         # Return the config data as a single node tuple for the NetworkX graph
         return (fabric_config_node_name, fabric_config_attributes)
+
+    ####################
+    # Privates Methods #
+    ####################
+
+    # Function that fetches the subtree of a single Tenant, restricted to the classes used by the reports
+    def _get_tenant_subtree(self, main_cookie: getCookie, Urls: UrlClass, User: UserClass, tenant_name: str) -> Optional[Dict[str, Any]]:
+
+        apic_url = Urls.getTenantSubtree().replace('https://%s', "https://" + User.base_url).replace('tn-%s', 'tn-' + tenant_name)
+        tenant_data = self.parse_pool.requestParsed(main_cookie, apic_url, 'getTenantFullSubtreeInfo')
+
+        # The MO query returns a single fvTenant object
+        return tenant_data[0] if tenant_data else None
@@ -0,0 +1,225 @@
+# coding=utf-8
+
+#########################################################################
+#  Class that will watch the counters (rmonEtherStats) and operational  #
+#  status (ethpmPhysIf) of a set of fabric links at a fixed interval    #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Callable, Dict, Type, List, Optional, Sequence, Tuple
+from aci_api_client.getCookie import getCookie
+from aci_api_client.Url import UrlClass
+from aci_api_client.UserClass import UserClass
+from analysis.aci_error_analyzer import FabricErrorAnalyzer
+from parsers.aci_parse_pool import ACIParsePool
+from model.aci_watched_interface import WatchedInterface
+from model.aci_counter_store import CounterStore
+from model.aci_interface_table import InterfaceTable
+from datetime import datetime
+import networkx as nx
+import concurrent.futures
+import threading
+import time
+
+###########################
+# Private Singleton Class #
+###########################
+
+class _PrivateCookie(type):
+
+    _instances: Dict[Type[Any], Any] = {}
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+
+        if cls not in cls._instances:
+            instance = super().__call__(*args, **kwargs)
+            cls._instances[cls] = instance
+        return cls._instances[cls]
+
+#########################################################################################################
+# ACIWatchController Class. Every poll sends two node-wide class queries per watched switch             #
+# (rmonEtherStats and ethpmPhysIf), whatever the number of watched interfaces of the switch, through a  #
+# thread pool kept for the whole watch and the keep-alive connections of the cookie session. A poll     #
+# starts only when the previous one is complete: when a poll takes longer than the interval the missed  #
+# ticks are skipped (counted as 'late') instead of queueing requests                                    #
+#########################################################################################################
+
+class ACIWatchController(metaclass=_PrivateCookie):
+
+    # Default seconds between polls
+    DEFAULT_INTERVAL: float = 5
+
+    # Polls kept in the rolling window of every interface
+    HISTORY: int = 12
+
+    # Maximum concurrent requests of a poll
+    MAX_WORKERS: int = 16
+
+    # Counters watched: the error counters of the reports plus the received packets and octets
+    WATCH_COUNTERS: Tuple[str, ...] = FabricErrorAnalyzer.ERROR_COUNTERS + ('pkts', 'octets')
+
+    def __init__(self) -> None:
+        self.parse_pool: ACIParsePool = ACIParsePool()
+        self.status: Dict[str, Any] = {}
+        self.__targets: Dict[str, Dict[str, WatchedInterface]] = {}
+        self.__last_poll: Dict[str, float] = {}
+        self.__counter_store: Optional[CounterStore] = None
+        self.__stop: threading.Event = threading.Event()
+
+    ##################
+    # Public Methods #
+    ##################
+
+    # Method that selects the interfaces to watch from the fabric edges of the Graph. Every target is a node
+    # (name or ID: both sides of all its fabric links) or NODE:INTERFACE (both sides of that link, or that
+    # interface if it is not a fabric link). No targets: all the fabric links
+    def selectTargets(self, graph: nx.Graph, targets: Sequence[str] = ()) -> List[WatchedInterface]:
+
+        # Auxilear Dicts with the node names by ID and the IDs by name
+        names = {str(data.get('id')): node for node, data in graph.nodes(data=True) if data.get('id') is not None}
+        ids = {node: node_id for node_id, node in names.items()}
+
+        # Auxilear List with both sides of every fabric link ((node_id, port), (peer node_id, peer port))
+        links: List[Tuple[Tuple[str, str], Tuple[str, str]]] = []
+        for _, _, data in graph.edges(data=True):
+            if data is None or data.get('downlink'):
+                continue
+            sides = [(str(data.get(side + '_node_id')), str(data.get(side + '_interface_id') or '').lower()) for side in ('source', 'dest')]
+            if all(node_id in names and port for node_id, port in sides):
+                links += [(sides[0], sides[1]), (sides[1], sides[0])]
+
+        # Auxilear Dict with the selected interfaces and their peer ((node_id, port) -> peer)
+        selected: Dict[Tuple[str, str], Optional[Tuple[str, str]]] = {}
+        for target in targets or [None]:
+            if target is None:
+                selected.update(links)
+                continue
+            node, _, port = str(target).partition(':')
+            node_id = ids.get(node, node if node in names else None)
+            if node_id is None:
+                raise ValueError(f"Unknown watch target '{target}', expected a node name/ID or NODE:INTERFACE")
+            matches = [link for link in links if link[0][0] == node_id and (not port or link[0][1] == port.lower())]
+            for side, peer in matches:
+                selected[side] = peer
+                selected[peer] = side
+            if port and not matches:
+                selected[(node_id, port.lower())] = None
+
+        # Watched interfaces grouped by switch (one pair of queries per switch)
+        self.__targets = {}
+        self.__last_poll = {}
+        for (node_id, port), peer in sorted(selected.items()):
+            peer_label = f"{names.get(peer[0], peer[0])} {peer[1]}" if peer else "-"
+            self.__targets.setdefault(node_id, {})[port] = WatchedInterface(names[node_id], node_id, port, peer_label, self.WATCH_COUNTERS, FabricErrorAnalyzer.ERROR_COUNTERS, self.HISTORY)
+        self.status = {'nodes': len(self.__targets), 'interfaces': len(selected), 'polls': 0, 'late': 0, 'requests': 0, 'failed': 0, 'last_poll': None, 'poll_seconds': 0.0, 'interval': None, 'last_error': None}
+
+        return self.interfaces()
+
+    # Method that returns the watched interfaces
+    def interfaces(self) -> List[WatchedInterface]:
+        return [interface for ports in self.__targets.values() for interface in ports.values()]
+
+    # Method that sets the Counter Store, the counters of every poll are appended into it
+    def setCounterStore(self, store: Optional[CounterStore]) -> None:
+        self.__counter_store = store
+
+    # Method that polls the counters and the status of all the watched switches once, the deltas are computed
+    # in place in the watched interfaces. Returns the seconds spent
+    def pollOnce(self, executor: concurrent.futures.Executor, main_cookie: getCookie, Urls: UrlClass, User: UserClass) -> float:
+
+        started = time.monotonic()
+        queries = (('counters', Urls.getChassisNodeInterfaceCounters(), 'getSwitchOperationalCountersByInt'),
+                   ('status', Urls.getChassisNodeOperationalInterfaceStatus(), 'getSwitchOperationalStatusByInt'))
+
+        futures = {
+            executor.submit(self.parse_pool.requestParsed, main_cookie, url.replace('https://%s', "https://" + User.base_url).replace('node-%s', 'node-' + node_id), parser_method): (node_id, kind)
+            for node_id in self.__targets for kind, url, parser_method in queries
+        }
+
+        # Results applied in this thread as they arrive (the watched interfaces are only updated here)
+        for future in concurrent.futures.as_completed(futures):
+            node_id, kind = futures[future]
+            self.status['requests'] += 1
+            try:
+                result = future.result()
+            except Exception as e:
+                self.status['failed'] += 1
+                self.status['last_error'] = f"Error polling the {kind} of node {node_id}: {e}"
+                continue
+            if kind == 'counters':
+                self.__applyCounters(node_id, result, time.monotonic())
+            else:
+                self.__applyStatus(node_id, result)
+
+        self.status['polls'] += 1
+        self.status['last_poll'] = datetime.now().strftime('%H:%M:%S')
+        self.status['poll_seconds'] = time.monotonic() - started
+
+        if self.__counter_store is not None:
+            self.__storeSamples()
+
+        return self.status['poll_seconds']
+
+    # Method that polls the watched interfaces every 'interval' seconds until stopWatch() (or 'iterations' polls),
+    # 'report' is called after every poll with the Watch Controller
+    def watch(self, main_cookie: getCookie, Urls: UrlClass, User: UserClass, interval: float = DEFAULT_INTERVAL, report: Optional[Callable[["ACIWatchController"], None]] = None, iterations: Optional[int] = None) -> None:
+
+        self.__stop.clear()
+        self.status['interval'] = interval
+        workers = max(1, min(self.MAX_WORKERS, 2 * len(self.__targets)))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aci-counter-watch") as executor:
+            deadline = time.monotonic()
+            while not self.__stop.is_set():
+                self.pollOnce(executor, main_cookie, Urls, User)
+                if report is not None:
+                    report(self)
+                if iterations is not None and self.status['polls'] >= iterations:
+                    break
+
+                # Next tick, the ticks missed by a slow poll are skipped
+                deadline += interval
+                now = time.monotonic()
+                if now > deadline:
+                    missed = int((now - deadline) // interval) + 1
+                    self.status['late'] += missed
+                    deadline += missed * interval
+                self.__stop.wait(deadline - now)
+
+    # Method that stops the watch loop after the current poll
+    def stopWatch(self) -> None:
+        self.__stop.set()
+
+    ####################
+    # Privates Methods #
+    ####################
+
+    # Applying the counters of a switch into its watched interfaces
+    def __applyCounters(self, node_id: str, counters: Dict[str, Dict[str, Any]], received: float) -> None:
+        previous = self.__last_poll.get(node_id)
+        self.__last_poll[node_id] = received
+        seconds = received - previous if previous is not None else 0.0
+        for port, interface in self.__targets[node_id].items():
+            if port in counters:
+                interface.updateCounters(self.WATCH_COUNTERS, counters[port], seconds)
+
+    # Applying the operational status of a switch into its watched interfaces
+    def __applyStatus(self, node_id: str, status: Dict[str, Dict[str, Any]]) -> None:
+        for port, interface in self.__targets[node_id].items():
+            if port in status:
+                interface.updateStatus(status[port])
+
+    # Appending the counters of the poll into the Counter Store
+    def __storeSamples(self) -> None:
+        samples = [
+            (interface.node_id, interface.port, counter, interface.values[index])
+            for interface in self.interfaces() if interface.polls
+            for index, counter in enumerate(self.WATCH_COUNTERS) if interface.values[index] != InterfaceTable.MISSING
+        ]
+        try:
+            self.__counter_store.appendSamples(samples)
+        except Exception as e:
+            self.status['last_error'] = f"Error appending the counters into the counter store: {e}"
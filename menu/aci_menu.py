@@ -9,7 +9,16 @@
 ##################
 
 from printers.aci_printers import ACITroubleshooterPrinter
+from analysis.aci_error_analyzer import FabricErrorAnalyzer
 from aci_api_client.UserClass import UserClass
+from model.aci_lazy_attributes import materializeAttributes, prefetchAttributes
+from parsers.aci_parse_pool import ACIParsePool
+from model.aci_graph_snapshot import ACIGraphSnapshot
+from analysis.aci_graph_query import ACIGraphQuery
+from analysis.aci_path_analyzer import FabricPathAnalyzer
+from analysis.aci_failure_simulator import FabricFailureSimulator
+from analysis.aci_port_analyzer import PortAnalyzer
+from model.aci_vlan_index import VlanIndex
 from typing import Any, Type
 import os
 import json
@@ -39,6 +48,11 @@ class MenuPrinter(metaclass=_PrivateCookie):
 
     def __init__(self):
         self.__printer = ACITroubleshooterPrinter()
+        self.__error_analyzer = FabricErrorAnalyzer()
+        self.__graph_query = ACIGraphQuery()
+        self.__path_analyzer = FabricPathAnalyzer()
+        self.__failure_simulator = FabricFailureSimulator()
+        self.__port_analyzer = PortAnalyzer()
 
     ##################
     # Public Methods #
@@ -59,7 +73,7 @@ class MenuPrinter(metaclass=_PrivateCookie):
             self.__clear_screen()
 
             # Displaying Main Menu
-            self.__display_menu()
+            self.__display_menu(graph)
 
             # Waiting for user option selection
             choice = input("Enter your choice: ")
@@ -105,7 +119,7 @@ class MenuPrinter(metaclass=_PrivateCookie):
         _ = os.system('clear')
 
     # Private Method that print the main menu with the script banner
-    def __display_menu(self):
+    def __display_menu(self, graph):
 
         # Header for the Fabric Attributes table
         menu_header_keys = [' Menu Option ', ' Option Description ']
@@ -146,6 +160,79 @@ class MenuPrinter(metaclass=_PrivateCookie):
         print("+" + "-" * (len(menu_header_line) - 2) + "+")
         print("-" * len(menu_header_line))
 
+        # Printing the APIC Subscription state when the Graph is kept live
+        self.__display_graph_status(graph, len(menu_header_line))
+
+    # Private Method that run a report holding the Graph lock (the Graph can be filled in background)
+    # and warn the user when the collection is still running. The lazy attributes read by the report
+    # ('attributes', all of them when None) are fetched from the APIC before the lock is taken
+    def __run(self, report, graph, attributes=()):
+
+        # Graph lock created by the ACIController collection. A failed report is reported and the menu keeps running
+        lock = graph.graph.get('graph_lock')
+        try:
+            if attributes is None or attributes:
+                prefetchAttributes(graph, attributes)
+            if lock is None:
+                report(graph)
+            else:
+                with lock:
+                    report(graph)
+        except Exception as e:
+            print(f"An error occurred while running the report: {e} ❌")
+
+        # Report printed with a partial Graph
+        if not graph.graph.get('collection_complete', True):
+            pending = ["{} {}".format(section['label'], self.__progress_text(section)) for section in graph.graph.get('collection_progress', {}).values() if section.get('state') != 'done']
+            print("NOTE: Fabric collection still running, the report can be partial (" + ", ".join(pending) + ")")
+
+    # Private Method that return the progress of a collection section as text
+    def __progress_text(self, section):
+        if section.get('total') is None:
+            return "pending"
+        return "{}/{}".format(section.get('done', 0), section.get('total'))
+
+    # Private Method that print the live state of the Graph below the main menu
+    def __display_graph_status(self, graph, total_width):
+
+        # Background collection progress per section
+        collection_progress = graph.graph.get('collection_progress')
+        if collection_progress and not graph.graph.get('collection_complete', True):
+            for section in collection_progress.values():
+                status_line = " {:<24} {:<10} {}".format(section['label'], self.__progress_text(section), section.get('state', 'N/A'))
+                print("|{:<{width}}|".format(status_line[:total_width - 2], width=total_width - 2))
+            print("-" * total_width)
+        elif graph.graph.get('collection_error'):
+            print(graph.graph['collection_error'])
+
+        # Graph loaded from a snapshot (--snapshot)
+        snapshot = graph.graph.get('snapshot')
+        if snapshot:
+            status_line = " Snapshot: {} (collected {})".format(snapshot.get('path', 'N/A'), snapshot.get('created', 'N/A'))
+            print("|{:<{width}}|".format(status_line[:total_width - 2], width=total_width - 2))
+            print("-" * total_width)
+
+        # Parsing throughput of the worker processes (--parse-workers)
+        parse_stats = graph.graph.get('parse_stats')
+        if parse_stats and parse_stats.get('workers'):
+            status_line = " Parsing: " + ACIParsePool().formatStats()
+            print("|{:<{width}}|".format(status_line[:total_width - 2], width=total_width - 2))
+            print("-" * total_width)
+
+        # APIC Subscriptions (--subscribe)
+        subscription_status = graph.graph.get('subscription_status')
+        if subscription_status:
+            status_line = " Live: {} ({} subs, {} events, last {})".format(
+                subscription_status.get('state', 'N/A'),
+                subscription_status.get('subscriptions', 0),
+                subscription_status.get('events', 0),
+                subscription_status.get('last_event') or 'N/A'
+            )
+            if subscription_status.get('last_error'):
+                status_line += " - {} refresh failures, last {}".format(subscription_status.get('refresh_failures', 0), subscription_status['last_error'])
+            print("|{:<{width}}|".format(status_line[:total_width - 2], width=total_width - 2))
+            print("-" * total_width)
+
     # Menu that will print 
     def __displayApicMenu(self, graph):
 
@@ -212,55 +299,55 @@ class MenuPrinter(metaclass=_PrivateCookie):
 
             # Printing APICs BBDD Sync Status
             elif choice == '1':
-                self.__printer.printApicNodesBbddSyncStatusInfo(graph)
+                self.__run(self.__printer.printApicNodesBbddSyncStatusInfo, graph, ('apic_bbdd_sync',))
                 input()
                 self.__clear_screen()
 
             # Printing Controller Filesystem Info
             elif choice == '2':
-                self.__printer.printApicNodesFileSystemInfo(graph)
+                self.__run(self.__printer.printApicNodesFileSystemInfo, graph, ('apic_filesystem',))
                 input()
                 self.__clear_screen()
 
             # Printing Controller PSU Info
             elif choice == '3':
-                self.__printer.printApicNodesPsuInfo(graph)
+                self.__run(self.__printer.printApicNodesPsuInfo, graph, ('apic_power_supplies',))
                 input()
                 self.__clear_screen()
 
             # Printing Controller FAN Info
             elif choice == '4':
-                self.__printer.printApicNodesFanInfo(graph)
+                self.__run(self.__printer.printApicNodesFanInfo, graph, ('apic_fans',))
                 input()
                 self.__clear_screen()
 
             # Printing Controller Sensors Info
             elif choice == '5':
-                self.__printer.printApicNodesSensorInfo(graph)
+                self.__run(self.__printer.printApicNodesSensorInfo, graph, ('apic_sensor',))
                 input()
                 self.__clear_screen()
 
             # Printing Controller DIMMs Info
             elif choice == '6':
-                self.__printer.printApicNodesDimmsInfo(graph)
+                self.__run(self.__printer.printApicNodesDimmsInfo, graph, ('apic_dimm',))
                 input()
                 self.__clear_screen()
 
             # Printing Controller NTP Info
             elif choice == '7':
-                self.__printer.printApicNodesNtpInfo(graph)
+                self.__run(self.__printer.printApicNodesNtpInfo, graph, ('apic_ntp',))
                 input()
                 self.__clear_screen()
 
             # Printing Controller Physical Interface Info
             elif choice == '8':
-                self.__printer.printApicNodesPhyIntInfo(graph)
+                self.__run(self.__printer.printApicNodesPhyIntInfo, graph, ('apic_phyint',))
                 input()
                 self.__clear_screen()
 
             # Printing Controller Aggregate Interface Info
             elif choice == '9':
-                self.__printer.printApicNodesAggIntInfo(graph)
+                self.__run(self.__printer.printApicNodesAggIntInfo, graph, ('apic_aggint',))
                 input()
                 self.__clear_screen()
 
@@ -333,55 +420,55 @@ class MenuPrinter(metaclass=_PrivateCookie):
 
             # Printing Cisco ACI Switch Interfaces
             elif choice == '1':
-                self.__printer.getSwitchNodeInterfacesInfo(graph)
+                self.__run(self.__printer.getSwitchNodeInterfacesInfo, graph, ('opt_interfaces', 'sfp'))
                 input()
                 self.__clear_screen()
 
             # Printing Cisco ACI Switch Supervisors
             elif choice == '2':
-                self.__printer.getSwitchNodeSupervisorInfo(graph)
+                self.__run(self.__printer.getSwitchNodeSupervisorInfo, graph, ('supervisors',))
                 input()
                 self.__clear_screen()
 
             # Printing Cisco ACI Switch Faults
             elif choice == '3':
-                self.__printer.getSwitchNodeFaultsInfo(graph)
+                self.__run(self.__printer.getSwitchNodeFaultsInfo, graph, ('faults',))
                 input()
                 self.__clear_screen()
 
             # Printing Cisco ACI Switch Controllers
             elif choice == '4':
-                self.__printer.getSpineSwitchNodeSystemControllerInfo(graph)
+                self.__run(self.__printer.getSpineSwitchNodeSystemControllerInfo, graph, ('system_controller',))
                 input()
                 self.__clear_screen()
 
             # Printing Cisco ACI Switch Fabric Modules
             elif choice == '5':
-                self.__printer.getSpineSwitchNodeFabricModulesInfo(graph)
+                self.__run(self.__printer.getSpineSwitchNodeFabricModulesInfo, graph, ('fabric_modules', 'sfp'))
                 input()
                 self.__clear_screen()
 
             # Printing Cisco ACI Switch PSUs
             elif choice == '6':
-                self.__printer.getSwitchNodePsuInfo(graph)
+                self.__run(self.__printer.getSwitchNodePsuInfo, graph, ('psus',))
                 input()
                 self.__clear_screen()
 
             # Printing Cisco ACI Linecards
             elif choice == '7':
-                self.__printer.getSwitchNodeLinecardInfo(graph)
+                self.__run(self.__printer.getSwitchNodeLinecardInfo, graph, ('linecard', 'sfp'))
                 input()
                 self.__clear_screen()
 
             # Printing Cisco ACI SFP
             elif choice == '8':
-                self.__printer.printSwitchNodesSfpInterfaceInfo(graph)
+                self.__run(self.__printer.printSwitchNodesSfpInterfaceInfo, graph, ('sfp',))
                 input()
                 self.__clear_screen()
 
             # Printing Cisco ACI Filesystem
             elif choice == '9':
-                self.__printer.printFabricSwitchesFilesystemNodes(graph)
+                self.__run(self.__printer.printFabricSwitchesFilesystemNodes, graph, ('filesystem',))
                 input()
 
             # Wrong Option Selected
@@ -437,6 +524,12 @@ class MenuPrinter(metaclass=_PrivateCookie):
             print("|        2.           Fabric Interfaces with Errors Summary        |")
             print("|        3.           Fabric Interfaces with Errors Detailed       |")
             print("|        4.           SFP Diagnostic Report (Temp, Power, Volt)    |")
+            print("|        5.           Fabric Interfaces Error Rates (Errors/s)     |")
+            print("|        6.           Leaf-to-Leaf Paths and ECMP Width            |")
+            print("|        7.           Failure Impact Simulation (What-If)          |")
+            print("|        8.           Port-Level Path (Switch, Port or Device)     |")
+            print("|        9.           vPC Pairs and Dual-Homed Devices             |")
+            print("|        10.          Port Blast Radius (What-If)                  |")
             print("+" + "-" * (len(menu_header_line) - 2) + "+")
 
             # Waiting for user option selection
@@ -449,28 +542,62 @@ class MenuPrinter(metaclass=_PrivateCookie):
 
             # Printing Cisco ACI Switch Interfaces
             elif choice == '1':
-                self.__printer.getSwitchNodeInterfacesShouldBeDownInfo(graph)
+                self.__run(self.__printer.getSwitchNodeInterfacesShouldBeDownInfo, graph, ('opt_interfaces', 'sfp'))
                 input()
                 self.__clear_screen()
 
             # Printing Cisco ACI Interfaces with error (Summary)
             elif choice == '2':
-                self.__printer.printFabricEdgesWithErrorsCli(graph)
+                self.__run(self.__printer.printFabricEdgesWithErrorsCli, graph)
                 input()
                 self.__clear_screen()
 
             # Printing Cisco ACI Interfaces with Errors (Details)
             elif choice == '3':
-                self.__printer.printFabricEdgesWithErrorDetailsCli(graph)
+                self.__run(self.__printer.printFabricEdgesWithErrorDetailsCli, graph)
                 input()
                 self.__clear_screen()
 
             # Printing SFP Diagnostic Report (New)
             elif choice == '4':
-                self.__printer.printSwitchSfpDiagnostics(graph)
+                self.__run(self.__printer.printSwitchSfpDiagnostics, graph, ('sfp',))
+                input()
+                self.__clear_screen()
+
+            # Printing Cisco ACI Interfaces ranked by errors per second (Counter Store)
+            elif choice == '5':
+                self.__run(self.__printer.printFabricEdgesErrorRatesCli, graph)
+                input()
+                self.__clear_screen()
+
+            # Printing the leaf-to-leaf paths through the spines (one pair or all the pairs)
+            elif choice == '6':
+                self.__leaf_paths(graph)
+                input()
+                self.__clear_screen()
+
+            # Simulating the failure of nodes, linecards or interfaces before a maintenance
+            elif choice == '7':
+                self.__simulate_failures(graph)
+                self.__clear_screen()
+
+            # Printing the port-level path between two switches, interfaces or downlink devices
+            elif choice == '8':
+                self.__port_path(graph)
                 input()
                 self.__clear_screen()
 
+            # Printing the leaves that share dual-homed devices and the state of their ports
+            elif choice == '9':
+                self.__run(lambda g: self.__printer.printVpcPairs(self.__port_analyzer.vpcPairs(g)), graph)
+                input()
+                self.__clear_screen()
+
+            # Printing the switches and devices cut from the spines by a failure scenario
+            elif choice == '10':
+                self.__blast_radius(graph)
+                self.__clear_screen()
+
             # Wrong Option Selected
             else:
                 print("Invalid choice. Please try again.")
@@ -523,6 +650,8 @@ class MenuPrinter(metaclass=_PrivateCookie):
             print("|       1.            Print Graph Nodes                     |")
             print("|       2.            Print Graph Edges                     |")
             print("|       3.            Print Graph EPG Nodes                 |")
+            print("|       4.            Query the Graph                       |")
+            print("|       5.            Downlink Ports Carrying a VLAN        |")
             print("+" + "-" * (len(menu_header_line) - 2) + "+")
 
             # Waiting for user option selection
@@ -535,19 +664,30 @@ class MenuPrinter(metaclass=_PrivateCookie):
 
             # Printing All Graph Nodes Elements
             elif choice == '1':
-                self.__printer.printingNodeAttributes(graph)
+                self.__run(self.__printer.printingNodeAttributes, graph, None)
                 input()
                 self.__clear_screen()
 
             # Printing All Graph Edges Elements
             elif choice == '2':
-                self.__printer.printAllFabricEdgesAttributesCli(graph)
+                self.__run(self.__printer.printAllFabricEdgesAttributesCli, graph)
                 input()
                 self.__clear_screen()
 
             # Printing All Graph Edges Elements
             elif choice == '3':
-                self.__printer.printAllNetworkDevicesNodesCli(graph)
+                self.__run(self.__printer.printAllNetworkDevicesNodesCli, graph)
+                input()
+                self.__clear_screen()
+
+            # Running ad-hoc queries over the Graph
+            elif choice == '4':
+                self.__query_graph(graph)
+                self.__clear_screen()
+
+            # Printing the downlink ports that carry or allow a VLAN (VLAN Index)
+            elif choice == '5':
+                self.__vlan_ports(graph)
                 input()
                 self.__clear_screen()
 
@@ -622,55 +762,55 @@ class MenuPrinter(metaclass=_PrivateCookie):
 
             # Printing Tenant Info
             elif choice == '1':
-                self.__printer.printFabricTenantInfo(graph)
+                self.__run(self.__printer.printFabricTenantInfo, graph)
                 input()
                 self.__clear_screen()
 
             # Printing EPG List
             elif choice == '2':
-                self.__printer.printTenantEpgList(graph)
+                self.__run(self.__printer.printTenantEpgList, graph)
                 input()
                 self.__clear_screen()
 
             # Printing EPG Full Details
             elif choice == '3':
-                self.__printer.printEpgDetails(graph)
+                self.__run(self.__printer.printEpgDetails, graph)
                 input()
                 self.__clear_screen()
 
             # Printing Bridge Domain Full Details
             elif choice == '4':
-                self.__printer.printBdDetails(graph)
+                self.__run(self.__printer.printBdDetails, graph)
                 input()
                 self.__clear_screen()
 
             # Printing VRF Full Details
             elif choice == '5':
-                self.__printer.printVrfDetails(graph)
+                self.__run(self.__printer.printVrfDetails, graph)
                 input()
                 self.__clear_screen()
 
             # Printing L3Out Full Details
             elif choice == '6':
-                self.__printer.printL3OutDetails(graph)
+                self.__run(self.__printer.printL3OutDetails, graph)
                 input()
                 self.__clear_screen()
 
             # Printing Contract Full Details
             elif choice == '7':
-                self.__printer.printContractDetails(graph)
+                self.__run(self.__printer.printContractDetails, graph)
                 input()
                 self.__clear_screen()
 
             # Printing Filter Full Details
             elif choice == '8':
-                self.__printer.printFilterDetails(graph)
+                self.__run(self.__printer.printFilterDetails, graph)
                 input()
                 self.__clear_screen()
 
             # Printing Endpoint Details
             elif choice == '9':
-                self.__printer.printEndpointDetails(graph)
+                self.__run(self.__printer.printEndpointDetails, graph)
                 input()
                 self.__clear_screen()
 
@@ -725,6 +865,8 @@ class MenuPrinter(metaclass=_PrivateCookie):
             print("|       0.            Exit                                  |")
             print("|       1.            Export Graph Node JSON Format         |")
             print("|       2.            Export Graph Node Yaml Format         |")
+            print("|       3.            Export Fabric Errors JSON Format      |")
+            print("|       4.            Save Graph Snapshot (Binary)          |")
             print("+" + "-" * (len(menu_header_line) - 2) + "+")
 
                         # Waiting for user option selection
@@ -737,13 +879,25 @@ class MenuPrinter(metaclass=_PrivateCookie):
 
             # Printing All Graph Nodes Elements
             elif choice == '1':
-                self.__save_graph_to_jsonfile(graph)
+                self.__run(self.__save_graph_to_jsonfile, graph, None)
                 input()
                 self.__clear_screen()
 
             # Printing All Graph Edges Elements
             elif choice == '2':
-                self.__save_graph_to_jsonYaml(graph)
+                self.__run(self.__save_graph_to_jsonYaml, graph, None)
+                input()
+                self.__clear_screen()
+
+            # Exporting the Fabric Edges with Errors
+            elif choice == '3':
+                self.__run(self.__save_fabric_errors_to_jsonfile, graph)
+                input()
+                self.__clear_screen()
+
+            # Saving the whole Graph (nodes, edges, Tenant subtree) into a binary snapshot
+            elif choice == '4':
+                self.__run(self.__save_graph_snapshot, graph, None)
                 input()
                 self.__clear_screen()
 
@@ -764,7 +918,7 @@ class MenuPrinter(metaclass=_PrivateCookie):
             if attributes:
                 node_data = {
                     "node": node,
-                    "attributes": attributes
+                    "attributes": materializeAttributes(attributes)
                 }
 
             # Inserting the Fabric Node in the Graph inside the list
@@ -792,7 +946,7 @@ class MenuPrinter(metaclass=_PrivateCookie):
             if attributes:
                 node_data = {
                     "node": node,
-                    "attributes": attributes
+                    "attributes": materializeAttributes(attributes)
                 }
 
             # Inserting the Fabric Node in the Graph inside the list
@@ -807,3 +961,123 @@ class MenuPrinter(metaclass=_PrivateCookie):
 
         except Exception as e:
             print(f"An error occurred while saving the file: {e} ❌")
+
+    # Export method to save the Fabric Edges with Errors (ranked) to a JSON file
+    def __save_fabric_errors_to_jsonfile(self, graph):
+
+        # Fabric Edges with Errors as plain dicts
+        errors_data = self.__error_analyzer.errorsToDicts(self.__error_analyzer.analyzeFabricErrors(graph))
+
+        # Saving the Fabric Errors List 'errors_data' into the file
+        try:
+            with open(UserClass().Path + "FabricErrorsData.json", 'w') as f:
+                json.dump(errors_data, f, indent=4)
+                print(f" ✨ ✨ ✨ Fabric errors ({len(errors_data)} edges) successfully saved in JSON format. ✨ ✨ ✨")
+
+        except Exception as e:
+            print(f"An error occurred while saving the file: {e} ❌")
+
+    # Export method to save the whole Graph (nodes, edges, Tenant subtree) into a binary snapshot
+    def __save_graph_snapshot(self, graph):
+
+        # Saving the Graph into the snapshot file, loaded back with 'network_graph.py --snapshot'
+        try:
+            snapshot = ACIGraphSnapshot().saveSnapshot(graph, UserClass().Path + "GraphSnapshot.acigraph")
+            print(f" ✨ ✨ ✨ Graph snapshot ({snapshot['nodes']} nodes, {snapshot['edges']} edges, {snapshot['size'] / 1e6:.1f} MB) successfully saved in {snapshot['path']}. ✨ ✨ ✨")
+
+        except Exception as e:
+            print(f"An error occurred while saving the file: {e} ❌")
+
+    # Method that runs the queries typed by the user over the Graph until an empty query
+    def __query_graph(self, graph):
+
+        print("Examples: role==leaf and psus[*].operSt!=ok | edges where source_cRCAlignErrors>0 | interfaces where admin_st==up and oper_st==down")
+
+        while True:
+
+            # Waiting for the query
+            expression = input("Query (empty to return): ").strip()
+            if not expression:
+                break
+
+            # Running the query holding the Graph lock, the errors of the query are shown to the user
+            try:
+                self.__run(lambda g: self.__printer.printQueryResult(self.__graph_query.query(g, expression)), graph, None)
+            except ValueError as e:
+                print(f"Invalid query: {e} ❌")
+
+    # Method that prints the paths between two leaves typed by the user, or the ECMP width of all the leaf pairs
+    def __leaf_paths(self, graph):
+
+        # Waiting for the leaves (name or node ID)
+        source = input("Source leaf (empty for all the leaf pairs): ").strip()
+        dest = input("Destination leaf: ").strip() if source else ""
+
+        # Computing the paths holding the Graph lock, an unknown leaf is shown to the user
+        try:
+            if source:
+                self.__run(lambda g: self.__printer.printLeafPaths(self.__path_analyzer.leafPaths(g, source, dest), g.graph['path_engine']), graph)
+            else:
+                self.__run(lambda g: self.__printer.printFabricRedundancy(self.__path_analyzer.fabricRedundancy(g), g.graph['path_engine']), graph)
+        except ValueError as e:
+            print(f"Invalid leaf: {e} ❌")
+
+    # Method that simulates the failure scenarios typed by the user until an empty scenario
+    def __simulate_failures(self, graph):
+
+        print("Examples: spine201 | leaf101:1 (linecard) | leaf101:eth1/49,leaf102:eth1/49 | 201,202")
+
+        while True:
+
+            # Waiting for the scenario
+            scenario = input("Scenario (empty to return): ").strip()
+            if not scenario:
+                break
+
+            # Simulating holding the Graph lock, an unknown node is shown to the user
+            try:
+                self.__run(lambda g: self.__printer.printFailureImpact(self.__failure_simulator.simulate(g, [scenario])[0]), graph)
+            except ValueError as e:
+                print(f"Invalid scenario: {e} ❌")
+
+    # Method that prints the downlink ports of the VLANs typed by the user (comma separated VLAN IDs or ranges)
+    def __vlan_ports(self, graph):
+
+        # Waiting for the VLANs, e.g. "1234" or "10-12,30"
+        vlans = VlanIndex.vlanList(input("VLAN IDs (e.g. 1234 or 10-12,30): ").strip())
+        if not vlans:
+            print("Invalid VLAN ❌")
+            return
+
+        self.__run(lambda g: self.__printer.printVlanPorts(g, vlans), graph)
+
+    # Method that prints the port-level path between two endpoints typed by the user
+    def __port_path(self, graph):
+
+        # Waiting for the endpoints (switch or device name/ID, or NODE:INTERFACE)
+        source = input("Source (switch, device or NODE:INTERFACE): ").strip()
+        dest = input("Destination (switch, device or NODE:INTERFACE): ").strip()
+
+        # Computing the path holding the Graph lock, an unknown endpoint is shown to the user
+        try:
+            self.__run(lambda g: self.__printer.printPortPath(self.__port_analyzer.portPath(g, source, dest)), graph)
+        except ValueError as e:
+            print(f"Invalid endpoint: {e} ❌")
+
+    # Method that prints the blast radius of the scenarios typed by the user until an empty scenario
+    def __blast_radius(self, graph):
+
+        print("Examples: spine201 | leaf101:1 (linecard) | leaf101:eth1/49,leaf102:eth1/49 | 201,202")
+
+        while True:
+
+            # Waiting for the scenario
+            scenario = input("Scenario (empty to return): ").strip()
+            if not scenario:
+                break
+
+            # Computing holding the Graph lock, an unknown node is shown to the user
+            try:
+                self.__run(lambda g: self.__printer.printBlastRadius(self.__port_analyzer.blastRadius(g, [scenario])[0]), graph)
+            except ValueError as e:
+                print(f"Invalid scenario: {e} ❌")
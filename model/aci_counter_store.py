@@ -0,0 +1,175 @@
+# coding=utf-8
+
+#########################################################################
+#  Counter Store: the interface counters of every collection appended   #
+#  into a local SQLite file, with delta and rate queries over a window  #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from model.aci_interface_table import InterfaceTable
+import networkx as nx
+import threading
+import sqlite3
+import time
+
+#########################################################################################################
+# CounterRate Class, the increase of a counter of an interface over the window                         #
+#########################################################################################################
+
+class CounterRate:
+
+    __slots__ = ('node_id', 'port', 'counter', 'delta', 'seconds', 'samples')
+
+    def __init__(self, node_id: str, port: str, counter: str, delta: int, seconds: float, samples: int) -> None:
+        self.node_id: str = node_id
+        self.port: str = port
+        self.counter: str = counter
+        self.delta: int = delta
+        self.seconds: float = seconds
+        self.samples: int = samples
+
+    # Increase per second over the window
+    @property
+    def rate(self) -> float:
+        return self.delta / self.seconds if self.seconds > 0 else 0.0
+
+    # Returning the rate as a plain dict (exports)
+    def to_dict(self) -> Dict[str, Any]:
+        return {'node_id': self.node_id, 'port': self.port, 'counter': self.counter, 'delta': self.delta, 'seconds': self.seconds, 'samples': self.samples, 'rate': self.rate}
+
+#########################################################################################################
+# CounterStore Class, one row per (collection, interface, counter) with integer columns only: the      #
+# interfaces and counter names are stored once and referenced by id. The delta of a counter is the sum #
+# of its increases between consecutive collections, so a counter cleared on the switch is not negative #
+#########################################################################################################
+
+class CounterStore:
+
+    # Default window of the rate queries (seconds)
+    DEFAULT_WINDOW: int = 3600
+
+    # Tables of the store
+    SCHEMA: Tuple[str, ...] = (
+        "CREATE TABLE IF NOT EXISTS collections (id INTEGER PRIMARY KEY, ts REAL NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS interfaces (id INTEGER PRIMARY KEY, node_id TEXT NOT NULL, port TEXT NOT NULL, UNIQUE (node_id, port))",
+        "CREATE TABLE IF NOT EXISTS counters (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE)",
+        "CREATE TABLE IF NOT EXISTS samples (interface INTEGER NOT NULL, counter INTEGER NOT NULL, collection INTEGER NOT NULL, value INTEGER NOT NULL, "
+        "PRIMARY KEY (collection, interface, counter)) WITHOUT ROWID",
+        "CREATE INDEX IF NOT EXISTS collections_ts ON collections (ts)",
+    )
+
+    # Delta of every (interface, counter) over the collections of the window
+    RATES_QUERY: str = """
+        WITH window_samples AS (
+            SELECT s.interface, s.counter, c.ts, s.value,
+                   s.value - LAG(s.value) OVER (PARTITION BY s.interface, s.counter ORDER BY s.collection) AS delta
+            FROM samples s JOIN collections c ON c.id = s.collection
+            WHERE s.collection >= (SELECT MIN(id) FROM collections WHERE ts >= ?) AND s.counter IN ({counters})
+        )
+        SELECT i.node_id, i.port, k.name, SUM(CASE WHEN w.delta < 0 THEN w.value ELSE w.delta END), MAX(w.ts) - MIN(w.ts), COUNT(*)
+        FROM window_samples w JOIN interfaces i ON i.id = w.interface JOIN counters k ON k.id = w.counter
+        GROUP BY w.interface, w.counter HAVING COUNT(*) > 1
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self.__lock: threading.Lock = threading.Lock()
+        self.__connection: sqlite3.Connection = sqlite3.connect(path, check_same_thread=False)
+        self.__interfaces: Dict[Tuple[str, str], int] = {}
+        self.__counters: Dict[str, int] = {}
+
+        with self.__lock, self.__connection:
+            for statement in self.SCHEMA:
+                self.__connection.execute(statement)
+            self.__interfaces = {(node_id, port): row_id for row_id, node_id, port in self.__connection.execute("SELECT id, node_id, port FROM interfaces")}
+            self.__counters = {name: row_id for row_id, name in self.__connection.execute("SELECT id, name FROM counters")}
+
+    ##################
+    # Public Methods #
+    ##################
+
+    # Appending the counters of the Interface Table of the Graph as a new collection, returning the samples stored
+    def appendCollection(self, graph: nx.Graph, timestamp: Optional[float] = None) -> int:
+
+        table: Optional[InterfaceTable] = graph.graph.get('interface_table')
+        if table is None:
+            return 0
+
+        # Auxilear List with the (node_id, port, counter, value) of the collected counters
+        samples: List[Tuple[str, str, str, int]] = []
+        for counter in InterfaceTable.COUNTER_COLUMNS:
+            column = table.column(counter)
+            for node_id, port, row in table:
+                if column[row] != InterfaceTable.MISSING:
+                    samples.append((node_id, port, counter, column[row]))
+
+        return self.appendSamples(samples, timestamp)
+
+    # Appending the (node_id, port, counter, value) samples as a new collection, returning the samples stored
+    def appendSamples(self, samples: Iterable[Tuple[str, str, str, int]], timestamp: Optional[float] = None) -> int:
+
+        samples = list(samples)
+        if not samples:
+            return 0
+
+        with self.__lock, self.__connection:
+            collection = self.__connection.execute("INSERT INTO collections (ts) VALUES (?)", (time.time() if timestamp is None else timestamp,)).lastrowid
+            rows = [(self.__interfaceId(node_id, port), self.__counterId(counter), collection, int(value)) for node_id, port, counter, value in samples]
+            self.__connection.executemany("INSERT OR REPLACE INTO samples (interface, counter, collection, value) VALUES (?, ?, ?, ?)", rows)
+
+        return len(rows)
+
+    # Returning the delta and rate of the counters of every interface over the window (seconds before now)
+    def rates(self, counters: Sequence[str], window: float = DEFAULT_WINDOW, now: Optional[float] = None) -> List[CounterRate]:
+
+        counter_ids = [self.__counters[counter] for counter in counters if counter in self.__counters]
+        if not counter_ids:
+            return []
+
+        since = (time.time() if now is None else now) - window
+        with self.__lock:
+            rows = self.__connection.execute(self.RATES_QUERY.format(counters=",".join("?" * len(counter_ids))), (since, *counter_ids)).fetchall()
+
+        return [CounterRate(node_id, port, counter, delta or 0, seconds, samples) for node_id, port, counter, delta, seconds, samples in rows]
+
+    # Returning the number of collections and the time of the first and last one
+    def collections(self) -> Tuple[int, Optional[float], Optional[float]]:
+        with self.__lock:
+            return tuple(self.__connection.execute("SELECT COUNT(*), MIN(ts), MAX(ts) FROM collections").fetchone())  # type: ignore[return-value]
+
+    # Removing the collections older than the age (seconds), returning the collections removed
+    def prune(self, max_age: float, now: Optional[float] = None) -> int:
+        since = (time.time() if now is None else now) - max_age
+        with self.__lock, self.__connection:
+            self.__connection.execute("DELETE FROM samples WHERE collection IN (SELECT id FROM collections WHERE ts < ?)", (since,))
+            return self.__connection.execute("DELETE FROM collections WHERE ts < ?", (since,)).rowcount
+
+    # Closing the store
+    def close(self) -> None:
+        with self.__lock:
+            self.__connection.close()
+
+    ####################
+    # Privates Methods #
+    ####################
+
+    # Returning the id of the interface, the interface is added if it is new (lock held by the caller)
+    def __interfaceId(self, node_id: str, port: str) -> int:
+        key = (str(node_id), str(port).lower())
+        row_id = self.__interfaces.get(key)
+        if row_id is None:
+            row_id = self.__connection.execute("INSERT INTO interfaces (node_id, port) VALUES (?, ?)", key).lastrowid
+            self.__interfaces[key] = row_id
+        return row_id
+
+    # Returning the id of the counter, the counter is added if it is new (lock held by the caller)
+    def __counterId(self, counter: str) -> int:
+        row_id = self.__counters.get(counter)
+        if row_id is None:
+            row_id = self.__connection.execute("INSERT INTO counters (name) VALUES (?)", (counter,)).lastrowid
+            self.__counters[counter] = row_id
+        return row_id
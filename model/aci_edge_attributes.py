@@ -0,0 +1,243 @@
+# coding=utf-8
+
+#########################################################################
+#  Compact Fabric Edge Attributes: the 'source_*' and 'dest_*' keys of  #
+#  a fabric link are stored in two typed endpoint records               #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Dict, FrozenSet, Iterator, Optional, Tuple, cast
+from collections.abc import MutableMapping
+from array import array
+
+#########################################################################################################
+# EdgeEndpoint Class, one side of a fabric link: interface configuration/operational fields and the    #
+# interface counters (rmonEtherStats) stored as a numeric array                                        #
+#########################################################################################################
+
+class EdgeEndpoint:
+
+    # Interface fields of the endpoint (edge key without the 'source_'/'dest_' prefix)
+    FIELDS: Tuple[str, ...] = (
+        'node_id', 'interface_id', 'interface_speed', 'interface_mtu', 'interface_adminSt', 'interface_mode',
+        'interface_operSt', 'interface_operAllowedVlans', 'interface_operLastErrors', 'interface_operLastLinkStChg',
+        'interface_operOperDuplex', 'interface_operOperMode', 'interface_operSpeed', 'row',
+    )
+
+    # Interface counters (rmonEtherStats), same order as ACIController.EDGE_COUNTERS
+    COUNTERS: Tuple[str, ...] = (
+        'broadcastPkts', 'cRCAlignErrors', 'collisions', 'dropEvents', 'fragments', 'jabbers', 'multicastPkts',
+        'oversizePkts', 'pkts', 'pkts65to127Octets', 'pkts128to255Octets', 'pkts256to511Octets', 'pkts512to1023Octets',
+        'pkts1024to1518Octets', 'octets', 'pkts64Octets', 'rXNoErrors', 'rxGiantPkts', 'rxOversizePkts', 'tXNoErrors',
+        'txGiantPkts', 'txOversizePkts', 'undersizePkts',
+    )
+    COUNTER_INDEX: Dict[str, int] = {counter: index for index, counter in enumerate(COUNTERS)}
+    FIELD_SET: FrozenSet[str] = frozenset(FIELDS)
+
+    # Bit of every field and counter in the mask of the keys set
+    KEY_BITS: Dict[str, int] = {key: 1 << index for index, key in enumerate(FIELDS + COUNTERS)}
+
+    # Value stored in the counters array when the counter was not collected
+    MISSING: int = -1
+
+    # Highest value of the counters array (signed 64 bits), bigger counters are clamped
+    MAX_COUNTER: int = (1 << 63) - 1
+
+    __slots__ = FIELDS + ('counters', 'keys_set')
+
+    def __init__(self) -> None:
+        for field in self.FIELDS:
+            setattr(self, field, None)
+        self.counters: array = array('q', [self.MISSING]) * len(self.COUNTERS)
+        self.keys_set: int = 0
+
+    # Returning True when the field or counter was set
+    def has(self, key: str) -> bool:
+        return bool(self.keys_set & self.KEY_BITS[key])
+
+    # Returning the value of a field or counter (None for the counters not collected)
+    def value(self, key: str) -> Any:
+        index = self.COUNTER_INDEX.get(key)
+        if index is None:
+            return getattr(self, key)
+        counter = self.counters[index]
+        return None if counter == self.MISSING else counter
+
+    # Setting the value of a field or counter (the counters are converted to int)
+    def setValue(self, key: str, value: Any) -> None:
+        index = self.COUNTER_INDEX.get(key)
+        if index is None:
+            setattr(self, key, value)
+        else:
+            self.counters[index] = self.parseCounter(value)
+        self.keys_set |= self.KEY_BITS[key]
+
+    # Removing a field or counter, the value is reset
+    def removeValue(self, key: str) -> None:
+        index = self.COUNTER_INDEX.get(key)
+        if index is None:
+            setattr(self, key, None)
+        else:
+            self.counters[index] = self.MISSING
+        self.keys_set &= ~self.KEY_BITS[key]
+
+    # Number of fields and counters set
+    def __len__(self) -> int:
+        return bin(self.keys_set).count('1')
+
+    # Returning the (key, value) pairs of the fields and counters set, fields first and then the counters
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        for field in self.FIELDS:
+            if self.keys_set & self.KEY_BITS[field]:
+                yield field, getattr(self, field)
+        for counter in self.COUNTERS:
+            if self.keys_set & self.KEY_BITS[counter]:
+                yield counter, self.value(counter)
+
+    # Function that convert the APIC counter (string) into int, MISSING if it is not a number or it is negative.
+    # The counters above the signed 64 bits range of the array are clamped to MAX_COUNTER
+    @classmethod
+    def parseCounter(cls, value: Any) -> int:
+        if value is None:
+            return cls.MISSING
+        try:
+            counter = int(value)
+        except (TypeError, ValueError):
+            return cls.MISSING
+        return cls.MISSING if counter < 0 else min(counter, cls.MAX_COUNTER)
+
+#########################################################################################################
+# FabricEdgeAttributes Class, edge attribute dictionary of the Graph (see model.aci_graph). The        #
+# 'source_<field>' and 'dest_<field>' keys are stored in the endpoints and the other keys ('downlink', #
+# 'lldp_adjacency', etc.) in a small dict created with the first of them, so the fabric links do not   #
+# carry a dict of their own. The read interface is the same as the flat dict.                          #
+#########################################################################################################
+
+class FabricEdgeAttributes(MutableMapping):
+
+    __slots__ = ('_extra', 'source', 'dest')
+
+    # Endpoint sides and their key prefix
+    SIDES: Tuple[str, ...] = ('source', 'dest')
+    PREFIXES: Tuple[str, ...] = ('source_', 'dest_')
+
+    # Old key names accepted on read/write
+    ALIASES: Dict[str, str] = {'interface_admingSt': 'interface_adminSt'}
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._extra: Optional[Dict[str, Any]] = None
+        self.source: Optional[EdgeEndpoint] = None
+        self.dest: Optional[EdgeEndpoint] = None
+        self.update(*args, **kwargs)
+
+    ##################
+    # Public Methods #
+    ##################
+
+    # Returning the value of the key
+    def __getitem__(self, key: str) -> Any:
+        side, field = self.__split(key)
+        if side is None:
+            if self._extra is None:
+                raise KeyError(key)
+            return self._extra[key]
+        endpoint = getattr(self, side)
+        if endpoint is None or not endpoint.has(field):
+            raise KeyError(key)
+        return endpoint.value(field)
+
+    # Returning the value of the key or the default value (faster than the MutableMapping one)
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    # Setting the value of the key, the endpoint is created with the first key of its side
+    def __setitem__(self, key: str, value: Any) -> None:
+        side, field = self.__split(key)
+        if side is None:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+            return
+        endpoint = getattr(self, side)
+        if endpoint is None:
+            endpoint = EdgeEndpoint()
+            setattr(self, side, endpoint)
+        endpoint.setValue(field, value)
+
+    # Deleting a key, the endpoint keeps track of the keys set
+    def __delitem__(self, key: str) -> None:
+        side, field = self.__split(key)
+        if side is None:
+            if self._extra is None:
+                raise KeyError(key)
+            del self._extra[key]
+        elif getattr(self, side) is None or not getattr(self, side).has(field):
+            raise KeyError(key)
+        else:
+            getattr(self, side).removeValue(field)
+
+    # Iterating the keys: source endpoint, dest endpoint and the other keys
+    def __iter__(self) -> Iterator[str]:
+        for side in self.SIDES:
+            endpoint = getattr(self, side)
+            if endpoint is not None:
+                for field, _ in endpoint.items():
+                    yield side + '_' + field
+        yield from self._extra or ()
+
+    # Number of keys
+    def __len__(self) -> int:
+        return sum(len(getattr(self, side)) for side in self.SIDES if getattr(self, side) is not None) + len(self._extra or ())
+
+    # Returning the (key, value) pairs without looking up every key
+    def items(self) -> Iterator[Tuple[str, Any]]:  # type: ignore[override]
+        for side in self.SIDES:
+            endpoint = getattr(self, side)
+            if endpoint is not None:
+                for field, value in endpoint.items():
+                    yield side + '_' + field, value
+        if self._extra is not None:
+            yield from self._extra.items()
+
+    # Returning the counters array of a side (None if the side is not set), used by the error scans
+    def counters(self, side: str) -> Optional[array]:
+        endpoint = getattr(self, side)
+        return endpoint.counters if endpoint is not None else None
+
+    # Returning the endpoint record of a side (None if the side is not set)
+    def endpoint(self, side: str) -> Optional[EdgeEndpoint]:
+        return cast(Optional[EdgeEndpoint], getattr(self, side))
+
+    # Returning a copy of the edge attributes
+    def copy(self) -> "FabricEdgeAttributes":
+        return self.__class__(self.items())
+
+    # Same representation as the flat dict
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    # Pickle support, the edge is rebuilt from its (key, value) pairs
+    def __reduce__(self) -> Any:
+        return (self.__class__, (list(self.items()),))
+
+    ####################
+    # Privates Methods #
+    ####################
+
+    # Returning the endpoint side and field of the key, (None, key) for the other keys
+    def __split(self, key: str) -> Tuple[Optional[str], str]:
+        if not key.startswith(self.PREFIXES):
+            return None, key
+        for side in self.SIDES:
+            if key.startswith(side + '_'):
+                field = key[len(side) + 1:]
+                field = self.ALIASES.get(field, field)
+                if field in EdgeEndpoint.COUNTER_INDEX or field in EdgeEndpoint.FIELD_SET:
+                    return side, field
+        return None, key
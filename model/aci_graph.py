@@ -0,0 +1,185 @@
+# coding=utf-8
+
+#########################################################################
+#  NetworkX Graph used to model the Cisco ACI Fabric                    #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from model.aci_lazy_attributes import LazyNodeAttributes
+from model.aci_edge_attributes import FabricEdgeAttributes
+from model.aci_node_index import NodeIndex
+import networkx as nx
+import functools
+import threading
+
+#########################################################################################################
+# ACIFabricGraph Class, nx.MultiGraph whose node attributes support the lazy (fetch on first access)    #
+# values and whose fabric edges are stored as compact endpoint records. Every physical link is its own  #
+# edge keyed by its interfaces (see edgeKey), so the parallel links between two switches are all kept.  #
+# The Node Index (role -> nodes, node id -> name, podId -> nodes) is kept in graph.graph['node_index']  #
+# and updated on every node change                                                                      #
+#########################################################################################################
+
+class ACIFabricGraph(nx.MultiGraph):
+
+    # Node attribute dictionary that resolve the LazyAttribute placeholders
+    node_attr_dict_factory = LazyNodeAttributes
+
+    # Edge attribute dictionary that stores the 'source_*'/'dest_*' keys in two compact endpoints
+    edge_attr_dict_factory = FabricEdgeAttributes
+
+    def __init__(self, incoming_graph_data: Any = None, **attr: Any) -> None:
+        self._node_index: NodeIndex = NodeIndex()
+        super().__init__(incoming_graph_data, **attr)
+        self.__nodeIndex()
+
+    #
+    # Node Index maintenance (the node attributes notify the 'role', 'id' and 'podId' changes)
+    #
+
+    # Adding or updating a node
+    def add_node(self, node_for_adding: Any, **attr: Any) -> None:
+        super().add_node(node_for_adding, **attr)
+        self.__track(node_for_adding)
+
+    # Adding or updating several nodes
+    def add_nodes_from(self, nodes_for_adding: Iterable[Any], **attr: Any) -> None:
+        nodes = list(nodes_for_adding)
+        super().add_nodes_from(nodes, **attr)
+        for node in nodes:
+            try:
+                self.__track(node if node in self._node else node[0])
+            except TypeError:
+                self.__track(node[0])
+
+    # Adding an edge keyed by its interfaces (edgeKey), the same link added again updates its attributes.
+    # The new nodes are tracked too
+    def add_edge(self, u_of_edge: Any, v_of_edge: Any, key: Any = None, **attr: Any) -> Any:
+        if key is None:
+            key = self.edgeKey(u_of_edge, v_of_edge, attr)
+        key = super().add_edge(u_of_edge, v_of_edge, key, **attr)
+        self.__track(u_of_edge)
+        self.__track(v_of_edge)
+        return key
+
+    # Adding several edges ((u, v), (u, v, data) or (u, v, key, data)), the edges without key are keyed by their interfaces
+    def add_edges_from(self, ebunch_to_add: Iterable[Any], **attr: Any) -> Any:
+        edges = [(edge[0], edge[1], self.edgeKey(edge[0], edge[1], {**attr, **edge[2]}), edge[2]) if len(edge) == 3 and isinstance(edge[2], dict) else edge for edge in ebunch_to_add]
+        keys = super().add_edges_from(edges, **attr)
+        for edge in edges:
+            self.__track(edge[0])
+            self.__track(edge[1])
+        return keys
+
+    # Removing a node
+    def remove_node(self, n: Any) -> None:
+        super().remove_node(n)
+        self.__nodeIndex().removeNode(n)
+
+    # Removing several nodes
+    def remove_nodes_from(self, nodes: Iterable[Any]) -> None:
+        nodes = list(nodes)
+        super().remove_nodes_from(nodes)
+        for node in nodes:
+            if node not in self._node:
+                self.__nodeIndex().removeNode(node)
+
+    # Removing all the nodes, edges and Graph attributes
+    def clear(self) -> None:
+        super().clear()
+        self._node_index.clear()
+        self.__nodeIndex()
+
+    # Method that fetch all the pending lazy attributes of the Graph
+    def materialize(self) -> "ACIFabricGraph":
+        for _, attributes in self.nodes(data=True):
+            if isinstance(attributes, LazyNodeAttributes):
+                attributes.materialize()
+        return self
+
+    # Method that returns the key of a link: the interfaces of both sides, the one of the first node (by name) first.
+    # The 'source_*' side is the node whose 'id' is 'source_node_id' (the first node of the edge when not known).
+    # Downlinks are keyed by the leaf interface, None for the edges without interfaces (integer key)
+    def edgeKey(self, u: Any, v: Any, data: Dict[str, Any]) -> Optional[Tuple[Optional[str], Optional[str]]]:
+
+        if data.get('downlink'):
+            return (str(data['leaf_int']).lower(), None) if data.get('leaf_int') else None
+
+        source, dest = data.get('source_interface_id'), data.get('dest_interface_id')
+        if not source and not dest:
+            return None
+        source, dest = str(source or '').lower() or None, str(dest or '').lower() or None
+
+        # Orientation of the attributes (the node of the 'source_*' side)
+        source_node = u
+        if u in self._node and v in self._node and data.get('source_node_id') is not None:
+            if str(self._node[v].get('id')) == str(data['source_node_id']) and str(self._node[u].get('id')) != str(data['source_node_id']):
+                source_node = v
+        return (source, dest) if (source_node == u) == (str(u) <= str(v)) else (dest, source)
+
+    # Method that return True when the Graph support lazy attributes
+    def supportsLazyAttributes(self) -> bool:
+        return issubclass(self.node_attr_dict_factory, LazyNodeAttributes)
+
+    # Pickle/deepcopy support, the Graph lock and the Node Index are not copied, they are created again
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop('_node_index', None)
+        state['graph'] = {key: value for key, value in self.graph.items() if key not in ('graph_lock', 'node_index')}
+        return state
+
+    # Restoring the Graph with a new lock and a new Node Index
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.graph['graph_lock'] = threading.RLock()
+        self._node_index = NodeIndex()
+        for node in self._node:
+            self.__track(node)
+
+    ####################
+    # Privates Methods #
+    ####################
+
+    # Returning the Node Index, graph.graph always points to the index of this Graph (copy() copies graph.graph)
+    def __nodeIndex(self) -> NodeIndex:
+        if self.graph.get('node_index') is not self._node_index:
+            self.graph['node_index'] = self._node_index
+        return self._node_index
+
+    # Indexing the node, the node attributes are watched so the later updates keep the index consistent
+    def __track(self, node: Any) -> None:
+        index = self.__nodeIndex()
+        attributes = self._node[node]
+        if isinstance(attributes, LazyNodeAttributes):
+            if attributes._watcher is not None:
+                return
+            attributes.watch(functools.partial(index.indexNode, node), NodeIndex.KEYS)
+        index.indexNode(node, attributes)
+
+####################
+# Public Functions #
+####################
+
+# Function that returns the (u, v, key, data) of the edges of the Graph (or of the nodes of nbunch), the key is None
+# for the Graphs that are not multigraphs
+def keyedEdges(graph: nx.Graph, nbunch: Any = None) -> Iterator[Tuple[Any, Any, Any, Any]]:
+    if graph.is_multigraph():
+        yield from graph.edges(nbunch, keys=True, data=True)
+    else:
+        for u, v, data in graph.edges(nbunch, data=True):
+            yield u, v, None, data
+
+# Function that returns the attributes of the edge, of all the links between u and v for the multigraphs without key
+def edgeAttributes(graph: nx.Graph, u: Any, v: Any, key: Any = None) -> List[Any]:
+    if not graph.has_edge(u, v):
+        return []
+    if not graph.is_multigraph():
+        return [graph.edges[u, v]]
+    links = graph.adj[u][v]
+    if key is None:
+        return list(links.values())
+    return [links[key]] if key in links else []
@@ -0,0 +1,174 @@
+# coding=utf-8
+
+#########################################################################
+#  Class that will save the whole Fabric Graph (nodes, edges, Tenant    #
+#  subtree and Interface Table) into a binary snapshot and load it back #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Dict, Type, List, Tuple
+from model.aci_graph import ACIFabricGraph, keyedEdges
+from model.aci_lazy_attributes import LazyAttribute
+from model.aci_records import ACIRecord
+from datetime import datetime
+import networkx as nx
+import functools
+import hashlib
+import json
+import struct
+import pickle
+import mmap
+import zlib
+import os
+
+###########################
+# Private Singleton Class #
+###########################
+
+class _PrivateCookie(type):
+
+    _instances: Dict[Type[Any], Any] = {}
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+
+        if cls not in cls._instances:
+            instance = super().__call__(*args, **kwargs)
+            cls._instances[cls] = instance
+        return cls._instances[cls]
+
+####################
+# Public Functions #
+####################
+
+# Function that returns the digest (16 bytes) of an attribute value, equal values have equal digests whatever
+# their container (records/dicts, tuples/lists) or dict key order. Used by the snapshots and the Snapshot Diff
+def valueDigest(value: Any) -> bytes:
+    canonical = json.dumps(value, sort_keys=True, separators=(',', ':'), default=lambda item: item.to_dict() if isinstance(item, ACIRecord) else repr(item))
+    return hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+
+#########################################################################################################
+# ACIGraphSnapshot Class. Snapshot file layout:                                                         #
+#   MAGIC | blob ... blob | header | header offset (8 bytes) | MAGIC                                    #
+# every blob is a zlib compressed pickle. The header holds the Graph attributes, the edges blob and,    #
+# for every node, its scalar attributes plus the (offset, size, digest) of the blob of each list/dict   #
+# attribute (interfaces, SFPs, faults, tenants, etc.). The file is memory-mapped and those blobs are    #
+# loaded as lazy attributes, so only the header and the edges are read when the snapshot is opened.   #
+# The digests (graph.graph['snapshot']['digests']) let the Snapshot Diff skip the unchanged blobs      #
+#########################################################################################################
+
+class ACIGraphSnapshot(metaclass=_PrivateCookie):
+
+    # File signature and format version
+    MAGIC: bytes = b'ACIGSNP1'
+    VERSION: int = 3
+
+    # Versions that can be loaded (version 1 snapshots have no digests, versions 1 and 2 have no edge keys)
+    READABLE_VERSIONS: Tuple[int, ...] = (1, 2, 3)
+
+    # Graph attributes rebuilt at runtime, not stored in the snapshot
+    RUNTIME_GRAPH_KEYS: Tuple[str, ...] = ('graph_lock', 'node_index', 'tenant_index', 'interface_views', 'parse_stats', 'subscription_status', 'snapshot', 'counter_store', 'path_engine', 'failure_model', 'port_graph')
+
+    # Node attributes always loaded with the header (plain values)
+    SCALAR_TYPES: Tuple[type, ...] = (str, int, float, bool, type(None))
+
+    ##################
+    # Public Methods #
+    ##################
+
+    # Method that saves the Graph into the snapshot file, the pending lazy attributes are fetched first
+    def saveSnapshot(self, graph: nx.Graph, path: str) -> Dict[str, Any]:
+
+        # Auxilear List with the header entry of every node (node, scalar attributes, blob attributes)
+        nodes: List[Tuple[Any, Dict[str, Any], Dict[str, Tuple[int, int, bytes]]]] = []
+
+        temporary_path = path + '.tmp'
+        with open(temporary_path, 'wb') as snapshot:
+            snapshot.write(self.MAGIC)
+
+            for node, attributes in graph.nodes(data=True):
+                scalars: Dict[str, Any] = {}
+                blobs: Dict[str, Tuple[int, int, bytes]] = {}
+                for key, value in attributes.items():
+                    if isinstance(value, self.SCALAR_TYPES):
+                        scalars[key] = value
+                    else:
+                        blobs[key] = self.__writeBlob(snapshot, value) + (valueDigest(value),)
+                nodes.append((node, scalars, blobs))
+
+            edges = self.__writeBlob(snapshot, [(u, v, dict(data.items())) if key is None else (u, v, key, dict(data.items())) for u, v, key, data in keyedEdges(graph)])
+            graph_attributes = self.__writeBlob(snapshot, {key: value for key, value in graph.graph.items() if key not in self.RUNTIME_GRAPH_KEYS})
+
+            header = {
+                'version'          : self.VERSION,
+                'created'          : datetime.now().isoformat(timespec='seconds'),
+                'graph_attributes' : graph_attributes,
+                'edges'            : edges,
+                'nodes'            : nodes,
+            }
+            header_offset = snapshot.tell()
+            snapshot.write(zlib.compress(pickle.dumps(header, protocol=pickle.HIGHEST_PROTOCOL)))
+            snapshot.write(struct.pack('<Q', header_offset))
+            snapshot.write(self.MAGIC)
+
+        # The previous snapshot is only replaced when the new one is complete
+        os.replace(temporary_path, path)
+
+        return {'path': path, 'created': header['created'], 'nodes': len(nodes), 'edges': graph.number_of_edges(), 'size': os.path.getsize(path)}
+
+    # Method that loads the snapshot into a new Graph, with lazy=True the list/dict attributes are read from the
+    # memory-mapped file the first time a report reads them
+    def loadSnapshot(self, path: str, lazy: bool = True) -> ACIFabricGraph:
+
+        with open(path, 'rb') as snapshot:
+            data = mmap.mmap(snapshot.fileno(), 0, access=mmap.ACCESS_READ)
+
+        trailer = len(data) - len(self.MAGIC) - 8
+        if len(data) < 2 * len(self.MAGIC) + 8 or data[:len(self.MAGIC)] != self.MAGIC or data[trailer + 8:] != self.MAGIC:
+            raise ValueError(f"{path} is not a Fabric Graph snapshot")
+        header_offset = struct.unpack('<Q', data[trailer:trailer + 8])[0]
+        header = pickle.loads(zlib.decompress(data[header_offset:trailer]))
+        if header.get('version') not in self.READABLE_VERSIONS:
+            raise ValueError(f"Unsupported snapshot version {header.get('version')} in {path}")
+
+        graph = ACIFabricGraph()
+        graph.graph.update(self.__readBlob(data, *header['graph_attributes']))
+
+        # Nodes: scalar attributes at once, the blobs as lazy attributes
+        baseNodes = []
+        digests: Dict[Any, Dict[str, bytes]] = {}
+        for node, scalars, blobs in header['nodes']:
+            attributes = dict(scalars)
+            for key, (offset, size, *digest) in blobs.items():
+                attributes[key] = LazyAttribute(functools.partial(self.__readBlob, data, offset, size), description=f"'{key}' of {node} (snapshot)")
+                if digest:
+                    digests.setdefault(node, {})[key] = digest[0]
+            baseNodes.append((node, attributes))
+        graph.add_nodes_from(baseNodes)
+
+        graph.add_edges_from(self.__readBlob(data, *header['edges']))
+
+        graph.graph['collection_complete'] = True
+        graph.graph['snapshot'] = {'path': path, 'created': header['created'], 'digests': digests}
+
+        if not lazy:
+            graph.materialize()
+
+        return graph
+
+    ####################
+    # Privates Methods #
+    ####################
+
+    # Writing the value as a compressed pickle, returning its (offset, size) in the file
+    def __writeBlob(self, snapshot: Any, value: Any) -> Tuple[int, int]:
+        blob = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        offset = snapshot.tell()
+        snapshot.write(blob)
+        return offset, len(blob)
+
+    # Reading the value of a blob from the memory-mapped file
+    def __readBlob(self, data: mmap.mmap, offset: int, size: int) -> Any:
+        return pickle.loads(zlib.decompress(data[offset:offset + size]))
@@ -0,0 +1,188 @@
+# coding=utf-8
+
+#########################################################################
+#  Fabric-wide columnar Interface Table: one row per (node, port) with  #
+#  typed columns for the state, speed, MTU, counters and optics         #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from array import array
+
+#########################################################################################################
+# InterfaceTable Class, the interfaces of all the switches stored by columns. The rows are created by   #
+# the collector (graph.graph['interface_table']) and the nodes ('interface_rows') and fabric edges      #
+# ('source_row', 'dest_row') point into the table. The columns can be read and filtered at once.        #
+#########################################################################################################
+
+class InterfaceTable:
+
+    # Value stored in the numeric columns when the value was not collected
+    MISSING: int = -1
+
+    # Categorical columns, the values are stored as codes (array 'h') and the labels once per table
+    CATEGORY_COLUMNS: Tuple[str, ...] = ('admin_st', 'oper_st', 'usage', 'oper_mode', 'oper_duplex')
+
+    # Numeric columns (array 'q'), speeds are stored in Mbps
+    NUMBER_COLUMNS: Tuple[str, ...] = ('speed', 'oper_speed', 'mtu')
+
+    # Text columns (one string per row)
+    TEXT_COLUMNS: Tuple[str, ...] = ('node_id', 'node_name', 'port', 'optics_type', 'optics_pid', 'optics_sn', 'last_link_change')
+
+    # Interface counters (rmonEtherStats), one numeric column per counter
+    COUNTER_COLUMNS: Tuple[str, ...] = (
+        'broadcastPkts', 'cRCAlignErrors', 'collisions', 'dropEvents', 'fragments', 'jabbers', 'multicastPkts',
+        'oversizePkts', 'pkts', 'pkts65to127Octets', 'pkts128to255Octets', 'pkts256to511Octets', 'pkts512to1023Octets',
+        'pkts1024to1518Octets', 'octets', 'pkts64Octets', 'rXNoErrors', 'rxGiantPkts', 'rxOversizePkts', 'tXNoErrors',
+        'txGiantPkts', 'txOversizePkts', 'undersizePkts',
+    )
+
+    # Speed units of the APIC values ('100G', '10G', '100M', 'inherit', etc.)
+    SPEED_UNITS: Dict[str, int] = {'M': 1, 'G': 1000, 'T': 1000000}
+
+    def __init__(self) -> None:
+        self.__index: Dict[Tuple[str, str], int] = {}
+        self.__node_rows: Dict[str, List[int]] = {}
+        self.__labels: Dict[str, List[str]] = {column: ['unknown'] for column in self.CATEGORY_COLUMNS}
+        self.__codes: Dict[str, Dict[str, int]] = {column: {'unknown': 0} for column in self.CATEGORY_COLUMNS}
+        self.__columns: Dict[str, Union[array, List[str]]] = {}
+        for column in self.CATEGORY_COLUMNS:
+            self.__columns[column] = array('h')
+        for column in self.NUMBER_COLUMNS + self.COUNTER_COLUMNS:
+            self.__columns[column] = array('q')
+        for column in self.TEXT_COLUMNS:
+            self.__columns[column] = []
+
+    ##################
+    # Public Methods #
+    ##################
+
+    # Number of rows (interfaces) in the table
+    def __len__(self) -> int:
+        return len(self.__index)
+
+    # Returning the row of the interface, the row is created if the interface is not in the table
+    def rowFor(self, node_id: Any, port: Any, node_name: str = "") -> int:
+        key = (str(node_id), str(port).lower())
+        row = self.__index.get(key)
+        if row is None:
+            row = len(self.__index)
+            self.__index[key] = row
+            self.__node_rows.setdefault(key[0], []).append(row)
+            for column in self.CATEGORY_COLUMNS:
+                self.__columns[column].append(0)
+            for column in self.NUMBER_COLUMNS + self.COUNTER_COLUMNS:
+                self.__columns[column].append(self.MISSING)
+            for column in self.TEXT_COLUMNS:
+                self.__columns[column].append("")
+            self.__columns['node_id'][row] = key[0]
+            self.__columns['port'][row] = key[1]
+        if node_name:
+            self.__columns['node_name'][row] = node_name
+        return row
+
+    # Returning the row of the interface or None if the interface is not in the table
+    def find(self, node_id: Any, port: Any) -> Optional[int]:
+        return self.__index.get((str(node_id), str(port).lower()))
+
+    # Returning the rows of a node
+    def nodeRows(self, node_id: Any) -> List[int]:
+        return list(self.__node_rows.get(str(node_id), []))
+
+    # Setting the values of a row (column -> APIC value), the values are converted to the column type
+    def setValues(self, row: int, **values: Any) -> None:
+        for column, value in values.items():
+            if value is None:
+                continue
+            if column in self.__codes:
+                self.__columns[column][row] = self.__code(column, str(value))
+            elif column in ('speed', 'oper_speed'):
+                self.__columns[column][row] = self.parseSpeed(value)
+            elif column in self.NUMBER_COLUMNS or column in self.COUNTER_COLUMNS:
+                self.__columns[column][row] = self.parseNumber(value)
+            elif column in self.TEXT_COLUMNS:
+                self.__columns[column][row] = str(value)
+            else:
+                raise KeyError(f"{column} is not a column of the Interface Table")
+
+    # Returning the value of a row (labels for the categorical columns, None for the missing numbers)
+    def value(self, row: int, column: str) -> Any:
+        data = self.__columns[column][row]
+        if column in self.__labels:
+            return self.__labels[column][data]
+        if isinstance(data, int) and data == self.MISSING:
+            return None
+        return data
+
+    # Returning a row as a dict
+    def rowDict(self, row: int) -> Dict[str, Any]:
+        return {column: self.value(row, column) for column in self.__columns}
+
+    # Returning the raw column (array of codes/numbers or list of strings), read only
+    def column(self, column: str) -> Sequence[Any]:
+        return self.__columns[column]
+
+    # Returning the code of a label in a categorical column (None if the label was never stored)
+    def code(self, column: str, label: str) -> Optional[int]:
+        return self.__codes[column].get(label)
+
+    # Returning the labels stored in a categorical column
+    def labels(self, column: str) -> List[str]:
+        return list(self.__labels[column])
+
+    # Returning the rows whose categorical columns have the given labels, e.g. select(admin_st='up', oper_st='down')
+    def select(self, rows: Optional[Sequence[int]] = None, **labels: str) -> List[int]:
+        candidates: Sequence[int] = range(len(self)) if rows is None else rows
+        for column, label in labels.items():
+            code = self.code(column, label)
+            if code is None:
+                return []
+            data = self.__columns[column]
+            candidates = [row for row in candidates if data[row] == code]
+        return list(candidates)
+
+    # Returning the rows where the predicate of the numeric column is True, e.g. where('mtu', lambda mtu: mtu < 9000)
+    def where(self, column: str, predicate: Callable[[int], bool], rows: Optional[Sequence[int]] = None) -> List[int]:
+        data = self.__columns[column]
+        candidates: Sequence[int] = range(len(self)) if rows is None else rows
+        return [row for row in candidates if data[row] != self.MISSING and predicate(data[row])]
+
+    # Iterating (node_id, port, row)
+    def __iter__(self) -> Iterator[Tuple[str, str, int]]:
+        return ((node_id, port, row) for (node_id, port), row in self.__index.items())
+
+    # Function that convert the APIC speed ('100G', '10G', '100M') into Mbps, MISSING for 'inherit', 'unknown', etc.
+    @classmethod
+    def parseSpeed(cls, value: Any) -> int:
+        text = str(value).strip().upper()
+        if text[-1:] in cls.SPEED_UNITS and text[:-1].isdigit():
+            return int(text[:-1]) * cls.SPEED_UNITS[text[-1]]
+        return int(text) if text.isdigit() else cls.MISSING
+
+    # Function that convert the APIC numbers (strings) into int, MISSING if it is not a number
+    @classmethod
+    def parseNumber(cls, value: Any) -> int:
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            try:
+                return int(float(value))
+            except (TypeError, ValueError):
+                return cls.MISSING
+
+    ####################
+    # Privates Methods #
+    ####################
+
+    # Returning the code of the label, the label is added to the column if it is new
+    def __code(self, column: str, label: str) -> int:
+        codes = self.__codes[column]
+        code = codes.get(label)
+        if code is None:
+            code = len(self.__labels[column])
+            codes[label] = code
+            self.__labels[column].append(label)
+        return code
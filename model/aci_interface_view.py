@@ -0,0 +1,141 @@
+# coding=utf-8
+
+#########################################################################
+#  Interface View: the interfaces of a switch joined once by ID         #
+#  (l1PhysIf, ethpmPhysIf, SFP and the Interface Table counters)        #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from model.aci_interface_table import InterfaceTable
+import networkx as nx
+
+#########################################################################################################
+# InterfaceRecord Class, one interface of the switch. 'config', 'oper' and 'sfp' are the same objects   #
+# of the node attributes (no copy), 'row' is the row of the interface in the Interface Table            #
+#########################################################################################################
+
+class InterfaceRecord:
+
+    __slots__ = ('id', 'config', 'oper', 'sfp', 'row')
+
+    def __init__(self, int_id: str) -> None:
+        self.id: str = int_id
+        self.config: Optional[Dict[str, Any]] = None
+        self.oper: Optional[Dict[str, Any]] = None
+        self.sfp: Optional[Any] = None
+        self.row: Optional[int] = None
+
+    # Returning a value of the operational status (ethpmPhysIf), default if it was not collected
+    def operValue(self, key: str, default: Any = None) -> Any:
+        return self.oper.get(key, default) if self.oper else default
+
+    def __repr__(self) -> str:
+        return f"InterfaceRecord({self.id})"
+
+#########################################################################################################
+# InterfaceView Class, built once per switch from its 'interfaces', 'opt_interfaces' and 'sfp' lists.   #
+# The records keep the order of the 'interfaces' list, the SFPs keep the order of the 'sfp' list        #
+#########################################################################################################
+
+class InterfaceView:
+
+    def __init__(self, node_id: Any, interfaces: Sequence[Any], opt_interfaces: Sequence[Any], sfps: Sequence[Any], table: Optional[InterfaceTable] = None) -> None:
+        self.source: Tuple[Sequence[Any], ...] = (interfaces, opt_interfaces, sfps, table)
+        self.table: Optional[InterfaceTable] = table
+        self.__records: Dict[str, InterfaceRecord] = {}
+        self.__configured: List[Tuple[InterfaceRecord, Any]] = []
+        self.__sfps: List[Tuple[InterfaceRecord, Any]] = []
+
+        # The first entry of an ID is joined, the repeated entries are still returned by configured() and withSfp()
+        for interface in interfaces:
+            record = self.__record(interface.get('id', ''))
+            record.config = record.config if record.config is not None else interface
+            self.__configured.append((record, interface))
+
+        for opt_interface in opt_interfaces:
+            record = self.__record(opt_interface.get('intID', ''))
+            record.oper = record.oper if record.oper is not None else opt_interface.get('operSt')
+
+        for sfp in sfps:
+            record = self.__record(sfp.get('int_id', ''))
+            record.sfp = record.sfp if record.sfp is not None else sfp
+            self.__sfps.append((record, sfp))
+
+        if table is not None and node_id is not None:
+            for record in self.__records.values():
+                record.row = table.find(node_id, record.id)
+
+    ##################
+    # Public Methods #
+    ##################
+
+    # Number of interfaces in the view
+    def __len__(self) -> int:
+        return len(self.__records)
+
+    # Iterating all the interfaces of the view
+    def __iter__(self) -> Iterator[InterfaceRecord]:
+        return iter(self.__records.values())
+
+    # Returning the interface of the ID (case insensitive) or None
+    def get(self, int_id: Any) -> Optional[InterfaceRecord]:
+        return self.__records.get(str(int_id).lower())
+
+    # Returning the (record, l1PhysIf entry) of the configured interfaces in the order of the 'interfaces' list
+    def configured(self) -> List[Tuple[InterfaceRecord, Any]]:
+        return self.__configured
+
+    # Returning the (record, SFP entry) of the interfaces with an SFP in the order of the 'sfp' list
+    def withSfp(self) -> List[Tuple[InterfaceRecord, Any]]:
+        return self.__sfps
+
+    # Returning True if the view was built from these lists (the same objects, not equal ones)
+    def isBuiltFrom(self, *sources: Any) -> bool:
+        return len(sources) == len(self.source) and all(source is current for source, current in zip(sources, self.source))
+
+    # Returning the counter of the interface from the Interface Table (None if it was not collected)
+    def counter(self, record: InterfaceRecord, counter: str) -> Optional[int]:
+        if self.table is None or record.row is None:
+            return None
+        return self.table.value(record.row, counter)
+
+    ####################
+    # Privates Methods #
+    ####################
+
+    # Returning the record of the interface ID, the record is created if it is new
+    def __record(self, int_id: Any) -> InterfaceRecord:
+        key = str(int_id).lower()
+        record = self.__records.get(key)
+        if record is None:
+            record = InterfaceRecord(key)
+            self.__records[key] = record
+        return record
+
+# Shared empty list of the switches without interfaces, SFPs, etc.
+_EMPTY: Tuple[Any, ...] = ()
+
+####################
+# Public Functions #
+####################
+
+# Function that returns the Interface View of the switch, joined on the first call and cached in
+# graph.graph['interface_views']. The view is rebuilt when one of its lists is replaced (new collection or MO event)
+def nodeInterfaceView(graph: nx.Graph, node: Any) -> InterfaceView:
+
+    attributes = graph.nodes[node]
+    interfaces = attributes.get('interfaces') or _EMPTY
+    opt_interfaces = attributes.get('opt_interfaces') or _EMPTY
+    sfps = attributes.get('sfp') or _EMPTY
+    table = graph.graph.get('interface_table')
+
+    views: Dict[Any, InterfaceView] = graph.graph.setdefault('interface_views', {})
+    view = views.get(node)
+    if view is None or not view.isBuiltFrom(interfaces, opt_interfaces, sfps, table):
+        view = InterfaceView(attributes.get('id'), interfaces, opt_interfaces, sfps, table)
+        views[node] = view
+    return view
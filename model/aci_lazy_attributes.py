@@ -0,0 +1,203 @@
+# coding=utf-8
+
+#########################################################################
+#  Lazy Node Attributes: placeholders that fetch and parse their data   #
+#  from the APIC on first access and cache the result in the node       #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Callable, Collection, Dict, FrozenSet, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from model.aci_records import ACIRecord
+import contextlib
+import threading
+
+# Number of placeholders fetched in parallel by prefetchAttributes
+PREFETCH_WORKERS = 16
+
+#########################################################################################################
+# LazyAttribute Class, placeholder stored in the node attributes until the value is requested           #
+#########################################################################################################
+
+class LazyAttribute:
+
+    __slots__ = ('_loader', '_default', '_lock', '_value', '_resolved', 'description')
+
+    def __init__(self, loader: Callable[[], Any], default: Any = None, description: str = "") -> None:
+        self._loader: Callable[[], Any] = loader
+        self._default: Any = default
+        self._lock: threading.Lock = threading.Lock()
+        self._value: Any = None
+        self._resolved: bool = False
+        self.description: str = description
+
+    # Method that fetch the value only once, if the loader fails the default value is returned and the
+    # placeholder is kept so the next access try it again
+    def resolve(self) -> Any:
+        with self._lock:
+            if not self._resolved:
+                try:
+                    self._value = self._loader()
+                    self._resolved = True
+                except Exception as e:
+                    print(f"Error fetching the attribute {self.description}: {e}")
+                    return self._default() if callable(self._default) else self._default
+            return self._value
+
+    # Placeholder representation in the CLI outputs
+    def __repr__(self) -> str:
+        return "<not fetched>"
+
+#########################################################################################################
+# LazyNodeAttributes Class, node attribute dictionary that resolve the LazyAttribute placeholders when  #
+# the value is read (get, [], items, values, copy, pop) and replace the placeholder by the value         #
+#########################################################################################################
+
+class LazyNodeAttributes(dict):
+
+    # Callback (and its keys) notified when a watched key is written, used by the Graph indexes (see model.aci_graph)
+    _watcher: Optional[Callable[["LazyNodeAttributes"], None]] = None
+    _watched_keys: FrozenSet[Any] = frozenset()
+
+    # Returning the value, resolving the placeholder
+    def __getitem__(self, key: Any) -> Any:
+        value = dict.__getitem__(self, key)
+        if isinstance(value, LazyAttribute):
+            value = self.__resolve(key, value)
+        return value
+
+    # Returning the value, resolving the placeholder
+    def get(self, key: Any, default: Any = None) -> Any:
+        if dict.__contains__(self, key):
+            return self[key]
+        return default
+
+    # Returning all the values resolved (exports and full attribute printers)
+    def items(self) -> Any:
+        self.materialize()
+        return dict.items(self)
+
+    # Returning all the values resolved
+    def values(self) -> Any:
+        self.materialize()
+        return dict.values(self)
+
+    # Returning a plain dict copy with all the values resolved
+    def copy(self) -> Dict[Any, Any]:
+        self.materialize()
+        return dict(dict.items(self))
+
+    # Removing the key, returning the resolved value
+    def pop(self, key: Any, *default: Any) -> Any:
+        if dict.__contains__(self, key):
+            value = self[key]
+            del self[key]
+            return value
+        return dict.pop(self, key, *default)
+
+    # Returning the resolved value or setting the default
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if dict.__contains__(self, key):
+            return self[key]
+        self[key] = default
+        return default
+
+    # Setting the value, the watcher is notified if the key is watched
+    def __setitem__(self, key: Any, value: Any) -> None:
+        dict.__setitem__(self, key, value)
+        if self._watcher is not None and key in self._watched_keys:
+            self._watcher(self)
+
+    # Updating the values, the watcher is notified once
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        dict.update(self, *args, **kwargs)
+        if self._watcher is not None:
+            self._watcher(self)
+
+    # Removing the key, the watcher is notified if the key is watched
+    def __delitem__(self, key: Any) -> None:
+        dict.__delitem__(self, key)
+        if self._watcher is not None and key in self._watched_keys:
+            self._watcher(self)
+
+    # Removing all the keys
+    def clear(self) -> None:
+        dict.clear(self)
+        if self._watcher is not None:
+            self._watcher(self)
+
+    # Method that registers the callback notified when one of the keys is written
+    def watch(self, watcher: Optional[Callable[["LazyNodeAttributes"], None]], keys: Tuple[Any, ...] = ()) -> None:
+        self._watcher = watcher
+        self._watched_keys = frozenset(keys)
+
+    # Method that resolve all the placeholders of the node
+    def materialize(self) -> "LazyNodeAttributes":
+        for key, value in list(dict.items(self)):
+            if isinstance(value, LazyAttribute):
+                self.__resolve(key, value)
+        return self
+
+    # Method that return the value without fetching it, the default is returned for placeholders
+    def peek(self, key: Any, default: Any = None) -> Any:
+        value = dict.get(self, key, default)
+        return default if isinstance(value, LazyAttribute) else value
+
+    # Method that return True when the attribute is already fetched
+    def isResolved(self, key: Any) -> bool:
+        return not isinstance(dict.get(self, key), LazyAttribute)
+
+    # Returning the attribute keys still pending to be fetched
+    def pendingKeys(self) -> Tuple[Any, ...]:
+        return tuple(key for key, value in dict.items(self) if isinstance(value, LazyAttribute))
+
+    # Method that replace the placeholders already fetched by their value, nothing is requested to the APIC
+    def swapResolved(self) -> None:
+        for key, value in list(dict.items(self)):
+            if isinstance(value, LazyAttribute) and value._resolved:
+                dict.__setitem__(self, key, value._value)
+
+    # Private method that replace the placeholder by the value once it is fetched
+    def __resolve(self, key: Any, lazy: LazyAttribute) -> Any:
+        value = lazy.resolve()
+        if lazy._resolved and dict.get(self, key) is lazy:
+            dict.__setitem__(self, key, value)
+        return value
+
+    # Pickle/deepcopy always store the resolved values
+    def __reduce__(self) -> Any:
+        return (self.__class__, (), None, None, iter(self.items()))
+
+####################
+# Public Functions #
+####################
+
+# Function that return a node attribute without fetching placeholders (plain dicts are supported too)
+def peekAttribute(attributes: Dict[Any, Any], key: Any, default: Any = None) -> Any:
+    value = dict.get(attributes, key, default)
+    return default if isinstance(value, LazyAttribute) else value
+
+# Function that return a plain dict with all the values resolved, used by the exports
+# (the slotted records of the lists are exported as plain dicts)
+def materializeAttributes(attributes: Dict[Any, Any]) -> Dict[Any, Any]:
+    return {key: [item.to_dict() if isinstance(item, ACIRecord) else item for item in value] if isinstance(value, list) else value for key, value in attributes.items()}
+
+# Function that fetch the placeholders of the Graph nodes ('keys' only, all of them when None) without holding the
+# Graph lock: the lock is taken to list the placeholders and to swap in the values, the APIC requests run in a
+# thread pool outside of it. Returning the number of placeholders fetched
+def prefetchAttributes(graph: Any, keys: Optional[Collection[Any]] = None) -> int:
+    lock = graph.graph.get('graph_lock') or contextlib.nullcontext()
+    with lock:
+        nodes: List[LazyNodeAttributes] = [attributes for _, attributes in graph.nodes(data=True) if isinstance(attributes, LazyNodeAttributes)]
+        placeholders: List[LazyAttribute] = [dict.get(attributes, key) for attributes in nodes for key in attributes.pendingKeys() if keys is None or key in keys]
+    if not placeholders:
+        return 0
+    with ThreadPoolExecutor(max_workers=min(PREFETCH_WORKERS, len(placeholders))) as executor:
+        list(executor.map(LazyAttribute.resolve, placeholders))
+    with lock:
+        for attributes in nodes:
+            attributes.swapResolved()
+    return len(placeholders)
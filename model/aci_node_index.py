@@ -0,0 +1,126 @@
+# coding=utf-8
+
+#########################################################################
+#  Node Index: secondary indexes of the Graph nodes (role -> nodes,     #
+#  node id -> name and podId -> nodes) kept in graph.graph              #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from itertools import chain
+import networkx as nx
+
+#########################################################################################################
+# NodeIndex Class, maintained by the ACIFabricGraph (model.aci_graph) on every node added, removed or    #
+# updated ('role', 'id' and 'podId' attributes). The nodes are returned in the Graph order.             #
+#########################################################################################################
+
+class NodeIndex:
+
+    # Node attributes indexed
+    KEYS: Tuple[str, ...] = ('role', 'id', 'podId')
+
+    def __init__(self) -> None:
+        self.__by_role: Dict[str, Dict[Any, None]] = {}
+        self.__by_id: Dict[str, Any] = {}
+        self.__by_pod: Dict[str, Dict[Any, None]] = {}
+        self.__indexed: Dict[Any, Tuple[Any, Any, Any]] = {}
+        self.__order: Dict[Any, int] = {}
+
+    ##################
+    # Public Methods #
+    ##################
+
+    # Number of nodes in the index
+    def __len__(self) -> int:
+        return len(self.__indexed)
+
+    # Indexing the node, only the keys that changed are moved
+    def indexNode(self, node: Any, attributes: Dict[str, Any]) -> None:
+        values = tuple(None if dict.get(attributes, key) is None else str(dict.get(attributes, key)) for key in self.KEYS)
+        current = self.__indexed.get(node)
+        if current == values:
+            return
+        if current is not None:
+            self.__unindex(node, current)
+        self.__order.setdefault(node, len(self.__order))
+        self.__indexed[node] = values
+
+        role, node_id, pod = values
+        if role is not None:
+            self.__by_role.setdefault(role, {})[node] = None
+        if node_id is not None:
+            self.__by_id[node_id] = node
+        if pod is not None:
+            self.__by_pod.setdefault(pod, {})[node] = None
+
+    # Removing the node from the index
+    def removeNode(self, node: Any) -> None:
+        current = self.__indexed.pop(node, None)
+        if current is not None:
+            self.__unindex(node, current)
+        self.__order.pop(node, None)
+
+    # Removing all the nodes
+    def clear(self) -> None:
+        for index in (self.__by_role, self.__by_id, self.__by_pod, self.__indexed, self.__order):
+            index.clear()
+
+    # Returning the nodes of the roles in the Graph order, e.g. nodesWithRole(('spine', 'leaf'))
+    def nodesWithRole(self, roles: Union[str, Iterable[str]]) -> List[Any]:
+        roles = (roles,) if isinstance(roles, str) else tuple(roles)
+        return sorted(chain.from_iterable(self.__by_role.get(role, {}) for role in roles), key=self.__order.__getitem__)
+
+    # Returning the Graph node name of the Node ID or None
+    def nodeName(self, node_id: Any) -> Optional[Any]:
+        return self.__by_id.get(str(node_id))
+
+    # Returning the nodes of the Pod in the Graph order
+    def nodesInPod(self, pod: Any) -> List[Any]:
+        return sorted(self.__by_pod.get(str(pod), {}), key=self.__order.__getitem__)
+
+    # Returning the roles of the indexed nodes
+    def roles(self) -> List[str]:
+        return [role for role, nodes in self.__by_role.items() if nodes]
+
+    ####################
+    # Privates Methods #
+    ####################
+
+    # Removing the node from the role, id and pod indexes
+    def __unindex(self, node: Any, values: Tuple[Any, Any, Any]) -> None:
+        role, node_id, pod = values
+        if role is not None:
+            self.__by_role.get(role, {}).pop(node, None)
+        if node_id is not None and self.__by_id.get(node_id) == node:
+            del self.__by_id[node_id]
+        if pod is not None:
+            self.__by_pod.get(pod, {}).pop(node, None)
+
+####################
+# Public Functions #
+####################
+
+# Function that returns the Node Index of the Graph, None for the Graphs that do not maintain it (plain nx.Graph,
+# even if graph.graph was copied from an ACIFabricGraph)
+def graphNodeIndex(graph: nx.Graph) -> Optional[NodeIndex]:
+    index = getattr(graph, '_node_index', None)
+    return index if isinstance(index, NodeIndex) else None
+
+# Function that returns the (node, attributes) of the roles, from the Node Index or scanning the nodes
+def nodesWithRole(graph: nx.Graph, roles: Union[str, Iterable[str]]) -> List[Tuple[Any, Dict[str, Any]]]:
+    index = graphNodeIndex(graph)
+    if index is not None:
+        return [(node, graph.nodes[node]) for node in index.nodesWithRole(roles)]
+    roles = (roles,) if isinstance(roles, str) else tuple(roles)
+    return [(node, attributes) for node, attributes in graph.nodes(data=True) if attributes.get('role') in roles]
+
+# Function that returns the Graph node name of the Node ID, from the Node Index or scanning the nodes
+def nodeNameById(graph: nx.Graph, node_id: Any) -> Optional[Any]:
+    index = graphNodeIndex(graph)
+    if index is not None:
+        return index.nodeName(node_id)
+    return next((node for node, attributes in graph.nodes(data=True) if str(attributes.get('id')) == str(node_id)), None)
@@ -0,0 +1,176 @@
+# coding=utf-8
+
+#########################################################################
+#  Port Graph: the interfaces of the switches as child nodes of their   #
+#  switch, linked by the LLDP links and to the downlink devices         #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from model.aci_interface_table import InterfaceTable
+from model.aci_node_index import nodeNameById
+from array import array
+import networkx as nx
+
+#########################################################################################################
+# PortGraph Class, an optional layer built from the ACIFabricGraph (graph.graph['port_graph']). Every   #
+# switch, interface and downlink device is an integer ID of an nx.Graph without node or edge            #
+# attributes: the labels (switch name, (switch, port) or device name), the kind and the parent switch    #
+# of every ID are kept in a list and two arrays. The edge kind follows from the kinds of its IDs:       #
+# switch-port (member), port-port (LLDP link) and port-device (downlink)                                #
+#########################################################################################################
+
+class PortGraph:
+
+    # Kinds of the IDs
+    SWITCH: int = 0
+    PORT: int = 1
+    DEVICE: int = 2
+
+    # Operational states of a port that are usable (None: not collected)
+    USABLE_OPER_ST: Tuple[Any, ...] = ('up', None, 'N/A', 'unknown')
+
+    def __init__(self, graph: nx.Graph) -> None:
+        self.signature: Tuple[int, int, int] = self.signatureOf(graph)
+        self.topology: nx.Graph = nx.Graph()
+        self.labels: List[Any] = []
+        self.kinds: bytearray = bytearray()
+        self.parents: array = array('i')
+        self.down: Set[int] = set()
+        self.lost: Set[Tuple[int, int]] = set()
+        self.__ids: Dict[Any, int] = {}
+        self.__build(graph)
+
+    ##################
+    # Public Methods #
+    ##################
+
+    # Method that reads again the operational state of the ports and the LLDP adjacencies (no new IDs)
+    def refreshStates(self, graph: nx.Graph) -> None:
+
+        down: Set[int] = set()
+        lost: Set[Tuple[int, int]] = set()
+
+        table: Optional[InterfaceTable] = graph.graph.get('interface_table')
+        if table is not None:
+            for node_id, port, row in table:
+                port_id = self.__ids.get((nodeNameById(graph, node_id), port))
+                if port_id is not None and table.value(row, 'oper_st') not in self.USABLE_OPER_ST:
+                    down.add(port_id)
+
+        # The edges have the last state (subscriptions update the edges, not the table)
+        for u, v, data in graph.edges(data=True):
+            for port_id, oper_st in self.__edgePorts(graph, u, v, data):
+                if oper_st in self.USABLE_OPER_ST:
+                    down.discard(port_id)
+                else:
+                    down.add(port_id)
+            if data is not None and not data.get('downlink') and data.get('lldp_adjacency') == 'lost':
+                ports = [port_id for port_id, _ in self.__edgePorts(graph, u, v, data)]
+                if len(ports) == 2:
+                    lost.add(tuple(sorted(ports)))
+
+        self.down, self.lost = down, lost
+
+    # Method that returns the ID of a label (switch or device name, (switch, port)), None if unknown
+    def nodeId(self, label: Any) -> Optional[int]:
+        return self.__ids.get(label)
+
+    # Method that returns the IDs of the ports of a switch
+    def ports(self, switch_id: int) -> List[int]:
+        return sorted(peer for peer in self.topology[switch_id] if self.kinds[peer] == self.PORT and self.parents[peer] == switch_id)
+
+    # Method that returns the IDs of a kind
+    def idsOf(self, kind: int) -> List[int]:
+        return [node for node, node_kind in enumerate(self.kinds) if node_kind == kind]
+
+    # Method that returns the label of an ID as text ('leaf101 eth1/49' for the ports)
+    def text(self, node: int) -> str:
+        label = self.labels[node]
+        return f"{label[0]} {label[1]}" if self.kinds[node] == self.PORT else str(label)
+
+    # Method that returns a read-only view without the down ports, the lost LLDP links and the hidden IDs and edges.
+    # The devices are hidden too (a dual-homed server is not a transit between two leaves) except 'devices'
+    def usableView(self, hidden: Iterable[int] = (), hidden_edges: Iterable[Tuple[int, int]] = (), devices: Iterable[int] = ()) -> nx.Graph:
+        keep = set(devices)
+        nodes = self.down | set(hidden) | {node for node in self.idsOf(self.DEVICE) if node not in keep}
+        return nx.restricted_view(self.topology, nodes, self.lost | set(hidden_edges))
+
+    # Returning the values that change when the Graph gets new nodes, edges or interfaces (the IDs are built again)
+    @staticmethod
+    def signatureOf(graph: nx.Graph) -> Tuple[int, int, int]:
+        table: Optional[InterfaceTable] = graph.graph.get('interface_table')
+        return (graph.number_of_nodes(), graph.number_of_edges(), len(table) if table is not None else 0)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    ####################
+    # Privates Methods #
+    ####################
+
+    # Building the IDs: the switches of the fabric links, their interfaces (Interface Table and edges) and the devices
+    def __build(self, graph: nx.Graph) -> None:
+
+        for u, v, data in graph.edges(data=True):
+            if data is not None and not data.get('downlink'):
+                self.__add(u, self.SWITCH)
+                self.__add(v, self.SWITCH)
+
+        table: Optional[InterfaceTable] = graph.graph.get('interface_table')
+        if table is not None:
+            for node_id, port, _ in sorted(table):
+                node = nodeNameById(graph, node_id)
+                if node is not None and node in graph:
+                    self.__addPort(node, port)
+
+        for u, v, data in graph.edges(data=True):
+            if data is None:
+                continue
+            if data.get('downlink'):
+                leaf, device = (u, v) if str(graph.nodes[u].get('id')) == str(data.get('leaf')) else (v, u)
+                port_id = self.__addPort(leaf, str(data.get('leaf_int') or '').lower())
+                self.topology.add_edge(port_id, self.__add(device, self.DEVICE))
+            else:
+                ports = [self.__addPort(node, port) for node, port in self.__linkSides(graph, u, v, data)]
+                if len(ports) == 2:
+                    self.topology.add_edge(*ports)
+
+        self.refreshStates(graph)
+
+    # Adding an ID (the existing ID of the label is returned)
+    def __add(self, label: Any, kind: int, parent: int = -1) -> int:
+        node = self.__ids.get(label)
+        if node is None:
+            node = self.__ids[label] = len(self.labels)
+            self.labels.append(label)
+            self.kinds.append(kind)
+            self.parents.append(parent)
+            self.topology.add_node(node)
+        return node
+
+    # Adding the ID of a port and its member edge to the switch
+    def __addPort(self, node: Any, port: str) -> int:
+        switch_id = self.__add(node, self.SWITCH)
+        port_id = self.__add((node, port), self.PORT, switch_id)
+        self.topology.add_edge(switch_id, port_id)
+        return port_id
+
+    # Returning the (node, port) of both sides of a fabric link
+    def __linkSides(self, graph: nx.Graph, u: Any, v: Any, data: Any) -> List[Tuple[Any, str]]:
+        nodes = {str(graph.nodes[node].get('id')): node for node in (u, v)}
+        return [(nodes[str(data.get(side + '_node_id'))], str(data.get(side + '_interface_id') or '').lower()) for side in ('source', 'dest') if str(data.get(side + '_node_id')) in nodes and data.get(side + '_interface_id')]
+
+    # Returning the (port ID, operSt) of the ports of an edge
+    def __edgePorts(self, graph: nx.Graph, u: Any, v: Any, data: Any) -> List[Tuple[int, Any]]:
+        if data is None:
+            return []
+        if data.get('downlink'):
+            leaf = u if str(graph.nodes[u].get('id')) == str(data.get('leaf')) else v
+            port_id = self.__ids.get((leaf, str(data.get('leaf_int') or '').lower()))
+            return [(port_id, data.get('operSt'))] if port_id is not None else []
+        sides = {str(data.get(side + '_node_id')): data.get(side + '_interface_operSt') for side in ('source', 'dest')}
+        return [(self.__ids[(node, port)], sides[str(graph.nodes[node].get('id'))]) for node, port in self.__linkSides(graph, u, v, data) if (node, port) in self.__ids]
@@ -0,0 +1,143 @@
+# coding=utf-8
+
+#########################################################################
+#  Compact records for the entries stored in the Graph nodes            #
+#  (interfaces, SFPs, faults, PSUs, etc.) with a dict read interface    #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Dict, FrozenSet, Iterator, Tuple, Type
+import threading
+
+#########################################################################################################
+# ACIRecord Class, base of the slotted record types. Each MO class has its own record type with one    #
+# slot per field, the field names are stored once per type instead of once per entry as in a dict.    #
+# A field that was not returned by the APIC is not set and behaves like a missing dict key.            #
+#########################################################################################################
+
+class ACIRecord:
+
+    __slots__ = ()
+
+    # MO class and fields of the record type
+    MO_CLASS: str = ""
+    FIELDS: Tuple[str, ...] = ()
+    FIELD_SET: FrozenSet[str] = frozenset()
+
+    def __init__(self, values: Dict[str, Any]) -> None:
+        for key, value in values.items():
+            self[key] = value
+
+    #
+    # Dict read interface (used by the printers)
+    #
+
+    # Returning the field value, KeyError if the field is not set
+    def __getitem__(self, key: str) -> Any:
+        if key in self.FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    # Returning the field value or the default value if the field is not set
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default) if key in self.FIELD_SET else default
+
+    # Checking if the field is set
+    def __contains__(self, key: object) -> bool:
+        return key in self.FIELD_SET and hasattr(self, key)
+
+    # Iterating the fields set, in the order of the projection
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in self.FIELDS if hasattr(self, key))
+
+    # Number of fields set
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    # Returning the fields set
+    def keys(self) -> Iterator[str]:
+        return iter(self)
+
+    # Returning the values of the fields set
+    def values(self) -> Iterator[Any]:
+        return (getattr(self, key) for key in self)
+
+    # Returning the (field, value) pairs of the fields set
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return ((key, getattr(self, key)) for key in self)
+
+    #
+    # Dict write interface (used by the parsers and the MO subscriptions), only the fields of the type
+    #
+
+    # Setting the field value, KeyError if the field is not part of the record type
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self.FIELD_SET:
+            raise KeyError(f"{key} is not a field of the {self.MO_CLASS} record")
+        setattr(self, key, value)
+
+    # Setting the field value only if it is not set
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    # Updating the fields values
+    def update(self, values: Dict[str, Any]) -> None:
+        for key, value in values.items():
+            self[key] = value
+
+    #
+    # Conversions
+    #
+
+    # Returning the record as a plain dict (exports)
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    # Records are equal to the records/dicts with the same fields set
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ACIRecord, dict)):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    # Records are mutable (subscriptions), they can not be hashed
+    __hash__ = None  # type: ignore[assignment]
+
+    # Same representation as the dict in the CLI outputs and reports
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+    # Pickle support, the record type is rebuilt from its MO class and fields
+    def __reduce__(self) -> Any:
+        return (_restore_record, (self.MO_CLASS, self.FIELDS, self.to_dict()))
+
+############################
+# Record Types Definitions #
+############################
+
+# Auxilear Dict with the record type of each MO class
+_RECORD_TYPES: Dict[Tuple[str, Tuple[str, ...]], Type[ACIRecord]] = {}
+_RECORD_TYPES_LOCK = threading.Lock()
+
+# Function that returns the record type of the MO class (one type per MO class and fields)
+def recordType(mo_class: str, fields: Tuple[str, ...]) -> Type[ACIRecord]:
+    key = (mo_class, tuple(fields))
+    record_type = _RECORD_TYPES.get(key)
+    if record_type is None:
+        with _RECORD_TYPES_LOCK:
+            record_type = _RECORD_TYPES.get(key)
+            if record_type is None:
+                record_type = type(mo_class + "Record", (ACIRecord,), {'__slots__': key[1], 'MO_CLASS': mo_class, 'FIELDS': key[1], 'FIELD_SET': frozenset(key[1])})
+                _RECORD_TYPES[key] = record_type
+    return record_type
+
+# Function used by pickle to rebuild a record
+def _restore_record(mo_class: str, fields: Tuple[str, ...], values: Dict[str, Any]) -> ACIRecord:
+    return recordType(mo_class, fields)(values)
@@ -0,0 +1,131 @@
+# coding=utf-8
+
+#########################################################################
+#  Tenant Index: the objects of the Tenant subtrees indexed once by     #
+#  DN, by class, parent -> children and relation tDn -> source          #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from parsers.aci_dn_parser import ACIDnParser
+
+#########################################################################################################
+# TenantObject Class, one MO of the Tenant subtree. 'attributes' and 'children' are the same objects  #
+# of the APIC JSON (no copy), so the helpers that read the raw children lists keep working.            #
+#########################################################################################################
+
+class TenantObject:
+
+    __slots__ = ('dn', 'mo_class', 'attributes', 'children', 'parent')
+
+    def __init__(self, dn: str, mo_class: str, attributes: Dict[str, Any], children: List[Dict[str, Any]], parent: Optional[str]) -> None:
+        self.dn: str = dn
+        self.mo_class: str = mo_class
+        self.attributes: Dict[str, Any] = attributes
+        self.children: List[Dict[str, Any]] = children
+        self.parent: Optional[str] = parent
+
+    # Name of the object ('name' attribute)
+    @property
+    def name(self) -> str:
+        return self.attributes.get('name', 'N/A')
+
+    def __repr__(self) -> str:
+        return f"TenantObject({self.mo_class}, {self.dn})"
+
+#########################################################################################################
+# TenantIndex Class, built once from the 'tenants' list of the Fabric_Config_Root node (see             #
+# ACIController). The objects are kept in the order of the subtree, so the reports print the same order #
+#########################################################################################################
+
+class TenantIndex:
+
+    def __init__(self, tenants: List[Dict[str, Any]]) -> None:
+        self.source: List[Dict[str, Any]] = tenants
+        self.__by_dn: Dict[str, TenantObject] = {}
+        self.__by_class: Dict[str, List[TenantObject]] = {}
+        self.__children: Dict[str, List[TenantObject]] = {}
+        self.__relations: Dict[str, List[TenantObject]] = {}
+        self.__dn_parser: ACIDnParser = ACIDnParser()
+
+        for tenant in tenants:
+            self.__add(tenant, None)
+
+    ##################
+    # Public Methods #
+    ##################
+
+    # Number of objects in the index
+    def __len__(self) -> int:
+        return len(self.__by_dn)
+
+    # Iterating all the objects of the index (subtree order)
+    def __iter__(self) -> Iterator[TenantObject]:
+        return iter(self.__by_dn.values())
+
+    # Returning the object of the DN or None
+    def get(self, dn: str) -> Optional[TenantObject]:
+        return self.__by_dn.get(dn)
+
+    # Returning all the objects of the MO class (subtree order)
+    def objects(self, mo_class: str) -> List[TenantObject]:
+        return self.__by_class.get(mo_class, [])
+
+    # Returning the direct children of the DN, optionally only the ones of the MO class
+    def childrenOf(self, dn: str, mo_class: Optional[str] = None) -> List[TenantObject]:
+        children = self.__children.get(dn, [])
+        return children if mo_class is None else [child for child in children if child.mo_class == mo_class]
+
+    # Returning the parent object of the DN or None
+    def parentOf(self, dn: str) -> Optional[TenantObject]:
+        obj = self.__by_dn.get(dn)
+        return self.__by_dn.get(obj.parent) if obj is not None and obj.parent is not None else None
+
+    # Returning the closest ancestor of the MO class (e.g. the fvTenant of an EPG) or None
+    def ancestor(self, dn: str, mo_class: str) -> Optional[TenantObject]:
+        parent = self.parentOf(dn)
+        while parent is not None and parent.mo_class != mo_class:
+            parent = self.parentOf(parent.dn)
+        return parent
+
+    # Returning the (parent, child) pairs of the MO class whose parent is of the parent class, e.g. ('fvTenant', 'fvBD')
+    def pairs(self, parent_class: str, mo_class: str) -> Iterator[Tuple[TenantObject, TenantObject]]:
+        for obj in self.objects(mo_class):
+            parent = self.parentOf(obj.dn)
+            if parent is not None and parent.mo_class == parent_class:
+                yield parent, obj
+
+    # Returning the relation objects (fvRs*, vzRs*, etc.) pointing to the DN, e.g. the fvRsBd of the EPGs of a BD
+    def relationSources(self, tDn: str) -> List[TenantObject]:
+        return self.__relations.get(tDn, [])
+
+    ####################
+    # Privates Methods #
+    ####################
+
+    # Adding the MO and its subtree into the index
+    def __add(self, mo: Dict[str, Any], parent: Optional[TenantObject]) -> None:
+        for mo_class, body in mo.items():
+            attributes = body.get('attributes', {})
+            children = body.get('children', [])
+            obj = TenantObject(self.__dn(mo_class, attributes, parent), mo_class, attributes, children, parent.dn if parent is not None else None)
+
+            self.__by_dn[obj.dn] = obj
+            self.__by_class.setdefault(mo_class, []).append(obj)
+            if parent is not None:
+                self.__children.setdefault(parent.dn, []).append(obj)
+            if attributes.get('tDn'):
+                self.__relations.setdefault(attributes['tDn'], []).append(obj)
+
+            for child in children:
+                self.__add(child, obj)
+
+    # Returning the DN of the MO, the subtree children may only have the 'rn' (or neither)
+    def __dn(self, mo_class: str, attributes: Dict[str, Any], parent: Optional[TenantObject]) -> str:
+        if attributes.get('dn'):
+            return self.__dn_parser.parseDn(attributes['dn']).dn
+        rn = attributes.get('rn') or (mo_class + '-' + attributes['name'] if attributes.get('name') else mo_class + '-' + str(len(self.__by_dn)))
+        return self.__dn_parser.parseDn(parent.dn + '/' + rn if parent is not None else rn).dn
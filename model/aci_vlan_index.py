@@ -0,0 +1,190 @@
+# coding=utf-8
+
+#########################################################################
+#  VLAN Index: the operational and allowed VLANs of the downlink ports  #
+#  as bitsets, with the inverted VLAN -> ports map                      #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from array import array
+import networkx as nx
+
+#########################################################################################################
+# VlanIndex Class, built by the collector from the downlink edges (graph.graph['vlan_index']). Every   #
+# distinct VLAN set is a profile: a bitset (int, one bit per VLAN ID) parsed once per range string     #
+# ("10-20,30"). Every port has a slot that points to its profile (array per kind) and every VLAN        #
+# points to the profiles that have it, with the port slots of every profile, so a VLAN lookup only     #
+# reads the ports of the profiles of the VLAN                                                           #
+#########################################################################################################
+
+class VlanIndex:
+
+    # Highest VLAN ID
+    MAX_VLAN: int = 4095
+
+    # VLAN sets of every port: operational VLANs ('operVlans') and allowed VLANs ('allowedVlans')
+    KINDS: Tuple[str, ...] = ('oper', 'allowed')
+
+    def __init__(self) -> None:
+        self.__slots: Dict[Tuple[Any, str], int] = {}
+        self.__ports: List[Optional[Tuple[Any, str]]] = []
+        self.__free: List[int] = []
+        self.__parsed: Dict[str, int] = {}
+        self.__profiles: Dict[int, int] = {0: 0}
+        self.__profile_bits: List[int] = [0]
+        self.__vlan_profiles: Dict[int, List[int]] = {}
+        self.__port_profiles: Dict[str, array] = {kind: array('i') for kind in self.KINDS}
+        self.__profile_ports: Dict[str, List[Set[int]]] = {kind: [set()] for kind in self.KINDS}
+
+    ##################
+    # Public Methods #
+    ##################
+
+    # Number of ports in the index
+    def __len__(self) -> int:
+        return len(self.__slots)
+
+    # Setting the VLAN range strings of a port, None keeps the current VLANs of that kind
+    def setPort(self, node: Any, port: Any, oper: Optional[str] = None, allowed: Optional[str] = None) -> None:
+
+        key = (node, str(port).lower())
+        slot = self.__slots.get(key)
+        if slot is None:
+            slot = self.__slots[key] = self.__free.pop() if self.__free else len(self.__ports)
+            if slot == len(self.__ports):
+                self.__ports.append(key)
+                for kind in self.KINDS:
+                    self.__port_profiles[kind].append(0)
+                    self.__profile_ports[kind][0].add(slot)
+            else:
+                self.__ports[slot] = key
+
+        for kind, text in (('oper', oper), ('allowed', allowed)):
+            if text is not None:
+                self.__setProfile(kind, slot, self.__profile(self.__bitset(text)))
+
+    # Removing a port from the index
+    def removePort(self, node: Any, port: Any) -> None:
+        slot = self.__slots.pop((node, str(port).lower()), None)
+        if slot is None:
+            return
+        for kind in self.KINDS:
+            self.__setProfile(kind, slot, 0)
+            self.__profile_ports[kind][0].discard(slot)
+        self.__ports[slot] = None
+        self.__free.append(slot)
+
+    # Returning the (node, port) that carry the VLAN
+    def ports(self, vlan: int, kind: str = 'oper') -> List[Tuple[Any, str]]:
+        profile_ports = self.__profile_ports[kind]
+        return [self.__ports[slot] for profile in self.__vlan_profiles.get(vlan, ()) for slot in profile_ports[profile]]
+
+    # Returning the number of ports that carry the VLAN
+    def portCount(self, vlan: int, kind: str = 'oper') -> int:
+        profile_ports = self.__profile_ports[kind]
+        return sum(len(profile_ports[profile]) for profile in self.__vlan_profiles.get(vlan, ()))
+
+    # Returning the VLAN bitset of a port (0 if the port is not in the index)
+    def vlanBits(self, node: Any, port: Any, kind: str = 'oper') -> int:
+        slot = self.__slots.get((node, str(port).lower()))
+        return self.__profile_bits[self.__port_profiles[kind][slot]] if slot is not None else 0
+
+    # Returning the VLAN IDs of a port
+    def vlans(self, node: Any, port: Any, kind: str = 'oper') -> List[int]:
+        return list(self.__bits(self.vlanBits(node, port, kind)))
+
+    # Returning the VLAN IDs carried by at least one port
+    def vlansInUse(self, kind: str = 'oper') -> List[int]:
+        bits = 0
+        for profile, slots in enumerate(self.__profile_ports[kind]):
+            bits |= self.__profile_bits[profile] if slots else 0
+        return list(self.__bits(bits))
+
+    # Function that parses a VLAN range string ("10-20,30") into a bitset, the invalid items are ignored
+    @classmethod
+    def parseRanges(cls, text: Any) -> int:
+        bits = 0
+        for item in str(text or '').replace(' ', '').split(','):
+            first, _, last = item.partition('-')
+            if not first.isdigit() or (last and not last.isdigit()):
+                continue
+            first_vlan, last_vlan = max(int(first), 1), min(int(last or first), cls.MAX_VLAN)
+            if first_vlan <= last_vlan:
+                bits |= ((1 << (last_vlan - first_vlan + 1)) - 1) << first_vlan
+        return bits
+
+    # Function that returns the VLAN IDs of a range string ("10-12,30" -> [10, 11, 12, 30])
+    @classmethod
+    def vlanList(cls, text: Any) -> List[int]:
+        return list(cls.__bits(cls.parseRanges(text)))
+
+    # Function that formats a VLAN bitset as a range string ("10-20,30")
+    @classmethod
+    def formatRanges(cls, bits: int) -> str:
+        ranges: List[List[int]] = []
+        for vlan in cls.__bits(bits):
+            if ranges and ranges[-1][1] == vlan - 1:
+                ranges[-1][1] = vlan
+            else:
+                ranges.append([vlan, vlan])
+        return ",".join(str(first) if first == last else f"{first}-{last}" for first, last in ranges)
+
+    ####################
+    # Privates Methods #
+    ####################
+
+    # Returning the bitset of a range string, parsed once per distinct string
+    def __bitset(self, text: Any) -> int:
+        text = str(text)
+        bits = self.__parsed.get(text)
+        if bits is None:
+            bits = self.__parsed[text] = self.parseRanges(text)
+        return bits
+
+    # Returning the profile of a bitset, a new profile is added into the VLANs it has
+    def __profile(self, bits: int) -> int:
+        profile = self.__profiles.get(bits)
+        if profile is None:
+            profile = self.__profiles[bits] = len(self.__profile_bits)
+            self.__profile_bits.append(bits)
+            for kind in self.KINDS:
+                self.__profile_ports[kind].append(set())
+            for vlan in self.__bits(bits):
+                self.__vlan_profiles.setdefault(vlan, []).append(profile)
+        return profile
+
+    # Moving a port slot into another profile
+    def __setProfile(self, kind: str, slot: int, profile: int) -> None:
+        previous = self.__port_profiles[kind][slot]
+        if previous != profile:
+            self.__profile_ports[kind][previous].discard(slot)
+            self.__profile_ports[kind][profile].add(slot)
+            self.__port_profiles[kind][slot] = profile
+
+    # Returning the positions of the bits set in the bitset
+    @staticmethod
+    def __bits(bits: int) -> Iterator[int]:
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+####################
+# Public Functions #
+####################
+
+# Function that returns the VLAN Index of the Graph, built from the downlink edges when the Graph has none (snapshots
+# saved before the index)
+def graphVlanIndex(graph: nx.Graph) -> VlanIndex:
+    index: Optional[VlanIndex] = graph.graph.get('vlan_index')
+    if index is None:
+        index = graph.graph['vlan_index'] = VlanIndex()
+        for u, v, data in graph.edges(data=True):
+            if data is not None and data.get('downlink'):
+                leaf = u if str(graph.nodes[u].get('id')) == str(data.get('leaf')) else v
+                index.setPort(leaf, data.get('leaf_int'), data.get('operVlans'), data.get('allowedVlans'))
+    return index
@@ -0,0 +1,101 @@
+# coding=utf-8
+
+#########################################################################
+#  Watched Interface: the counters and operational status of an         #
+#  interface polled by the Counter Watch, with the deltas of each poll  #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Deque, Dict, Optional, Sequence
+from model.aci_interface_table import InterfaceTable
+from collections import deque
+from array import array
+
+#########################################################################################################
+# WatchedInterface Class, the last raw values and the deltas of the counters are kept in two arrays     #
+# (one slot per counter, same order as the Counter Watch counters) updated in place on every poll.      #
+# A counter lower than the previous value was cleared on the switch, its delta is the new value         #
+#########################################################################################################
+
+class WatchedInterface:
+
+    __slots__ = ('node', 'node_id', 'port', 'peer', 'oper_st', 'last_link_change', 'flaps', 'values', 'deltas', 'seconds', 'polls', 'history', 'errors', 'error_slots', 'packet_slot')
+
+    def __init__(self, node: str, node_id: str, port: str, peer: str, counters: Sequence[str], error_counters: Sequence[str], history: int) -> None:
+        self.node: str = node
+        self.node_id: str = node_id
+        self.port: str = port
+        self.peer: str = peer
+        self.oper_st: Optional[str] = None
+        self.last_link_change: Optional[str] = None
+        self.flaps: int = 0
+        self.values: array = array('q', [InterfaceTable.MISSING] * len(counters))
+        self.deltas: array = array('q', [0] * len(counters))
+        self.seconds: float = 0.0
+        self.polls: int = 0
+        self.history: Deque[int] = deque(maxlen=history)
+        self.errors: int = 0
+        self.error_slots: Sequence[int] = [index for index, counter in enumerate(counters) if counter in error_counters]
+        self.packet_slot: Optional[int] = list(counters).index('pkts') if 'pkts' in counters else None
+
+    ##################
+    # Public Methods #
+    ##################
+
+    # Updating the counters with the values of a poll, 'seconds' is the time since the previous poll
+    def updateCounters(self, counters: Sequence[str], values: Dict[str, Any], seconds: float) -> None:
+
+        first = self.polls == 0
+        for index, counter in enumerate(counters):
+            value = InterfaceTable.parseNumber(values.get(counter))
+            previous = self.values[index]
+            if value == InterfaceTable.MISSING or previous == InterfaceTable.MISSING:
+                self.deltas[index] = 0
+            else:
+                self.deltas[index] = value - previous if value >= previous else value
+            self.values[index] = value
+
+        self.polls += 1
+        if not first:
+            self.seconds = seconds
+            errors = self.errorDelta()
+            self.history.append(errors)
+            self.errors += errors
+
+    # Updating the operational status, a new operSt or a new last link change is counted as a flap
+    def updateStatus(self, status: Dict[str, Any]) -> None:
+        oper_st, last_link_change = status.get('operSt'), status.get('lastLinkStChg')
+        if self.oper_st is not None and (oper_st != self.oper_st or last_link_change != self.last_link_change):
+            self.flaps += 1
+        self.oper_st, self.last_link_change = oper_st, last_link_change
+
+    # Errors of the last poll (sum of the error counters deltas)
+    def errorDelta(self) -> int:
+        return sum(self.deltas[index] for index in self.error_slots)
+
+    # Errors per second of the last poll
+    def errorRate(self) -> float:
+        return self.errorDelta() / self.seconds if self.seconds > 0 else 0.0
+
+    # Packets per second of the last poll (received packets, rmonEtherStats 'pkts')
+    def packetRate(self) -> float:
+        if self.packet_slot is None or self.seconds <= 0:
+            return 0.0
+        return self.deltas[self.packet_slot] / self.seconds
+
+    # Errors of the rolling window (last polls kept in the history)
+    def windowErrors(self) -> int:
+        return sum(self.history)
+
+    # Returning the interface as a plain dict (exports)
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'node': self.node, 'node_id': self.node_id, 'port': self.port, 'peer': self.peer, 'oper_st': self.oper_st, 'flaps': self.flaps,
+            'polls': self.polls, 'errors': self.errors, 'window_errors': self.windowErrors(), 'error_rate': self.errorRate(), 'packet_rate': self.packetRate(),
+        }
+
+    def __repr__(self) -> str:
+        return f"WatchedInterface({self.node} {self.port})"
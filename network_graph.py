@@ -22,26 +22,208 @@
 # Import Section #
 ##################
 
+from typing import List, Optional
 from aci_api_client.getCookie import getCookie
 from aci_api_client.Url import UrlClass
 from aci_api_client.UserClass import UserClass
 from menu.aci_menu import MenuPrinter
 from controller.aci_controller import ACIController
+from controller.aci_subscription_controller import ACISubscriptionController
+from controller.aci_watch_controller import ACIWatchController
 from report.email_reporter import EmailReportGenerator
+from model.aci_graph import ACIFabricGraph
+from model.aci_graph_snapshot import ACIGraphSnapshot
+from model.aci_counter_store import CounterStore
+from model.aci_vlan_index import VlanIndex
+from analysis.aci_snapshot_diff import ACISnapshotDiff
+from analysis.aci_graph_query import ACIGraphQuery
+from analysis.aci_path_analyzer import FabricPathAnalyzer
+from analysis.aci_failure_simulator import FabricFailureSimulator
+from analysis.aci_port_analyzer import PortAnalyzer
+from printers.aci_printers import ACITroubleshooterPrinter
+from parsers.aci_parse_pool import ACIParsePool
 import networkx as nx
+import argparse
+import json
 
 #######################
 # Function Definition #
 #######################
 
+# Function that read the CLI arguments of the Script
+def parseArguments() -> argparse.Namespace:
+
+    parser = argparse.ArgumentParser(description="Cisco ACI Diagnostic CLI Tool based on NetworkX Graphs")
+
+    # Block until the full collection is done before showing the Menu
+    parser.add_argument('--wait', action='store_true', help="collect the whole fabric before opening the menu (default: progressive loading)")
+
+    # Collection Profile, only the MO classes of the profile are fetched (url.yaml 'PROFILES')
+    parser.add_argument('--profile', default='full', help="collection profile: inventory, links, optics, tenants or full (default: full)")
+
+    # Node attributes fetched on first access
+    parser.add_argument('--lazy', action='store_true', help="fetch the node details (SFPs, interfaces status, faults, etc.) only when a report reads them")
+
+    # Keep the Graph live with the APIC MO subscriptions (websocket)
+    parser.add_argument('--subscribe', action='store_true', help="subscribe to the APIC MO events and keep the graph attributes live")
+
+    # Worker processes that decode and parse the large APIC responses
+    parser.add_argument('--parse-workers', type=int, default=0, metavar='N', help="decode and parse the large APIC responses in N worker processes (default: 0, parse in the collector threads)")
+
+    # Binary snapshots of the whole Graph
+    parser.add_argument('--snapshot', metavar='FILE', help="open the menu on a saved graph snapshot instead of collecting the fabric (no APIC connection)")
+    parser.add_argument('--save-snapshot', metavar='FILE', help="collect the whole fabric (as --wait) and save it into a graph snapshot")
+
+    # Changes between two graph snapshots
+    parser.add_argument('--diff', nargs=2, metavar=('OLD', 'NEW'), help="print the changes between two graph snapshots and exit (no APIC connection)")
+    parser.add_argument('--diff-json', metavar='FILE', help="with --diff, also save the change set into a JSON file")
+    parser.add_argument('--diff-counters', action='store_true', help="with --diff, also compare the interface counters of the fabric edges")
+
+    # Interface counters of every collection, for the error rates reports
+    parser.add_argument('--counter-store', metavar='FILE', help="append the interface counters of every collection into a local SQLite file and rank the fabric links by errors per second")
+
+    # Counter Watch of a set of nodes or links
+    parser.add_argument('--watch', nargs='*', metavar='TARGET', help="poll the counters and status of the fabric links of the targets (node name/ID or NODE:INTERFACE, all the fabric links if empty) and print a rolling view until Ctrl+C")
+    parser.add_argument('--watch-interval', type=float, default=ACIWatchController.DEFAULT_INTERVAL, metavar='SECONDS', help="seconds between the --watch polls (default: %(default)s)")
+
+    # Non-interactive Graph queries
+    parser.add_argument('--query', action='append', metavar='EXPR', help="print the nodes, edges or interfaces matching the query and exit, e.g. \"role==leaf and psus[*].operSt!=ok\" (repeatable, works with --snapshot)")
+    parser.add_argument('--query-json', metavar='FILE', help="with --query, also save the results into a JSON file")
+
+    # Leaf-to-leaf paths through the spines
+    parser.add_argument('--paths', nargs='*', metavar='LEAF', help="print the paths and ECMP width between two leaves (name or node ID), or the ECMP width of all the leaf pairs if empty, and exit (works with --snapshot)")
+    parser.add_argument('--lifetime-errors', action='store_true', help="with --paths and no --counter-store, also exclude the links whose lifetime error counters are not zero")
+
+    # Failure impact of nodes, linecards or interfaces (what-if before a maintenance)
+    parser.add_argument('--simulate', action='append', metavar='SCENARIO', help="print the impact of the failure of the comma separated nodes (name/ID), NODE:SLOT linecards or NODE:INTERFACE and exit, e.g. \"spine201\" (repeatable, works with --snapshot)")
+    parser.add_argument('--simulate-json', metavar='FILE', help="with --simulate, also save the impacts into a JSON file")
+
+    # Port-level questions over the interfaces of the switches as child nodes of the Graph
+    parser.add_argument('--port-path', nargs=2, metavar=('SOURCE', 'DEST'), help="print the shortest path over the usable ports between two switches, devices (name or ID) or NODE:INTERFACE and exit (works with --snapshot)")
+    parser.add_argument('--vpc', action='store_true', help="print the leaves that share dual-homed devices (vPC pairs) and the down member ports and exit (works with --snapshot)")
+    parser.add_argument('--blast-radius', action='append', metavar='SCENARIO', help="print the switches and devices that lose the reachability to the spines when the scenario fails (same format as --simulate) and exit (repeatable, works with --snapshot)")
+
+    # VLAN-scope lookups over the VLAN Index of the downlink ports
+    parser.add_argument('--vlan', action='append', metavar='VLANS', help="print the downlink ports that carry or allow the VLANs (e.g. 1234 or 10-12,30) and exit (repeatable, works with --snapshot)")
+
+    return parser.parse_args()
+
+# Function that runs the queries over the Graph and prints the results, returns the exit code (1 if a query is not valid)
+def runQueries(graph: nx.Graph, queries: List[str], json_file: Optional[str]) -> int:
+
+    results = []
+    for expression in queries:
+        try:
+            result = ACIGraphQuery().query(graph, expression)
+        except ValueError as e:
+            print(f"ERROR: Invalid query '{expression}': {e}")
+            return 1
+        ACITroubleshooterPrinter().printQueryResult(result)
+        results.append(result.to_dict())
+
+    if json_file:
+        with open(json_file, 'w') as f:
+            json.dump(results, f, indent=4, default=lambda value: value.to_dict() if hasattr(value, 'to_dict') else str(value))
+
+    return 0
+
+# Function that prints the paths between two leaves (or the ECMP width of all the leaf pairs), returns the exit code
+def runPaths(graph: nx.Graph, leaves: List[str], lifetime_errors: bool = False) -> int:
+
+    if len(leaves) not in (0, 2):
+        print("ERROR: --paths expects two leaves (SOURCE DEST) or none for all the leaf pairs")
+        return 1
+
+    try:
+        if leaves:
+            result = FabricPathAnalyzer().leafPaths(graph, leaves[0], leaves[1], lifetime_errors=lifetime_errors)
+            ACITroubleshooterPrinter().printLeafPaths(result, graph.graph['path_engine'])
+        else:
+            ACITroubleshooterPrinter().printFabricRedundancy(FabricPathAnalyzer().fabricRedundancy(graph, lifetime_errors=lifetime_errors), graph.graph['path_engine'])
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        return 1
+
+    return 0
+
+# Function that prints the impact of the failure scenarios, returns the exit code (1 if a scenario is not valid)
+def runSimulations(graph: nx.Graph, scenarios: List[str], json_file: Optional[str]) -> int:
+
+    try:
+        impacts = FabricFailureSimulator().simulate(graph, scenarios)
+    except ValueError as e:
+        print(f"ERROR: Invalid scenario: {e}")
+        return 1
+
+    for impact in impacts:
+        ACITroubleshooterPrinter().printFailureImpact(impact)
+
+    if json_file:
+        with open(json_file, 'w') as f:
+            json.dump([impact.to_dict() for impact in impacts], f, indent=4, default=str)
+
+    return 0
+
+# Function that prints the port-level path, the vPC pairs and the blast radius of the scenarios, returns the exit code
+def runPortAnalysis(graph: nx.Graph, port_path: Optional[List[str]], vpc: bool, scenarios: Optional[List[str]]) -> int:
+
+    try:
+        if port_path:
+            ACITroubleshooterPrinter().printPortPath(PortAnalyzer().portPath(graph, port_path[0], port_path[1]))
+        if vpc:
+            ACITroubleshooterPrinter().printVpcPairs(PortAnalyzer().vpcPairs(graph))
+        for result in PortAnalyzer().blastRadius(graph, scenarios or []):
+            ACITroubleshooterPrinter().printBlastRadius(result)
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        return 1
+
+    return 0
+
+# Function that prints the downlink ports of the VLANs (range strings), returns the exit code (1 if a VLAN is not valid)
+def runVlanLookups(graph: nx.Graph, vlan_ranges: List[str]) -> int:
+
+    vlans = [vlan for text in vlan_ranges for vlan in VlanIndex.vlanList(text)]
+    if not vlans:
+        print("ERROR: --vlan expects VLAN IDs or ranges, e.g. 1234 or 10-12,30")
+        return 1
+
+    ACITroubleshooterPrinter().printVlanPorts(graph, vlans)
+    return 0
+
+# Function that returns True when a non-interactive action (queries, leaf paths, failure simulations, port analysis
+# or VLAN lookups) is requested in the CLI instead of the Menu
+def hasActions(args: argparse.Namespace) -> bool:
+    return bool(args.query or args.paths is not None or args.simulate or args.port_path or args.vpc or args.blast_radius or args.vlan)
+
+# Function that runs every non-interactive action requested in the CLI, returns the exit code (1 if one of them failed)
+def runActions(graph: nx.Graph, args: argparse.Namespace) -> int:
+
+    exit_codes = []
+    if args.query:
+        exit_codes.append(runQueries(graph, args.query, args.query_json))
+    if args.paths is not None:
+        exit_codes.append(runPaths(graph, args.paths, args.lifetime_errors))
+    if args.simulate:
+        exit_codes.append(runSimulations(graph, args.simulate, args.simulate_json))
+    if args.port_path or args.vpc or args.blast_radius:
+        exit_codes.append(runPortAnalysis(graph, args.port_path, args.vpc, args.blast_radius))
+    if args.vlan:
+        exit_codes.append(runVlanLookups(graph, args.vlan))
+
+    return max(exit_codes, default=0)
+
 ################
 # Main Program #
 ################
 
 if __name__ == '__main__':
 
-    # Generating a networkx Graph Object
-    network_graph: nx.Graph = nx.Graph()
+    # CLI arguments
+    args: argparse.Namespace = parseArguments()
+
+    # Generating a networkx Graph Object (node attributes support the lazy placeholders)
+    network_graph: nx.Graph = ACIFabricGraph()
 
     # Object that will print in the CLI all the information collected in the Graph
     #myPrinter = ACITroubleshooterPrinter()
@@ -49,6 +231,33 @@ if __name__ == '__main__':
     # Object that will print the Menu for the User
     Menu: MenuPrinter = MenuPrinter()
 
+    # Comparing two Graph snapshots, only the node attributes whose digests differ are read from the files
+    if args.diff:
+        try:
+            changes = ACISnapshotDiff().diffGraphs(ACIGraphSnapshot().loadSnapshot(args.diff[0]), ACIGraphSnapshot().loadSnapshot(args.diff[1]), args.diff_counters)
+        except Exception as e:
+            print(f"ERROR: Unable to compare the snapshots {args.diff[0]} and {args.diff[1]}: {e}")
+            exit(1)
+        ACITroubleshooterPrinter().printGraphChanges(changes)
+        if args.diff_json:
+            with open(args.diff_json, 'w') as f:
+                json.dump(changes.to_dict(), f, indent=4, default=str)
+        exit(0)
+
+    # Opening a saved Graph snapshot, the node details are read from the file when a report needs them
+    if args.snapshot:
+        try:
+            network_graph = ACIGraphSnapshot().loadSnapshot(args.snapshot)
+        except Exception as e:
+            print(f"ERROR: Unable to open the snapshot {args.snapshot}: {e}")
+            exit(1)
+        if args.counter_store:
+            network_graph.graph['counter_store'] = CounterStore(args.counter_store)
+        if hasActions(args):
+            exit(runActions(network_graph, args))
+        Menu.mainMenu(network_graph)
+        exit(0)
+
     # Object that will grant access to the Cisco ACI Fabric
     User: UserClass = UserClass()
 
@@ -61,20 +270,80 @@ if __name__ == '__main__':
     # Object that will perform the restconf querie
     main_cookie: getCookie = getCookie(User.user, User.pwd, User.base_url, Urls.getTokenV5())
 
-    # List of nodes detected in the Cisco ACI Fabric
-    nodeList: list = []
+    # Seconds between the Counter Watch polls
+    if args.watch is not None and args.watch_interval <= 0:
+        print("ERROR: --watch-interval must be a positive number of seconds")
+        exit(1)
+
+    # The Counter Watch only needs the fabric links, the 'links' profile is collected unless another profile is selected
+    if args.watch is not None and args.profile == 'full':
+        args.profile = 'links'
+
+    # Collection Profile selected in the CLI
+    if args.profile not in Urls.getCollectionProfiles():
+        print("ERROR: Unknown collection profile '%s', available profiles: %s" % (args.profile, ", ".join(Urls.getCollectionProfiles())))
+        exit(1)
+    AciController.setCollectionProfile(args.profile)
 
-    # List of Edges detected in the Cisco ACI Fabric
-    edgeList: list = []
+    # Lazy attributes are fetched by the printers on first access
+    AciController.setLazyAttributes(args.lazy)
 
-    # Feching Node List information
-    nodeList, edgeList = AciController.getNodesList(main_cookie, Urls, User)
+    # Worker processes of the Parse Pool (0: the responses are parsed in the collector threads)
+    if args.parse_workers < 0:
+        print("ERROR: --parse-workers must be 0 or a positive number")
+        exit(1)
+    ParsePool: ACIParsePool = ACIParsePool()
+    ParsePool.setWorkers(args.parse_workers)
 
-    # Adding nodes to the Network Graph Object from Node List
-    network_graph.add_nodes_from(nodeList)
+    # Counter Store where the counters of every collection are appended
+    CounterStoreFile: Optional[CounterStore] = None
+    if args.counter_store:
+        try:
+            CounterStoreFile = CounterStore(args.counter_store)
+        except Exception as e:
+            print(f"ERROR: Unable to open the counter store {args.counter_store}: {e}")
+            exit(1)
+        AciController.setCounterStore(CounterStoreFile)
 
-    # Adding Edges to the Network Graph Object from edge List
-    network_graph.add_edges_from(edgeList)
+    # Feching the Fabric information into the Graph, by default the collection runs in background
+    # (inventory & health, tenants, interfaces, counters & SFPs) and the Menu is shown at once
+    if args.wait or args.save_snapshot or args.watch is not None or hasActions(args):
+        AciController.collectGraph(network_graph, main_cookie, Urls, User)
+        if args.parse_workers:
+            print("Parsing: " + ParsePool.formatStats())
+        if args.save_snapshot:
+            snapshot = ACIGraphSnapshot().saveSnapshot(network_graph, args.save_snapshot)
+            print("Graph snapshot saved in %s (%d nodes, %d edges, %.1f MB)" % (snapshot['path'], snapshot['nodes'], snapshot['edges'], snapshot['size'] / 1e6))
+    else:
+        AciController.startBackgroundCollection(network_graph, main_cookie, Urls, User)
+
+    # Printing the results of the queries, the leaf paths, the failure simulations, the port analysis or the VLAN lookups instead of the Menu
+    if hasActions(args):
+        exit_code = runActions(network_graph, args)
+        ParsePool.shutdown()
+        if CounterStoreFile is not None:
+            CounterStoreFile.close()
+        main_cookie.aaaLogout()
+        exit(exit_code)
+
+    # Watching the counters of the selected links, the rolling view is printed after every poll
+    if args.watch is not None:
+        WatchController: ACIWatchController = ACIWatchController()
+        try:
+            WatchController.selectTargets(network_graph, args.watch)
+        except ValueError as e:
+            print(f"ERROR: {e}")
+            exit(1)
+        WatchController.setCounterStore(CounterStoreFile)
+        try:
+            WatchController.watch(main_cookie, Urls, User, args.watch_interval, lambda watch: ACITroubleshooterPrinter().printCounterWatch(watch.status, watch.interfaces()))
+        except KeyboardInterrupt:
+            WatchController.stopWatch()
+        ParsePool.shutdown()
+        if CounterStoreFile is not None:
+            CounterStoreFile.close()
+        main_cookie.aaaLogout()
+        exit(0)
 
     #email_report_gen = EmailReportGenerator(
     #    User.getEmailSender(),
@@ -85,10 +354,26 @@ if __name__ == '__main__':
     #    )
 
     ## Send the report
-    #email_report_gen.send_report(nodeList, edgeList, subject="ACI Fabric Report")
+    #email_report_gen.send_report(list(network_graph.nodes(data=True)), list(network_graph.edges(data=True)), subject="ACI Fabric Report")
+
+    # Subscribing to the APIC MO events, the Graph attributes are updated in place by the events
+    if args.subscribe:
+        SubscriptionController: ACISubscriptionController = ACISubscriptionController()
+        SubscriptionController.startSubscriptions(network_graph, main_cookie, Urls, User)
 
     # Printing Menu Based on the Graph 'network_graph' created with the aci_controller Class
     Menu.mainMenu(network_graph)
 
+    # Closing the APIC Websocket
+    if args.subscribe:
+        SubscriptionController.stopSubscriptions()
+
+    # Stopping the Parse Pool worker processes
+    ParsePool.shutdown()
+
+    # Closing the Counter Store
+    if CounterStoreFile is not None:
+        CounterStoreFile.close()
+
     # Logout from Cisco ACI Token
     main_cookie.aaaLogout()
@@ -0,0 +1,216 @@
+# coding=utf-8
+
+#########################################################################
+#  Class that will parse the Cisco ACI Distinguished Names (DN) into    #
+#  cached tuples (pod, node, interface, tenant, ap, epg, etc.)          #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Dict, Type, List, NamedTuple, Iterable, Optional, Tuple
+from functools import lru_cache
+import sys
+
+###########################
+# Private Singleton Class #
+###########################
+
+class _PrivateCookie(type):
+
+    _instances: Dict[Type[Any], Any] = {}
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+
+        if cls not in cls._instances:
+            instance = super().__call__(*args, **kwargs)
+            cls._instances[cls] = instance
+        return cls._instances[cls]
+
+#########################################################################################################
+# ParsedDn Tuple, the parts of a DN. The parts not present in the DN are None and the Relative Names   #
+# (RN) are kept in 'rns' as (prefix, value) tuples, e.g. 'tn-T' -> ('tn', 'T'), 'sys' -> ('sys', '')    #
+#########################################################################################################
+
+class ParsedDn(NamedTuple):
+    dn: str
+    pod: Optional[str] = None
+    node: Optional[str] = None
+    paths: Optional[str] = None
+    interface: Optional[str] = None
+    slot: Optional[str] = None
+    tenant: Optional[str] = None
+    ap: Optional[str] = None
+    epg: Optional[str] = None
+    bd: Optional[str] = None
+    vrf: Optional[str] = None
+    l3out: Optional[str] = None
+    contract: Optional[str] = None
+    subject: Optional[str] = None
+    filter: Optional[str] = None
+    extpath: Optional[str] = None
+    rns: Tuple[Tuple[str, str], ...] = ()
+
+    # Value of the last RN, the name of the object: 'uni/tn-T/BD-B' -> 'B'
+    @property
+    def name(self) -> str:
+        return self.rns[-1][1] if self.rns else ""
+
+###############
+# RN Prefixes #
+###############
+
+# RN prefix -> ParsedDn field
+_RN_FIELDS: Dict[str, str] = {
+    'pod'       : 'pod',
+    'node'      : 'node',
+    'paths'     : 'paths',
+    'protpaths' : 'paths',
+    'phys'      : 'interface',
+    'if'        : 'interface',
+    'aggr'      : 'interface',
+    'pathep'    : 'interface',
+    'psuslot'   : 'slot',
+    'lcslot'    : 'slot',
+    'supslot'   : 'slot',
+    'fcslot'    : 'slot',
+    'ftslot'    : 'slot',
+    'scslot'    : 'slot',
+    'tn'        : 'tenant',
+    'ap'        : 'ap',
+    'epg'       : 'epg',
+    'BD'        : 'bd',
+    'ctx'       : 'vrf',
+    'out'       : 'l3out',
+    'brc'       : 'contract',
+    'subj'      : 'subject',
+    'flt'       : 'filter',
+    'extpaths'  : 'extpath',
+}
+
+# Function that splits the DN into RNs, the '/' inside brackets are part of the RN: 'phys-[eth1/1]'
+def _split_rns(dn: str) -> List[str]:
+
+    # Auxilear List with the RNs of the DN
+    rns: List[str] = []
+
+    depth = 0
+    start = 0
+    for index, char in enumerate(dn):
+        if char == '[':
+            depth += 1
+        elif char == ']':
+            depth = max(depth - 1, 0)
+        elif char == '/' and depth == 0:
+            rns.append(dn[start:index])
+            start = index + 1
+    rns.append(dn[start:])
+
+    return [rn for rn in rns if rn]
+
+# Function that parses the DN, the results are cached and every string is interned (shared by all the objects)
+@lru_cache(maxsize=65536)
+def _parse_dn(dn: str) -> ParsedDn:
+
+    # Auxilear Dict with the parts of the DN
+    parts: Dict[str, Any] = {}
+    rns: List[Tuple[str, str]] = []
+
+    for rn in _split_rns(dn):
+        prefix, _, value = rn.partition('-')
+        if value.startswith('[') and value.endswith(']'):
+            value = value[1:-1]
+        prefix, value = sys.intern(prefix), sys.intern(value)
+        rns.append((prefix, value))
+        field = _RN_FIELDS.get(prefix)
+        if field is not None and value:
+            parts[field] = value.lower() if field == 'interface' else value
+
+    return ParsedDn(sys.intern(dn), rns=tuple(rns), **{field: sys.intern(value) for field, value in parts.items()})
+
+# Function that builds the DN from its RNs, the DN is also stored in the parse cache
+@lru_cache(maxsize=16384)
+def _build_dn(rns: Tuple[Tuple[str, str], ...]) -> str:
+    return _parse_dn("/".join(prefix + '-' + value if value else prefix for prefix, value in rns)).dn
+
+#########################################################################################################
+# ACIDnParser Class, parses the DNs of the MOs (and the tDn of the relations) and builds the DNs back   #
+# from their parts. Used by the parsers, the MO subscriptions and the printers instead of string ops.  #
+#########################################################################################################
+
+class ACIDnParser(metaclass=_PrivateCookie):
+
+    ##################
+    # Public Methods #
+    ##################
+
+    # Method that returns the parts of the DN (cached)
+    def parseDn(self, dn: Optional[str]) -> ParsedDn:
+        return _parse_dn(dn or "")
+
+    # Method that returns the Node ID of the DN: 'topology/pod-1/node-101/sys' -> '101'
+    def nodeId(self, dn: Optional[str]) -> Optional[str]:
+        return self.parseDn(dn).node
+
+    # Method that returns the Interface ID of the DN (lower case): '.../phys-[eth1/49]/phys/fcot' -> 'eth1/49'
+    def interfaceId(self, dn: Optional[str]) -> Optional[str]:
+        return self.parseDn(dn).interface
+
+    # Method that returns the name of the object of the DN: 'uni/tn-T/ctx-V' -> 'V', default for empty DNs
+    def objectName(self, dn: Optional[str], default: str = 'N/A') -> str:
+        return self.parseDn(dn).name or default
+
+    # Method that groups the objects by the Node ID of their DN, the objects without Node ID are not returned
+    def groupByNode(self, objects: Iterable[Any], key: str = 'dn') -> Dict[str, List[Any]]:
+
+        # Auxilear Dict with the objects of every node (Node ID -> objects)
+        groups: Dict[str, List[Any]] = {}
+
+        for item in objects:
+            node_id = self.nodeId(item.get(key))
+            if node_id is not None:
+                groups.setdefault(node_id, []).append(item)
+
+        return groups
+
+    #
+    # Reverse Lookups, DNs built from their parts (cached)
+    #
+
+    # Method that returns the DN of the node: ('1', '101') -> 'topology/pod-1/node-101'
+    def nodeDn(self, pod: Any, node: Any) -> str:
+        return _build_dn((('topology', ''), ('pod', str(pod)), ('node', str(node))))
+
+    # Method that returns the DN of the physical interface: 'topology/pod-1/node-101/sys/phys-[eth1/1]'
+    def interfaceDn(self, pod: Any, node: Any, interface: str) -> str:
+        return _build_dn((('topology', ''), ('pod', str(pod)), ('node', str(node)), ('sys', ''), ('phys', '[' + interface + ']')))
+
+    # Method that returns the DN of the tenant: 'uni/tn-T'
+    def tenantDn(self, tenant: str) -> str:
+        return _build_dn((('uni', ''), ('tn', tenant)))
+
+    # Method that returns the DN of the EPG: 'uni/tn-T/ap-A/epg-E'
+    def epgDn(self, tenant: str, ap: str, epg: str) -> str:
+        return _build_dn((('uni', ''), ('tn', tenant), ('ap', ap), ('epg', epg)))
+
+    # Method that returns the DN of the Bridge Domain: 'uni/tn-T/BD-B'
+    def bdDn(self, tenant: str, bd: str) -> str:
+        return _build_dn((('uni', ''), ('tn', tenant), ('BD', bd)))
+
+    # Method that returns the DN of the VRF: 'uni/tn-T/ctx-V'
+    def vrfDn(self, tenant: str, vrf: str) -> str:
+        return _build_dn((('uni', ''), ('tn', tenant), ('ctx', vrf)))
+
+    # Method that returns the DN of the L3Out: 'uni/tn-T/out-L'
+    def l3outDn(self, tenant: str, l3out: str) -> str:
+        return _build_dn((('uni', ''), ('tn', tenant), ('out', l3out)))
+
+    # Method that returns the DN of the contract: 'uni/tn-T/brc-C'
+    def contractDn(self, tenant: str, contract: str) -> str:
+        return _build_dn((('uni', ''), ('tn', tenant), ('brc', contract)))
+
+    # Method that clears the cached DNs (e.g. before a new collection of a large fabric)
+    def clearCache(self) -> None:
+        _parse_dn.cache_clear()
+        _build_dn.cache_clear()
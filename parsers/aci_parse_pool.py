@@ -0,0 +1,153 @@
+# coding=utf-8
+
+#########################################################################
+#  Class that will decode and parse the APIC responses in a pool of     #
+#  worker processes (the JSON decoding and projection use all the CPUs) #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Callable, Dict, Type, Optional, Tuple
+from parsers.aci_parser import ACITroubleshooterParser
+import concurrent.futures
+import multiprocessing
+import threading
+import json
+import time
+
+###########################
+# Private Singleton Class #
+###########################
+
+class _PrivateCookie(type):
+
+    _instances: Dict[Type[Any], Any] = {}
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+
+        if cls not in cls._instances:
+            instance = super().__call__(*args, **kwargs)
+            cls._instances[cls] = instance
+        return cls._instances[cls]
+
+####################
+# Worker Functions #
+####################
+
+# Function that decodes the raw response and parses it with the parser method (runs in the worker process, or inline
+# when the pool is disabled). Returns the totalCount of the response, the parsed result (None when the response is
+# empty and skip_empty is set), the number of MOs and the CPU seconds spent
+def _parse_payload(payload: bytes, parser_method: str, args: Tuple[Any, ...], skip_empty: bool) -> Tuple[int, Any, int, float]:
+
+    started = time.process_time()
+    moJson = json.loads(payload)
+    total_count = int(moJson.get('totalCount') or 0)
+    result = None
+    if total_count > 0 or not skip_empty:
+        result = getattr(ACITroubleshooterParser(), parser_method)(moJson, *args)
+
+    return total_count, result, len(moJson.get('imdata') or []), time.process_time() - started
+
+#########################################################################################################
+# ACIParsePool Class, the collectors send the raw response bytes of the large queries (node-wide       #
+# classes, interfaces, SFPs and tenant subtrees) and receive the projected records. With 0 workers     #
+# (default) the responses are parsed in the calling thread. The parsing throughput is kept in 'stats'. #
+#########################################################################################################
+
+class ACIParsePool(metaclass=_PrivateCookie):
+
+    def __init__(self) -> None:
+        self.__workers: int = 0
+        self.__executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self.__lock: threading.Lock = threading.Lock()
+        self.stats: Dict[str, Any] = {}
+        self.resetStats()
+
+    ##################
+    # Public Methods #
+    ##################
+
+    # Method that sets the number of worker processes (0 disables the pool), a running pool is restarted
+    def setWorkers(self, workers: int) -> None:
+        with self.__lock:
+            if workers == self.__workers:
+                return
+            self.__shutdown()
+            self.__workers = max(int(workers), 0)
+            self.stats['workers'] = self.__workers
+
+    # Method that returns the number of worker processes
+    def getWorkers(self) -> int:
+        return self.__workers
+
+    # Method that fetches the URL and parses the response with the parser method, e.g.
+    # requestParsed(main_cookie, url, 'getSwitchSfpInfo', default=list). When the default factory is set, the
+    # default value is returned for the responses without objects (totalCount 0) and the parser is not called
+    def requestParsed(self, main_cookie: Any, url: str, parser_method: str, *args: Any, default: Optional[Callable[[], Any]] = None) -> Any:
+        return self.parse(main_cookie.get_raw_request(url), parser_method, *args, default=default)
+
+    # Method that parses the raw response bytes with the parser method, in the pool or in the calling thread
+    def parse(self, payload: bytes, parser_method: str, *args: Any, default: Optional[Callable[[], Any]] = None) -> Any:
+
+        started = time.perf_counter()
+        executor = self.__pool()
+        if executor is not None:
+            total_count, result, objects, cpu_time = executor.submit(_parse_payload, payload, parser_method, args, default is not None).result()
+        else:
+            total_count, result, objects, cpu_time = _parse_payload(payload, parser_method, args, default is not None)
+        self.__record(len(payload), objects, cpu_time, started, time.perf_counter())
+
+        if total_count == 0 and default is not None:
+            return default()
+        return result
+
+    # Method that resets the parsing statistics
+    def resetStats(self) -> None:
+        self.stats.update({'workers': self.__workers, 'responses': 0, 'bytes': 0, 'objects': 0, 'cpu_seconds': 0.0, 'first': None, 'last': None})
+
+    # Method that returns the parsing throughput as text, per wall second (first to last response) and per CPU second
+    def formatStats(self) -> str:
+        stats = dict(self.stats)
+        wall_seconds = (stats['last'] - stats['first']) if stats['first'] is not None else 0.0
+        cpu_seconds = stats['cpu_seconds']
+        return "{} responses, {:.1f} MB, {} objects | {:.1f} MB/s over {:.2f}s, {:.1f} MB/s per CPU second ({:.2f}s CPU, {} workers)".format(
+            stats['responses'], stats['bytes'] / 1e6, stats['objects'], stats['bytes'] / 1e6 / (wall_seconds or 1e-9), wall_seconds,
+            stats['bytes'] / 1e6 / (cpu_seconds or 1e-9), cpu_seconds, stats['workers'] or 'no'
+        )
+
+    # Method that stops the worker processes
+    def shutdown(self) -> None:
+        with self.__lock:
+            self.__shutdown()
+
+    ####################
+    # Privates Methods #
+    ####################
+
+    # Returning the process pool (started on first use) or None when the pool is disabled
+    def __pool(self) -> Optional[concurrent.futures.ProcessPoolExecutor]:
+        if self.__workers == 0:
+            return None
+        with self.__lock:
+            if self.__executor is None and self.__workers > 0:
+                # 'spawn' workers, the collector threads may hold locks while the pool is started
+                self.__executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.__workers, mp_context=multiprocessing.get_context('spawn'))
+            return self.__executor
+
+    # Adding a parsed response into the statistics
+    def __record(self, size: int, objects: int, cpu_time: float, started: float, finished: float) -> None:
+        with self.__lock:
+            self.stats['responses'] += 1
+            self.stats['bytes'] += size
+            self.stats['objects'] += objects
+            self.stats['cpu_seconds'] += cpu_time
+            self.stats['first'] = started if self.stats['first'] is None else min(self.stats['first'], started)
+            self.stats['last'] = finished if self.stats['last'] is None else max(self.stats['last'], finished)
+
+    # Stopping the worker processes (lock held by the caller)
+    def __shutdown(self) -> None:
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True)
+            self.__executor = None
@@ -8,7 +8,9 @@
 # Import Section #
 ##################
 
-from typing import Any, Dict, Type, List
+from typing import Any, Callable, Dict, Type, List, Optional, Tuple, Union
+from model.aci_records import ACIRecord, recordType
+from parsers.aci_dn_parser import ACIDnParser
 
 ###########################
 # Private Singleton Class #
@@ -25,6 +27,22 @@ class _PrivateCookie(type):
             cls._instances[cls] = instance
         return cls._instances[cls]
 
+#####################
+# Projection Fields #
+#####################
+
+# A field of the projection is the MO attribute name (kept with the same name) or
+# a tuple (MO attribute, name in the Graph, conversion) where the conversion can be None
+FieldSpec = Union[str, Tuple[str, str, Optional[Callable[[Any], Any]]]]
+
+# Interface ID from the dn of the SFP: topology/pod-1/node-101/sys/phys-[eth1/49]/phys/fcot
+def _interface_from_dn(dn: str) -> str:
+    return ACIDnParser().interfaceId(dn) or ""
+
+# Node ID from the LLDP System Description: topology/pod-1/node-101
+def _node_from_sys_desc(sysDesc: str) -> Optional[str]:
+    return ACIDnParser().nodeId(sysDesc)
+
 #########################################################################################################
 # ACITroubleshooterParser Class that will parse all the json info received from network_graph.py Script #
 # returning a list with the information parser                                                          #
@@ -32,236 +50,191 @@ class _PrivateCookie(type):
 
 class ACITroubleshooterParser(metaclass=_PrivateCookie):
 
+    # Fields kept for every MO class, only these attributes are built for the Graph (no full copy of the MO)
+    PROJECTIONS: Dict[str, Tuple[FieldSpec, ...]] = {
+
+        # Switch Section
+        'ethpmFcot'               : ('actualType', 'guiSN', 'guiCiscoPID', 'guiCiscoPN', 'guiCiscoEID', 'typeName', 'flags', 'operSt',
+                                     'temp', 'volt', 'txPwr', 'rxPwr', 'bias', ('dn', 'int_id', _interface_from_dn)),
+        'eqptPsu'                 : ('id', 'descr', 'model', 'hwVer', 'operSt', 'ser', 'vendor'),
+        'eqptSupC'                : ('id', 'descr', 'model', 'hwVer', 'numP', 'operSt', 'pwrSt', 'rdSt', 'type', 'ser', 'upTs', 'vendor'),
+        'eqptFC'                  : ('id', 'descr', 'model', 'hwVer', 'operSt', 'rdSt', 'type', 'ser', 'upTs', 'vendor'),
+        'eqptLC'                  : ('id', 'descr', 'model', 'hwVer', 'operSt', 'rdSt', 'type', 'ser', 'upTs', 'vendor'),
+        'eqptSysC'                : ('id', 'descr', 'model', 'hwVer', 'operSt', 'rdSt', 'pwrSt', 'type', 'ser', 'upTs', 'vendor'),
+        'faultSummary'            : ('dn', 'code', 'severity', 'count', 'descr', 'subject', 'type', 'cause', 'domain', 'rule'),
+        'eqptcapacityFSPartition' : ('name', 'path', 'avail', 'used', 'memAlert'),
+        'l1PhysIf'                : ('id', 'adminSt', 'mtu', 'speed', 'mode', 'usage', 'medium', 'layer', 'descr'),
+        'lldpAdjEp'               : ('sysName', ('sysDesc', 'neighbor_id', _node_from_sys_desc), ('portIdV', 'destInt', None)),
+        'ethpmPhysIf'             : ('accessVlan', 'allowedVlans', 'lastErrors', 'lastLinkStChg', 'operDuplex', 'operMode', 'operSpeed', 'operSt'),
+
+        # The Ethernet RMON counters of the interface:
+        #  - broadcastPkts / multicastPkts: broadcast and multicast packets received
+        #  - cRCAlignErrors: packets with a CRC or frame alignment error, often a faulty cable or transceiver
+        #  - collisions: packets with a collision, in full-duplex networks it should always be "0"
+        #  - dropEvents: packets dropped due to congestion or resource limitations
+        #  - fragments / undersizePkts: packets shorter than 64 bytes, with and without CRC error
+        #  - jabbers / oversizePkts: packets longer than 1518 bytes, with and without CRC error
+        #  - pkts / octets: total packets and octets received (good and bad)
+        #  - pkts64Octets ... pkts1024to1518Octets: received packets per length
+        #  - rXNoErrors / tXNoErrors: packets received and transmitted without any errors
+        #  - rxGiantPkts / txGiantPkts / rxOversizePkts / txOversizePkts: packets bigger than the interface maximum size
+        'rmonEtherStats'          : ('broadcastPkts', 'cRCAlignErrors', 'collisions', 'dropEvents', 'fragments', 'jabbers', 'multicastPkts',
+                                     'oversizePkts', 'pkts', 'pkts65to127Octets', 'pkts128to255Octets', 'pkts256to511Octets', 'pkts512to1023Octets',
+                                     'pkts1024to1518Octets', 'octets', 'pkts64Octets', 'rXNoErrors', 'rxGiantPkts', 'rxOversizePkts', 'tXNoErrors',
+                                     'txGiantPkts', 'txOversizePkts', 'undersizePkts'),
+
+        # APIC Section
+        'datetimeNtpq'            : ('remote', 'refid', 'auth', 'stratum', 't', 'when', 'poll', 'reach', 'delay', 'offset', 'jitter', 'tally'),
+        'infraWiNode'             : ('id', 'podId', 'addr', 'adminSt', 'operSt', 'health', 'apicMode', 'chassis', 'cntrlSbstState', 'failoverStatus', 'mbSn'),
+        'eqptFan'                 : ('id', 'descr', 'model', 'operSt', 'speed', 'maxSpeed', 'vendor'),
+        'eqptSensor'              : ('id', 'descr', 'model', 'type', 'operSt', 'value', 'minorThresh', 'majorThresh', 'vendor'),
+        'eqptDimm'                : ('id', 'model', 'acc', 'cap', 'operSt', 'ser', 'type', 'vendor'),
+        'eqptStorage'             : ('name', 'device', 'fileSystem', 'mount', 'operSt', 'capUtilized'),
+        'cnwPhysIf'               : ('id', 'adminSt', 'operSt', 'speed', 'mode', 'mtu', 'medium'),
+        'l3EncRtdIf'              : ('id', 'name', 'descr', 'adminSt', 'mtu', 'mplsMtu', 'routerMac'),
+    }
+
+    # Fields calculated by the parser methods, added to the record of the MO class
+    CALCULATED_FIELDS: Dict[str, Tuple[str, ...]] = {
+        'eqptcapacityFSPartition' : ('avail_gb', 'used_gb', 'used_perc'),
+    }
+
+    def __init__(self) -> None:
+
+        # Normalized projections: every field as (MO attribute, name in the Graph, conversion)
+        self.__projections: Dict[str, Tuple[Tuple[str, str, Optional[Callable[[Any], Any]]], ...]] = {
+            mo_class: tuple((field, field, None) if isinstance(field, str) else field for field in fields)
+            for mo_class, fields in self.PROJECTIONS.items()
+        }
+
+        # Slotted record type of every MO class (projected and calculated fields)
+        self.__records: Dict[str, Type[ACIRecord]] = {
+            mo_class: recordType(mo_class, tuple(target for _, target, _ in fields) + self.CALCULATED_FIELDS.get(mo_class, ()))
+            for mo_class, fields in self.__projections.items()
+        }
+
     #
-    # Switch Section
+    # Projection Engine
     #
 
-    # Method that return the SFP Info from Switch
-    def getSwitchSfpInfo(self, sfpJson: Dict[str, Any], int_id: str) -> List[Dict[str, Any]]: # Added type hints for clarity
-
-        # Auxilear List with the SFP info
-        sfpList: List[Dict[str, Any]] = []
-
-        # For each SFP detected in the JSON var, we add the info into a list
-        for sfp in sfpJson['imdata']:
+    # Method that builds the projected dict of a single MO, only the fields of the spec are built
+    def projectAttributes(self, mo_class: str, attributes: Dict[str, Any]) -> Dict[str, Any]:
 
-            # Auxilear Var Attribute 
-            attributes = sfp['ethpmFcot']['attributes']
+        # Auxilear Dict with the projected fields
+        projected: Dict[str, Any] = {}
 
-            # Copy Attribute info for Dict Manipulation
-            sfp_attribute = attributes.copy()
+        for source, target, convert in self.__projections[mo_class]:
+            if source in attributes:
+                projected[target] = convert(attributes[source]) if convert else attributes[source]
 
-            # Removing unnecesary info
-            sfp_attribute.pop('dn', None)
-            sfp_attribute.pop('modTs', None)
-            sfp_attribute.pop('monPolDn', None)
+        return projected
 
-            # Adding Interface ID to identify it in the print section
-            sfp_attribute['int_id'] = int_id
+    # Method that builds the projected record of a single MO, the entries stored in the Graph nodes
+    def projectRecord(self, mo_class: str, attributes: Dict[str, Any]) -> ACIRecord:
+        return self.__records[mo_class](self.projectAttributes(mo_class, attributes))
 
-            # If the switch has a SFP in the interface 'id'
-            # the 'actualType' have to be different for 'unknown' (sfp, qsfp, etc.)
-            if sfp_attribute.get('actualType') != 'unknown':
+    # Method that returns the projected records of all the MOs of the class in the JSON var
+    def projectList(self, mo_class: str, moJson: Dict[str, Any]) -> List[ACIRecord]:
+        return [self.projectRecord(mo_class, mo[mo_class]['attributes']) for mo in moJson.get('imdata') or [] if mo_class in mo]
 
-                # This ensures the printer has the keys to check later.
-                sfp_attribute['temp'] = sfp_attribute.get('temp', 'N/A')
-                sfp_attribute['volt'] = sfp_attribute.get('volt', 'N/A')
-                sfp_attribute['txPwr'] = sfp_attribute.get('txPwr', 'N/A')
-                sfp_attribute['rxPwr'] = sfp_attribute.get('rxPwr', 'N/A')
-                sfp_attribute['bias'] = sfp_attribute.get('bias', 'N/A')
+    # Method that returns the projected dict of the last MO of the class in the JSON var (single object queries)
+    def projectSingle(self, mo_class: str, moJson: Dict[str, Any]) -> Dict[str, Any]:
 
-                # Adding sfp detail to the list
-                sfpList.append(sfp_attribute)
+        # Auxilear Dict with the MO Info
+        projected: Dict[str, Any] = {}
 
-        # Returning List with the SFP Info
-        return sfpList
+        # We check if the JSON var have info inside or not
+        if int(moJson.get('totalCount') or 0) > 0:
+            for mo in moJson.get('imdata'):
+                projected = self.projectAttributes(mo_class, mo[mo_class]['attributes'])
 
-    # Method that return the PSU info from Switches
-    def getSwitchPsuInfo(self, psuJson):
+        return projected
 
-        # Auxilear List with the PSU info
-        psuList = []
+    # Method that returns the projected dict of every MO of the class in the JSON var by the Interface ID of its DN
+    # (node-wide class queries: rmonEtherStats, ethpmPhysIf)
+    def projectByInterface(self, mo_class: str, moJson: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
 
-        # For each PSU detected in the JSON var, we add the info into a list
-        for psu in psuJson['imdata']:
+        # Auxilear Dict with the MO Info of every interface
+        projected: Dict[str, Dict[str, Any]] = {}
 
-            # Auxilear Var Attribute 
-            attributes = psu['eqptPsu']['attributes']
+        for mo in moJson.get('imdata') or []:
+            if mo_class in mo:
+                attributes = mo[mo_class]['attributes']
+                int_id = _interface_from_dn(attributes.get('dn', ''))
+                if int_id:
+                    projected[int_id] = self.projectAttributes(mo_class, attributes)
 
-            # Copy Attribute info for Dict Manipulation
-            psu_attribute = attributes.copy()
+        return projected
 
-            # Removing unnecesary info
-            psu_attribute.pop('almReg', None)
-            psu_attribute.pop('childAction', None)
-            psu_attribute.pop('cimcVersion', None)
-            psu_attribute.pop('dn', None)
-            psu_attribute.pop('mfgTm', None)
-            psu_attribute.pop('modTs', None)
-            psu_attribute.pop('monPolDn', None)
+    #
+    # Switch Section
+    #
 
-            # Adding PSU Attributes to the psuList
-            psuList.append(psu_attribute)
+    # Method that return the SFP Info from Switch
+    # When int_id is not provided (node-wide ethpmFcot query) the interface is taken from the SFP dn
+    def getSwitchSfpInfo(self, sfpJson: Dict[str, Any], int_id: Optional[str] = None) -> List[ACIRecord]: # Added type hints for clarity
 
-        # Returning List with PSU Info
-        return psuList
+        # Auxilear List with the SFP info
+        sfpList: List[ACIRecord] = []
 
-    # Method that return the Supervisor info from switches
-    def getSwitchSupInfo(self, SupJson):
+        # For each SFP detected in the JSON var, we add the info into a list
+        for sfp_attribute in self.projectList('ethpmFcot', sfpJson):
 
-        # Auxilear List with the PSU info
-        SupList = []
+            # If the switch has a SFP in the interface 'id'
+            # the 'actualType' have to be different for 'unknown' (sfp, qsfp, etc.)
+            if sfp_attribute.get('actualType') == 'unknown':
+                continue
 
-        # For each PSU detected in the JSON var, we add the info into a list
-        for sup in SupJson['imdata']:
+            # Adding Interface ID to identify it in the print section
+            if int_id:
+                sfp_attribute['int_id'] = int_id
+            else:
+                sfp_attribute.setdefault('int_id', '')
 
-            # Auxilear Var Attribute 
-            attributes = sup['eqptSupC']['attributes']
+            # This ensures the printer has the keys to check later.
+            for key in ('temp', 'volt', 'txPwr', 'rxPwr', 'bias'):
+                sfp_attribute.setdefault(key, 'N/A')
 
-            # Copy Attributes info for Dict Manipulation
-            sup_attribute = attributes.copy()
+            # Adding sfp detail to the list
+            sfpList.append(sfp_attribute)
 
-            # Removing unnecesary info
-            sup_attribute.pop('childAction', None)
-            sup_attribute.pop('cimcVersion', None)
-            sup_attribute.pop('dn', None)
-            sup_attribute.pop('mfgTm', None)
-            sup_attribute.pop('modTs', None)
-            sup_attribute.pop('monPolDn', None)
+        # Returning List with the SFP Info
+        return sfpList
 
-            # Adding Supervisor Attributes to the SupList
-            SupList.append(sup_attribute)
+    # Method that return the PSU info from Switches
+    def getSwitchPsuInfo(self, psuJson):
+        return self.projectList('eqptPsu', psuJson)
 
-        # Returning List with Supervisor Info
-        return SupList
+    # Method that return the Supervisor info from switches
+    def getSwitchSupInfo(self, SupJson):
+        return self.projectList('eqptSupC', SupJson)
 
     # Method that return the Fabric Modules information from Spine Switches
     def getSwitchFabricModuleInfo(self, FmJson):
-
-        # Auxilear List with the Fabric Module Info
-        FmList = []
-
-        # for each Fabric Module in the JSON var, we add the info into a List
-        for fm in FmJson['imdata']:
-
-            # Auxilear Var Attributes
-            attributes = fm['eqptFC']['attributes']
-
-            # Copy Attributes info for Dict Manipulation
-            fm_attributes = attributes.copy()
-
-            #Removing unnecesary info
-            fm_attributes.pop('childAction', None)
-            fm_attributes.pop('cimcVersion', None)
-            fm_attributes.pop('dn', None)
-            fm_attributes.pop('mfgTm', None)
-            fm_attributes.pop('modTs', None)
-            fm_attributes.pop('monPolDn', None)
-
-            # Adding Fabric Module Info to the FmList
-            FmList.append(fm_attributes)
-
-        # Returning List with all Fabric Module Info
-        return FmList
+        return self.projectList('eqptFC', FmJson)
 
     # Method that return the Linecard information from Switches
     def getSwitchLinecardInfo(self, linecardJson):
-
-        # Auxilear List with the Linecard Info
-        linecardList = []
-
-        # For each Linecard in the JSON var, we add the info into the list
-        for lc in linecardJson['imdata']:
-
-            # Auxilear Var Attributes
-            attributes = lc['eqptLC']['attributes']
-
-            # Copy Attributes info for Dict Manipulation
-            lc_attributes = attributes.copy()
-
-            # Removing unnecesary info
-            lc_attributes.pop('childAction', None)
-            lc_attributes.pop('cimcVersion', None)
-            lc_attributes.pop('dn', None)
-            lc_attributes.pop('mfgTm', None)
-            lc_attributes.pop('modTs', None)
-            lc_attributes.pop('monPolDn', None)
-
-            # # Adding Linecard Info to the lcList
-            linecardList.append(lc_attributes)
-
-        # Returning List with all the Linecards Info
-        return linecardList
+        return self.projectList('eqptLC', linecardJson)
 
     # Method that return the System Controller information from Spine Switches
     def getSwitchFabricSystemControllerInfo(self, scJson):
-
-        # Auxilear List with the System Controller Info
-        SmList = []
-
-        # for each System Controller in the JSON var, we add the info into the List
-        for sc in scJson['imdata']:
-
-            # Auxilear Var Attributes
-            attributes = sc['eqptSysC']['attributes']
-
-            # Copy Attributes info for Dict Manipulation
-            sc_attributes = attributes.copy()
-
-            # Removing unnecesary info
-            sc_attributes.pop('childAction', None)
-            sc_attributes.pop('cimcVersion', None)
-            sc_attributes.pop('dn', None)
-            sc_attributes.pop('mfgTm', None)
-            sc_attributes.pop('modTs', None)
-            sc_attributes.pop('monPolDn', None)
-
-            # Adding System Controllers Info to the SmList
-            SmList.append(sc_attributes)
-
-        # Returning List with all the System Controllers Info
-        return SmList
+        return self.projectList('eqptSysC', scJson)
 
     # Method that return the faults detected in the Switches
     def getSwitchFaultsInfo(self, faultsJson):
-
-        # Auxilear List with the faults Info
-        switchFaults = []
-
-        # for each fault in the JSON var, we add the info into the List
-        for fault in faultsJson['imdata']:
-
-            # Auxilear Var Attributes
-            attributes = fault['faultSummary']['attributes']
-
-            # Adding Faults Info to the switchFaults list
-            switchFaults.append(attributes)
-
-        # Returning faults info detected in the switch
-        return switchFaults
+        return self.projectList('faultSummary', faultsJson)
 
     # Method that return the Filesystem information from the Switches
     def getSwitchFileSystemInfo(self, FileSystemJson):
 
         # Auxilear List with the Filesystem info
-        switchFileSystem = []
+        switchFileSystem = self.projectList('eqptcapacityFSPartition', FileSystemJson)
 
-        # for each directory detected in the JSON var, we add the info into the List
-        for directory in FileSystemJson.get('imdata'):
+        # for each directory detected in the JSON var, we add the calculations for better visual understanding
+        for fs_attributes in switchFileSystem:
 
-            # Auxilear Var Attributes
-            attributes = directory['eqptcapacityFSPartition']['attributes']
-
-            # Copy Attributes info for Dict Manipulation
-            fs_attributes = attributes.copy()
-
-            # Removing unnecesary info
-            fs_attributes.pop('dn', None)
-            fs_attributes.pop('modTs', None)
-            fs_attributes.pop('monPolDn', None)
-            fs_attributes.pop('childAction', None)
-
-            # Making calculation for better visual understanding
+            # Making calculation of the utilization percentage
             fs_utilization = ( 100 * int(fs_attributes.get('used',0)) ) / int(fs_attributes.get('avail') )
 
             # Transforming fields 'avail' and 'used' from bytes to GB
@@ -271,9 +244,6 @@ class ACITroubleshooterParser(metaclass=_PrivateCookie):
             # Adding utilization percentage to the fs_attributes
             fs_attributes['used_perc'] = round(fs_utilization,2)
 
-            # Adding FileSystem Info to the switchFileSystem List
-            switchFileSystem.append(fs_attributes)
-
         # Returning FileSystem info detected in the Switch
         return switchFileSystem
 
@@ -284,7 +254,7 @@ class ACITroubleshooterParser(metaclass=_PrivateCookie):
         downlinkUsageType = ('epg', 'epg,infra', 'controller', 'infra', 'l3out', 'l2out')
 
         # Auxilear List with the Physics Interface Info
-        swIntList = []
+        swIntList = self.projectList('l1PhysIf', swIntJson)
 
         # Fabric Interfaces List
         swFabricIntList = []
@@ -292,23 +262,8 @@ class ACITroubleshooterParser(metaclass=_PrivateCookie):
         # Downlink Interfaces List in EPG Mode
         swDownlinkIntList = []
 
-        # For each Interface detected in the JSON var, we add the info into the swIntList list
-        for swInt in swIntJson['imdata']:
-
-            # Auxilear Var Attributes
-            attributes = swInt['l1PhysIf']['attributes']
-
-            # Copy Attributes info for Dict Manipulation
-            swInt_attributes = attributes.copy()
-
-            # Removing unnecesary info
-            swInt_attributes.pop('childAction', None)
-            swInt_attributes.pop('dn', None)
-            swInt_attributes.pop('modTs', None)
-            swInt_attributes.pop('monPolDn', None)
-
-            # Adding Physical Interface info to the PhyIntList List
-            swIntList.append(swInt_attributes)
+        # For each Interface detected in the JSON var, we split the fabric and downlink interfaces
+        for swInt_attributes in swIntList:
 
             # If the interface is the fabric type, we added in the swFabricIntList List
             if "fabric" in swInt_attributes.get('usage'):
@@ -340,169 +295,40 @@ class ACITroubleshooterParser(metaclass=_PrivateCookie):
     # Method to return the LLDP Neighbor Name
     def getSwitchLldpNeightborIntInfo(self, lldpJson):
 
-        # Auxilear Variable to retrieve the neighbor
-        neighbor = None
+        # Auxilear Variable to retrieve the neighbor (sysName, neighbor_id, destInt)
+        neighbor = self.projectSingle('lldpAdjEp', lldpJson)
 
-        # We check if the lldpJson have info inside we retrieve the neghbor name
-        if int(lldpJson.get('totalCount')) > 0:
+        if not neighbor:
+            return None
 
-            # We move for the List in the Json file
-            for lldpNei in lldpJson['imdata']:
-
-                # Auxilear Var Attributes
-                attribute = lldpNei['lldpAdjEp']['attributes']
-
-                # Setting the LLDP Neighbor Name to the neighbor auxilear var
-                neighbor =  {
-                    'sysName'     : attribute.get('sysName',""),
-                    'neighbor_id' : attribute.get('sysDesc').split("node-")[1],
-                    'destInt'     : attribute.get('portIdV',"")
-                    }
+        neighbor.setdefault('sysName', "")
+        neighbor.setdefault('destInt', "")
 
         return neighbor
 
     # Method to return the interface Admin Status for a single interface
     def getSwitchSingleIntInfo(self, intJson):
 
-        # Auxilear var with Adming Interface Info
-        interface = {}
-
-        # We check if the intJson variable have info inside or not
-        if int(intJson.get('totalCount')) > 0:
+        # Adming Interface Info, only the fields used by the fabric edges
+        interface = self.projectSingle('l1PhysIf', intJson)
 
-            # For each element in the list 'imdata', we scan the interface info
-            for inter in intJson.get('imdata'):
-
-                # Auxilear Var Attribute
-                attribute = inter['l1PhysIf']['attributes']
-
-                # Adding attributes from Json var to interface dict
-                interface['adminSt'] = attribute.get('adminSt')
-                interface['mtu']     = attribute.get('mtu')
-                interface['speed']   = attribute.get('speed')
-                interface['mode']    = attribute.get('mode')
-
-        # Returning Interface Dict with interface info
-        return interface
+        return {key: interface.get(key) for key in ('adminSt', 'mtu', 'speed', 'mode')} if interface else interface
 
     # Method to return the interface Operational Status for a single interface
     def getSwitchSingleOperationalIntInfo(self, operJson):
+        return self.projectSingle('ethpmPhysIf', operJson)
 
-        # Auxilear var with Operational Interface Info
-        Interface = {}
-
-        # We check if the intJson variable have info inside or not
-        if int(operJson.get('totalCount')) > 0:
-
-            # For each element in the list 'imdata', we scan the interface info
-            for operInt in operJson.get('imdata'):
-
-                # Auxilear Var Attribute
-                attribute = operInt['ethpmPhysIf']['attributes']
-
-                # Adding attributes from Json var to interface dict
-                Interface['accessVlan']    = attribute['accessVlan']
-                Interface['allowedVlans']  = attribute['allowedVlans']
-                Interface['lastErrors']    = attribute['lastErrors']
-                Interface['lastLinkStChg'] = attribute['lastLinkStChg']
-                Interface['operDuplex']    = attribute['operDuplex']
-                Interface['operMode']      = attribute['operMode']
-                Interface['operSpeed']     = attribute['operSpeed']
-                Interface['operSt']        = attribute['operSt']
-
-        # Returning Dict with Operational Status
-        return Interface
-
-    # Method to return the interface Operational Status for a single interface
+    # Method to return the interface Operational Counters for a single interface
     def getSwitchSingleOperationalCounterIntInfo(self, operCounterJson):
+        return self.projectSingle('rmonEtherStats', operCounterJson)
 
-        # Auxilear var with Operational Counters of the Interface 
-        Interface = {}
-
-        # We check if the intJson variable have info inside or not
-        if int(operCounterJson.get('totalCount')) > 0:
-
-            # For each element in the list 'imdata', we scan the Interface Counters info
-            for counter in operCounterJson.get('imdata'):
-
-                # Auxilear Var Attribute
-                attribute = counter['rmonEtherStats']['attributes']
-
-                # The number of broadcast packets received on the interface.
-                Interface['broadcastPkts'] = attribute['broadcastPkts']
-
-                # The number of packets with a CRC (Cyclic Redundancy Check) error or a frame alignment error.
-                # This indicates a physical layer issue, often due to a faulty cable or transceiver.
-                Interface['cRCAlignErrors'] = attribute['cRCAlignErrors']
-
-                # The number of packets that experienced a collision during transmission.
-                # In modern full-duplex networks, this counter should always be "0."
-                Interface['collisions'] = attribute['collisions']
+    # Method to return the Operational Counters of all the interfaces of a switch (interface ID -> counters)
+    def getSwitchOperationalCountersByInt(self, operCounterJson):
+        return self.projectByInterface('rmonEtherStats', operCounterJson)
 
-                # The number of packets dropped by the interface due to congestion or resource limitations.
-                Interface['dropEvents'] = attribute['dropEvents']
-
-                # The number of packets that were shorter than the minimum valid packet size of 64 bytes, excluding packets with a CRC error. 
-                # These are often caused by late collisions.
-                Interface['fragments'] = attribute['fragments']
-
-                # The number of packets that were longer than the maximum valid packet size (1518 bytes for standard Ethernet) 
-                # and had a CRC error. This often points to a faulty network card.
-                Interface['jabbers'] = attribute['jabbers']
-
-                # The number of multicast packets received. Multicast packets are addressed to a group of specific devices.
-                Interface['multicastPkts'] = attribute['multicastPkts']
-
-                # The number of received packets that were larger than the maximum valid packet size but were otherwise error-free.
-                Interface['oversizePkts'] = attribute['oversizePkts']
-
-                # The total number of packets, both valid and invalid, received on the interface.
-                Interface['pkts'] = attribute['pkts']
-
-                # The number of received packets with a length between 65 and 127 bytes.
-                Interface['pkts65to127Octets'] = attribute['pkts65to127Octets']
-
-                # The number of received packets with a length between 128 and 255 bytes.
-                Interface['pkts128to255Octets'] = attribute['pkts128to255Octets']
-
-                # The number of received packets with a length between 256 and 511 bytes.
-                Interface['pkts256to511Octets'] = attribute['pkts256to511Octets']
-
-                # The number of received packets with a length between 512 and 1023 bytes.
-                Interface['pkts512to1023Octets'] = attribute['pkts512to1023Octets']
-
-                # The number of received packets with a length between 1024 and 1518 bytes.
-                Interface['pkts1024to1518Octets'] = attribute['pkts1024to1518Octets']
-
-                # The total number of octets (bytes) received on the interface, including good packets, bad packets, and inter-frame gaps.
-                Interface['octets'] = attribute['octets']
-
-                # The number of received packets with a length of exactly 64 bytes. This is the minimum valid Ethernet frame size.
-                Interface['pkts64Octets'] = attribute['pkts64Octets']
-
-                # The number of packets received without any errors. This is a crucial metric for evaluating the quality of the network link.
-                Interface['rXNoErrors'] = attribute['rXNoErrors']
-
-                # The number of received packets that exceeded the maximum frame size.
-                Interface['rxGiantPkts'] = attribute['rxGiantPkts']
-
-                # The number of received packets that were larger than the maximum size of the interface.
-                Interface['rxOversizePkts'] = attribute['rxOversizePkts']
-
-                # The number of packets transmitted from the interface without any errors.
-                Interface['tXNoErrors'] = attribute['tXNoErrors']
-
-                # The number of transmitted packets that exceeded the maximum frame size.
-                Interface['txGiantPkts'] = attribute['txGiantPkts']
-
-                # The number of transmitted packets that were larger than the maximum size of the interface.
-                Interface['txOversizePkts'] = attribute['txOversizePkts']
-
-                # The number of received packets that were smaller than the minimum valid packet size (64 bytes) but were otherwise error-free.
-                Interface['undersizePkts'] = attribute['undersizePkts']
-
-        # Returning Dict with the Operational Counters in the Interface
-        return Interface
+    # Method to return the Operational Status of all the interfaces of a switch (interface ID -> status)
+    def getSwitchOperationalStatusByInt(self, operJson):
+        return self.projectByInterface('ethpmPhysIf', operJson)
 
     #
     # APIC Section 
@@ -510,283 +336,48 @@ class ACITroubleshooterParser(metaclass=_PrivateCookie):
 
     # Method that return the NTP Information from the Controllers
     def getApicNtpInfo(self, ntpJson):
-
-        # Auxilear List with the NTP info
-        NtpList = []
-
-        # for each NTP Server detected in the JSON var, we add the info into the List
-        for ntp in ntpJson['imdata']:
-
-            # Auxilear Var Attributes
-            attributes = ntp['datetimeNtpq']['attributes']
-
-            # Copy Attributes info for Dcit Manipulation
-            ntp_attributes = attributes.copy()
-
-            # Removing Removing unnecesary info
-            ntp_attributes.pop('dn', None)
-            ntp_attributes.pop('childAction', None)
-            ntp_attributes.pop('modTs', None)
-            ntp_attributes.pop('monPolDn', None)
-            ntp_attributes.pop('', None)
-            ntp_attributes.pop('', None)
-            ntp_attributes.pop('', None)
-            ntp_attributes.pop('', None)
-
-            # Adding NTP Server Info to the NtpList List
-            NtpList.append(ntp_attributes)
-
-        # Returning the NTP Server info detected in the Controller
-        return NtpList
+        return self.projectList('datetimeNtpq', ntpJson)
 
     # Method that return the Controller Database status from the Controllers
     def getApicDatabaseStatusInfo(self, BBDDstatusJson):
-
-        # Auxilear List with the power supply info
-        BBDDStatusList = []
-
-        # for each entry detected in the JSON var, we add the info into the List
-        for health in BBDDstatusJson['imdata']:
-
-            # Auxilear Var Attributes
-            attributes = health['infraWiNode']['attributes']
-
-            # Copy Attributes info for Dict Manipulation
-            BBDD_attributes = attributes.copy()
-
-            # Removing Removing unnecesary info
-            BBDD_attributes.pop('annotation', None)
-            BBDD_attributes.pop('childAction', None)
-            BBDD_attributes.pop('dn', None)
-            BBDD_attributes.pop('extMngdBy', None)
-            BBDD_attributes.pop('modTs', None)
-            BBDD_attributes.pop('monPolDn', None)
-            BBDD_attributes.pop('mutnTs', None)
-            BBDD_attributes.pop('name', None)
-            BBDD_attributes.pop('nameAlias', None)
-            BBDD_attributes.pop('status', None)
-            BBDD_attributes.pop('targetMbSn', None)
-            BBDD_attributes.pop('uid', None)
-            BBDD_attributes.pop('userdom', None)
-
-            # Adding Power Supply Info to the powerSupplyList List
-            BBDDStatusList.append(BBDD_attributes)
-
-        # Returning Power Supply info detected in the APIC
-        return BBDDStatusList
+        return self.projectList('infraWiNode', BBDDstatusJson)
 
     # Method that return the Power Supply Information from the Controllers
     def getApicPowerSupplyInfo(self, powerSupplyJson):
-
-        # Auxilear List with the power supply info
-        powerSupplyList = []
-
-        # for each power supply detected in the JSON var, we add the info into the List
-        for ps in powerSupplyJson['imdata']:
-
-            # Auxilear Var Attributes
-            attributes = ps['eqptPsu']['attributes']
-
-            # Copy Attributes info for Dict Manipulation
-            ps_attributes = attributes.copy()
-
-            # Removing Removing unnecesary info
-            ps_attributes.pop('childAction', None)
-            ps_attributes.pop('cimcVersion', None)
-            ps_attributes.pop('dn', None)
-            ps_attributes.pop('mfgTm', None)
-            ps_attributes.pop('modTs', None)
-            ps_attributes.pop('monPolDn', None)
-
-            # Adding Power Supply Info to the powerSupplyList List
-            powerSupplyList.append(ps_attributes)
-
-        # Returning Power Supply info detected in the APIC
-        return powerSupplyList
+        return self.projectList('eqptPsu', powerSupplyJson)
 
     # Method that return the power supply information from the Controllers
     def getApicFansInfo(self, fansJson):
-
-        # Auxilear List with the FANs info
-        FansList = []
-
-        # for each FAN detected in the JSON var, we add the info into the List
-        for fan in fansJson['imdata']:
-
-            # Auxilear Var Attributes
-            attributes = fan['eqptFan']['attributes']
-
-            # Copy Attributes info for Dict Manipulation
-            fan_attributes = attributes.copy()
-
-            # Removing Removing unnecesary info
-            fan_attributes.pop('childAction', None)
-            fan_attributes.pop('cimcVersion', None)
-            fan_attributes.pop('dir', None)
-            fan_attributes.pop('dn', None)
-            fan_attributes.pop('mfgTm', None)
-            fan_attributes.pop('modTs', None)
-            fan_attributes.pop('monPolDn', None)
-
-            # Adding FANs Info to the FansList List
-            FansList.append(fan_attributes)
-
-        # Returning FANs info detected in the APICs
-        return FansList
+        return self.projectList('eqptFan', fansJson)
 
     # Method that return the Sensor information from the Controllers
     def getApicSensorInfo(self, sensorJson):
 
-        # Auxilear List with the Sensor info
-        SensorList = []
-
-        # for each Sensor detected in the JSON var, we add the info into the List
-        for sensor in sensorJson['imdata']:
-
-            # Auxilear Var Attributes
-            attributes = sensor['eqptSensor']['attributes']
-
-            # Copy Attributes info for Dict Manipulation
-            sensor_attributes = attributes.copy()
-
-            # Removing Removing unnecesary info
-            sensor_attributes.pop('childAction', None)
-            sensor_attributes.pop('cimcVersion', None)
-            sensor_attributes.pop('dn', None)
-            sensor_attributes.pop('modTs', None)
-            sensor_attributes.pop('monPolDn', None)
-            sensor_attributes.pop('', None)
-            sensor_attributes.pop('', None)
-
-            # Adding Sensor Info to the SensorList List
-            SensorList.append(sensor_attributes)
-
         # Sorting list based on Sensor ID for clarity
-        SensorList.sort(key=lambda x: x['id'])
-
-        # Returning Sensors info detected in the APICs
-        return SensorList
+        return sorted(self.projectList('eqptSensor', sensorJson), key=lambda x: x['id'])
 
     # Method that return the DIMM information from the Controllers
     def getApicDimmInfo(self, dimmJson):
 
-        # Auxilear List with the FANs info
-        DimmList = []
-
-        # for each DIMM detected in the JSON var, we add the info into the List
-        for dimm in dimmJson['imdata']:
-
-            # Auxilear Var Attributes
-            attributes = dimm['eqptDimm']['attributes']
-
-            # Copy Attributes info for Dict Manipulation
-            dimm_attributes = attributes.copy()
-
-            # Removing Removing unnecesary info
-            dimm_attributes.pop('childAction', None)
-            dimm_attributes.pop('cimcVersion', None)
-            dimm_attributes.pop('modTs', None)
-            dimm_attributes.pop('mfgTm', None)
-
-            # Adding DIMM Info to the SensorList List
-            DimmList.append(dimm_attributes)
-
         # Sorting DimmList based on DIMM ID
-        DimmList.sort(key=lambda x: x['id'])
-
-        # Returning DIMM info detected in the APICs
-        return DimmList
+        return sorted(self.projectList('eqptDimm', dimmJson), key=lambda x: x['id'])
 
     # Method that return the Filesystem information from the Controllers
     def getApicFileSystemInfo(self, fsJson):
-
-        # Auxilear List with the Filesystem info
-        fsList = []
-
-        # For each Filesystem detected in the JSON var, we add the info into the List
-        for fs in fsJson['imdata']:
-
-            # Auxilear Var Attributes
-            attributes = fs['eqptStorage']['attributes']
-
-            # Copy Attributes info for Dict Manipulation
-            fs_attributes = attributes.copy()
-
-            # Removing unnecesary info
-            fs_attributes.pop('dn', None)
-            fs_attributes.pop('firmwareVersion', None)
-            fs_attributes.pop('modTs', None)
-            fs_attributes.pop('monPolDn', None)
-            fs_attributes.pop('nameAlias', None)
-
-            # Adding Filesystem Info to the fsList List
-            fsList.append(fs_attributes)
-
-        # Returning Filesystem info detected in the APICs
-        return fsList
+        return self.projectList('eqptStorage', fsJson)
 
     # Method that return the Physical Interface Controllers information
     def getApicPhyIntInfo(self, PhyIntJson):
 
-        # Auxilear List with the Physics Interface Info
-        PhyIntList = []
-
-        # For each Physical Interface detected in the JSON var, we add the info into the PhyIntList list
-        for phyInt in PhyIntJson['imdata']:
-
-            # Auxilear Var Attributes
-            attributes = phyInt['cnwPhysIf']['attributes']
-
-            # Copy Attributes info for Dict Manipulation
-            PhyInt_attributes = attributes.copy()
-
-            # Removing unnecesary info
-            PhyInt_attributes.pop('annotation', None)
-            PhyInt_attributes.pop('childAction', None)
-            PhyInt_attributes.pop('dn', None)
-            PhyInt_attributes.pop('extMngdBy', None)
-            PhyInt_attributes.pop('modTs', None)
-            PhyInt_attributes.pop('monPolDn', None)
-
-            # Adding Physical Interface info to the PhyIntList List
-            PhyIntList.append(PhyInt_attributes)
-
         # Sorting list based in interface name
-        PhyIntList.sort(key=lambda x: x['id'])
-
-        # Returning Physical Information info detected in the APICs
-        return PhyIntList
+        return sorted(self.projectList('cnwPhysIf', PhyIntJson), key=lambda x: x['id'])
 
     # Method that return the Aggregate Interface in Controllers information
     def getApicAggyIntInfo(self, AggIntJson):
 
-        # Auxilear List with the Physics Interface Info
-        AggIntList = []
-
-        # For each Physical Interface detected in the JSON var, we add the info into the PhyIntList list
-        for aggInt in AggIntJson['imdata']:
-
-            # Auxilear Var Attributes
-            attributes = aggInt['l3EncRtdIf']['attributes']
-
-            # Copy Attributes info for Dict Manipulation
-            aggInt_attributes = attributes.copy()
-
-            # Removing unnecesary info
-            aggInt_attributes.pop('childAction', None)
-            aggInt_attributes.pop('dn', None)
-            aggInt_attributes.pop('ethpmCfgFailedTs', None)
-            aggInt_attributes.pop('modTs', None)
-            aggInt_attributes.pop('monPolDn', None)
-
-            # Adding Physical Interface info to the PhyIntList List
-            AggIntList.append(aggInt_attributes)
-
         # Sorting list based in interface name
-        AggIntList.sort(key=lambda x: x['id'])
+        return sorted(self.projectList('l3EncRtdIf', AggIntJson), key=lambda x: x['id'])
 
-        # Returning Physical Information info detected in the APICs
-        return AggIntList
 
     ######################
     # Tenant Get Methods #
@@ -8,8 +8,22 @@
 # Import Section #
 ##################
 
-from typing import Any, Dict, Type, List
+from typing import Any, Dict, Type, List, Optional, Tuple
+from analysis.aci_error_analyzer import FabricErrorAnalyzer
+from analysis.aci_graph_query import QueryResult
+from analysis.aci_path_analyzer import FabricPathEngine, LeafPathResult
+from analysis.aci_failure_simulator import FailureImpact
+from analysis.aci_port_analyzer import BlastRadiusResult, PortPathResult, VpcPairResult
+from model.aci_counter_store import CounterStore
+from model.aci_watched_interface import WatchedInterface
+from analysis.aci_snapshot_diff import ChangeSet
+from parsers.aci_dn_parser import ACIDnParser
+from model.aci_tenant_index import TenantIndex
+from model.aci_node_index import nodesWithRole
+from model.aci_interface_view import nodeInterfaceView
+from model.aci_vlan_index import graphVlanIndex
 import networkx as nx
+import time
 
 ###########################
 # Private Singleton Class #
@@ -32,6 +46,10 @@ class _PrivateCookie(type):
 
 class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
 
+    def __init__(self) -> None:
+        self.__error_analyzer: FabricErrorAnalyzer = FabricErrorAnalyzer()
+        self.__dn_parser: ACIDnParser = ACIDnParser()
+
     ########################
     # Switch Nodes Methods #
     ########################
@@ -57,7 +75,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print("-" * len(sw_int_header_line))
 
         # Iterate through each node in the graph
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabricSwitches):
 
             # Auxilear variable to compare the role in the if statement below
             role = attributes.get('role')
@@ -65,30 +83,16 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
             # Check if the node is a switch and has the 'interfaces' attribute
             if role is not None and role in fabricSwitches and 'interfaces' in attributes and attributes['interfaces']:
 
-                # Iterate through each interfaces entry for the Switch Node
-                for interface in attributes['interfaces']:
-
-                    # Find the corresponding operational info for the current interface
-                    # Use a dictionary comprehension for a more efficient lookup
-                    oper_info_map = {op_int['intID']: op_int for op_int in attributes.get('opt_interfaces', [])}
-                    oper_info = oper_info_map.get(interface.get('id', '').lower())
-
-                    # Initialize variables with default values
-                    operSt = "down"
-                    lastError = "0"
-                    operMode = "trunk"
-                    operDuplex = "full"
-                    operSpeed = "inherit"
-                    lastListStateChange = "N/A"
-
-                    # Update variables if operational info is found
-                    if oper_info and oper_info.get('operSt'):
-                        operSt = oper_info['operSt'].get('operSt', operSt)
-                        lastError = oper_info['operSt'].get('lastErrors', lastError)
-                        operMode = oper_info['operSt'].get('operMode', operMode)
-                        operDuplex = oper_info['operSt'].get('operDuplex', operDuplex)
-                        operSpeed = oper_info['operSt'].get('operSpeed', operSpeed)
-                        lastListStateChange = oper_info['operSt'].get('lastLinkStChg', lastListStateChange)
+                # Iterate through each interfaces entry for the Switch Node, joined with its operational info
+                for record, interface in nodeInterfaceView(graph, node).configured():
+
+                    # Operational info of the interface (default values if it was not found)
+                    operSt = record.operValue('operSt', "down")
+                    lastError = record.operValue('lastErrors', "0")
+                    operMode = record.operValue('operMode', "trunk")
+                    operDuplex = record.operValue('operDuplex', "full")
+                    operSpeed = record.operValue('operSpeed', "inherit")
+                    lastListStateChange = record.operValue('lastLinkStChg', "N/A")
 
                     # Preparing the data tuple to be printed
                     interface_data = (
@@ -133,7 +137,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print("-" * len(sw_sup_header_line))
 
         # Iterate through each node in the graph
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabricSwitches):
 
             # Auxilear variable to compare the role in the if statement below
             role = attributes.get('role')
@@ -186,7 +190,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print("-" * len(sw_fault_header_line))
 
         # Iterate through each node in the graph
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabricSwitches):
 
             # Auxilear variable to compare the role in the if statement below
             role = attributes.get('role')
@@ -245,7 +249,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print("-" * len(sw_sc_header_line))
 
         # Iterate through each node in the graph
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabricSwitches):
 
             # Auxilear variable to compare the role in the if statement below
             role = attributes.get('role')
@@ -298,7 +302,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print("-" * len(sw_fm_header_line))
 
         # Iterate through each node in the graph
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabricSwitches):
 
             # Auxilear variable to compare the role in the if statement below
             role = attributes.get('role')
@@ -349,7 +353,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print("-" * len(sw_psu_header_line))
 
         # Iterate through each node in the graph
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabricSwitches):
 
             # Auxilear variable to compare the role in the if statement below
             role = attributes.get('role')
@@ -398,7 +402,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print("-" * len(sw_linecard_header_line))
 
         # Iterate through each node in the graph
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabricSwitches):
 
             # Auxilear variable to compare the role in the if statement below
             role = attributes.get('role')
@@ -448,7 +452,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print("-" * len(sw_sfp_header_line))
 
         # Iterate through each node in the graph
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabricSwitches):
 
             # Auxilear variable to compare the role in the if statement below
             role = attributes.get('role')
@@ -456,8 +460,8 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
             # Check if the node is a switch and has the 'sfp' attribute
             if role is not None and role in fabricSwitches and 'sfp' in attributes and attributes['sfp']:
 
-                # Iterate through each sfp entry for the Controller node
-                for sfp in attributes['sfp']:
+                # Iterate through each sfp entry for the Switch node
+                for _, sfp in nodeInterfaceView(graph, node).withSfp():
 
                     # Prepare the data tuple to be printed
                     sfp_data = (
@@ -501,7 +505,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
 
         sfps_checked = 0
 
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabricSwitches):
             role = attributes.get('role')
 
             if role in fabricSwitches and 'sfp' in attributes and attributes['sfp']:
@@ -516,7 +520,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
                 print(header_line)
                 print("-" * 120)
 
-                for sfp in attributes['sfp']:
+                for _, sfp in nodeInterfaceView(graph, node).withSfp():
                     sfps_checked += 1
 
                     # Core Attributes
@@ -622,7 +626,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print("-" * len(fs_header_line))
 
         # For each node in the graph, check for filesystem attributes
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabricSwitches):
 
             # We check if if the attribute
             if (attributes.get('role') in fabricSwitches) and ('filesystem' in attributes) and (attributes['filesystem']):
@@ -666,7 +670,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         header_printed = True
 
         # For each Node attribute, we print the info in the CLI
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabricSwitches):
 
             # We print the content if the element is a leaf or spine switch
             if attributes.get('role') in fabricSwitches:
@@ -711,7 +715,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         controller_header_line = "{:<20} {:<5} {:<15} {:<10} {:<20} {:<10} {:<15} {:<20} {:<5} {:<10}".format(*controller_header_keys)
 
         # For each Node attribute, we print the info in the CLI
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabricController):
 
             # Auxilear Variable to detect if the node in the graph have a Fabric Controller
             role = attributes.get('role')
@@ -773,7 +777,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print("-" * len(sw_int_header_line))
 
         # Iterate through each node in the graph
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabricSwitches):
 
             # Auxilear variable to compare the role in the if statement below
             role = attributes.get('role')
@@ -781,20 +785,11 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
             # Check if the node is a switch and has the 'interfaces' attribute
             if role is not None and role in fabricSwitches and 'interfaces' in attributes and attributes['interfaces']:
 
-                # Iterate through each interfaces entry for the Switch Node
-                for interface in attributes['interfaces']:
-
-                    # Find the corresponding operational info for the current interface
-                    # Use a dictionary comprehension for a more efficient lookup
-                    oper_info_map = {op_int['intID']: op_int for op_int in attributes.get('opt_interfaces', [])}
-                    oper_info = oper_info_map.get(interface.get('id', '').lower())
-
-                    # Initialize variables with default values
-                    operSt = "down"
+                # Iterate through each interfaces entry for the Switch Node, joined with its operational info
+                for record, interface in nodeInterfaceView(graph, node).configured():
 
-                    # Update variables if operational info is found
-                    if oper_info and oper_info.get('operSt'):
-                        operSt = oper_info['operSt'].get('operSt', operSt)
+                    # Operational status of the interface ("down" if it was not found)
+                    operSt = record.operValue('operSt', "down")
 
                     if interface.get('adminSt') == "up" and operSt == "down":
 
@@ -836,7 +831,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print("-" * len(apic_ntp_header_line))
 
         # Iterate through each node in the graph
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabricController):
 
             # Auxilear variable to compare the role in the if statement below
             role = attributes.get('role')
@@ -898,7 +893,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         header_printed = True
 
         # Iterate through each node in the graph
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabricController):
 
             # Auxilear variable to compare the role in the if statement below
             role = attributes.get('role')
@@ -980,7 +975,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print("-" * len(apic_psu_header_line))
 
         # Iterate through each node in the graph
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabricController):
 
             # Auxilear variable to compare the role in the if statement below
             role = attributes.get('role')
@@ -1029,7 +1024,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print("-" * len(apic_fan_header_line))
 
         # Iterate through each node in the graph
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabricController):
 
             # Auxilear variable to compare the role in the if statement below
             role = attributes.get('role')
@@ -1077,7 +1072,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print("-" * len(apic_sensor_header_line))
 
         # Iterate through each node in the graph
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabricController):
 
             # Auxilear variable to compare the role in the if statement below
             role = attributes.get('role')
@@ -1127,7 +1122,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print("-" * len(apic_dimm_header_line))
 
         # Iterate through each node in the graph
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabricController):
 
             # Auxilear variable to compare the role in the if statement below
             role = attributes.get('role')
@@ -1176,7 +1171,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print("-" * len(apic_aggint_header_line))
 
         # Iterate through each node in the graph
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabricController):
 
             # Auxilear variable to compare the role in the if statement below
             role = attributes.get('role')
@@ -1224,7 +1219,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print("-" * len(apic_bbddSync_header_line))
 
         # Iterate through each node in the graph
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabricController):
 
             # Auxilear variable to compare the role in the if statement below
             role = attributes.get('role')
@@ -1274,7 +1269,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print("-" * len(apic_phyint_header_line))
 
         # Iterate through each node in the graph
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabricController):
 
             # Auxilear variable to compare the role in the if statement below
             role = attributes.get('role')
@@ -1385,7 +1380,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print("-" * len(apic_fa_header_line))
 
         # Iterate through each node in the graph
-        for node, attributes in graph.nodes(data=True):
+        for node, attributes in nodesWithRole(graph, fabric_role):
 
             # Auxilear variable to compare the role in the if statement below
             role_type = attributes.get('role')
@@ -1858,18 +1853,6 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
     # General Method that prints fabric edge links reporting errors in the interface counters
     def printFabricEdgesWithErrorsCli(self, graph: nx.Graph) -> None:
 
-        # Define error keys to check in both source and destination interface counters
-        error_keys = [
-            'source_cRCAlignErrors', 'source_collisions', 'source_dropEvents',
-            'source_fragments', 'source_jabbers', 'source_undersizePkts',
-            'source_oversizePkts', 'source_rxGiantPkts', 'source_rxOversizePkts',
-            'source_txGiantPkts', 'source_txOversizePkts', 'source_interface_operLastErrors',
-            'dest_cRCAlignErrors', 'dest_collisions', 'dest_dropEvents',
-            'dest_fragments', 'dest_jabbers', 'dest_undersizePkts',
-            'dest_oversizePkts', 'dest_rxGiantPkts', 'dest_rxOversizePkts',
-            'dest_txGiantPkts', 'dest_txOversizePkts', 'dest_interface_operLastErrors',
-        ]
-
         # Header for the error-focused table
         header_keys = ['Source Node', 'Source Int', 'Dest Node', 'Dest Int', 'Errors Detected?']
         header_line = "{:<15} {:<12} {:<15} {:<12} {:<20}".format(*header_keys)
@@ -1884,54 +1867,25 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print(header_line)
         print("-" * total_width)
 
-        # Flag to track if any error was found
-        errors_found = False
-
-        # Iterate through all edges
-        for u, v, data in graph.edges(data=True):
-
-            # Skip downlink edges (focus on fabric interconnects)
-            if data.get('downlink'):
-                continue
+        # Fabric edges with errors, ranked by the total number of errors
+        results = self.__error_analyzer.analyzeFabricErrors(graph)
 
-            # Check if any error counter has a non-zero/non-None value
-            has_errors = False
-            for key in error_keys:
-                # Retrieve the value, safely converting it to an integer, defaulting to 0
-                try:
-                    # Treat 'N/A' or missing keys as 0
-                    value = int(data.get(key, 0) or 0)
-                except ValueError:
-                    # Handle cases where value might be a non-numeric string like "N/A"
-                    value = 0
-
-                # Check for "lastErrors" value being non-zero/non-empty
-                if 'operLastErrors' in key and data.get(key) not in [None, '0', '', 'N/A']:
-                    has_errors = True
-                    break
-
-                # Check for counter values being greater than zero
-                if value > 0:
-                    has_errors = True
-                    break
-
-            if has_errors:
-                errors_found = True
+        for result in results:
 
-                # Prepare the data tuple to be printed
-                edge_data = (
-                    u,
-                    data.get('source_interface_id', 'N/A'),
-                    v,
-                    data.get('dest_interface_id', 'N/A'),
-                    "YES (Review Counters)"
-                )
+            # Prepare the data tuple to be printed
+            edge_data = (
+                result.source_node,
+                result.source_interface,
+                result.dest_node,
+                result.dest_interface,
+                "YES (Review Counters)"
+            )
 
-                # Print the edge data
-                print("{:<15} {:<12} {:<15} {:<12} {:<20}".format(*edge_data))
+            # Print the edge data
+            print("{:<15} {:<12} {:<15} {:<12} {:<20}".format(*edge_data))
 
         # Print message if no errors were found
-        if not errors_found:
+        if not results:
             print("{:<64}".format("No fabric edges reported interface errors."))
 
         # Print end separation
@@ -1940,110 +1894,502 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
     # Method that prints fabric edge links reporting errors with detailed counter information
     def printFabricEdgesWithErrorDetailsCli(self, graph: nx.Graph) -> None:
 
-        # Define error keys to check (same as before)
-        error_keys = [
-            'source_cRCAlignErrors', 'source_collisions', 'source_dropEvents',
-            'source_fragments', 'source_jabbers', 'source_undersizePkts',
-            'source_oversizePkts', 'source_rxGiantPkts', 'source_rxOversizePkts',
-            'source_txGiantPkts', 'source_txOversizePkts', 'source_interface_operLastErrors',
-            'dest_cRCAlignErrors', 'dest_collisions', 'dest_dropEvents',
-            'dest_fragments', 'dest_jabbers', 'dest_undersizePkts',
-            'dest_oversizePkts', 'dest_rxGiantPkts', 'dest_rxOversizePkts',
-            'dest_txGiantPkts', 'dest_txOversizePkts', 'dest_interface_operLastErrors',
+        # Fixed width for the sub-tables
+        summary_line_width = 80
+
+        # Keys to map the error counters to clean column headers (Attribute, Counter)
+        printable_error_map = [
+            ("CRC/Align Errors", 'cRCAlignErrors'),
+            ("Collisions", 'collisions'),
+            ("Drop Events", 'dropEvents'),
+            ("Fragments", 'fragments'),
+            ("Jabbers", 'jabbers'),
+            ("Undersize Pkts", 'undersizePkts'),
+            ("Oversize Pkts", 'oversizePkts'),
+            ("Rx Giant Pkts", 'rxGiantPkts'),
+            ("Rx Oversize Pkts", 'rxOversizePkts'),
+            ("Tx Giant Pkts", 'txGiantPkts'),
+            ("Tx Oversize Pkts", 'txOversizePkts'),
         ]
 
-        # Flag to track if any error was found
-        errors_found = False
+        # Fabric edges with errors, ranked by the total number of errors
+        results = self.__error_analyzer.analyzeFabricErrors(graph)
 
-        # Iterate through all edges
-        for u, v, data in graph.edges(data=True):
+        for result in results:
 
-            # Skip downlink edges (focus on fabric interconnects)
-            if data.get('downlink'):
-                continue
+            # Print the summary header for this specific edge
+            summary_header = f" ERRORS DETECTED on Edge: {result.source_node} ({result.source_interface}) <-> {result.dest_node} ({result.dest_interface}) "
+            print("\n" + "#" * summary_line_width)
+            print(summary_header.center(summary_line_width, '#'))
+            print("#" * summary_line_width)
 
-            # Check if any error counter has a non-zero/non-None value
-            has_errors = False
-            error_details = {} # Store non-zero errors for printing
+            # Detailed table header
+            detail_header_keys = ['Error Type', f'Source: {result.source_node}', f'Dest: {result.dest_node}']
+            detail_header_line = "{:<30} {:<24} {:<24}".format(*detail_header_keys)
 
-            for key in error_keys:
-                raw_value = data.get(key)
-                value = 0
+            print(detail_header_line)
+            print("-" * summary_line_width)
 
-                # Check for "lastErrors" value being non-zero/non-empty string
-                if 'operLastErrors' in key:
-                    if raw_value not in [None, '0', '', 'N/A']:
-                        has_errors = True
-                        error_details[key] = raw_value
+            # Print details for non-zero errors, "N/A" for the side without errors
+            rows = [(attr_name, result.errors[counter]) for attr_name, counter in printable_error_map if counter in result.errors]
+            if result.last_errors != (None, None):
+                rows.append(("Last Errors (Text)", result.last_errors))
 
-                # Check for counter values being greater than zero
-                else:
-                    try:
-                        value = int(raw_value or 0)
-                    except (ValueError, TypeError):
-                        value = 0 # If it's a non-numeric string, treat as 0 for this check
-
-                    if value > 0:
-                        has_errors = True
-                        error_details[key] = value
-
-            if has_errors:
-                errors_found = True
-
-                # Print the summary header for this specific edge
-                summary_header = f" ERRORS DETECTED on Edge: {u} ({data.get('source_interface_id', 'N/A')}) <-> {v} ({data.get('dest_interface_id', 'N/A')}) "
-                summary_line_width = 80 # Fixed width for this sub-table
-                print("\n" + "#" * summary_line_width)
-                print(summary_header.center(summary_line_width, '#'))
-                print("#" * summary_line_width)
-
-                # Prepare and print the detailed error table
-
-                # Keys to map source/dest prefixes to clean column headers
-                # (Attribute, Source Key, Destination Key)
-                printable_error_map = [
-                    ("CRC/Align Errors", 'source_cRCAlignErrors', 'dest_cRCAlignErrors'),
-                    ("Collisions", 'source_collisions', 'dest_collisions'),
-                    ("Drop Events", 'source_dropEvents', 'dest_dropEvents'),
-                    ("Fragments", 'source_fragments', 'dest_fragments'),
-                    ("Jabbers", 'source_jabbers', 'dest_jabbers'),
-                    ("Undersize Pkts", 'source_undersizePkts', 'dest_undersizePkts'),
-                    ("Oversize Pkts", 'source_oversizePkts', 'dest_oversizePkts'),
-                    ("Rx Giant Pkts", 'source_rxGiantPkts', 'dest_rxGiantPkts'),
-                    ("Rx Oversize Pkts", 'source_rxOversizePkts', 'dest_rxOversizePkts'),
-                    ("Tx Giant Pkts", 'source_txGiantPkts', 'dest_txGiantPkts'),
-                    ("Tx Oversize Pkts", 'source_txOversizePkts', 'dest_txOversizePkts'),
-                    ("Last Errors (Text)", 'source_interface_operLastErrors', 'dest_interface_operLastErrors'),
-                ]
-
-                # Detailed table header
-                detail_header_keys = ['Error Type', f'Source: {u}', f'Dest: {v}']
-                detail_header_line = "{:<30} {:<24} {:<24}".format(*detail_header_keys)
-
-                print(detail_header_line)
-                print("-" * summary_line_width)
-
-                # Print details for non-zero errors
-                for attr_name, src_key, dest_key in printable_error_map:
-                    src_val = error_details.get(src_key)
-                    dest_val = error_details.get(dest_key)
-
-                    # Only print rows where at least one side has a non-zero/non-empty error
-                    if src_val is not None or dest_val is not None:
-                        # Convert number to string, format "N/A" if None
-                        src_display = str(src_val) if src_val is not None else "N/A"
-                        dest_display = str(dest_val) if dest_val is not None else "N/A"
-
-                        print("{:<30} {:<24} {:<24}".format(attr_name, src_display, dest_display))
-
-                print("-" * summary_line_width)
+            for attr_name, (src_val, dest_val) in rows:
+                src_display = str(src_val) if src_val is not None else "N/A"
+                dest_display = str(dest_val) if dest_val is not None else "N/A"
+                print("{:<30} {:<24} {:<24}".format(attr_name, src_display, dest_display))
+
+            print("-" * summary_line_width)
 
         # Print overall status at the end
-        if not errors_found:
+        if not results:
             print("\n" + "-" * summary_line_width)
             print("No fabric edges reported interface errors with non-zero counters.".center(summary_line_width))
             print("-" * summary_line_width)
 
+    # Method that prints fabric edge links ranked by errors per second over the window of the Counter Store
+    def printFabricEdgesErrorRatesCli(self, graph: nx.Graph, window: float = CounterStore.DEFAULT_WINDOW) -> None:
+
+        # The rates need the counters of at least two collections
+        store: Optional[CounterStore] = graph.graph.get('counter_store')
+        if store is None:
+            print("No Counter Store for this Graph, run the tool with --counter-store FILE to keep the counters of every collection.")
+            return
+
+        # Header for the rates table
+        header_keys = ['Source Node', 'Source Int', 'Dest Node', 'Dest Int', 'Errors/s', 'Top Counter']
+        header_line = "{:<15} {:<12} {:<15} {:<12} {:<12} {:<20}".format(*header_keys)
+
+        # Print header
+        collections, _, _ = store.collections()
+        header_text = f" Fabric Edges Error Rates (last {int(window)}s, {collections} collections stored) "
+        total_width = len(header_line)
+        print("-" * total_width)
+        print(header_text.center(total_width, '-'))
+        print("-" * total_width)
+        print(header_line)
+        print("-" * total_width)
+
+        # Fabric edges whose error counters increased, ranked by errors per second
+        results = self.__error_analyzer.analyzeFabricErrorRates(graph, store, window)
+
+        for result in results:
+
+            # Counter with the highest rate on any side of the link
+            top_counter = max(result.errors, key=lambda counter: sum(rate or 0 for rate in result.errors[counter]))
+
+            # Print the edge data
+            print("{:<15} {:<12} {:<15} {:<12} {:<12} {:<20}".format(result.source_node, result.source_interface, result.dest_node, result.dest_interface, f"{result.total:.4f}", top_counter))
+
+        # Print message if no errors were found
+        if not results:
+            print("{:<64}".format("No fabric edges increased their error counters in the window."))
+
+        # Print end separation
+        print("-" * total_width)
+
+    ###############################
+    # Counter Watch Print Methods #
+    ###############################
+
+    # Method that prints the rolling view of the Counter Watch (one line per watched interface, the interfaces
+    # with errors in the rolling window and the flapping ones first). With clear=True the view is redrawn in place
+    def printCounterWatch(self, status: Dict[str, Any], interfaces: List[WatchedInterface], clear: bool = True) -> None:
+
+        # Header for the watch table
+        header_keys = ['Node', 'Interface', 'Peer', 'OperSt', 'Flaps', 'Errors', 'Errors/s', 'Window', 'Total', 'Rx Pkts/s']
+        header_line = "{:<15} {:<11} {:<22} {:<8} {:>5} {:>8} {:>10} {:>8} {:>10} {:>12}".format(*header_keys)
+        total_width = len(header_line)
+
+        # Moving the cursor to the top of the terminal instead of spawning 'clear' on every poll
+        if clear:
+            print("\033[H\033[J", end="")
+
+        # Print header
+        header_text = " Counter Watch (Ctrl+C to stop) "
+        print("-" * total_width)
+        print(header_text.center(total_width, '-'))
+        print("-" * total_width)
+        print("Poll #{} at {} in {:.2f}s | every {}s | {} interfaces on {} nodes | {} requests, {} failed, {} late polls".format(
+            status.get('polls', 0), status.get('last_poll') or 'N/A', status.get('poll_seconds', 0.0), status.get('interval'),
+            status.get('interfaces', 0), status.get('nodes', 0), status.get('requests', 0), status.get('failed', 0), status.get('late', 0)))
+        if status.get('last_error'):
+            print(status['last_error'])
+        print("-" * total_width)
+        print(header_line)
+        print("-" * total_width)
+
+        # Ranking: errors in the rolling window, flaps, then by interface name
+        for interface in sorted(interfaces, key=lambda item: (-item.windowErrors(), -item.flaps, item.node, item.port)):
+            if interface.polls < 2:
+                counters = ('-', '-', '-', '-', '-')
+            else:
+                counters = (interface.errorDelta(), f"{interface.errorRate():.2f}", interface.windowErrors(), interface.errors, f"{interface.packetRate():.1f}")
+            print("{:<15} {:<11} {:<22} {:<8} {:>5} {:>8} {:>10} {:>8} {:>10} {:>12}".format(
+                interface.node, interface.port, interface.peer[:22], interface.oper_st or 'N/A', interface.flaps, *counters))
+
+        # Print message if there is nothing to watch
+        if not interfaces:
+            print("{:<64}".format("No interfaces selected for the watch."))
+
+        # Print end separation
+        print("-" * total_width)
+
+    #############################
+    # Fabric Path Print Methods #
+    #############################
+
+    # Method that prints the equal-cost paths between two leaves through the spines
+    def printLeafPaths(self, result: LeafPathResult, engine: FabricPathEngine) -> None:
+
+        # Header for the paths table
+        header_line = "{:<6} {:<80}".format('Path', 'Nodes')
+        total_width = len(header_line)
+
+        # Print header
+        header_text = f" Paths {result.source} -> {result.dest} "
+        print("-" * total_width)
+        print(header_text.center(total_width, '-'))
+        print("-" * total_width)
+        if result.hops is None:
+            print(f"No usable path between {result.source} and {result.dest}.")
+        else:
+            print(f"ECMP width: {result.ecmp} | Hops: {result.hops} | Spines: {', '.join(map(str, result.spines)) or 'N/A'}")
+        print("-" * total_width)
+        print(header_line)
+        print("-" * total_width)
+
+        for index, path in enumerate(result.paths, 1):
+            print("{:<6} {:<80}".format(index, " -> ".join(map(str, path))))
+        if result.ecmp > len(result.paths):
+            print(f"... {result.ecmp - len(result.paths)} more equal-cost paths")
+
+        # Print end separation with the excluded links
+        self.__printExcludedLinks(engine, total_width)
+
+    # Method that prints the ECMP width of every pair of leaves, the pairs with less redundancy first
+    def printFabricRedundancy(self, results: List[LeafPathResult], engine: FabricPathEngine) -> None:
+
+        # Header for the redundancy table
+        header_keys = ['Source Leaf', 'Dest Leaf', 'ECMP', 'Hops', 'Spines']
+        header_line = "{:<20} {:<20} {:>6} {:>6}  {:<40}".format(*header_keys)
+        total_width = len(header_line)
+
+        # Print header
+        header_text = f" Leaf-to-Leaf Redundancy ({len(engine.leaves())} leaves, {engine.stats['links']} fabric links) "
+        print("-" * total_width)
+        print(header_text.center(total_width, '-'))
+        print("-" * total_width)
+        print(header_line)
+        print("-" * total_width)
+
+        for result in results:
+            print("{:<20} {:<20} {:>6} {:>6}  {:<40}".format(str(result.source), str(result.dest), result.ecmp,
+                                                             'N/A' if result.hops is None else result.hops, ", ".join(map(str, result.spines))[:40]))
+
+        # Print message if there are no pairs
+        if not results:
+            print("{:<64}".format("Less than two leaves in the Graph."))
+
+        # Print end separation with the excluded links
+        self.__printExcludedLinks(engine, total_width)
+
+    ####################################
+    # Failure Simulation Print Methods #
+    ####################################
+
+    # Method that prints the impact of a failure scenario (lost and reduced leaf pairs, isolated leaves, downlink devices)
+    def printFailureImpact(self, impact: FailureImpact) -> None:
+
+        # Header for the impact table
+        header_line = "{:<12} {:<30} {:<50}".format('Impact', 'Item', 'Details')
+        total_width = len(header_line)
+
+        # Print header
+        header_text = f" What-If: {impact.scenario} "
+        print("-" * total_width)
+        print(header_text[:total_width].center(total_width, '-'))
+        print("-" * total_width)
+        print(f"{impact.failed_links} fabric links and {impact.failed_downlinks} downlinks down | {len(impact.lost_pairs)} leaf pairs lost, "
+              f"{len(impact.reduced_pairs)} with less ECMP | {len(impact.lost_devices)} devices lost, {len(impact.degraded_devices)} degraded")
+        print("-" * total_width)
+        print(header_line)
+        print("-" * total_width)
+
+        for leaf in impact.isolated_leaves:
+            print("{:<12} {:<30} {:<50}".format('Isolated', str(leaf), 'no spine left'))
+        for source, dest, before in impact.lost_pairs:
+            print("{:<12} {:<30} {:<50}".format('Lost', f"{source} <-> {dest}", f"ECMP {before} -> 0"))
+        for source, dest, before, after in impact.reduced_pairs:
+            print("{:<12} {:<30} {:<50}".format('Reduced', f"{source} <-> {dest}", f"ECMP {before} -> {after}"))
+        for device, ports in impact.lost_devices:
+            print("{:<12} {:<30} {:<50}".format('Device Lost', str(device)[:30], ", ".join(ports)[:50]))
+        for device, ports in impact.degraded_devices:
+            print("{:<12} {:<30} {:<50}".format('Degraded', str(device)[:30], ("down: " + ", ".join(ports))[:50]))
+
+        # Print message if nothing is impacted
+        if not (impact.isolated_leaves or impact.lost_pairs or impact.reduced_pairs or impact.lost_devices or impact.degraded_devices):
+            print("{:<64}".format("No leaf connectivity, ECMP or downlink device impacted."))
+
+        # Print end separation
+        print("-" * total_width)
+        print(f"Simulated in {impact.seconds * 1000:.2f} ms")
+        print("-" * total_width)
+
+    ############################
+    # Port Graph Print Methods #
+    ############################
+
+    # Method that prints the shortest port-level path between two endpoints
+    def printPortPath(self, result: PortPathResult) -> None:
+
+        # Header for the path table
+        header_line = "{:<6} {:<80}".format('Hop', 'Switch / Port / Device')
+        total_width = len(header_line)
+
+        # Print header
+        header_text = f" Port Path {result.source} -> {result.dest} "
+        print("-" * total_width)
+        print(header_text[:total_width].center(total_width, '-'))
+        print("-" * total_width)
+        if result.path:
+            print(f"Hops: {len(result.path) - 1} | Devices reachable from {result.source}: {result.reachable_devices}")
+        else:
+            print(f"No usable port path between {result.source} and {result.dest}.")
+        print("-" * total_width)
+        print(header_line)
+        print("-" * total_width)
+
+        for index, hop in enumerate(result.path):
+            print("{:<6} {:<80}".format(index, hop))
+
+        # Print end separation
+        print("-" * total_width)
+
+    # Method that prints the leaves that share dual-homed devices (vPC pairs) and the devices of every pair
+    def printVpcPairs(self, results: List[VpcPairResult]) -> None:
+
+        # Header for the vPC table
+        header_keys = ['vPC Pair', 'Device', 'Ports', 'Down']
+        header_line = "{:<26} {:<26} {:<36} {:<20}".format(*header_keys)
+        total_width = len(header_line)
+
+        # Print header
+        devices = sum(len(result.devices) for result in results)
+        degraded = sum(len(result.degraded()) for result in results)
+        header_text = f" vPC Pairs ({len(results)} pairs, {devices} dual-homed devices, {degraded} degraded) "
+        print("-" * total_width)
+        print(header_text.center(total_width, '-'))
+        print("-" * total_width)
+        print(header_line)
+        print("-" * total_width)
+
+        for result in results:
+            pair = " / ".join(map(str, result.leaves))
+            for device, by_leaf, down in result.devices:
+                ports = ", ".join(f"{leaf} {port}" for leaf, leaf_ports in by_leaf.items() for port in leaf_ports)
+                print("{:<26} {:<26} {:<36} {:<20}".format(pair[:26], str(device)[:26], ports[:36], (", ".join(down) or '-')[:20]))
+                pair = ""
+
+        # Print message if there are no dual-homed devices
+        if not results:
+            print("{:<64}".format("No device connected to more than one leaf."))
+
+        # Print end separation
+        print("-" * total_width)
+
+    # Method that prints the blast radius of a failure scenario (switches and devices cut from the spines)
+    def printBlastRadius(self, result: BlastRadiusResult) -> None:
+
+        # Header for the blast radius table
+        header_line = "{:<12} {:<30} {:<50}".format('Impact', 'Item', 'Ports')
+        total_width = len(header_line)
+
+        # Print header
+        header_text = f" Blast Radius: {result.scenario} "
+        print("-" * total_width)
+        print(header_text[:total_width].center(total_width, '-'))
+        print("-" * total_width)
+        print(f"{result.failed_ports} usable ports failed | {len(result.isolated_switches)} switches isolated | "
+              f"{len(result.lost_devices)} devices lost, {len(result.degraded_devices)} degraded")
+        print("-" * total_width)
+        print(header_line)
+        print("-" * total_width)
+
+        for switch in result.isolated_switches:
+            print("{:<12} {:<30} {:<50}".format('Isolated', str(switch)[:30], 'no port path to a spine'))
+        for device, ports in result.lost_devices:
+            print("{:<12} {:<30} {:<50}".format('Device Lost', str(device)[:30], ", ".join(ports)[:50]))
+        for device, ports in result.degraded_devices:
+            print("{:<12} {:<30} {:<50}".format('Degraded', str(device)[:30], ("lost: " + ", ".join(ports))[:50]))
+
+        # Print message if nothing is impacted
+        if not (result.isolated_switches or result.lost_devices or result.degraded_devices):
+            print("{:<64}".format("No switch or downlink device loses the reachability to the spines."))
+
+        # Print end separation
+        print("-" * total_width)
+        print(f"Computed in {result.seconds * 1000:.2f} ms")
+        print("-" * total_width)
+
+    ############################
+    # VLAN Index Print Methods #
+    ############################
+
+    # Method that prints the downlink ports that carry every VLAN (operational VLANs) and the ports that only allow it
+    def printVlanPorts(self, graph: nx.Graph, vlans: List[int]) -> None:
+
+        # Header for the ports table
+        header_keys = ['Leaf', 'Port', 'Device', 'VLAN']
+        header_line = "{:<20} {:<12} {:<30} {:<12}".format(*header_keys)
+        total_width = len(header_line)
+
+        index = graphVlanIndex(graph)
+        for vlan in vlans:
+
+            # Operational ports and the ports that allow the VLAN without carrying it (index lookups only)
+            started = time.perf_counter()
+            oper_ports = index.ports(vlan, 'oper')
+            carried = set(oper_ports)
+            allowed_ports = [port for port in index.ports(vlan, 'allowed') if port not in carried]
+            seconds = time.perf_counter() - started
+
+            # Auxilear Dict with the devices of the downlinks of the leaves in the result
+            devices: Dict[Tuple[Any, str], List[str]] = {}
+            for leaf in {leaf for leaf, _ in oper_ports + allowed_ports}:
+                for _, device, data in graph.edges(leaf, data=True):
+                    if data.get('downlink'):
+                        devices.setdefault((leaf, str(data.get('leaf_int') or '').lower()), []).append(str(device))
+
+            # Print header
+            header_text = f" VLAN {vlan}: {len(oper_ports)} ports carry it, {len(allowed_ports)} only allow it "
+            print("-" * total_width)
+            print(header_text.center(total_width, '-'))
+            print("-" * total_width)
+            print(header_line)
+            print("-" * total_width)
+
+            for state, ports in (('oper', oper_ports), ('allowed', allowed_ports)):
+                for leaf, port in sorted(ports, key=lambda item: (str(item[0]), item[1])):
+                    print("{:<20} {:<12} {:<30} {:<12}".format(str(leaf)[:20], port, ", ".join(devices.get((leaf, port), ['N/A']))[:30], state))
+
+            # Print message if no port has the VLAN
+            if not (oper_ports or allowed_ports):
+                print("{:<64}".format(f"No downlink port carries or allows the VLAN {vlan}."))
+
+            # Print end separation
+            print("-" * total_width)
+            print(f"{len(index)} ports indexed | Lookup in {seconds * 1e6:.1f} us")
+            print("-" * total_width)
+
+    #############################
+    # Graph Query Print Methods #
+    #############################
+
+    # Method that prints the result of a Graph Query (ACIGraphQuery), one line per item with the values of the paths of the query
+    def printQueryResult(self, result: QueryResult) -> None:
+
+        # Width of the key and of every value column
+        key_width, value_width = {'nodes': (34, 24), 'edges': (46, 24)}.get(result.target, (22, 24))
+        header_keys = [result.target.capitalize()[:-1]] + [column[:value_width] for column in result.columns]
+        line_format = "{:<" + str(key_width) + "}" + (" {:<" + str(value_width) + "}") * len(result.columns)
+        header_line = line_format.format(*header_keys)
+        total_width = max(len(header_line), 80)
+
+        # Print header
+        header_text = f" Query: {result.expression} "
+        print("-" * total_width)
+        print(header_text[:total_width].center(total_width, '-'))
+        print("-" * total_width)
+        print(header_line)
+        print("-" * total_width)
+
+        for key, values in result.items:
+
+            # Edges as 'node <-> node' (with the interfaces of the link), interfaces as 'node_id port'
+            if result.target == 'edges' and len(key) > 2 and isinstance(key[2], tuple):
+                key_text = f"{key[0]} {key[2][0] or ''} <-> {key[1]} {key[2][1] or ''}"
+            elif result.target == 'edges':
+                key_text = f"{key[0]} <-> {key[1]}"
+            elif result.target == 'interfaces':
+                key_text = f"{key[0]} {key[1]}"
+            else:
+                key_text = str(key)
+
+            # Lists and objects are summarized, the values of the entries are joined
+            cells = []
+            for column in result.columns:
+                shown = [f"{len(value)} entries" if isinstance(value, (list, tuple, dict)) else str(value) for value in values[column] if value is not None]
+                cells.append((", ".join(shown) or "N/A")[:value_width])
+
+            print(line_format.format(key_text[:key_width], *cells))
+
+        # Print message if nothing matched
+        if not result.items:
+            print("{:<64}".format(f"No {result.target} matched the query."))
+
+        # Print end separation with the plan of the query
+        print("-" * total_width)
+        print(f"{len(result)} {result.target} matched, {result.scanned} evaluated ({result.plan}) in {result.seconds * 1000:.1f} ms")
+        print("-" * total_width)
+
+    ###############################
+    # Snapshot Diff Print Methods #
+    ###############################
+
+    # Method that prints the changes between two Graphs (ACISnapshotDiff change set)
+    def printGraphChanges(self, changes: ChangeSet) -> None:
+
+        # Header for the changes table
+        header_keys = ['Kind', 'Target', 'Action', 'Attribute', 'Item', 'Field', 'Old', 'New']
+        header_line = "{:<5} {:<30} {:<8} {:<34} {:<22} {:<22} {:<20} {:<20}".format(*header_keys)
+
+        # Print header
+        header_text = f" Graph Changes: {changes.old_label} -> {changes.new_label} "
+        total_width = len(header_line)
+        print("-" * total_width)
+        print(header_text.center(total_width, '-'))
+        print("-" * total_width)
+
+        # Summary of the comparison
+        print("Nodes compared: {} ({} unchanged) | Edges compared: {} ({} unchanged) | Changes: {}".format(
+            changes.stats['nodes'], changes.stats['nodes_unchanged'], changes.stats['edges'], changes.stats['edges_unchanged'], len(changes)))
+        for (kind, attribute, action), count in sorted(changes.summary().items(), key=lambda entry: (entry[0][0], str(entry[0][1]), entry[0][2])):
+            print(" - {} {} {}: {}".format(kind, attribute or '', action, count))
+        print("-" * total_width)
+        print(header_line)
+        print("-" * total_width)
+
+        for change in changes:
+
+            # Auxilear function that fits a value into its column
+            def cell(value: Any, width: int) -> str:
+                text = "" if value is None else (" <-> ".join(map(str, value)) if isinstance(value, tuple) else str(value))
+                return text if len(text) <= width else text[:width - 3] + "..."
+
+            # Prepare the data tuple to be printed
+            change_data = (
+                change.kind,
+                cell(change.target, 30),
+                change.action,
+                cell(change.attribute, 34),
+                cell(change.item, 22),
+                cell(change.field, 22),
+                cell(change.old, 20),
+                cell(change.new, 20)
+            )
+
+            # Print the change data
+            print("{:<5} {:<30} {:<8} {:<34} {:<22} {:<22} {:<20} {:<20}".format(*change_data))
+
+        # Print message if no changes were found
+        if not len(changes):
+            print("No changes between the two Graphs.")
+
+        # Print end separation
+        print("-" * total_width)
+
     ########################
     # Tenant Print Methods #
     ########################
@@ -2052,7 +2398,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
     def printFabricTenantInfo(self, graph: nx.Graph) -> None:
 
         # Look for the dedicated Fabric Root Node where global config is stored
-        tenant_root_node = next((data for node, data in graph.nodes(data=True) if node == "Fabric_Config_Root"), None)
+        tenant_root_node, tenant_index = self.__tenant_config(graph)
 
         if not tenant_root_node or not tenant_root_node.get('tenants'):
             print("❌ No Tenant Configuration data found in the graph (Fabric_Config_Root node).")
@@ -2065,16 +2411,16 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print(" Fabric Tenant Configuration Summary ".center(80, '-'))
         print("-" * 80)
 
-        # The 'tenants' attribute contains a list of objects, one for each fvTenant
-        all_tenants = tenant_root_node.get('tenants', [])
+        # The Tenant Index contains one object for each fvTenant
+        all_tenants = tenant_index.objects('fvTenant')
 
         if not all_tenants:
             print("No Tenants configured in the fabric.")
 
-        for tenant_obj in all_tenants:
+        for tenant in all_tenants:
             # Safely navigate to the tenant attributes
-            tenant_attr = tenant_obj.get('fvTenant', {}).get('attributes', {})
-            tenant_name = tenant_attr.get('name', 'N/A')
+            tenant_attr = tenant.attributes
+            tenant_name = tenant.name
 
             # 💡 NEW: Skip the default "common" and "mgmt" tenants for cleaner output
             if tenant_name in ['mgmt', 'common', 'N/A']:
@@ -2082,7 +2428,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
 
             print("\n" + f" Tenant: {tenant_name} ".center(80, '='))
             print(f"  |-> Name Alias: {tenant_attr.get('nameAlias', 'N/A')}")
-            print(f"  |-> Dn: uni/tn-{tenant_name}")
+            print(f"  |-> Dn: {self.__dn_parser.tenantDn(tenant_name)}")
 
             # Initialize counters for this tenant
             ap_count = 0
@@ -2092,37 +2438,27 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
             other_children = 0
 
             # Get the list of direct children objects under the fvTenant
-            children = tenant_obj.get('fvTenant', {}).get('children', [])
-
-            for child in children:
+            for child in tenant_index.childrenOf(tenant.dn):
 
                 # Check for Application Profiles (fvAp)
-                if 'fvAp' in child:
+                if child.mo_class == 'fvAp':
                     ap_count += 1
-                    ap_attr = child['fvAp']['attributes']
-                    ap_name = ap_attr.get('name', 'N/A')
-                    print(f"  |--- Application Profile: {ap_name}")
+                    print(f"  |--- Application Profile: {child.name}")
 
                     # Check for EPGs (fvAEPg) inside the Application Profile
-                    ap_children = child['fvAp'].get('children', [])
-                    for ap_child in ap_children:
-                        if 'fvAEPg' in ap_child:
-                            epg_count += 1
-                            epg_name = ap_child['fvAEPg']['attributes'].get('name', 'N/A')
-                            print(f"  |-----> EPG: {epg_name} (DN: {ap_child['fvAEPg']['attributes'].get('dn')})")
-                        # You can add logic here to parse Contracts (vzBrCP) or other objects if needed.
+                    for epg in tenant_index.childrenOf(child.dn, 'fvAEPg'):
+                        epg_count += 1
+                        print(f"  |-----> EPG: {epg.name} (DN: {self.__dn_parser.epgDn(tenant_name, child.name, epg.name)})")
 
                 # Check for L3Outs (l3extOut)
-                elif 'l3extOut' in child:
+                elif child.mo_class == 'l3extOut':
                     l3out_count += 1
-                    l3out_name = child['l3extOut']['attributes'].get('name', 'N/A')
-                    print(f"  |--- L3Out: {l3out_name} (DN: {child['l3extOut']['attributes'].get('dn')})")
+                    print(f"  |--- L3Out: {child.name} (DN: {self.__dn_parser.l3outDn(tenant_name, child.name)})")
 
                 # 💡 NEW: Check for VRFs (fvCtx)
-                elif 'fvCtx' in child:
+                elif child.mo_class == 'fvCtx':
                     vrf_count += 1
-                    vrf_name = child['fvCtx']['attributes'].get('name', 'N/A')
-                    print(f"  |--- VRF (Context): {vrf_name} (DN: {child['fvCtx']['attributes'].get('dn')})")
+                    print(f"  |--- VRF (Context): {child.name} (DN: {self.__dn_parser.vrfDn(tenant_name, child.name)})")
 
                 # Count other top-level children (e.g., vzBrCP/contracts, faultInst)
                 else:
@@ -2135,13 +2471,17 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
             print(f"  - Total VRFs Found: {vrf_count}") # 💡 NEW VRF line
             print(f"  - Other top-level objects: {other_children}")
 
+        # Tenants whose subtree could not be fetched
+        for tenant_name, tenant_error in tenant_root_node.get('tenant_errors', {}).items():
+            print(f"\n❌ Tenant {tenant_name}: {tenant_error}")
+
         print("\n" + "=" * 80)
 
     # Method that prints a simple list of all EPGs detected, organized by Tenant and Application Profile.
     def printTenantEpgList(self, graph: nx.Graph) -> None:
 
         # Look for the dedicated Fabric Root Node where global config is stored
-        tenant_root_node = next((data for node, data in graph.nodes(data=True) if node == "Fabric_Config_Root"), None)
+        tenant_root_node, tenant_index = self.__tenant_config(graph)
 
         if not tenant_root_node or not tenant_root_node.get('tenants'):
             print("❌ No Tenant Configuration data found in the graph (Fabric_Config_Root node).")
@@ -2154,58 +2494,40 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print(" EPG List per Tenant and Application Profile ".center(80, '-'))
         print("-" * 80)
 
-        all_tenants = tenant_root_node.get('tenants', [])
+        all_tenants = tenant_index.objects('fvTenant')
 
         if not all_tenants:
             print("No Tenants configured in the fabric.")
 
         epgs_found = 0
 
-        for tenant_obj in all_tenants:
+        for tenant in all_tenants:
             # 1. Get Tenant Info
-            tenant_attr = tenant_obj.get('fvTenant', {}).get('attributes', {})
-            tenant_name = tenant_attr.get('name', 'N/A')
+            tenant_name = tenant.name
 
             # Skip the default tenants for a focused list
             if tenant_name in ['mgmt', 'common', 'N/A']:
                 continue
 
-            print(f"\n--- TENANT: {tenant_name} ({tenant_attr.get('nameAlias', 'N/A')}) ---")
-
-            # 2. Iterate over direct children (looking for Application Profiles)
-            children = tenant_obj.get('fvTenant', {}).get('children', [])
-
-            tenant_has_apgs = False
+            print(f"\n--- TENANT: {tenant_name} ({tenant.attributes.get('nameAlias', 'N/A')}) ---")
 
-            for child in children:
-
-                # Check for Application Profiles (fvAp)
-                if 'fvAp' in child:
-                    tenant_has_apgs = True
-                    ap_attr = child['fvAp']['attributes']
-                    ap_name = ap_attr.get('name', 'N/A')
-
-                    print(f"  |-> Application Profile: {ap_name}")
-
-                    # 3. Iterate over children of the Application Profile (looking for EPGs)
-                    ap_children = child['fvAp'].get('children', [])
+            # 2. Application Profiles of the Tenant
+            tenant_aps = tenant_index.childrenOf(tenant.dn, 'fvAp')
 
-                    ap_has_epgs = False
+            for ap in tenant_aps:
+                print(f"  |-> Application Profile: {ap.name}")
 
-                    for ap_child in ap_children:
-                        if 'fvAEPg' in ap_child:
-                            ap_has_epgs = True
-                            epgs_found += 1
-                            epg_attr = ap_child['fvAEPg']['attributes']
-                            epg_name = epg_attr.get('name', 'N/A')
-                            epg_pcTag = epg_attr.get('pcTag', 'N/A')
+                # 3. EPGs of the Application Profile
+                ap_epgs = tenant_index.childrenOf(ap.dn, 'fvAEPg')
 
-                            print(f"    |---> EPG: {epg_name} (PC Tag: {epg_pcTag})")
+                for epg in ap_epgs:
+                    epgs_found += 1
+                    print(f"    |---> EPG: {epg.name} (PC Tag: {epg.attributes.get('pcTag', 'N/A')})")
 
-                    if not ap_has_epgs:
-                         print("    |---> No EPGs found in this Application Profile.")
+                if not ap_epgs:
+                     print("    |---> No EPGs found in this Application Profile.")
 
-            if not tenant_has_apgs:
+            if not tenant_aps:
                  print("  |-> No Application Profiles found.")
 
         print("\n" + "=" * 80)
@@ -2216,7 +2538,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
     def printEpgDetails(self, graph: nx.Graph) -> None:
 
         # Look for the dedicated Fabric Root Node
-        tenant_root_node = next((data for node, data in graph.nodes(data=True) if node == "Fabric_Config_Root"), None)
+        tenant_root_node, tenant_index = self.__tenant_config(graph)
 
         if not tenant_root_node or not tenant_root_node.get('tenants'):
             print("❌ No Tenant Configuration data found in the graph (Fabric_Config_Root node).")
@@ -2229,49 +2551,31 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print(" FULL EPG CONFIGURATION DETAILS ".center(100, '='))
         print("-" * 100)
 
-        all_tenants = tenant_root_node.get('tenants', [])
-
-        if not all_tenants:
+        if not tenant_index.objects('fvTenant'):
             print("No Tenants configured in the fabric.")
             return
 
-        for tenant_obj in all_tenants:
-            tenant_attr = tenant_obj.get('fvTenant', {}).get('attributes', {})
-            tenant_name = tenant_attr.get('name', 'N/A')
+        # EPGs of every Application Profile, in the order of the Tenant subtree
+        for ap, epg in tenant_index.pairs('fvAp', 'fvAEPg'):
+            tenant = tenant_index.parentOf(ap.dn)
+            tenant_name = tenant.name if tenant is not None else 'N/A'
 
             if tenant_name in ['mgmt', 'common', 'N/A']:
                 continue
 
-            # ----------------------------------------------------------------------
-            # Start EPG Search within Tenant
-            # ----------------------------------------------------------------------
-            tenant_children = tenant_obj.get('fvTenant', {}).get('children', [])
-
-            for ap_child in tenant_children:
-                if 'fvAp' in ap_child:
-                    ap_name = ap_child['fvAp']['attributes'].get('name', 'N/A')
-                    ap_epgs = ap_child['fvAp'].get('children', [])
-
-                    for epg_child in ap_epgs:
-                        if 'fvAEPg' in epg_child:
-                            epg_obj = epg_child['fvAEPg']
-                            epg_attr = epg_obj.get('attributes', {})
-                            epg_name = epg_attr.get('name', 'N/A')
-                            epg_children = epg_obj.get('children', [])
+            # --- 1. EPG Header ---
+            print("\n" + "#" * 90)
+            print(f" EPG: {epg.name} ({tenant_name}/{ap.name}) ".center(90, '#'))
+            print("#" * 90)
 
-                            # --- 1. EPG Header ---
-                            print("\n" + "#" * 90)
-                            print(f" EPG: {epg_name} ({tenant_name}/{ap_name}) ".center(90, '#'))
-                            print("#" * 90)
+            # --- 2. Core EPG Data Section ---
+            self._print_epg_core_data(tenant_name, ap.name, epg.attributes, epg.children)
 
-                            # --- 2. Core EPG Data Section ---
-                            self._print_epg_core_data(tenant_name, ap_name, epg_attr, epg_children)
+            # --- 3. Contract Details Section ---
+            self._print_epg_contracts(epg.children)
 
-                            # --- 3. Contract Details Section ---
-                            self._print_epg_contracts(epg_children)
-
-                            # --- 4. Domain and Path Attachments Section (VMM, Static, VPC) ---
-                            self._print_epg_attachments(epg_children)
+            # --- 4. Domain and Path Attachments Section (VMM, Static, VPC) ---
+            self._print_epg_attachments(epg.children)
 
         print("\n" + "=" * 100)
         print(" END OF EPG DETAIL REPORT ".center(100, '='))
@@ -2281,7 +2585,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
     def printBdDetails(self, graph: nx.Graph) -> None:
 
         # Look for the dedicated Fabric Root Node
-        tenant_root_node = next((data for node, data in graph.nodes(data=True) if node == "Fabric_Config_Root"), None)
+        tenant_root_node, tenant_index = self.__tenant_config(graph)
 
         if not tenant_root_node or not tenant_root_node.get('tenants'):
             print("❌ No Tenant Configuration data found in the graph (Fabric_Config_Root node).")
@@ -2294,39 +2598,25 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print(" BRIDGE DOMAIN (BD) CONFIGURATION DETAILS ".center(100, '='))
         print("-" * 100)
 
-        all_tenants = tenant_root_node.get('tenants', [])
-
-        if not all_tenants:
+        if not tenant_index.objects('fvTenant'):
             print("No Tenants configured in the fabric.")
             return
 
-        for tenant_obj in all_tenants:
-            tenant_attr = tenant_obj.get('fvTenant', {}).get('attributes', {})
-            tenant_name = tenant_attr.get('name', 'N/A')
-
-            # Skip only the 'N/A' tenants, include 'common' and 'mgmt' since BDs are often there
-            if tenant_name == 'N/A':
+        # Include 'common' and 'mgmt' since BDs are often there, skip only the 'N/A' tenants
+        for tenant, bd in tenant_index.pairs('fvTenant', 'fvBD'):
+            if tenant.name == 'N/A':
                 continue
 
-            # ----------------------------------------------------------------------
-            # Start BD Search within Tenant
-            # ----------------------------------------------------------------------
-            tenant_children = tenant_obj.get('fvTenant', {}).get('children', [])
-
-            for child in tenant_children:
-                if 'fvBD' in child:
-                    bd_obj = child['fvBD']
-                    bd_attr = bd_obj.get('attributes', {})
-                    bd_name = bd_attr.get('name', 'N/A')
-                    bd_children = bd_obj.get('children', [])
+            # --- 1. BD Header ---
+            print("\n" + "#" * 90)
+            print(f" BRIDGE DOMAIN: {bd.name} (Tenant: {tenant.name}) ".center(90, '#'))
+            print("#" * 90)
 
-                    # --- 1. BD Header ---
-                    print("\n" + "#" * 90)
-                    print(f" BRIDGE DOMAIN: {bd_name} (Tenant: {tenant_name}) ".center(90, '#'))
-                    print("#" * 90)
+            # --- 2. Core BD Data Section ---
+            self._print_bd_core_data(tenant.name, bd.attributes, bd.children)
 
-                    # --- 2. Core BD Data Section ---
-                    self._print_bd_core_data(tenant_name, bd_attr, bd_children)
+            # --- 3. EPGs whose fvRsBd points to the BD ---
+            self.__printRelationSources(tenant_index, self.__dn_parser.bdDn(tenant.name, bd.name), ('fvRsBd',), "EPGs Using the Bridge Domain")
 
         print("\n" + "=" * 100)
         print(" END OF BRIDGE DOMAIN DETAIL REPORT ".center(100, '='))
@@ -2336,7 +2626,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
     def printVrfDetails(self, graph: nx.Graph) -> None:
 
         # Look for the dedicated Fabric Root Node
-        tenant_root_node = next((data for node, data in graph.nodes(data=True) if node == "Fabric_Config_Root"), None)
+        tenant_root_node, tenant_index = self.__tenant_config(graph)
 
         if not tenant_root_node or not tenant_root_node.get('tenants'):
             print("❌ No Tenant Configuration data found in the graph (Fabric_Config_Root node).")
@@ -2349,39 +2639,25 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print(" VRF (Context) CONFIGURATION DETAILS ".center(100, '='))
         print("-" * 100)
 
-        all_tenants = tenant_root_node.get('tenants', [])
-
-        if not all_tenants:
+        if not tenant_index.objects('fvTenant'):
             print("No Tenants configured in the fabric.")
             return
 
-        for tenant_obj in all_tenants:
-            tenant_attr = tenant_obj.get('fvTenant', {}).get('attributes', {})
-            tenant_name = tenant_attr.get('name', 'N/A')
-
-            # Skip 'N/A' tenants
-            if tenant_name == 'N/A':
+        # Skip 'N/A' tenants
+        for tenant, vrf in tenant_index.pairs('fvTenant', 'fvCtx'):
+            if tenant.name == 'N/A':
                 continue
 
-            # ----------------------------------------------------------------------
-            # Start VRF Search within Tenant
-            # ----------------------------------------------------------------------
-            tenant_children = tenant_obj.get('fvTenant', {}).get('children', [])
+            # --- 1. VRF Header ---
+            print("\n" + "#" * 90)
+            print(f" VRF: {vrf.name} (Tenant: {tenant.name}) ".center(90, '#'))
+            print("#" * 90)
 
-            for child in tenant_children:
-                if 'fvCtx' in child:
-                    vrf_obj = child['fvCtx']
-                    vrf_attr = vrf_obj.get('attributes', {})
-                    vrf_name = vrf_attr.get('name', 'N/A')
-                    vrf_children = vrf_obj.get('children', [])
+            # --- 2. Core VRF Data Section and Per-Node Deployment ---
+            self._print_vrf_core_data(tenant.name, vrf.attributes, vrf.children)
 
-                    # --- 1. VRF Header ---
-                    print("\n" + "#" * 90)
-                    print(f" VRF: {vrf_name} (Tenant: {tenant_name}) ".center(90, '#'))
-                    print("#" * 90)
-
-                    # --- 2. Core VRF Data Section and Per-Node Deployment ---
-                    self._print_vrf_core_data(tenant_name, vrf_attr, vrf_children)
+            # --- 3. Bridge Domains whose fvRsCtx points to the VRF ---
+            self.__printRelationSources(tenant_index, self.__dn_parser.vrfDn(tenant.name, vrf.name), ('fvRsCtx',), "Bridge Domains in the VRF")
 
         print("\n" + "=" * 100)
         print(" END OF VRF DETAIL REPORT ".center(100, '='))
@@ -2391,7 +2667,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
     def printL3OutDetails(self, graph: nx.Graph) -> None:
 
         # Look for the dedicated Fabric Root Node
-        tenant_root_node = next((data for node, data in graph.nodes(data=True) if node == "Fabric_Config_Root"), None)
+        tenant_root_node, tenant_index = self.__tenant_config(graph)
 
         if not tenant_root_node or not tenant_root_node.get('tenants'):
             print("❌ No Tenant Configuration data found in the graph (Fabric_Config_Root node).")
@@ -2404,45 +2680,28 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print(" L3OUT (EXTERNAL NETWORK) CONFIGURATION DETAILS ".center(100, '='))
         print("-" * 100)
 
-        all_tenants = tenant_root_node.get('tenants', [])
-
-        if not all_tenants:
+        if not tenant_index.objects('fvTenant'):
             print("No Tenants configured in the fabric.")
             return
 
-        for tenant_obj in all_tenants:
-            tenant_attr = tenant_obj.get('fvTenant', {}).get('attributes', {})
-            tenant_name = tenant_attr.get('name', 'N/A')
-
-            # Skip 'N/A' tenants
-            if tenant_name == 'N/A':
+        # Skip 'N/A' tenants
+        for tenant, l3out in tenant_index.pairs('fvTenant', 'l3extOut'):
+            if tenant.name == 'N/A':
                 continue
 
-            # ----------------------------------------------------------------------
-            # Start L3Out Search within Tenant
-            # ----------------------------------------------------------------------
-            tenant_children = tenant_obj.get('fvTenant', {}).get('children', [])
+            # --- 1. L3Out Header ---
+            print("\n" + "#" * 90)
+            print(f" L3OUT: {l3out.name} (Tenant: {tenant.name}) ".center(90, '#'))
+            print("#" * 90)
 
-            for child in tenant_children:
-                if 'l3extOut' in child:
-                    l3out_obj = child['l3extOut']
-                    l3out_attr = l3out_obj.get('attributes', {})
-                    l3out_name = l3out_attr.get('name', 'N/A')
-                    l3out_children = l3out_obj.get('children', [])
+            # --- 2. Core L3Out Data Section and VRF/Route Policy ---
+            self._print_l3out_core_data(tenant.name, l3out.attributes, l3out.children)
 
-                    # --- 1. L3Out Header ---
-                    print("\n" + "#" * 90)
-                    print(f" L3OUT: {l3out_name} (Tenant: {tenant_name}) ".center(90, '#'))
-                    print("#" * 90)
+            # --- 3. External EPGs (l3extInstP) ---
+            self._print_l3out_ext_epgs(l3out.children)
 
-                    # --- 2. Core L3Out Data Section and VRF/Route Policy ---
-                    self._print_l3out_core_data(tenant_name, l3out_attr, l3out_children)
-
-                    # --- 3. External EPGs (l3extInstP) ---
-                    self._print_l3out_ext_epgs(l3out_children)
-
-                    # --- 4. Node and Interface Details (l3extLNode/l3extLIf) ---
-                    self._print_l3out_node_interfaces(l3out_children)
+            # --- 4. Node and Interface Details (l3extLNode/l3extLIf) ---
+            self._print_l3out_node_interfaces(l3out.children)
 
         print("\n" + "=" * 100)
         print(" END OF L3OUT DETAIL REPORT ".center(100, '='))
@@ -2452,7 +2711,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
     def printContractDetails(self, graph: nx.Graph) -> None:
 
         # Look for the dedicated Fabric Root Node
-        tenant_root_node = next((data for node, data in graph.nodes(data=True) if node == "Fabric_Config_Root"), None)
+        tenant_root_node, tenant_index = self.__tenant_config(graph)
 
         if not tenant_root_node or not tenant_root_node.get('tenants'):
             print("❌ No Tenant Configuration data found in the graph (Fabric_Config_Root node).")
@@ -2465,42 +2724,30 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print(" CONTRACT (vzBrCP) CONFIGURATION DETAILS ".center(100, '='))
         print("-" * 100)
 
-        all_tenants = tenant_root_node.get('tenants', [])
-
-        if not all_tenants:
+        if not tenant_index.objects('fvTenant'):
             print("No Tenants configured in the fabric.")
             return
 
-        for tenant_obj in all_tenants:
-            tenant_attr = tenant_obj.get('fvTenant', {}).get('attributes', {})
-            tenant_name = tenant_attr.get('name', 'N/A')
-
-            # Skip 'N/A' tenants
-            if tenant_name == 'N/A':
+        # Skip 'N/A' tenants
+        for tenant, contract in tenant_index.pairs('fvTenant', 'vzBrCP'):
+            if tenant.name == 'N/A':
                 continue
 
-            # ----------------------------------------------------------------------
-            # Start Contract Search within Tenant
-            # ----------------------------------------------------------------------
-            tenant_children = tenant_obj.get('fvTenant', {}).get('children', [])
-
-            for child in tenant_children:
-                if 'vzBrCP' in child:
-                    contract_obj = child['vzBrCP']
-                    contract_attr = contract_obj.get('attributes', {})
-                    contract_name = contract_attr.get('name', 'N/A')
-                    contract_children = contract_obj.get('children', [])
+            # --- 1. Contract Header ---
+            print("\n" + "#" * 90)
+            print(f" CONTRACT: {contract.name} (Tenant: {tenant.name}) ".center(90, '#'))
+            print("#" * 90)
 
-                    # --- 1. Contract Header ---
-                    print("\n" + "#" * 90)
-                    print(f" CONTRACT: {contract_name} (Tenant: {tenant_name}) ".center(90, '#'))
-                    print("#" * 90)
+            # --- 2. Core Contract Data Section (Scope, Target) ---
+            self._print_contract_core_data(tenant.name, contract.attributes)
 
-                    # --- 2. Core Contract Data Section (Scope, Target) ---
-                    self._print_contract_core_data(tenant_name, contract_attr)
+            # --- 3. Contract Subjects and Filters ---
+            self._print_contract_subjects_and_filters(contract.children)
 
-                    # --- 3. Contract Subjects and Filters ---
-                    self._print_contract_subjects_and_filters(contract_children)
+            # --- 4. EPGs consuming/providing the Contract ---
+            contract_dn = self.__dn_parser.contractDn(tenant.name, contract.name)
+            self.__printRelationSources(tenant_index, contract_dn, ('fvRsCons',), "Consumer EPGs")
+            self.__printRelationSources(tenant_index, contract_dn, ('fvRsProv',), "Provider EPGs")
 
         print("\n" + "=" * 100)
         print(" END OF CONTRACT DETAIL REPORT ".center(100, '='))
@@ -2510,7 +2757,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
     def printFilterDetails(self, graph: nx.Graph) -> None:
 
         # Look for the dedicated Fabric Root Node
-        tenant_root_node = next((data for node, data in graph.nodes(data=True) if node == "Fabric_Config_Root"), None)
+        tenant_root_node, tenant_index = self.__tenant_config(graph)
 
         if not tenant_root_node or not tenant_root_node.get('tenants'):
             print("❌ No Tenant Configuration data found in the graph (Fabric_Config_Root node).")
@@ -2523,42 +2770,25 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print(" FILTER (vzFilter) CONFIGURATION DETAILS ".center(100, '='))
         print("-" * 100)
 
-        all_tenants = tenant_root_node.get('tenants', [])
-
-        if not all_tenants:
+        if not tenant_index.objects('fvTenant'):
             print("No Tenants configured in the fabric.")
             return
 
-        for tenant_obj in all_tenants:
-            tenant_attr = tenant_obj.get('fvTenant', {}).get('attributes', {})
-            tenant_name = tenant_attr.get('name', 'N/A')
-
-            # Skip 'N/A' tenants
-            if tenant_name == 'N/A':
+        # Skip 'N/A' tenants
+        for tenant, filter_obj in tenant_index.pairs('fvTenant', 'vzFilter'):
+            if tenant.name == 'N/A':
                 continue
 
-            # ----------------------------------------------------------------------
-            # Start Filter Search within Tenant
-            # ----------------------------------------------------------------------
-            tenant_children = tenant_obj.get('fvTenant', {}).get('children', [])
+            # --- 1. Filter Header ---
+            print("\n" + "#" * 90)
+            print(f" FILTER: {filter_obj.name} (Tenant: {tenant.name}) ".center(90, '#'))
+            print("#" * 90)
 
-            for child in tenant_children:
-                if 'vzFilter' in child:
-                    filter_obj = child['vzFilter']
-                    filter_attr = filter_obj.get('attributes', {})
-                    filter_name = filter_attr.get('name', 'N/A')
-                    filter_children = filter_obj.get('children', [])
+            # --- 2. Core Filter Data Section (Description) ---
+            self._print_filter_core_data(tenant.attributes, filter_obj.attributes)
 
-                    # --- 1. Filter Header ---
-                    print("\n" + "#" * 90)
-                    print(f" FILTER: {filter_name} (Tenant: {tenant_name}) ".center(90, '#'))
-                    print("#" * 90)
-
-                    # --- 2. Core Filter Data Section (Description) ---
-                    self._print_filter_core_data(tenant_attr, filter_attr)
-
-                    # --- 3. Filter Entries ---
-                    self._print_filter_entries(filter_children)
+            # --- 3. Filter Entries ---
+            self._print_filter_entries(filter_obj.children)
 
         print("\n" + "=" * 100)
         print(" END OF FILTER DETAIL REPORT ".center(100, '='))
@@ -2569,7 +2799,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
     def printEndpointDetails(self, graph: nx.Graph) -> None:
 
         # Look for the dedicated Fabric Root Node
-        tenant_root_node = next((data for node, data in graph.nodes(data=True) if node == "Fabric_Config_Root"), None)
+        tenant_root_node, tenant_index = self.__tenant_config(graph)
 
         if not tenant_root_node or not tenant_root_node.get('tenants'):
             print("❌ No Tenant Configuration data found in the graph (Fabric_Config_Root node).")
@@ -2582,7 +2812,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print(" ENDPOINT (fvCEp/fvIp) CONFIGURATION DETAILS ".center(100, '='))
         print("-" * 100)
 
-        all_tenants = tenant_root_node.get('tenants', [])
+        all_tenants = tenant_index.objects('fvTenant')
 
         if not all_tenants:
             print("No Tenants configured in the fabric.")
@@ -2590,9 +2820,8 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
 
         endpoints_found = 0
 
-        for tenant_obj in all_tenants:
-            tenant_attr = tenant_obj.get('fvTenant', {}).get('attributes', {})
-            tenant_name = tenant_attr.get('name', 'N/A')
+        for tenant in all_tenants:
+            tenant_name = tenant.name
 
             # Skip 'N/A' tenants
             if tenant_name == 'N/A':
@@ -2603,87 +2832,102 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
             print(f" TENANT: {tenant_name} ".center(90, '='))
             print("=" * 90)
 
-            tenant_children = tenant_obj.get('fvTenant', {}).get('children', [])
-
-            for ap_child in tenant_children:
-                if 'fvAp' in ap_child:
-                    ap_name = ap_child['fvAp']['attributes'].get('name', 'N/A')
-                    ap_epgs = ap_child['fvAp'].get('children', [])
-
-                    for epg_child in ap_epgs:
-                        if 'fvAEPg' in epg_child:
-                            epg_name = epg_child['fvAEPg']['attributes'].get('name', 'N/A')
-                            epg_children = epg_child['fvAEPg'].get('children', [])
-
-                            epg_endpoints = []
-
-                            # Find Endpoints (fvCEp) inside EPG
-                            for ep_child in epg_children:
-                                if 'fvCEp' in ep_child:
-                                    ep_obj = ep_child['fvCEp']
-                                    ep_attr = ep_obj['attributes']
-                                    ep_children = ep_obj.get('children', [])
-
-                                    # Collect IPs (fvIp) associated with this Endpoint
-                                    ip_list = []
-                                    for ip_child in ep_children:
-                                        if 'fvIp' in ip_child:
-                                            ip_list.append(ip_child['fvIp']['attributes'].get('addr', 'N/A'))
-
-                                    # Extract location/path information
-                                    path_info = "N/A"
-                                    for path_child in ep_children:
-                                        if 'fvRsCEpToPathEp' in path_child:
-                                            path_dn = path_child['fvRsCEpToPathEp']['attributes'].get('tDn', '')
-                                            # Example DN: topology/pod-1/paths-1234/pathep-[eth1/1]
-                                            if path_dn:
-                                                # Extract Node ID and Interface
-                                                path_info = path_dn.split('/paths-')[-1].replace('/pathep-[', ' int-')
-                                                path_info = path_info.replace(']', '')
-                                                break
-
-                                    epg_endpoints.append({
-                                        'mac': ep_attr.get('mac', 'N/A'),
-                                        'ip': ', '.join(ip_list) if ip_list else 'N/A',
-                                        'status': ep_attr.get('status', 'N/A'),
-                                        'pcTag': ep_attr.get('pcTag', 'N/A'),
-                                        'encap': ep_attr.get('encap', 'N/A'),
-                                        'is_local': ep_attr.get('isLocal', 'yes'),
-                                        'path_info': path_info
-                                    })
-                                    endpoints_found += 1
-
-                            # --- Print EPG Details if Endpoints were found ---
-                            if epg_endpoints:
-                                print(f"\n--- Application Profile: {ap_name} / EPG: {epg_name} ---")
-
-                                # Prepare table header
-                                header_keys = ['MAC Address', 'IP Address(es)', 'PC Tag', 'Encap', 'Path/VPC Location', 'Local?', 'Status']
-                                header_line = "{:<18} {:<30} {:<8} {:<10} {:<30} {:<7} {:<10}".format(*header_keys)
-
-                                print(header_line)
-                                print("-" * 125)
-
-                                for ep in epg_endpoints:
-                                    print("{:<18} {:<30} {:<8} {:<10} {:<30} {:<7} {:<10}".format(
-                                        ep['mac'],
-                                        ep['ip'],
-                                        ep['pcTag'],
-                                        ep['encap'],
-                                        ep['path_info'],
-                                        ep['is_local'],
-                                        ep['status']
-                                    ))
-                                print("-" * 125)
+            for ap in tenant_index.childrenOf(tenant.dn, 'fvAp'):
+                for epg in tenant_index.childrenOf(ap.dn, 'fvAEPg'):
+
+                    epg_endpoints = []
+
+                    # Find Endpoints (fvCEp) inside EPG
+                    for endpoint in tenant_index.childrenOf(epg.dn, 'fvCEp'):
+                        ep_attr = endpoint.attributes
+
+                        # Collect IPs (fvIp) associated with this Endpoint
+                        ip_list = [ip.attributes.get('addr', 'N/A') for ip in tenant_index.childrenOf(endpoint.dn, 'fvIp')]
+
+                        # Extract location/path information
+                        path_info = "N/A"
+                        for path_relation in tenant_index.childrenOf(endpoint.dn, 'fvRsCEpToPathEp'):
+                            path_dn = path_relation.attributes.get('tDn', '')
+                            # Example DN: topology/pod-1/paths-1234/pathep-[eth1/1]
+                            if path_dn:
+                                # Extract Node ID and Interface
+                                path = self.__dn_parser.parseDn(path_dn)
+                                path_info = f"{path.paths} int-{path.interface}" if path.paths and path.interface else path_dn
+                                break
+
+                        epg_endpoints.append({
+                            'mac': ep_attr.get('mac', 'N/A'),
+                            'ip': ', '.join(ip_list) if ip_list else 'N/A',
+                            'status': ep_attr.get('status', 'N/A'),
+                            'pcTag': ep_attr.get('pcTag', 'N/A'),
+                            'encap': ep_attr.get('encap', 'N/A'),
+                            'is_local': ep_attr.get('isLocal', 'yes'),
+                            'path_info': path_info
+                        })
+                        endpoints_found += 1
+
+                    # --- Print EPG Details if Endpoints were found ---
+                    if epg_endpoints:
+                        print(f"\n--- Application Profile: {ap.name} / EPG: {epg.name} ---")
+
+                        # Prepare table header
+                        header_keys = ['MAC Address', 'IP Address(es)', 'PC Tag', 'Encap', 'Path/VPC Location', 'Local?', 'Status']
+                        header_line = "{:<18} {:<30} {:<8} {:<10} {:<30} {:<7} {:<10}".format(*header_keys)
+
+                        print(header_line)
+                        print("-" * 125)
+
+                        for ep in epg_endpoints:
+                            print("{:<18} {:<30} {:<8} {:<10} {:<30} {:<7} {:<10}".format(
+                                ep['mac'],
+                                ep['ip'],
+                                ep['pcTag'],
+                                ep['encap'],
+                                ep['path_info'],
+                                ep['is_local'],
+                                ep['status']
+                            ))
+                        print("-" * 125)
 
         print("\n" + "=" * 100)
         print(f" TOTAL ENDPOINTS FOUND: {endpoints_found} ".center(100, '='))
         print("=" * 100)
 
+    # Private Method that returns the Fabric_Config_Root node attributes and the Tenant Index of its
+    # 'tenants' list (graph.graph['tenant_index']), the index is built again if the list was replaced
+    def __tenant_config(self, graph: nx.Graph) -> Tuple[Optional[Dict[str, Any]], Optional[TenantIndex]]:
+
+        tenant_root_node = graph.nodes.get("Fabric_Config_Root")
+        if not tenant_root_node or not tenant_root_node.get('tenants'):
+            return tenant_root_node, None
+
+        tenant_index = graph.graph.get('tenant_index')
+        if tenant_index is None or tenant_index.source is not tenant_root_node['tenants']:
+            tenant_index = TenantIndex(tenant_root_node['tenants'])
+            graph.graph['tenant_index'] = tenant_index
+        return tenant_root_node, tenant_index
+
     #################################
     # Private General Print Methods #
     #################################
 
+    # Printing the fabric links excluded from the paths (oper-down, LLDP lost or erroring)
+    def __printExcludedLinks(self, engine: FabricPathEngine, total_width: int) -> None:
+        print("-" * total_width)
+        for (u, v, key), reason in sorted(engine.excluded().items(), key=lambda item: tuple(map(str, item[0]))):
+            print(f"Excluded link {u} {key[0]} <-> {v} {key[1]}: {reason}" if key else f"Excluded link {u} <-> {v}: {reason}")
+        print(f"{engine.stats['excluded']} links excluded (erroring links: {engine.error_source}) | {engine.stats['computed']} path computations, {engine.stats['invalidated']} cached sources invalidated")
+        print("-" * total_width)
+
+    # Printing the objects holding a relation (fvRsBd, fvRsCtx, etc.) to the DN, joined through the Tenant Index
+    def __printRelationSources(self, tenant_index: TenantIndex, tDn: str, relation_classes: Tuple[str, ...], title: str) -> None:
+        sources = [tenant_index.parentOf(relation.dn) for relation in tenant_index.relationSources(tDn) if relation.mo_class in relation_classes]
+        print(f"\n--- {title} ---")
+        for source in sorted({source.dn for source in sources if source is not None}):
+            print(f"  {source}")
+        if not any(sources):
+            print("  None")
+
     # Private Method that will print all the Edge Attributes for the Cisco ACI Fabric
     def __privatePrintFabricEdgesAttributesCli(self, edge1: str, edge2: str, data: Dict[str, Any]) -> None:
 
@@ -2693,10 +2937,10 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
 
         # Print a Edge combined header
         print("-" * (len(header_edge_line) + 1))
-        print(f" {edge1} Interface {data['source_interface_id']} -- {edge2} Interface {data['dest_interface_id']} ".center(len(header_edge_line) + 1, '-'))
+        print(f" {edge1} Interface {data.get('source_interface_id', 'N/A')} -- {edge2} Interface {data.get('dest_interface_id', 'N/A')} ".center(len(header_edge_line) + 1, '-'))
         print("-" * (len(header_edge_line) + 1))
 
-        # Separate data for source and destination
+        # Separate data for source and destination (the counters are None until the 'counters' section is collected)
         source_data = {key.replace('source_', ''): value for key, value in data.items() if key.startswith('source_')}
         dest_data = {key.replace('dest_', ''): value for key, value in data.items() if key.startswith('dest_')}
 
@@ -2732,8 +2976,8 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print(header_line)
         print("-" * len(header_line))
         for key in interface_details_keys:
-            source_val = source_data.get(key, 'N/A')
-            dest_val = dest_data.get(key, 'N/A')
+            source_val = source_data.get(key) if source_data.get(key) is not None else 'N/A'
+            dest_val = dest_data.get(key) if dest_data.get(key) is not None else 'N/A'
             print("{:<30} {:<30} {:<30}".format(key.replace('interface_', '').replace('_', ' ').title(), source_val, dest_val))
         print("-" * len(header_line))
 
@@ -2742,8 +2986,8 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print(header_line)
         print("-" * len(header_line))
         for key in packet_stats_keys:
-            source_val = source_data.get(key, 'N/A')
-            dest_val = dest_data.get(key, 'N/A')
+            source_val = source_data.get(key) if source_data.get(key) is not None else 'N/A'
+            dest_val = dest_data.get(key) if dest_data.get(key) is not None else 'N/A'
             print("{:<30} {:<30} {:<30}".format(key.replace('_', ' ').title(), source_val, dest_val))
         print("-" * len(header_line))
 
@@ -2752,8 +2996,8 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         print(header_line)
         print("-" * len(header_line))
         for key in error_stats_keys:
-            source_val = source_data.get(key, 'N/A')
-            dest_val = dest_data.get(key, 'N/A')
+            source_val = source_data.get(key) if source_data.get(key) is not None else 'N/A'
+            dest_val = dest_data.get(key) if dest_data.get(key) is not None else 'N/A'
             print("{:<30} {:<30} {:<30}".format(key.replace('_', ' ').title(), source_val, dest_val))
         print("-" * len(header_line))
 
@@ -2768,7 +3012,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
                     dn = child[target_class]['attributes'].get('tDn') if target_class.startswith('fvRs') else child[target_class]['attributes'].get('dn')
                     # Extract name from DN: 'uni/tn-T/BD-B' -> 'B'
                     if dn:
-                        return dn.split('-')[-1].split('/')[0]
+                        return self.__dn_parser.objectName(dn)
             return 'N/A'
 
         # Fetch BD (fvRsBd) and Vlan Domains (fvRsDomAtt)
@@ -2836,18 +3080,11 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
                 mode = path_attr.get('mode', 'N/A')
 
                 # tDn example: 'topology/pod-1/paths-1205-1206/extpaths-vpc-INTPOL-CC2_CNS1P113-A_INFR A_PROD_STORAGE/pathep-[eth1/1]'
-                path_segments = tDn.split('/')
-
-                # Extract Node IDs (e.g., 1205 1206) and Interface Name (e.g., vpc INTPOL-...)
-                node_ids = ""
-                interface_name = ""
+                path = self.__dn_parser.parseDn(tDn)
 
-                for segment in path_segments:
-                    if segment.startswith('paths-'):
-                        node_ids = segment.replace('paths-', '').replace('-', ' ')
-                    elif segment.startswith('extpaths-'):
-                        # Extract VPC/Path name
-                        interface_name = segment.replace('extpaths-', '').replace('[', '').replace(']', '').replace('pathep-', '')
+                # Extract Node IDs (e.g., 1205 1206) and Interface Name (e.g., vpc INTPOL-... or eth1/1)
+                node_ids = path.paths.replace('-', ' ') if path.paths else ""
+                interface_name = path.extpath or path.interface or ""
 
                 static_paths.append({
                     'node': node_ids,
@@ -2891,7 +3128,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
                     dn = child[target_class]['attributes'].get('tDn', 'N/A')
                     # Extract name: 'V'
                     if dn != 'N/A':
-                        return dn.split('-')[-1]
+                        return self.__dn_parser.objectName(dn)
             return 'N/A'
 
         # Helper to find specific child attributes
@@ -3057,7 +3294,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
                     dn = child[target_class]['attributes'].get('tDn', 'N/A')
                     # Extract name: 'V'
                     if dn != 'N/A':
-                        return dn.split('-')[-1].split('/')[0]
+                        return self.__dn_parser.objectName(dn)
             return 'N/A'
 
         # Fetch VRF (l3extRsVrf)
@@ -3078,9 +3315,9 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
         for child in l3out_children:
             # Check common route policy relations
             if 'l3extRsRedistributePol' in child:
-                route_policies.append(f"Redistribute Policy: {child['l3extRsRedistributePol']['attributes'].get('tDn', 'N/A').split('/')[-1]}")
+                route_policies.append(f"Redistribute Policy: {self.__dn_parser.objectName(child['l3extRsRedistributePol']['attributes'].get('tDn'))}")
             if 'l3extRsEppAd' in child:
-                route_policies.append(f"Egress Policy: {child['l3extRsEppAd']['attributes'].get('tDn', 'N/A').split('/')[-1]}")
+                route_policies.append(f"Egress Policy: {self.__dn_parser.objectName(child['l3extRsEppAd']['attributes'].get('tDn'))}")
 
         print(f"{'Route Policies':<25}: {route_policies[0] if route_policies else 'None'}")
         for policy in route_policies[1:]:
@@ -3235,7 +3472,7 @@ class ACITroubleshooterPrinter(metaclass=_PrivateCookie):
                         filter_attr = subj_child['vzRsSubjFiltAtt']['attributes']
                         # tDn format: uni/tn-T/flt-F (F is the filter name)
                         tDn = filter_attr.get('tDn', 'N/A')
-                        filter_name = tDn.split('-')[-1] if tDn != 'N/A' else 'N/A'
+                        filter_name = self.__dn_parser.objectName(tDn) if tDn != 'N/A' else 'N/A'
 
                         subject_detail['filters'].append({
                             'name': filter_name,
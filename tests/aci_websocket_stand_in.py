@@ -0,0 +1,70 @@
+# coding=utf-8
+
+#########################################################################
+#  Local Websocket Stand-In used by the tests to replay APIC MO events  #
+#  without an APIC                                                      #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import parse_qs, urlparse
+import queue
+import json
+
+#########################################################################################################
+# Local Websocket Stand-In, replays MO events without an APIC. It offers the same calls used by the     #
+# subscription engine on the cookie (get_request/getToken) and on the websocket (recv/close)            #
+#########################################################################################################
+
+class LocalWebsocketStandIn:
+
+    def __init__(self) -> None:
+        self.__events: "queue.Queue[Optional[str]]" = queue.Queue()
+        self.__subscription_id: int = 0
+        self.requested_urls: List[str] = []
+        self.expired: Set[str] = set()
+        self.unavailable: bool = False
+
+    # Returning a new subscription ID for every subscription request. The refresh of an expired ID returns the
+    # APIC error object, and every request raises while the Stand-In is unavailable
+    def get_request(self, url: str) -> Dict[str, Any]:
+        self.requested_urls.append(url)
+        if self.unavailable:
+            raise ConnectionError("Local websocket stand-in unavailable")
+        if 'subscriptionRefresh' in url:
+            subscription_id = parse_qs(urlparse(url).query).get('id', [''])[0]
+            if subscription_id in self.expired:
+                return {'totalCount': '1', 'imdata': [{'error': {'attributes': {'code': '400', 'text': f"Subscription {subscription_id} not found"}}}]}
+            return {'totalCount': '0', 'imdata': []}
+        self.__subscription_id += 1
+        return {'totalCount': '0', 'subscriptionId': str(self.__subscription_id), 'imdata': []}
+
+    # Returning a fake APIC Token
+    def getToken(self) -> str:
+        return "local-stand-in"
+
+    # Method used as transport factory, the Stand-In is its own websocket
+    def connect(self, url: str) -> "LocalWebsocketStandIn":
+        return self
+
+    # Pushing a MO event like the APIC does: {'subscriptionId': [...], 'imdata': [{class: {'attributes': {...}}}]}
+    def push(self, mo_class: str, attributes: Dict[str, Any]) -> None:
+        self.__events.put(json.dumps(self.message(mo_class, attributes)))
+
+    # Returning the message of a MO event
+    def message(self, mo_class: str, attributes: Dict[str, Any]) -> Dict[str, Any]:
+        return {'subscriptionId': [str(self.__subscription_id)], 'imdata': [{mo_class: {'attributes': attributes}}]}
+
+    # Blocking until the next event is pushed
+    def recv(self) -> str:
+        event = self.__events.get()
+        if event is None:
+            raise ConnectionError("Local websocket stand-in closed")
+        return event
+
+    # Closing the Stand-In, unblocking the receiver thread
+    def close(self) -> None:
+        self.__events.put(None)
@@ -0,0 +1,22 @@
+# coding=utf-8
+
+#########################################################################
+#  Pytest configuration: the repository root is importable and the     #
+#  environment variables read by UserClass point to this checkout      #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# UserClass reads the URL file from 'FabricGraphPath', the APIC is never contacted by the tests
+os.environ.setdefault('FabricGraphPath', ROOT)
+os.environ.setdefault('FabricGtmUrl', 'apic.local')
@@ -0,0 +1,169 @@
+# coding=utf-8
+
+#########################################################################
+#  Tests of the APIC MO subscriptions replayed with the Local Websocket #
+#  Stand-In (events, receiver thread, refresh and re-subscription)      #
+#########################################################################
+
+##################
+# Import Section #
+##################
+
+from typing import Any, Callable, Iterator
+from aci_api_client.Url import UrlClass
+from aci_api_client.UserClass import UserClass
+from controller.aci_subscription_controller import ACISubscriptionController
+from model.aci_graph import ACIFabricGraph
+from aci_websocket_stand_in import LocalWebsocketStandIn
+import pytest
+import time
+
+LEAF_DN = 'topology/pod-1/node-101'
+SPINE_DN = 'topology/pod-1/node-201'
+
+############
+# Fixtures #
+############
+
+# Graph with a leaf, a spine, the fabric link between them and a downlink of the leaf
+@pytest.fixture
+def graph() -> ACIFabricGraph:
+    graph = ACIFabricGraph()
+    graph.add_node('leaf101', id='101', role='leaf', fabricSt='active', faults=[], psus=[{'id': '1', 'operSt': 'ok'}, {'id': '2', 'operSt': 'ok'}])
+    graph.add_node('spine201', id='201', role='spine', fabricSt='active', faults=[])
+    graph.add_node('server1')
+    graph.add_edge('leaf101', 'spine201', source_node_id='201', source_interface_id='eth1/1', source_interface_operSt='up',
+                   dest_node_id='101', dest_interface_id='eth1/49', dest_interface_operSt='up')
+    graph.add_edge('leaf101', 'server1', downlink=True, leaf='101', leaf_int='eth1/1', operSt='up', operVlans='10')
+    return graph
+
+# Stand-In used as APIC cookie and as websocket
+@pytest.fixture
+def stand_in() -> LocalWebsocketStandIn:
+    return LocalWebsocketStandIn()
+
+# Subscription controller stopped after every test (the controller is a singleton)
+@pytest.fixture
+def controller() -> Iterator[ACISubscriptionController]:
+    controller = ACISubscriptionController()
+    yield controller
+    controller.stopSubscriptions()
+
+# Waiting until the condition is True (the events are applied by the background threads)
+def wait_for(condition: Callable[[], Any], timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return bool(condition())
+
+# Fabric link between leaf101 and spine201
+def fabric_link(graph: ACIFabricGraph) -> Any:
+    return next(data for _, _, data in graph.edges('leaf101', data=True) if not data.get('downlink'))
+
+##########################
+# applyEvent per MO class #
+##########################
+
+def test_fabric_node_event_updates_the_node(controller: ACISubscriptionController, graph: ACIFabricGraph, stand_in: LocalWebsocketStandIn) -> None:
+    applied = controller.applyEvent(graph, stand_in.message('fabricNode', {'dn': LEAF_DN, 'fabricSt': 'inactive', 'status': 'modified'}))
+    assert applied == 1
+    assert graph.nodes['leaf101']['fabricSt'] == 'inactive'
+    assert graph.graph['subscription_status']['events'] == 1
+
+def test_fault_summary_events_add_update_and_delete_by_dn(controller: ACISubscriptionController, graph: ACIFabricGraph, stand_in: LocalWebsocketStandIn) -> None:
+    fault_dn = LEAF_DN + '/sys/phys-[eth1/49]/fault-F0546'
+    other_dn = LEAF_DN + '/sys/phys-[eth1/50]/fault-F0546'
+
+    controller.applyEvent(graph, stand_in.message('faultSummary', {'dn': fault_dn, 'code': 'F0546', 'severity': 'major', 'status': 'created'}))
+    controller.applyEvent(graph, stand_in.message('faultSummary', {'dn': other_dn, 'code': 'F0546', 'severity': 'minor', 'status': 'created'}))
+    controller.applyEvent(graph, stand_in.message('faultSummary', {'dn': fault_dn, 'code': 'F0546', 'severity': 'critical', 'status': 'modified'}))
+    faults = graph.nodes['leaf101']['faults']
+    assert {fault.get('dn'): fault.get('severity') for fault in faults} == {fault_dn: 'critical', other_dn: 'minor'}
+
+    controller.applyEvent(graph, stand_in.message('faultSummary', {'dn': fault_dn, 'status': 'deleted'}))
+    assert [fault.get('dn') for fault in graph.nodes['leaf101']['faults']] == [other_dn]
+
+def test_operational_interface_event_updates_the_fabric_and_downlink_edges(controller: ACISubscriptionController, graph: ACIFabricGraph, stand_in: LocalWebsocketStandIn) -> None:
+    controller.applyEvent(graph, stand_in.message('ethpmPhysIf', {'dn': LEAF_DN + '/sys/phys-[eth1/49]/phys', 'operSt': 'down'}))
+    link = fabric_link(graph)
+    assert link['dest_interface_operSt'] == 'down'
+    assert link['source_interface_operSt'] == 'up'
+
+    controller.applyEvent(graph, stand_in.message('ethpmPhysIf', {'dn': LEAF_DN + '/sys/phys-[eth1/1]/phys', 'operSt': 'down', 'operVlans': '10,20'}))
+    downlink = graph.edges['leaf101', 'server1', ('eth1/1', None)]
+    assert downlink['operSt'] == 'down'
+    assert downlink['operVlans'] == '10,20'
+
+def test_lldp_adjacency_events_mark_the_link_lost_and_up(controller: ACISubscriptionController, graph: ACIFabricGraph, stand_in: LocalWebsocketStandIn) -> None:
+    controller.applyEvent(graph, stand_in.message('lldpAdjEp', {'dn': SPINE_DN + '/sys/lldp/inst/if-[eth1/1]/adj-1', 'status': 'deleted'}))
+    assert fabric_link(graph)['lldp_adjacency'] == 'lost'
+
+    controller.applyEvent(graph, stand_in.message('lldpAdjEp', {'dn': SPINE_DN + '/sys/lldp/inst/if-[eth1/1]/adj-1', 'status': 'created'}))
+    assert fabric_link(graph)['lldp_adjacency'] == 'up'
+
+def test_power_supply_event_updates_the_slot(controller: ACISubscriptionController, graph: ACIFabricGraph, stand_in: LocalWebsocketStandIn) -> None:
+    applied = controller.applyEvent(graph, stand_in.message('eqptPsu', {'dn': LEAF_DN + '/sys/ch/psuslot-2/psu', 'operSt': 'fail'}))
+    assert applied == 1
+    assert [psu['operSt'] for psu in graph.nodes['leaf101']['psus']] == ['ok', 'fail']
+
+def test_events_of_unknown_nodes_are_not_applied(controller: ACISubscriptionController, graph: ACIFabricGraph, stand_in: LocalWebsocketStandIn) -> None:
+    assert controller.applyEvent(graph, stand_in.message('fabricNode', {'dn': 'topology/pod-1/node-999', 'fabricSt': 'inactive'})) == 0
+
+#################
+# Receiver loop #
+#################
+
+def test_receiver_loop_applies_the_pushed_events(controller: ACISubscriptionController, graph: ACIFabricGraph, stand_in: LocalWebsocketStandIn) -> None:
+    controller.startSubscriptions(graph, stand_in, UrlClass(), UserClass(), transport_factory=stand_in.connect)
+    status = graph.graph['subscription_status']
+    assert status['state'] == 'live'
+    assert status['subscriptions'] == 5
+
+    stand_in.push('fabricNode', {'dn': LEAF_DN, 'fabricSt': 'inactive'})
+    stand_in.push('faultSummary', {'dn': LEAF_DN + '/fault-F1', 'code': 'F1', 'severity': 'major', 'status': 'created'})
+    stand_in.push('ethpmPhysIf', {'dn': LEAF_DN + '/sys/phys-[eth1/49]/phys', 'operSt': 'down'})
+    stand_in.push('lldpAdjEp', {'dn': LEAF_DN + '/sys/lldp/inst/if-[eth1/49]/adj-1', 'status': 'deleted'})
+    stand_in.push('eqptPsu', {'dn': LEAF_DN + '/sys/ch/psuslot-1/psu', 'operSt': 'fail'})
+    assert wait_for(lambda: status['events'] == 5)
+
+    assert graph.nodes['leaf101']['fabricSt'] == 'inactive'
+    assert [fault.get('code') for fault in graph.nodes['leaf101']['faults']] == ['F1']
+    assert fabric_link(graph)['dest_interface_operSt'] == 'down'
+    assert fabric_link(graph)['lldp_adjacency'] == 'lost'
+    assert graph.nodes['leaf101']['psus'][0]['operSt'] == 'fail'
+
+    controller.stopSubscriptions()
+    assert status['state'] == 'stopped'
+
+################
+# Refresh loop #
+################
+
+def test_refresh_error_registers_the_mo_class_again(controller: ACISubscriptionController, graph: ACIFabricGraph, stand_in: LocalWebsocketStandIn, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ACISubscriptionController, 'SUBSCRIPTION_REFRESH_INTERVAL', 0.01)
+    controller.startSubscriptions(graph, stand_in, UrlClass(), UserClass(), transport_factory=stand_in.connect)
+    status = graph.graph['subscription_status']
+
+    # The APIC answers the refresh of the expired ID with an error object, no exception is raised
+    stand_in.expired.add('1')
+    assert wait_for(lambda: status.get('refresh_failures', 0) >= 1 and any('fabricNode.json?subscription=yes' in url for url in stand_in.requested_urls[5:]))
+    controller.stopSubscriptions()
+
+    assert 'fabricNode' in status['last_error']
+    assert '400' in status['last_error']
+    assert status['subscriptions'] == 5
+
+def test_refresh_keeps_the_old_id_when_the_subscription_fails(controller: ACISubscriptionController, graph: ACIFabricGraph, stand_in: LocalWebsocketStandIn, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ACISubscriptionController, 'SUBSCRIPTION_REFRESH_INTERVAL', 0.01)
+    controller.startSubscriptions(graph, stand_in, UrlClass(), UserClass(), transport_factory=stand_in.connect)
+    status = graph.graph['subscription_status']
+
+    # Refresh and subscription requests raise, the MO classes stay subscribed with the old IDs to be tried again
+    stand_in.unavailable = True
+    assert wait_for(lambda: status.get('refresh_failures', 0) >= 10)
+    controller.stopSubscriptions()
+
+    assert 'Local websocket stand-in unavailable' in status['last_error']
+    assert status['subscriptions'] == 5